@@ -1,12 +1,24 @@
 """
 Analysis request management and background task processing module
+
+AnalysisScheduler runs /report and /us_report analyses on the bot's event loop:
+- N concurrent analysis slots (ANALYSIS_CONCURRENCY, default 2); the blocking
+  report subprocess runs in a worker thread via asyncio.to_thread
+- per-user fairness: a free slot goes to the waiting user with the fewest
+  running analyses (least recently served among ties), so one user's burst of requests
+  cannot hold every slot
+- coalescing: a request for a ticker that is already queued or running joins
+  that job and receives the same result
+- completion is delivered by awaiting the on_complete callback (no polling)
 """
+import asyncio
 import logging
+import os
 import traceback
 import uuid
-import threading
+from collections import OrderedDict, deque
 from datetime import datetime
-from queue import Queue
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 from report_generator import (
     get_cached_report, save_report, save_pdf_report,
@@ -18,8 +30,8 @@ from report_generator import (
 # Logger setup
 logger = logging.getLogger(__name__)
 
-# Analysis task queue
-analysis_queue = Queue()
+# Number of analyses run at the same time
+ANALYSIS_CONCURRENCY = int(os.getenv("ANALYSIS_CONCURRENCY", "2"))
 
 
 class AnalysisRequest:
@@ -47,131 +59,216 @@ class AnalysisRequest:
         self.market_type = market_type  # "kr" (Korea) or "us" (USA)
 
 
-def start_background_worker(bot_instance):
+def process_analysis_request(request: AnalysisRequest) -> None:
     """
-    Start background worker
-    Create thread to process analysis requests
+    Run one analysis request to completion (blocking — call from a worker thread).
+    Fills request.status / result / report_path / pdf_path.
     """
-    def worker():
-        logger.info("Background worker started")
-        while True:
-            try:
-                # Get task from queue (blocking)
-                request = analysis_queue.get()
-                logger.info(f"Worker: Starting analysis request processing - {request.id}")
-
-                # Update request status
-                bot_instance.pending_requests[request.id] = request
-
-                try:
-                    # Use different cache/analysis functions based on market type
-                    if request.market_type == "us":
-                        # Process US stock report
-                        is_cached, cached_content, cached_file, cached_pdf = get_cached_us_report(request.stock_code)
-
-                        if is_cached:
-                            logger.info(f"Cached US report found: {cached_file}")
-                            request.result = cached_content
-                            request.status = "completed"
-                            request.report_path = cached_file
-                            request.pdf_path = cached_pdf
-                        else:
-                            # Perform new US analysis
-                            logger.info(f"Performing new US analysis: {request.stock_code} - {request.company_name}")
-
-                            if request.avg_price and request.period:
-                                logger.info(f"US Evaluate request already processed: {request.id}")
-                                request.status = "skipped"
-                            else:
-                                # Generate US report (synchronous mode)
-                                report_result = generate_us_report_response_sync(
-                                    request.stock_code, request.company_name
-                                )
-
-                                if report_result:
-                                    request.result = report_result
-                                    request.status = "completed"
-
-                                    # Save US report file
-                                    md_path = save_us_report(
-                                        request.stock_code, request.company_name, report_result
-                                    )
-                                    request.report_path = md_path
-
-                                    # Generate US PDF
-                                    pdf_path = save_us_pdf_report(
-                                        request.stock_code, request.company_name, md_path
-                                    )
-                                    request.pdf_path = pdf_path
-                                else:
-                                    request.status = "failed"
-                                    request.result = "Error occurred during US stock analysis."
-                    else:
-                        # Process Korean stock report (existing logic)
-                        is_cached, cached_content, cached_file, cached_pdf = get_cached_report(request.stock_code)
-
-                        if is_cached:
-                            logger.info(f"Cached report found: {cached_file}")
-                            request.result = cached_content
-                            request.status = "completed"
-                            request.report_path = cached_file
-                            request.pdf_path = cached_pdf
-                        else:
-                            # Perform new analysis (using synchronous version)
-                            logger.info(f"Performing new analysis: {request.stock_code} - {request.company_name}")
-
-                            # Execute analysis (different prompts for evaluate vs report)
-                            if request.avg_price and request.period:  # For evaluate command
-                                # Evaluate requests are executed asynchronously, so not processed in background
-                                # Already handled by telegram bot
-                                logger.info(f"Evaluate request already processed: {request.id}")
-                                request.status = "skipped"
-                            else:  # For report command
-                                # Execute synchronously
-                                report_result = generate_report_response_sync(
-                                    request.stock_code, request.company_name
-                                )
-
-                                if report_result:
-                                    request.result = report_result
-                                    request.status = "completed"
-
-                                    # Save file
-                                    md_path = save_report(
-                                        request.stock_code, request.company_name, report_result
-                                    )
-                                    request.report_path = md_path
-
-                                    # Generate PDF
-                                    pdf_path = save_pdf_report(
-                                        request.stock_code, request.company_name, md_path
-                                    )
-                                    request.pdf_path = pdf_path
-                                else:
-                                    request.status = "failed"
-                                    request.result = "Error occurred during analysis."
-
-                    # Add to queue for result processing
-                    logger.info(f"Analysis complete, adding to result queue: {request.id}")
-                    bot_instance.result_queue.put(request.id)
-
-                except Exception as e:
-                    logger.error(f"Worker: Error during analysis processing - {str(e)}")
-                    logger.error(traceback.format_exc())
+    # Use different cache/analysis functions based on market type
+    if request.market_type == "us":
+        # Process US stock report
+        is_cached, cached_content, cached_file, cached_pdf = get_cached_us_report(request.stock_code)
+
+        if is_cached:
+            logger.info(f"Cached US report found: {cached_file}")
+            request.result = cached_content
+            request.status = "completed"
+            request.report_path = cached_file
+            request.pdf_path = cached_pdf
+        else:
+            # Perform new US analysis
+            logger.info(f"Performing new US analysis: {request.stock_code} - {request.company_name}")
+
+            if request.avg_price and request.period:
+                logger.info(f"US Evaluate request already processed: {request.id}")
+                request.status = "skipped"
+            else:
+                # Generate US report (synchronous mode)
+                report_result = generate_us_report_response_sync(
+                    request.stock_code, request.company_name
+                )
+
+                if report_result:
+                    request.result = report_result
+                    request.status = "completed"
+
+                    # Save US report file
+                    md_path = save_us_report(
+                        request.stock_code, request.company_name, report_result
+                    )
+                    request.report_path = md_path
+
+                    # Generate US PDF
+                    pdf_path = save_us_pdf_report(
+                        request.stock_code, request.company_name, md_path
+                    )
+                    request.pdf_path = pdf_path
+                else:
                     request.status = "failed"
-                    request.result = f"Error occurred during analysis: {str(e)}"
-                    # Add to result queue even on error for processing
-                    bot_instance.result_queue.put(request.id)
+                    request.result = "Error occurred during US stock analysis."
+    else:
+        # Process Korean stock report (existing logic)
+        is_cached, cached_content, cached_file, cached_pdf = get_cached_report(request.stock_code)
+
+        if is_cached:
+            logger.info(f"Cached report found: {cached_file}")
+            request.result = cached_content
+            request.status = "completed"
+            request.report_path = cached_file
+            request.pdf_path = cached_pdf
+        else:
+            # Perform new analysis (using synchronous version)
+            logger.info(f"Performing new analysis: {request.stock_code} - {request.company_name}")
+
+            # Execute analysis (different prompts for evaluate vs report)
+            if request.avg_price and request.period:  # For evaluate command
+                # Evaluate requests are executed asynchronously, so not processed in background
+                # Already handled by telegram bot
+                logger.info(f"Evaluate request already processed: {request.id}")
+                request.status = "skipped"
+            else:  # For report command
+                # Execute synchronously
+                report_result = generate_report_response_sync(
+                    request.stock_code, request.company_name
+                )
+
+                if report_result:
+                    request.result = report_result
+                    request.status = "completed"
+
+                    # Save file
+                    md_path = save_report(
+                        request.stock_code, request.company_name, report_result
+                    )
+                    request.report_path = md_path
+
+                    # Generate PDF
+                    pdf_path = save_pdf_report(
+                        request.stock_code, request.company_name, md_path
+                    )
+                    request.pdf_path = pdf_path
+                else:
+                    request.status = "failed"
+                    request.result = "Error occurred during analysis."
+
+
+class _AnalysisJob:
+    """One analysis run shared by every request for the same (market, ticker, kind)."""
+    def __init__(self, key: Tuple, request: AnalysisRequest):
+        self.key = key
+        self.user = request.user_id or request.chat_id
+        self.requests: List[AnalysisRequest] = [request]
 
+
+class AnalysisScheduler:
+    """
+    asyncio-native analysis job scheduler.
+
+    submit() is called from bot handlers on the event loop. Jobs wait in per-user
+    FIFO queues; a free slot takes the next job of the waiting user with the
+    fewest running jobs, least recently served among ties. When a
+    job finishes, every request attached to it gets the result and
+    on_complete(request) is awaited for each one.
+    """
+
+    def __init__(self, on_complete: Callable[[AnalysisRequest], Awaitable[None]],
+                 concurrency: Optional[int] = None,
+                 runner: Callable[[AnalysisRequest], None] = process_analysis_request):
+        self.on_complete = on_complete
+        self.concurrency = max(1, int(concurrency if concurrency is not None else ANALYSIS_CONCURRENCY))
+        self.runner = runner
+        self.running = 0
+        self._jobs: Dict[Tuple, _AnalysisJob] = {}
+        self._user_queues: "OrderedDict[object, Deque[_AnalysisJob]]" = OrderedDict()
+        self._running_by_user: Dict[object, int] = {}
+        self._last_served: Dict[object, int] = {}
+        self._dispatched = 0
+        self._tasks: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def job_key(request: AnalysisRequest) -> Tuple:
+        # evaluate-style requests carry per-user inputs — never shared
+        if request.avg_price and request.period:
+            return ("request", request.id)
+        return (request.market_type, request.stock_code)
+
+    @property
+    def queued(self) -> int:
+        return sum(len(q) for q in self._user_queues.values())
+
+    def submit(self, request: AnalysisRequest) -> bool:
+        """
+        Queue a request. Returns True when it joined an analysis that is already
+        queued or running (it will be delivered together with that job).
+        """
+        key = self.job_key(request)
+        job = self._jobs.get(key)
+        if job is not None:
+            job.requests.append(request)
+            logger.info(f"Scheduler: request {request.id} joined in-flight analysis {key}")
+            return True
+
+        job = _AnalysisJob(key, request)
+        self._jobs[key] = job
+        self._user_queues.setdefault(job.user, deque()).append(job)
+        logger.info(f"Scheduler: queued {key} (running={self.running}, queued={self.queued})")
+        self._dispatch()
+        return False
+
+    def _next_job(self) -> Optional[_AnalysisJob]:
+        if not self._user_queues:
+            return None
+        user = min(self._user_queues, key=lambda u: (
+            self._running_by_user.get(u, 0), self._last_served.get(u, -1)))
+        queue = self._user_queues[user]
+        job = queue.popleft()
+        if not queue:
+            del self._user_queues[user]
+        self._dispatched += 1
+        self._last_served[user] = self._dispatched
+        return job
+
+    def _dispatch(self) -> None:
+        while self.running < self.concurrency:
+            job = self._next_job()
+            if job is None:
+                return
+            self.running += 1
+            self._running_by_user[job.user] = self._running_by_user.get(job.user, 0) + 1
+            task = asyncio.get_running_loop().create_task(self._run(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, job: _AnalysisJob) -> None:
+        lead = job.requests[0]
+        logger.info(f"Scheduler: starting analysis {job.key} - {lead.id}")
+        try:
+            await asyncio.to_thread(self.runner, lead)
+        except Exception as e:
+            logger.error(f"Scheduler: Error during analysis processing - {str(e)}")
+            logger.error(traceback.format_exc())
+            lead.status = "failed"
+            lead.result = f"Error occurred during analysis: {str(e)}"
+        finally:
+            self.running -= 1
+            left = self._running_by_user.pop(job.user, 1) - 1
+            if left:
+                self._running_by_user[job.user] = left
+            elif job.user not in self._user_queues:
+                self._last_served.pop(job.user, None)   # idle user — forget history
+            # close the job before delivery so new requests start a fresh analysis
+            self._jobs.pop(job.key, None)
+            self._dispatch()
+
+        for request in job.requests[1:]:
+            request.status = lead.status
+            request.result = lead.result
+            request.report_path = lead.report_path
+            request.pdf_path = lead.pdf_path
+        logger.info(f"Analysis complete, delivering {len(job.requests)} result(s): {job.key}")
+        for request in job.requests:
+            try:
+                await self.on_complete(request)
             except Exception as e:
-                logger.error(f"Worker: Error during request processing - {str(e)}")
+                logger.error(f"Scheduler: Error delivering result {request.id} - {str(e)}")
                 logger.error(traceback.format_exc())
-            finally:
-                # Mark task as complete
-                analysis_queue.task_done()
-
-    # Start background thread
-    worker_thread = threading.Thread(target=worker, daemon=True)
-    worker_thread.start()
-    logger.info("Background worker thread started.")
-    return worker_thread
\ No newline at end of file
@@ -1,6 +1,13 @@
+import logging
+import sqlite3
+
 from mcp_agent.agents.agent import Agent
 
 from cores.openai_error_logging import log_openai_error
+from cores.llm.governor import governed_generate_str
+from cores.llm.translation_memory import get_translation_memory
+
+logger = logging.getLogger(__name__)
 
 
 def create_telegram_translator_agent(from_lang: str = "ko", to_lang: str = "en"):
@@ -111,6 +118,9 @@ async def translate_telegram_message(
     """
     Translate a telegram message from source language to target language
 
+    Messages already translated for the same language pair and model are served
+    from the translation memory (cores/llm/translation_memory) without an LLM call.
+
     Args:
         message: Telegram message to translate
         model: OpenAI model to use (default: gpt-5.4-nano for cost efficiency)
@@ -129,6 +139,16 @@ async def translate_telegram_message(
         import re as _re
         message = _re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', message)
 
+        memory = get_translation_memory()
+        if memory is not None:
+            try:
+                remembered = memory.get(message, from_lang, to_lang, model)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Translation memory read failed: {e}")
+                remembered = None
+            if remembered is not None:
+                return remembered
+
         # Create translator agent
         translator = create_telegram_translator_agent(from_lang=from_lang, to_lang=to_lang)
 
@@ -136,7 +156,8 @@ async def translate_telegram_message(
         llm = await translator.attach_llm(OpenAIAugmentedLLM)
 
         # Generate translation
-        translated = await llm.generate_str(
+        translated = await governed_generate_str(
+            llm,
             message=message,
             request_params=RequestParams(
                 model=model,
@@ -146,12 +167,17 @@ async def translate_telegram_message(
             )
         )
 
-        return translated.strip()
+        translated = translated.strip()
+        if memory is not None and translated:
+            try:
+                memory.put(message, translated, from_lang, to_lang, model)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Translation memory write failed: {e}")
+
+        return translated
 
     except Exception as e:
         # If translation fails, return original message with error note
-        import logging
-        logger = logging.getLogger(__name__)
         log_openai_error(logger, e, "telegram translation")
         logger.error(f"Translation failed: {str(e)}")
         return message  # Fallback to original message
@@ -14,6 +14,7 @@ import logging as _logging
 _BQ_LOG = _logging.getLogger("prism.buy_quality")
 
 from cores.agents import get_agent_directory
+from cores.report_pipeline import report_parallelism
 from cores.report_generation import generate_report, generate_summary, generate_investment_strategy, get_disclaimer, generate_market_report
 
 # Load environment variables
@@ -30,6 +31,27 @@ from cores.utils import clean_markdown
 
 # Market analysis cache storage (global variable)
 _market_analysis_cache = {}
+_market_analysis_lock = None
+
+
+async def _cached_market_report(agent, section, reference_date, log, language):
+    """
+    Market index section is identical for every ticker of a run - generate it once.
+    The lock keeps tickers analyzed concurrently (PRISM_PARALLEL_REPORT >= 2) from
+    generating it in parallel on a cold cache.
+    """
+    global _market_analysis_lock
+    if _market_analysis_lock is None:
+        _market_analysis_lock = asyncio.Lock()
+    async with _market_analysis_lock:
+        if "report" in _market_analysis_cache:
+            log.info("Using cached market analysis")
+            return _market_analysis_cache["report"]
+        log.info("Generating new market analysis")
+        report = await generate_market_report(agent, section, reference_date, log, language)
+        _market_analysis_cache["report"] = report
+        return report
+
 
 async def analyze_stock(company_code: str = "000660", company_name: str = "SK하이닉스", reference_date: str = None, language: str = "ko", macro_context: dict = None):
     """
@@ -78,10 +100,11 @@ async def analyze_stock(company_code: str = "000660", company_name: str = "SK하
         agents = get_agent_directory(company_name, company_code, reference_date, base_sections, language, prefetched_data=prefetched)
 
         # 6. Execute base analysis
-        # Parallel processing option: Activated when PRISM_PARALLEL_REPORT=true is set in .env file
+        # Parallel processing option: Activated when PRISM_PARALLEL_REPORT=true (or a ticker
+        # count >= 2, see cores.report_pipeline.report_parallelism) is set in .env file
         # ⚠️ Warning: Parallel processing greatly improves speed but may hit OpenAI API rate limits.
         # When using advanced models like GPT-5.2, rate limits may be stricter, so be careful.
-        parallel_enabled = os.getenv("PRISM_PARALLEL_REPORT", "false").lower() == "true"
+        parallel_enabled = report_parallelism() > 0
 
         if parallel_enabled:
             # Parallel execution mode
@@ -102,14 +125,8 @@ async def analyze_stock(company_code: str = "000660", company_name: str = "SK하
                     try:
                         agent = agents[section]
                         if section == "market_index_analysis":
-                            if "report" in _market_analysis_cache:
-                                section_logger.info("Using cached market analysis")
-                                return section, _market_analysis_cache["report"]
-                            else:
-                                section_logger.info("Generating new market analysis")
-                                report = await generate_market_report(agent, section, reference_date, section_logger, language)
-                                _market_analysis_cache["report"] = report
-                                return section, report
+                            report = await _cached_market_report(agent, section, reference_date, section_logger, language)
+                            return section, report
                         else:
                             report = await generate_report(agent, section, company_name, company_code, reference_date, section_logger, language)
                             return section, report
@@ -132,15 +149,8 @@ async def analyze_stock(company_code: str = "000660", company_name: str = "SK하
                     try:
                         agent = agents[section]
                         if section == "market_index_analysis":
-                            # Check if data exists in cache
-                            if "report" in _market_analysis_cache:
-                                logger.info("Using cached market analysis")
-                                report = _market_analysis_cache["report"]
-                            else:
-                                logger.info("Generating new market analysis")
-                                report = await generate_market_report(agent, section, reference_date, logger, language)
-                                # Save to cache
-                                _market_analysis_cache["report"] = report
+                            # Generated once per run, then served from cache
+                            report = await _cached_market_report(agent, section, reference_date, logger, language)
                         else:
                             report = await generate_report(agent, section, company_name, company_code, reference_date, logger, language)
                         section_reports[section] = report
@@ -13,7 +13,7 @@ import hashlib
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiosqlite
 
@@ -297,6 +297,15 @@ CREATE TABLE IF NOT EXISTS ticker_semantic_facts (
 )
 """
 
+_DDL_EMBEDDING_CACHE = """
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    text_hash   TEXT PRIMARY KEY,                  -- embedding.text_hash(text, model)
+    model       TEXT NOT NULL,
+    embedding   BLOB NOT NULL,                     -- float32 bytes
+    created_at  TEXT DEFAULT (datetime('now', 'localtime'))
+)
+"""
+
 # Migration: add confidence_score column to persistent_insights if missing
 _PERSISTENT_INSIGHTS_NEW_COLUMNS = [
     ("confidence_score", "REAL DEFAULT 0.0"),
@@ -371,6 +380,7 @@ async def init_db(db_path: Optional[str] = None) -> None:
         # Self-improvement layer (Phase B)
         await db.execute(_DDL_INSIGHT_FEEDBACK)
         await db.execute(_DDL_TICKER_SEMANTIC_FACTS)
+        await db.execute(_DDL_EMBEDDING_CACHE)
         # Indexes
         await db.execute("CREATE INDEX IF NOT EXISTS idx_ra_ticker ON report_archive(ticker)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_ra_date ON report_archive(report_date)")
@@ -378,6 +388,7 @@ async def init_db(db_path: Optional[str] = None) -> None:
         await db.execute("CREATE INDEX IF NOT EXISTS idx_tph_ticker_date ON ticker_price_history(ticker, price_date)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_pi_chat ON persistent_insights(chat_id, created_at DESC)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_pi_created ON persistent_insights(created_at DESC)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_pi_superseded ON persistent_insights(superseded_by)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_wis_week ON weekly_insight_summary(week_start DESC)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_itu_insight ON insight_tool_usage(insight_id)")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_if_insight ON insight_feedback(insight_id)")
@@ -609,26 +620,40 @@ async def update_enrichment_performance(
 async def bulk_upsert_price_history(
     rows: List[Dict[str, Any]],
     db_path: Optional[str] = None,
+    performance: Optional[List[Tuple[int, Dict[str, Any]]]] = None,
 ) -> int:
     """
     Insert or replace daily close rows into ticker_price_history.
 
     Each row dict: {report_id, ticker, market, price_date, close, return_pct}
+    performance: optional [(report_id, perf)] written to report_enrichment in the
+    same transaction (see update_enrichment_performance for perf keys) — the
+    price tracker commits one ticker's history + aggregates at once.
     Returns count of rows written.
     """
-    if not rows:
+    if not rows and not performance:
         return 0
     path = db_path or str(ARCHIVE_DB_PATH)
     async with aiosqlite.connect(path) as db:
         await db.execute("PRAGMA foreign_keys=ON")
-        await db.executemany(
-            """
-            INSERT OR REPLACE INTO ticker_price_history
-                (report_id, ticker, market, price_date, close, return_pct)
-            VALUES (:report_id, :ticker, :market, :price_date, :close, :return_pct)
-            """,
-            rows,
-        )
+        if rows:
+            await db.executemany(
+                """
+                INSERT OR REPLACE INTO ticker_price_history
+                    (report_id, ticker, market, price_date, close, return_pct)
+                VALUES (:report_id, :ticker, :market, :price_date, :close, :return_pct)
+                """,
+                rows,
+            )
+        for report_id, perf in performance or []:
+            cols = [c for c, _ in _ENRICHMENT_PERF_COLUMNS if c in perf]
+            if not cols:
+                continue
+            set_clause = ", ".join(f"{c} = ?" for c in cols)
+            await db.execute(
+                f"UPDATE report_enrichment SET {set_clause} WHERE report_id = ?",
+                [perf[c] for c in cols] + [report_id],
+            )
         await db.commit()
     return len(rows)
 
@@ -13,8 +13,13 @@ from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+KIS_DAILY_PAGE_ROWS = 100   # FHKST03010100 returns at most 100 daily bars per call
+KIS_DAILY_MAX_PAGES = 10
+
 
 # ---------------------------------------------------------------------------
 # Market phase classifier
@@ -201,45 +206,88 @@ class KRDataEnricher:
 
     def _sync_fetch_daily(self, ticker: str, start_date: str, end_date: str) -> Dict[str, Dict]:
         """
-        Sync call to KIS daily chart API (FHKST03010100).
+        Daily bars for ticker, served from the local daily-bar store when enabled
+        (only missing days go to the KIS daily chart API).
         Returns { 'YYYY-MM-DD': {'close': float, 'low': float, 'high': float} }
         """
+        from cores import daily_bar_store
+
+        try:
+            if daily_bar_store.is_enabled():
+                df = daily_bar_store.get_daily_bars(
+                    ticker, start_date, end_date,
+                    fetcher=lambda start, end: self._sync_fetch_daily_frame(ticker, start, end),
+                )
+            else:
+                df = self._sync_fetch_daily_frame(ticker, start_date, end_date)
+        except Exception as e:
+            logger.error(f"[KR] KIS API fetch failed for {ticker}: {e}")
+            return {}
+
+        result = {}
+        for idx, row in df.iterrows():
+            try:
+                result[idx.strftime("%Y-%m-%d")] = {
+                    "close": float(row.get("Close", 0) or 0),
+                    "low": float(row.get("Low", 0) or 0),
+                    "high": float(row.get("High", 0) or 0),
+                }
+            except (ValueError, TypeError):
+                pass
+        return result
+
+    def _sync_fetch_daily_frame(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        Sync call to KIS daily chart API (FHKST03010100).
+        Returns a date-indexed OHLCV DataFrame; raises on API errors so the
+        daily-bar store can tell a failure from an empty range.
+        KIS answers at most KIS_DAILY_PAGE_ROWS bars (newest first) per call, so
+        longer ranges are paged backwards from end_date until start_date is reached.
+        """
         trading = self._get_trading()
         if not trading:
-            return {}
-        try:
-            api_url = "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
-            tr_id = "FHKST03010100"
+            raise RuntimeError("KIS trading unavailable")
+        api_url = "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
+        tr_id = "FHKST03010100"
+        start = start_date.replace("-", "")
+        page_end = end_date.replace("-", "")
+        rows = {}
+        for _ in range(KIS_DAILY_MAX_PAGES):
             params = {
                 "fid_cond_mrkt_div_code": "J",
                 "fid_input_iscd": ticker,
-                "fid_input_date_1": start_date.replace("-", ""),
-                "fid_input_date_2": end_date.replace("-", ""),
+                "fid_input_date_1": start,
+                "fid_input_date_2": page_end,
                 "fid_period_div_code": "D",
                 "fid_org_adj_prc": "0",
             }
             res = trading._request(api_url, tr_id, params)
             if not res.isOK():
                 logger.warning(f"[KR] KIS API error for {ticker}: {res.getErrorCode()} - {res.getErrorMessage()}")
-                return {}
+                raise RuntimeError(f"KIS API error {res.getErrorCode()}")
             items = res.getBody().output2 or []
-            result = {}
+            dates = []
             for item in items:
                 date_raw = item.get("stck_bsop_date", "")
                 if len(date_raw) == 8:
-                    date_str = f"{date_raw[:4]}-{date_raw[4:6]}-{date_raw[6:]}"
                     try:
-                        result[date_str] = {
-                            "close": float(item.get("stck_clpr", 0) or 0),
-                            "low": float(item.get("stck_lwpr", 0) or 0),
-                            "high": float(item.get("stck_hgpr", 0) or 0),
+                        rows[datetime.strptime(date_raw, "%Y%m%d")] = {
+                            "Open": float(item.get("stck_oprc", 0) or 0),
+                            "High": float(item.get("stck_hgpr", 0) or 0),
+                            "Low": float(item.get("stck_lwpr", 0) or 0),
+                            "Close": float(item.get("stck_clpr", 0) or 0),
+                            "Volume": float(item.get("acml_vol", 0) or 0),
+                            "Amount": float(item.get("acml_tr_pbmn", 0) or 0),
                         }
+                        dates.append(date_raw)
                     except (ValueError, TypeError):
                         pass
-            return result
-        except Exception as e:
-            logger.error(f"[KR] KIS API fetch failed for {ticker}: {e}")
-            return {}
+            if len(items) < KIS_DAILY_PAGE_ROWS or not dates or min(dates) <= start:
+                break
+            page_end = (datetime.strptime(min(dates), "%Y%m%d") - timedelta(days=1)).strftime("%Y%m%d")
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame.from_dict(rows, orient="index").sort_index()
 
     def _sync_fetch_kospi(self, start_date: str, end_date: str) -> Dict[str, float]:
         """Fetch KOSPI index daily close. Returns { 'YYYY-MM-DD': close }"""
@@ -3,20 +3,34 @@ embedding.py — OpenAI 임베딩 생성 + SQLite BLOB 직렬화.
 
 text-embedding-3-small (1536 dim float32) 사용.
 BLOB은 numpy float32 배열의 바이트 표현.
+
+BatchingEmbedder:
+  - 동시 요청을 짧은 창(max_delay) 동안 모아 다중 입력 embeddings.create 1회로 처리
+  - 백엔드(= AsyncOpenAI 클라이언트)는 api_key/db_path/이벤트 루프당 1개 재사용
+  - archive.db embedding_cache (sha256(model, text) → 벡터) — 같은 질문 재임베딩,
+    기존 인사이트 백필은 API 호출 0회
+  - FakeEmbeddingBackend: 텍스트 해시 기반 결정적 벡터 (오프라인 테스트용)
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
+import aiosqlite
 import numpy as np
 
+from .archive_db import ARCHIVE_DB_PATH, init_db
+
 logger = logging.getLogger(__name__)
 
 EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_DIM = 1536
 _MAX_INPUT_CHARS = 8000
+_MAX_BATCH = 64          # embeddings.create 1회당 입력 수
+_BATCH_WINDOW_SEC = 0.02
 
 
 def _get_openai_client(api_key: str):
@@ -25,24 +39,212 @@ def _get_openai_client(api_key: str):
     return openai.AsyncOpenAI(api_key=api_key)
 
 
-async def embed_text(text: str, api_key: str) -> Optional[bytes]:
+def text_hash(text: str, model: str = EMBEDDING_MODEL) -> str:
+    return hashlib.sha256(f"{model}\n{text}".encode("utf-8")).hexdigest()
+
+
+def _clean(text: Optional[str]) -> Optional[str]:
+    if not text or not text.strip():
+        return None
+    return text[:_MAX_INPUT_CHARS]
+
+
+# ---------------------------------------------------------------------------
+# Backends — embed(texts) → 같은 순서의 벡터 리스트 (실패 항목은 None)
+# ---------------------------------------------------------------------------
+
+class OpenAIEmbeddingBackend:
+    model = EMBEDDING_MODEL
+
+    def __init__(self, api_key: str):
+        self._client = _get_openai_client(api_key)
+
+    async def embed(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        resp = await self._client.embeddings.create(model=self.model, input=list(texts))
+        out: List[Optional[np.ndarray]] = [None] * len(texts)
+        for item in resp.data:
+            out[item.index] = np.asarray(item.embedding, dtype=np.float32)
+        return out
+
+
+class FakeEmbeddingBackend:
+    """sha256(text) 시드 난수 벡터 — 같은 텍스트는 항상 같은 벡터. calls 에 배치 기록."""
+
+    model = "fake-embedding"
+
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        self.dim = dim
+        self.calls: List[List[str]] = []
+
+    async def embed(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        self.calls.append(list(texts))
+        return [self.vector(t) for t in texts]
+
+    def vector(self, text: str) -> np.ndarray:
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+        return np.random.default_rng(seed).standard_normal(self.dim).astype(np.float32)
+
+
+# ---------------------------------------------------------------------------
+# Batching + persistent cache
+# ---------------------------------------------------------------------------
+
+class BatchingEmbedder:
+    """
+    embed(text) / embed_many(texts) → float32 BLOB (또는 None).
+
+    같은 텍스트의 동시 요청은 하나의 future 를 공유한다. 모인 배치는 캐시를
+    한 번에 조회하고, 미스만 max_batch 단위로 백엔드에 보낸 뒤 캐시에 기록한다.
+    api_calls / cache_hits 는 호출 통계.
+    """
+
+    def __init__(
+        self,
+        backend,
+        db_path: Optional[str] = None,
+        max_batch: int = _MAX_BATCH,
+        max_delay: float = _BATCH_WINDOW_SEC,
+    ):
+        self.backend = backend
+        self.db_path = db_path
+        self.max_batch = max(1, int(max_batch))
+        self.max_delay = max_delay
+        self.api_calls = 0
+        self.cache_hits = 0
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._queue: List[Tuple[str, str]] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._db_ready = False
+
+    async def embed(self, text: Optional[str]) -> Optional[bytes]:
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts: Sequence[Optional[str]]) -> List[Optional[bytes]]:
+        loop = asyncio.get_running_loop()
+        futures: List[Optional[asyncio.Future]] = []
+        for text in texts:
+            text = _clean(text)
+            if text is None:
+                futures.append(None)
+                continue
+            key = text_hash(text, self.backend.model)
+            fut = self._pending.get(key)
+            if fut is None:
+                fut = self._pending[key] = loop.create_future()
+                self._enqueue(key, text)
+            futures.append(fut)
+        # shield: 한 호출자가 취소돼도 같은 future 를 기다리는 다른 호출자는 영향 없음
+        return [await asyncio.shield(f) if f is not None else None for f in futures]
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _enqueue(self, key: str, text: str) -> None:
+        self._queue.append((key, text))
+        if len(self._queue) >= self.max_batch:
+            batch, self._queue = self._queue, []
+            self._spawn(self._run_batch(batch))
+        elif self._timer is None:
+            self._timer = self._spawn(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.max_delay)
+        self._timer = None
+        batch, self._queue = self._queue, []
+        if batch:
+            await self._run_batch(batch)
+
+    async def _run_batch(self, batch: List[Tuple[str, str]]) -> None:
+        results: Dict[str, bytes] = {}
+        try:
+            results.update(await self._cache_get([k for k, _ in batch]))
+            self.cache_hits += len(results)
+            misses = [(k, t) for k, t in batch if k not in results]
+            fresh: Dict[str, bytes] = {}
+            for i in range(0, len(misses), self.max_batch):
+                chunk = misses[i:i + self.max_batch]
+                self.api_calls += 1
+                vecs = await self.backend.embed([t for _, t in chunk])
+                for (key, _), vec in zip(chunk, vecs):
+                    if vec is None or vec.shape != (EMBEDDING_DIM,):
+                        logger.warning(f"Unexpected embedding shape {getattr(vec, 'shape', None)}")
+                        continue
+                    fresh[key] = results[key] = np.asarray(vec, dtype=np.float32).tobytes()
+            await self._cache_put(fresh)
+        except Exception as e:
+            logger.warning(f"embedding batch failed ({len(batch)} texts): {e}")
+        finally:
+            for key, _ in batch:
+                fut = self._pending.pop(key, None)
+                if fut is not None and not fut.done():
+                    fut.set_result(results.get(key))
+
+    async def _ensure_db(self) -> None:
+        if not self._db_ready:
+            await init_db(self.db_path)
+            self._db_ready = True
+
+    def _path(self) -> str:
+        return self.db_path or str(ARCHIVE_DB_PATH)
+
+    async def _cache_get(self, keys: List[str]) -> Dict[str, bytes]:
+        try:
+            await self._ensure_db()
+            placeholders = ",".join("?" for _ in keys)
+            async with aiosqlite.connect(self._path()) as db:
+                cur = await db.execute(
+                    f"SELECT text_hash, embedding FROM embedding_cache "
+                    f"WHERE text_hash IN ({placeholders})",
+                    keys,
+                )
+                return {r[0]: r[1] for r in await cur.fetchall()}
+        except Exception as e:
+            logger.warning(f"embedding cache read failed: {e}")
+            return {}
+
+    async def _cache_put(self, fresh: Dict[str, bytes]) -> None:
+        if not fresh:
+            return
+        try:
+            async with aiosqlite.connect(self._path()) as db:
+                await db.executemany(
+                    "INSERT OR IGNORE INTO embedding_cache (text_hash, model, embedding) "
+                    "VALUES (?, ?, ?)",
+                    [(k, self.backend.model, v) for k, v in fresh.items()],
+                )
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"embedding cache write failed: {e}")
+
+
+# (api_key, db_path) → (loop, embedder). 클라이언트/future 는 루프에 묶이므로 루프가
+# 바뀌면 새로 만든다 (봇은 단일 루프 → 사실상 프로세스당 1개).
+_embedders: Dict[Tuple[str, Optional[str]], Tuple[asyncio.AbstractEventLoop, BatchingEmbedder]] = {}
+
+
+def get_embedder(api_key: str, db_path: Optional[str] = None) -> BatchingEmbedder:
+    loop = asyncio.get_running_loop()
+    entry = _embedders.get((api_key, db_path))
+    if entry is None or entry[0] is not loop:
+        entry = (loop, BatchingEmbedder(OpenAIEmbeddingBackend(api_key), db_path=db_path))
+        _embedders[(api_key, db_path)] = entry
+    return entry[1]
+
+
+async def embed_text(text: str, api_key: str, db_path: Optional[str] = None) -> Optional[bytes]:
     """
     Embed a single text into a 1536-dim float32 BLOB.
     Returns None on empty input or failure (caller stores NULL).
+    Goes through the shared BatchingEmbedder (pooled client + embedding_cache).
     """
     if not text or not text.strip() or not api_key:
         return None
     try:
-        client = _get_openai_client(api_key)
-        resp = await client.embeddings.create(
-            model=EMBEDDING_MODEL,
-            input=text[:_MAX_INPUT_CHARS],
-        )
-        vec = np.asarray(resp.data[0].embedding, dtype=np.float32)
-        if vec.shape != (EMBEDDING_DIM,):
-            logger.warning(f"Unexpected embedding shape {vec.shape}")
-            return None
-        return vec.tobytes()
+        return await get_embedder(api_key, db_path).embed(text)
     except Exception as e:
         logger.warning(f"embed_text failed: {e}")
         return None
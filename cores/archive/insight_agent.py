@@ -28,6 +28,8 @@ from mcp_agent.agents.agent import Agent
 from mcp_agent.workflows.llm.augmented_llm import RequestParams
 from mcp_agent.workflows.llm.augmented_llm_anthropic import AnthropicAugmentedLLM
 
+from cores.llm.governor import governed_generate_str
+
 _KST = timezone(timedelta(hours=9))
 
 from . import persistent_insights as pi_store
@@ -74,7 +76,9 @@ class InsightAgent:
     async def _build_retrieval_context(self, question: str) -> Dict[str, Any]:
         api_key = self._api_key or load_api_key()
         self._api_key = api_key
-        q_emb = await embed_text(question, api_key) if api_key else None
+        q_emb = (
+            await embed_text(question, api_key, db_path=self.db_path) if api_key else None
+        )
 
         engine = QueryEngine(db_path=self.db_path, model=self.model)
 
@@ -323,7 +327,8 @@ class InsightAgent:
                         f"## 컨텍스트 (누적 인사이트 + 리포트)\n{context_str}\n\n"
                         "위 컨텍스트와 JSON 형식만으로 답하세요."
                     )
-                    response_text = await llm.generate_str(
+                    response_text = await governed_generate_str(
+                        llm,
                         message=user_msg,
                         request_params=RequestParams(
                             model=self.model,
@@ -368,11 +373,13 @@ class InsightAgent:
 
         # 5. Embedding for key_takeaways (fire-and-forget 성격)
         api_key = self._api_key or load_api_key()
-        takeaway_text = (
-            " \n".join(parsed["key_takeaways"])
-            or parsed["answer"][:500]
+        takeaway_text = pi_store.insight_embedding_text(
+            parsed["key_takeaways"], parsed["answer"],
+        )
+        emb_blob = (
+            await embed_text(takeaway_text, api_key, db_path=self.db_path)
+            if api_key else None
         )
-        emb_blob = await embed_text(takeaway_text, api_key) if api_key else None
 
         # 6. Save
         insight_id: Optional[int] = None
@@ -4,15 +4,17 @@ persistent_insights.py — /insight 대화로 축적되는 영구 인사이트 
 핵심 API:
   save_insight(...)                — 신규 인사이트 저장 (+ tool_usage 기록)
   fts_candidates(query, limit)     — FTS5 후보 추출
-  search_insights(query, q_emb, …) — FTS 후보 → 임베딩 재랭킹 top-N
+  search_insights(query, q_emb, …) — FTS 후보 ∪ 벡터 인덱스 top-k → 융합 재랭킹 top-N
   recent_weekly_summaries(n)       — 최근 n주 요약
   check_and_increment_quota(...)   — 일일 쿼터 체크 & 증가
   mark_superseded(ids, summary_id) — 주간 요약이 커버한 raw 표시
+  backfill_embeddings(embedder)    — embedding 이 NULL 인 인사이트 채우기 (캐시 경유)
   increment_cost(...)              — insight_cost_daily UPSERT
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass
@@ -24,6 +26,7 @@ import numpy as np
 
 from .archive_db import ARCHIVE_DB_PATH, _sanitize_fts_query, init_db
 from .embedding import decode_embedding
+from . import vector_index
 
 logger = logging.getLogger(__name__)
 
@@ -120,7 +123,11 @@ async def save_insight(
                     (insight_id, tool),
                 )
         await db.commit()
-        return int(insight_id) if insight_id is not None else -1
+    if insight_id is not None and embedding:
+        index = vector_index.loaded_index(path)
+        if index is not None:
+            index.add(insight_id, embedding)
+    return int(insight_id) if insight_id is not None else -1
 
 
 async def fts_candidates(
@@ -175,6 +182,24 @@ async def _get_confidence_scores(
     return {r[0]: float(r[1]) for r in rows}
 
 
+async def _fetch_insights(
+    insight_ids: List[int], db_path: Optional[str] = None,
+) -> List[InsightRow]:
+    """id 순서대로 InsightRow 조회 (없는 id 는 생략)."""
+    if not insight_ids:
+        return []
+    path = db_path or str(ARCHIVE_DB_PATH)
+    placeholders = ",".join("?" for _ in insight_ids)
+    async with aiosqlite.connect(path) as db:
+        db.row_factory = aiosqlite.Row
+        cur = await db.execute(
+            f"SELECT * FROM persistent_insights WHERE id IN ({placeholders})",
+            insight_ids,
+        )
+        by_id = {r["id"]: _row_to_insight(r) for r in await cur.fetchall()}
+    return [by_id[i] for i in insight_ids if i in by_id]
+
+
 async def search_insights(
     query: str,
     query_embedding: Optional[bytes],
@@ -183,19 +208,50 @@ async def search_insights(
     db_path: Optional[str] = None,
     confidence_weight: float = 0.15,
     drop_below: float = -0.6,
+    semantic_k: int = 50,
+    semantic_floor: float = 0.3,
 ) -> List[InsightRow]:
     """
-    FTS top-50 → 임베딩 재랭킹 + confidence_score 가중치 → top-limit.
+    FTS top-50 ∪ 벡터 인덱스 top-semantic_k → 코사인 + confidence_score 가중치 → top-limit.
 
     final_score = cosine_sim + confidence_weight * confidence_score
                   (confidence_score ∈ [-1, 1])
 
     Insights with confidence_score below drop_below are filtered out entirely
     (heavily downvoted answers shouldn't pollute future retrievals).
+
+    The vector index (cores.archive.vector_index) finds semantically close
+    insights that share no FTS tokens with the query. Those index-only hits
+    must reach cosine >= semantic_floor — without an FTS match there is no
+    other relevance gate. Without query_embedding the FTS order is kept.
     """
-    candidates = await fts_candidates(
+    q_vec = decode_embedding(query_embedding) if query_embedding else None
+    fts_task = fts_candidates(
         query, limit=50, exclude_superseded=exclude_superseded, db_path=db_path
     )
+    semantic: List[Tuple[int, float]] = []
+    index = None
+    if q_vec is None:
+        candidates = await fts_task
+    else:
+        index = vector_index.get_index(db_path)
+        candidates, synced = await asyncio.gather(
+            fts_task, index.sync(), return_exceptions=True,
+        )
+        if isinstance(candidates, Exception):
+            logger.warning(f"persistent_insights FTS failed: {candidates}")
+            candidates = []
+        if isinstance(synced, Exception):
+            logger.warning(f"insight vector index sync failed: {synced}")
+        semantic = [
+            (iid, sim)
+            for iid, sim in index.search(q_vec, semantic_k, exclude_superseded)
+            if sim >= semantic_floor
+        ]
+        fts_ids = {c.id for c in candidates}
+        candidates = candidates + await _fetch_insights(
+            [iid for iid, _ in semantic if iid not in fts_ids], db_path=db_path,
+        )
     if not candidates:
         return []
 
@@ -206,22 +262,20 @@ async def search_insights(
     candidates = [c for c in candidates if cs_map.get(c.id, 0.0) > drop_below]
     if not candidates:
         return []
-    if not query_embedding or len(candidates) <= limit:
-        return candidates[:limit]
-
-    q_vec = decode_embedding(query_embedding)
     if q_vec is None:
         return candidates[:limit]
-    q_norm = float(np.linalg.norm(q_vec)) or 1e-9
+
+    sims = dict(semantic)
+    sims.update(index.similarities(q_vec, [c.id for c in candidates if c.id not in sims]))
+    q_unit = vector_index.normalize(q_vec)
 
     scored: List[Tuple[float, InsightRow]] = []
     for c in candidates:
-        cv = decode_embedding(c.embedding)
-        if cv is None:
-            sim = 0.0
-        else:
-            cn = float(np.linalg.norm(cv)) or 1e-9
-            sim = float(np.dot(q_vec, cv) / (q_norm * cn))
+        sim = sims.get(c.id)
+        if sim is None:
+            # 인덱스 밖 (sync 실패 / 방금 다른 프로세스가 쓴 행) — 직접 계산
+            cv = vector_index.normalize(decode_embedding(c.embedding))
+            sim = float(np.dot(q_unit, cv)) if cv is not None and q_unit is not None else 0.0
         boost = confidence_weight * cs_map.get(c.id, 0.0)
         scored.append((sim + boost, c))
     scored.sort(key=lambda x: -x[0])
@@ -302,7 +356,64 @@ async def mark_superseded(
             (summary_id, *insight_ids),
         )
         await db.commit()
-        return cur.rowcount
+    index = vector_index.loaded_index(path)
+    if index is not None:
+        index.deactivate(insight_ids)
+    return cur.rowcount
+
+
+def insight_embedding_text(key_takeaways: List[str], answer: str) -> str:
+    """저장 임베딩 대상 텍스트 — InsightAgent 저장 경로와 동일 규칙 (캐시 키 일치)."""
+    return " \n".join(key_takeaways or []) or (answer or "")[:500]
+
+
+async def backfill_embeddings(
+    embedder,
+    batch_size: int = 64,
+    db_path: Optional[str] = None,
+) -> int:
+    """
+    embedding 이 NULL 인 인사이트를 BatchingEmbedder 로 채운다. 채운 행 수 반환.
+
+    embedding_cache 를 거치므로 이미 임베딩된 적 있는 텍스트는 API 호출 없이 채워진다.
+    """
+    path = db_path or str(ARCHIVE_DB_PATH)
+    filled = 0
+    last_id = 0
+    while True:
+        async with aiosqlite.connect(path) as db:
+            db.row_factory = aiosqlite.Row
+            cur = await db.execute(
+                """
+                SELECT id, key_takeaways, answer, superseded_by
+                FROM persistent_insights
+                WHERE embedding IS NULL AND id > ?
+                ORDER BY id
+                LIMIT ?
+                """,
+                (last_id, batch_size),
+            )
+            rows = await cur.fetchall()
+        if not rows:
+            return filled
+        last_id = rows[-1]["id"]
+        blobs = await embedder.embed_many([
+            insight_embedding_text(_loads(r["key_takeaways"], []), r["answer"])
+            for r in rows
+        ])
+        updates = [(b, r["id"]) for r, b in zip(rows, blobs) if b]
+        if updates:
+            async with aiosqlite.connect(path) as db:
+                await db.executemany(
+                    "UPDATE persistent_insights SET embedding=? WHERE id=?", updates,
+                )
+                await db.commit()
+            index = vector_index.loaded_index(path)
+            if index is not None:
+                superseded = {r["id"] for r in rows if r["superseded_by"] is not None}
+                for blob, insight_id in updates:
+                    index.add(insight_id, blob, active=insight_id not in superseded)
+            filled += len(updates)
 
 
 async def increment_cost(
@@ -2,7 +2,12 @@
 price_tracker.py — Long-term price history tracker for PRISM archived tickers.
 
 Fetches daily closes from report_date to today, stores in ticker_price_history,
-and computes performance aggregates in report_enrichment:
+and computes performance aggregates in report_enrichment.
+Pending reports are grouped by (market, ticker): one bar fetch from the earliest
+report date serves every report of that ticker, and each ticker is written in
+one transaction — the refresh scales with unique tickers, not report count.
+
+Aggregates:
   - return_180d, return_365d, return_current
   - max_return_since / max_return_date  (best return ever achieved since report)
   - max_drawdown / max_drawdown_date    (worst drawdown from entry price)
@@ -21,7 +26,7 @@ import asyncio
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -166,6 +171,99 @@ class PriceTracker:
         from cores.archive.archive_db import ARCHIVE_DB_PATH  # type: ignore[import]
         self.db_path = db_path or str(ARCHIVE_DB_PATH)
 
+    async def _fetch_closes(
+        self, market: str, ticker: str, start_date: str,
+    ) -> Dict[str, float]:
+        today = datetime.today().strftime("%Y-%m-%d")
+        loop = asyncio.get_running_loop()
+        fetch = _fetch_kr_daily if market == "kr" else _fetch_us_daily
+        return await loop.run_in_executor(None, fetch, ticker, start_date, today)
+
+    async def update_ticker(
+        self,
+        market: str,
+        ticker: str,
+        reports: List[Dict[str, Any]],
+        dry_run: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Refresh every report of one ticker from a single daily-close series.
+
+        reports: [{id, report_date, price_at_analysis}, ...]
+        Fetches closes from the earliest report_date to today once, computes
+        aggregates per report, and persists history rows + aggregates in one
+        transaction unless dry_run=True.
+
+        Returns per-report summary dicts: {report_id, ticker, rows_written, aggregates}
+        (in input order). A report without a usable price_at_analysis (NULL / 0) is
+        skipped on its own and its dict carries an "error" key; the rest of the
+        ticker's reports are still updated.
+        """
+        earliest = min(r["report_date"] for r in reports)
+        closes = await self._fetch_closes(market, ticker, earliest)
+
+        if not closes:
+            logger.warning(f"[{market.upper()}] No price data for {ticker} from {earliest}")
+            return [
+                {"report_id": r["id"], "ticker": ticker, "rows_written": 0, "aggregates": {}}
+                for r in reports
+            ]
+
+        updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        history_rows: List[Dict[str, Any]] = []
+        performance: List[Tuple[int, Dict[str, Any]]] = []
+        results: List[Dict[str, Any]] = []
+        for r in reports:
+            report_date = r["report_date"]
+            price_at_report = r["price_at_analysis"]
+            if not price_at_report or price_at_report <= 0:
+                logger.warning(f"[{market.upper()}] {ticker} {report_date} (report {r['id']}): "
+                               f"invalid price_at_analysis={price_at_report!r}, skipped")
+                results.append({
+                    "report_id": r["id"],
+                    "ticker": ticker,
+                    "rows_written": 0,
+                    "aggregates": {},
+                    "error": f"invalid price_at_analysis: {price_at_report!r}",
+                })
+                continue
+            # Build rows for ticker_price_history
+            rows = [
+                {
+                    "report_id": r["id"],
+                    "ticker": ticker,
+                    "market": market,
+                    "price_date": d,
+                    "close": p,
+                    "return_pct": round((p - price_at_report) / price_at_report * 100, 4),
+                }
+                for d, p in closes.items()
+                if d > report_date
+            ]
+            aggregates = _compute_aggregates(closes, report_date, price_at_report)
+            aggregates["last_price_update"] = updated_at
+            history_rows.extend(rows)
+            performance.append((r["id"], aggregates))
+            results.append({
+                "report_id": r["id"],
+                "ticker": ticker,
+                "rows_written": len(rows),
+                "aggregates": aggregates,
+            })
+            if dry_run:
+                logger.info(
+                    f"[DRY-RUN] {ticker} {report_date}: {len(rows)} rows, "
+                    f"return_current={aggregates.get('return_current')}%, "
+                    f"max_return={aggregates.get('max_return_since')}%, "
+                    f"max_drawdown={aggregates.get('max_drawdown')}%"
+                )
+
+        if not dry_run:
+            from cores.archive.archive_db import bulk_upsert_price_history  # type: ignore[import]
+            await bulk_upsert_price_history(history_rows, self.db_path, performance=performance)
+
+        return results
+
     async def update_report(
         self,
         report_id: int,
@@ -177,65 +275,16 @@ class PriceTracker:
     ) -> Dict[str, Any]:
         """
         Fetch daily closes from report_date to today, compute aggregates,
-        and persist to DB unless dry_run=True.
+        and persist to DB unless dry_run=True (single-report update_ticker).
 
         Returns summary dict: {report_id, ticker, rows_written, aggregates}
         """
-        today = datetime.today().strftime("%Y-%m-%d")
-
-        loop = asyncio.get_running_loop()
-        if market == "kr":
-            closes = await loop.run_in_executor(
-                None, _fetch_kr_daily, ticker, report_date, today
-            )
-        else:
-            closes = await loop.run_in_executor(
-                None, _fetch_us_daily, ticker, report_date, today
-            )
-
-        if not closes:
-            logger.warning(f"[{market.upper()}] No price data for {ticker} from {report_date}")
-            return {"report_id": report_id, "ticker": ticker, "rows_written": 0, "aggregates": {}}
-
-        # Build rows for ticker_price_history
-        history_rows = [
-            {
-                "report_id": report_id,
-                "ticker": ticker,
-                "market": market,
-                "price_date": d,
-                "close": p,
-                "return_pct": round((p - price_at_report) / price_at_report * 100, 4),
-            }
-            for d, p in closes.items()
-            if d > report_date
-        ]
-
-        aggregates = _compute_aggregates(closes, report_date, price_at_report)
-        aggregates["last_price_update"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        if not dry_run:
-            from cores.archive.archive_db import (  # type: ignore[import]
-                bulk_upsert_price_history,
-                update_enrichment_performance,
-            )
-            rows_written = await bulk_upsert_price_history(history_rows, self.db_path)
-            await update_enrichment_performance(report_id, aggregates, self.db_path)
-        else:
-            rows_written = len(history_rows)
-            logger.info(
-                f"[DRY-RUN] {ticker} {report_date}: {rows_written} rows, "
-                f"return_current={aggregates.get('return_current')}%, "
-                f"max_return={aggregates.get('max_return_since')}%, "
-                f"max_drawdown={aggregates.get('max_drawdown')}%"
-            )
-
-        return {
-            "report_id": report_id,
-            "ticker": ticker,
-            "rows_written": rows_written,
-            "aggregates": aggregates,
-        }
+        results = await self.update_ticker(
+            market, ticker,
+            [{"id": report_id, "report_date": report_date, "price_at_analysis": price_at_report}],
+            dry_run=dry_run,
+        )
+        return results[0]
 
     async def run(
         self,
@@ -265,36 +314,41 @@ class PriceTracker:
         logger.info(f"Updating price history for {len(reports)} reports "
                     f"(concurrency={concurrency}, dry_run={dry_run})")
 
+        groups: Dict[Tuple[str, str], List[Dict]] = {}
+        for r in reports:
+            groups.setdefault((r["market"], r["ticker"]), []).append(r)
+        logger.info(f"{len(reports)} reports across {len(groups)} tickers")
+
         sem = asyncio.Semaphore(concurrency)
         processed = 0
         errors = 0
         results = []
 
-        async def _update_one(r: Dict) -> None:
+        async def _update_group(market_: str, ticker_: str, group: List[Dict]) -> None:
             nonlocal processed, errors
             async with sem:
                 try:
-                    result = await self.update_report(
-                        report_id=r["id"],
-                        ticker=r["ticker"],
-                        market=r["market"],
-                        report_date=r["report_date"],
-                        price_at_report=r["price_at_analysis"],
-                        dry_run=dry_run,
-                    )
-                    results.append(result)
-                    processed += 1
-                    logger.info(
-                        f"[{r['market'].upper()}] {r['ticker']} {r['report_date']}: "
-                        f"{result['rows_written']} rows, "
-                        f"return_current={result['aggregates'].get('return_current')}%"
+                    group_results = await self.update_ticker(
+                        market_, ticker_, group, dry_run=dry_run,
                     )
+                    failed = [res for res in group_results if "error" in res]
+                    results.extend(res for res in group_results if "error" not in res)
+                    processed += len(group_results) - len(failed)
+                    errors += len(failed)
+                    for r, result in zip(group, group_results):
+                        if "error" in result:
+                            continue
+                        logger.info(
+                            f"[{market_.upper()}] {ticker_} {r['report_date']}: "
+                            f"{result['rows_written']} rows, "
+                            f"return_current={result['aggregates'].get('return_current')}%"
+                        )
                 except Exception as e:
-                    errors += 1
-                    logger.error(f"Failed to update {r['ticker']} {r['report_date']}: {e}",
+                    errors += len(group)
+                    logger.error(f"Failed to update {ticker_} ({len(group)} reports): {e}",
                                  exc_info=True)
 
-        await asyncio.gather(*[_update_one(r) for r in reports])
+        await asyncio.gather(*[_update_group(m, t, g) for (m, t), g in groups.items()])
 
         summary = {
             "processed": processed,
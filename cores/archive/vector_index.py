@@ -0,0 +1,216 @@
+"""
+vector_index.py — persistent_insights 임베딩의 상주(in-memory) 벡터 인덱스.
+
+search_insights 는 FTS top-50 만 재랭킹했다 (쿼리마다 후보 BLOB 디코드 + norm 계산).
+FTS 토큰이 하나도 겹치지 않는 의미상 유사 인사이트는 찾을 수 없었다.
+
+이 모듈은 db_path 별로 정규화된 float32 행렬 (n, EMBEDDING_DIM) 을 메모리에 유지한다:
+  - 최초 검색 시 전체 로드, 이후 id > max_id 행만 증분 추가 (PK 범위 스캔 — BLOB 재로드 없음)
+  - save_insight / mark_superseded 가 같은 프로세스 인덱스를 즉시 갱신
+  - 다른 프로세스(주간 압축 cron 등)의 superseded 표시는 RECONCILE_SECONDS 마다
+    idx_pi_superseded 커버링 인덱스로 재동기화
+  - 같은 주기에 id <= max_id 인데 인덱스에 없는 행(다른 프로세스가 NULL 이던 임베딩을
+    나중에 채운 경우)을 id 목록으로 찾아 그 행 BLOB 만 읽어 추가
+  - top-k 는 정확한 brute-force 내적 (matrix @ q). 수만 건 × 1536 차원에서도 수 ms —
+    PQ/HNSW 근사 인덱스는 이 규모에서 이득 대비 의존성/정확도 비용이 커서 두지 않았다.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import aiosqlite
+import numpy as np
+
+from .archive_db import ARCHIVE_DB_PATH
+from .embedding import EMBEDDING_DIM, decode_embedding
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_SECONDS = 300.0
+_INITIAL_CAPACITY = 256
+
+
+def normalize(vec: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """L2 정규화 (float32). 영벡터/None 이면 None."""
+    if vec is None:
+        return None
+    v = np.asarray(vec, dtype=np.float32)
+    n = float(np.linalg.norm(v))
+    if n == 0.0:
+        return None
+    return v / n
+
+
+class InsightVectorIndex:
+    """정규화 임베딩 행렬 + id/활성(미-superseded) 마스크. 용량 2배 증가로 O(1) 분할상환 추가."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.dim = EMBEDDING_DIM
+        self._matrix = np.zeros((_INITIAL_CAPACITY, self.dim), dtype=np.float32)
+        self._ids = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._active = np.zeros(_INITIAL_CAPACITY, dtype=bool)
+        self._pos: Dict[int, int] = {}
+        self._undecodable: set = set()   # 디코드 불가 임베딩 id — reconcile 때마다 다시 읽지 않게
+        self.size = 0
+        self.max_id = 0
+        self._reconciled_at: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # 변경
+    # ------------------------------------------------------------------
+    def _grow(self, needed: int) -> None:
+        cap = len(self._ids)
+        if needed <= cap:
+            return
+        while cap < needed:
+            cap *= 2
+        matrix = np.zeros((cap, self.dim), dtype=np.float32)
+        matrix[: self.size] = self._matrix[: self.size]
+        ids = np.zeros(cap, dtype=np.int64)
+        ids[: self.size] = self._ids[: self.size]
+        active = np.zeros(cap, dtype=bool)
+        active[: self.size] = self._active[: self.size]
+        self._matrix, self._ids, self._active = matrix, ids, active
+
+    def add(self, insight_id: int, embedding: Optional[bytes], active: bool = True) -> bool:
+        """임베딩 1건 추가. 디코드 불가/중복이면 False.
+
+        max_id 는 sync 만 전진시킨다 — 쓰기 훅이 먼저 추가해도 다른 프로세스가 그 사이에
+        넣은 행을 건너뛰지 않는다 (다음 sync 가 중복은 무시).
+        """
+        insight_id = int(insight_id)
+        if insight_id in self._pos:
+            return False
+        vec = normalize(decode_embedding(embedding))
+        if vec is None:
+            if embedding is not None:
+                self._undecodable.add(insight_id)
+            return False
+        self._grow(self.size + 1)
+        i = self.size
+        self._matrix[i] = vec
+        self._ids[i] = insight_id
+        self._active[i] = active
+        self._pos[insight_id] = i
+        self.size += 1
+        return True
+
+    def deactivate(self, insight_ids: Iterable[int]) -> None:
+        for insight_id in insight_ids:
+            i = self._pos.get(int(insight_id))
+            if i is not None:
+                self._active[i] = False
+
+    # ------------------------------------------------------------------
+    # DB 동기화
+    # ------------------------------------------------------------------
+    async def sync(self, force_reconcile: bool = False) -> None:
+        """새 행(id > max_id) 추가 + 주기적으로 superseded 상태 / 뒤늦게 채워진 임베딩 재동기화."""
+        now = time.monotonic()
+        reconcile = (
+            force_reconcile
+            or self._reconciled_at is None
+            or now - self._reconciled_at >= RECONCILE_SECONDS
+        )
+        async with aiosqlite.connect(self.db_path) as db:
+            cur = await db.execute(
+                """
+                SELECT id, embedding, superseded_by
+                FROM persistent_insights
+                WHERE id > ? AND embedding IS NOT NULL
+                ORDER BY id
+                """,
+                (self.max_id,),
+            )
+            new_rows = await cur.fetchall()
+            superseded = None
+            backfilled = []
+            if reconcile:
+                cur = await db.execute(
+                    "SELECT id FROM persistent_insights WHERE superseded_by IS NOT NULL"
+                )
+                superseded = {r[0] for r in await cur.fetchall()}
+                # 레코드 헤더만 보는 NULL 검사 — BLOB 본문은 빠진 id 만 읽는다
+                cur = await db.execute(
+                    "SELECT id FROM persistent_insights WHERE id <= ? AND embedding IS NOT NULL",
+                    (self.max_id,),
+                )
+                missing = [
+                    r[0] for r in await cur.fetchall()
+                    if r[0] not in self._pos and r[0] not in self._undecodable
+                ]
+                for start in range(0, len(missing), 500):
+                    chunk = missing[start:start + 500]
+                    cur = await db.execute(
+                        "SELECT id, embedding, superseded_by FROM persistent_insights "
+                        f"WHERE id IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                    backfilled.extend(await cur.fetchall())
+        for insight_id, blob, superseded_by in backfilled:
+            self.add(insight_id, blob, active=superseded_by is None)
+        for insight_id, blob, superseded_by in new_rows:
+            self.add(insight_id, blob, active=superseded_by is None)
+            self.max_id = max(self.max_id, int(insight_id))
+        if superseded is not None:
+            n = self.size
+            self._active[:n] = ~np.isin(self._ids[:n], np.fromiter(superseded, dtype=np.int64))
+            self._reconciled_at = now
+        if new_rows or backfilled:
+            logger.debug(
+                f"insight vector index: +{len(new_rows)} new, +{len(backfilled)} backfilled rows "
+                f"(size={self.size})"
+            )
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def search(
+        self, query_vec: np.ndarray, k: int, exclude_superseded: bool = True,
+    ) -> List[Tuple[int, float]]:
+        """코사인 top-k → [(insight_id, sim)] (sim 내림차순)."""
+        q = normalize(query_vec)
+        if q is None or self.size == 0 or k <= 0:
+            return []
+        sims = self._matrix[: self.size] @ q
+        if exclude_superseded:
+            sims = np.where(self._active[: self.size], sims, -np.inf)
+        k = min(k, self.size)
+        top = np.argpartition(-sims, k - 1)[:k]
+        top = top[np.argsort(-sims[top], kind="stable")]
+        return [(int(self._ids[i]), float(sims[i])) for i in top if np.isfinite(sims[i])]
+
+    def similarities(self, query_vec: np.ndarray, insight_ids: Iterable[int]) -> Dict[int, float]:
+        """지정 id 들의 코사인 (인덱스에 없는 id 는 생략)."""
+        q = normalize(query_vec)
+        if q is None:
+            return {}
+        pairs = [(iid, self._pos[iid]) for iid in insight_ids if iid in self._pos]
+        if not pairs:
+            return {}
+        sims = self._matrix[[p for _, p in pairs]] @ q
+        return {iid: float(s) for (iid, _), s in zip(pairs, sims)}
+
+
+_indexes: Dict[str, InsightVectorIndex] = {}
+
+
+def get_index(db_path: Optional[str] = None) -> InsightVectorIndex:
+    path = db_path or str(ARCHIVE_DB_PATH)
+    index = _indexes.get(path)
+    if index is None:
+        index = _indexes[path] = InsightVectorIndex(path)
+    return index
+
+
+def loaded_index(db_path: Optional[str] = None) -> Optional[InsightVectorIndex]:
+    """이미 로드된 인덱스만 반환 (쓰기 경로 훅용 — 없으면 다음 검색이 로드)."""
+    return _indexes.get(db_path or str(ARCHIVE_DB_PATH))
+
+
+def reset_indexes() -> None:
+    _indexes.clear()
@@ -10,6 +10,7 @@ import re
 from typing import Any, Dict
 
 from cores.openai_error_logging import log_openai_error
+from cores.llm.governor import governed_generate_str
 
 logger = logging.getLogger(__name__)
 
@@ -125,7 +126,8 @@ Return ONLY the English company name, nothing else. No quotes, no explanation.
         llm = await agent.attach_llm(OpenAIAugmentedLLM)
 
         # Generate translation
-        english_name = await llm.generate_str(
+        english_name = await governed_generate_str(
+            llm,
             message=f"Translate this Korean company name to English: {korean_name}",
             request_params=RequestParams(
                 model="gpt-5.4-mini",
@@ -0,0 +1,454 @@
+"""
+daily_bar_store.py — Persistent local daily-bar (OHLCV) store for KR/US equities.
+
+KR/US counterpart of prism-btc collector/store.py's klines table. Callers ask for a
+(ticker, date range) window through get_daily_bars(); the store serves it from disk
+and only fetches the trading days it has not seen yet (older head / newer tail).
+
+Tables:
+  daily_bars          — one row per (market, ticker, adjusted, date)
+  daily_bar_coverage  — fetched date span per (market, ticker, adjusted)
+  daily_bar_snapshots — sessions stored as complete whole-market snapshots
+                        (closed-session frames of cores/market_snapshot_cache)
+
+Coverage semantics:
+  first_date / last_date  contiguous span already fetched; last_date never goes
+                          past the last CLOSED session (yesterday in market time),
+                          so today's intraday bar is always refreshed.
+  open_date / open_fetched_at
+                          when today's bar was last fetched; re-fetched after
+                          OPEN_SESSION_TTL_SEC.
+
+The tail fetch overlaps last_date by one day. If the stored close on that day no
+longer matches (split / rights adjustment rewrote adjusted history), the requested
+window is re-fetched in full and replaces the ticker's bars in one transaction;
+if that re-fetch fails the old bars are kept.
+
+The head fetch overlaps the earliest stored bar the same way. first_date only
+moves back as far as the earliest bar actually returned, so a source that caps
+rows per call (KIS daily chart: 100) cannot mark a truncated head as covered; the
+next call fetches the rest. Only an answer that holds nothing before the overlap
+bar proves the range is before listing and moves first_date to the requested
+start. An empty answer (KRX and FDR both down) leaves coverage unchanged so the
+next call retries.
+
+When the upstream fetch fails, whatever is on disk is returned (slightly stale)
+instead of raising.
+
+Env:
+  DAILY_BAR_STORE_ENABLED  "false" disables the store (callers fetch directly)
+  DAILY_BAR_DB_PATH        override DB location (default: <project>/daily_bars.db)
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_DB_PATH = PROJECT_ROOT / "daily_bars.db"
+
+BAR_COLUMNS = ("Open", "High", "Low", "Close", "Volume", "Amount")
+OPEN_SESSION_TTL_SEC = 900
+_MARKET_TZ = {"KR": "Asia/Seoul", "US": "America/New_York"}
+_ADJUST_TOLERANCE = 1e-6
+
+CREATE_BARS = """
+CREATE TABLE IF NOT EXISTS daily_bars (
+    market    TEXT    NOT NULL,
+    ticker    TEXT    NOT NULL,
+    adjusted  INTEGER NOT NULL,
+    date      TEXT    NOT NULL,
+    open      REAL,
+    high      REAL,
+    low       REAL,
+    close     REAL,
+    volume    REAL,
+    amount    REAL,
+    PRIMARY KEY (market, ticker, adjusted, date)
+) WITHOUT ROWID
+"""
+
+CREATE_COVERAGE = """
+CREATE TABLE IF NOT EXISTS daily_bar_coverage (
+    market           TEXT    NOT NULL,
+    ticker           TEXT    NOT NULL,
+    adjusted         INTEGER NOT NULL,
+    first_date       TEXT    NOT NULL,
+    last_date        TEXT    NOT NULL,
+    open_date        TEXT,
+    open_fetched_at  REAL,
+    PRIMARY KEY (market, ticker, adjusted)
+)
+"""
+
+CREATE_SNAPSHOTS = """
+CREATE TABLE IF NOT EXISTS daily_bar_snapshots (
+    market    TEXT    NOT NULL,
+    adjusted  INTEGER NOT NULL,
+    date      TEXT    NOT NULL,
+    tickers   INTEGER NOT NULL,
+    PRIMARY KEY (market, adjusted, date)
+)
+"""
+
+UPSERT_BAR = """
+INSERT INTO daily_bars (market, ticker, adjusted, date, open, high, low, close, volume, amount)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(market, ticker, adjusted, date) DO UPDATE SET
+    open   = excluded.open,
+    high   = excluded.high,
+    low    = excluded.low,
+    close  = excluded.close,
+    volume = excluded.volume,
+    amount = excluded.amount
+"""
+
+UPSERT_COVERAGE = """
+INSERT INTO daily_bar_coverage (market, ticker, adjusted, first_date, last_date, open_date, open_fetched_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(market, ticker, adjusted) DO UPDATE SET
+    first_date      = excluded.first_date,
+    last_date       = excluded.last_date,
+    open_date       = excluded.open_date,
+    open_fetched_at = excluded.open_fetched_at
+"""
+
+# (start YYYYMMDD, end YYYYMMDD) -> DataFrame indexed by date with BAR_COLUMNS (subset ok)
+Fetcher = Callable[[str, str], pd.DataFrame]
+
+
+def is_enabled() -> bool:
+    return os.getenv("DAILY_BAR_STORE_ENABLED", "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _get_db_path(db_path=None) -> Path:
+    if db_path is not None:
+        return Path(db_path)
+    return Path(os.getenv("DAILY_BAR_DB_PATH") or DEFAULT_DB_PATH)
+
+
+def get_connection(db_path=None) -> sqlite3.Connection:
+    """Return an open SQLite connection with WAL mode enabled."""
+    path = _get_db_path(db_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(CREATE_BARS)
+    conn.execute(CREATE_COVERAGE)
+    conn.execute(CREATE_SNAPSHOTS)
+    conn.commit()
+    return conn
+
+
+def _norm_date(value) -> str:
+    """'YYYY-MM-DD' / 'YYYYMMDD' / datetime → 'YYYYMMDD'."""
+    if hasattr(value, "strftime"):
+        return value.strftime("%Y%m%d")
+    return str(value).replace("-", "")[:8]
+
+
+def _shift(date_str: str, days: int) -> str:
+    return (datetime.strptime(date_str, "%Y%m%d") + timedelta(days=days)).strftime("%Y%m%d")
+
+
+def _market_today(market: str) -> str:
+    return datetime.now(ZoneInfo(_MARKET_TZ.get(market, "Asia/Seoul"))).strftime("%Y%m%d")
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        return None if pd.isna(value) else float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def upsert_bars(conn: sqlite3.Connection, market: str, ticker: str, df: pd.DataFrame,
+                adjusted: bool = True) -> int:
+    """Upsert daily bars from a date-indexed OHLCV frame. Returns rows written."""
+    if df is None or df.empty:
+        return 0
+    cols = {c: (c if c in df.columns else None) for c in BAR_COLUMNS}
+    records = []
+    for idx, row in df.iterrows():
+        records.append((
+            market, ticker, int(adjusted), _norm_date(idx),
+            *(_to_float(row[c]) if c else None for c in cols.values()),
+        ))
+    with conn:
+        conn.executemany(UPSERT_BAR, records)
+    return len(records)
+
+
+def upsert_market_snapshot(conn: sqlite3.Connection, market: str, date, df: pd.DataFrame,
+                           adjusted: bool = True, final: bool = False) -> int:
+    """Upsert one session's whole-market frame (index=ticker) as daily bars.
+
+    The latest session's adjusted and raw bars are identical, so a same-day
+    snapshot is valid for either key. Coverage is not touched: the next tail
+    fetch simply overwrites these rows. final=True records the session in
+    daily_bar_snapshots (closed session, never re-downloaded).
+    """
+    if df is None or df.empty:
+        return 0
+    date_str = _norm_date(date)
+    records = []
+    for ticker, row in df.iterrows():
+        records.append((
+            market, str(ticker), int(adjusted), date_str,
+            *(_to_float(row[c]) if c in df.columns else None for c in BAR_COLUMNS),
+        ))
+    with conn:
+        conn.executemany(UPSERT_BAR, records)
+        if final:
+            conn.execute(
+                "INSERT OR REPLACE INTO daily_bar_snapshots (market, adjusted, date, tickers) VALUES (?, ?, ?, ?)",
+                (market, int(adjusted), date_str, len(records)),
+            )
+    return len(records)
+
+
+def snapshot_dates(conn: sqlite3.Connection, market: str, adjusted: bool = True) -> set:
+    """Sessions already stored as final whole-market snapshots."""
+    rows = conn.execute(
+        "SELECT date FROM daily_bar_snapshots WHERE market=? AND adjusted=?",
+        (market, int(adjusted)),
+    ).fetchall()
+    return {r[0] for r in rows}
+
+
+def read_market_snapshot(conn: sqlite3.Connection, market: str, date,
+                         adjusted: bool = True) -> Optional[pd.DataFrame]:
+    """A final whole-market snapshot (index=ticker) as stored; None if the session is not stored."""
+    date_str = _norm_date(date)
+    if not conn.execute(
+        "SELECT 1 FROM daily_bar_snapshots WHERE market=? AND adjusted=? AND date=?",
+        (market, int(adjusted), date_str),
+    ).fetchone():
+        return None
+    rows = conn.execute(
+        "SELECT ticker, open, high, low, close, volume, amount FROM daily_bars "
+        "WHERE market=? AND adjusted=? AND date=? ORDER BY ticker",
+        (market, int(adjusted), date_str),
+    ).fetchall()
+    df = pd.DataFrame(rows, columns=("Ticker",) + BAR_COLUMNS).set_index("Ticker")
+    return df.dropna(axis=1, how="all")
+
+
+def read_market_closes(conn: sqlite3.Connection, market: str, dates: Iterable,
+                       adjusted: bool = True) -> pd.DataFrame:
+    """Stored closes for the given sessions as a date×ticker matrix."""
+    wanted = sorted({_norm_date(d) for d in dates})
+    if not wanted:
+        return pd.DataFrame()
+    rows = conn.execute(
+        "SELECT date, ticker, close FROM daily_bars "
+        "WHERE market=? AND adjusted=? AND date BETWEEN ? AND ?",
+        (market, int(adjusted), wanted[0], wanted[-1]),
+    ).fetchall()
+    if not rows:
+        return pd.DataFrame()
+    df = pd.DataFrame(rows, columns=["date", "ticker", "close"])
+    df = df[df["date"].isin(wanted)]
+    matrix = df.pivot(index="date", columns="ticker", values="close")
+    matrix.index = pd.to_datetime(matrix.index, format="%Y%m%d")
+    matrix.index.name = None
+    matrix.columns.name = None
+    return matrix.sort_index()
+
+
+def read_bars(conn: sqlite3.Connection, market: str, ticker: str, start_date, end_date,
+              adjusted: bool = True) -> pd.DataFrame:
+    """Return stored bars in [start_date, end_date] as a krx_data_client-style frame."""
+    rows = conn.execute(
+        "SELECT date, open, high, low, close, volume, amount FROM daily_bars "
+        "WHERE market=? AND ticker=? AND adjusted=? AND date BETWEEN ? AND ? ORDER BY date",
+        (market, ticker, int(adjusted), _norm_date(start_date), _norm_date(end_date)),
+    ).fetchall()
+    if not rows:
+        return pd.DataFrame()
+    df = pd.DataFrame(rows, columns=("date",) + BAR_COLUMNS)
+    df.index = pd.to_datetime(df.pop("date"), format="%Y%m%d")
+    df.index.name = None
+    return df.dropna(axis=1, how="all")
+
+
+def latest_closes(tickers: Iterable[str], on_or_before, market: str = "KR",
+                  adjusted: bool = True, db_path=None) -> Dict[str, float]:
+    """Most recent stored close per ticker on or before a date (stale-data fallback)."""
+    date_str = _norm_date(on_or_before)
+    result = {}
+    conn = get_connection(db_path)
+    try:
+        for ticker in tickers:
+            row = conn.execute(
+                "SELECT close FROM daily_bars WHERE market=? AND ticker=? AND adjusted=? "
+                "AND date<=? AND close IS NOT NULL ORDER BY date DESC LIMIT 1",
+                (market, ticker, int(adjusted), date_str),
+            ).fetchone()
+            if row:
+                result[ticker] = float(row[0])
+    finally:
+        conn.close()
+    return result
+
+
+def _get_coverage(conn, market, ticker, adjusted):
+    return conn.execute(
+        "SELECT first_date, last_date, open_date, open_fetched_at FROM daily_bar_coverage "
+        "WHERE market=? AND ticker=? AND adjusted=?",
+        (market, ticker, int(adjusted)),
+    ).fetchone()
+
+
+def _earliest_bar(conn, market, ticker, adjusted) -> Optional[str]:
+    row = conn.execute(
+        "SELECT MIN(date) FROM daily_bars WHERE market=? AND ticker=? AND adjusted=?",
+        (market, ticker, int(adjusted)),
+    ).fetchone()
+    return row[0] if row else None
+
+
+def _replace_ticker(conn, market, ticker, adjusted, df: pd.DataFrame, coverage: tuple) -> None:
+    """Swap all stored bars + coverage of a ticker for a freshly fetched window, atomically."""
+    cols = {c: (c if c in df.columns else None) for c in BAR_COLUMNS}
+    records = [
+        (market, ticker, int(adjusted), _norm_date(idx), *(_to_float(row[c]) if c else None for c in cols.values()))
+        for idx, row in df.iterrows()
+    ]
+    with conn:
+        conn.execute("DELETE FROM daily_bars WHERE market=? AND ticker=? AND adjusted=?",
+                     (market, ticker, int(adjusted)))
+        conn.executemany(UPSERT_BAR, records)
+        conn.execute(UPSERT_COVERAGE, (market, ticker, int(adjusted), *coverage))
+
+
+def _stored_close(conn, market, ticker, adjusted, date_str) -> Optional[float]:
+    row = conn.execute(
+        "SELECT close FROM daily_bars WHERE market=? AND ticker=? AND adjusted=? AND date=?",
+        (market, ticker, int(adjusted), date_str),
+    ).fetchone()
+    return row[0] if row else None
+
+
+def _history_rewritten(conn, market, ticker, adjusted, date_str, fetched: pd.DataFrame) -> bool:
+    """True if the fetched close on an already-stored day differs (adjusted history changed)."""
+    stored = _stored_close(conn, market, ticker, adjusted, date_str)
+    if stored is None or fetched is None or fetched.empty or "Close" not in fetched.columns:
+        return False
+    for idx, close in fetched["Close"].items():
+        if _norm_date(idx) == date_str:
+            new = _to_float(close)
+            return new is not None and abs(new - stored) > _ADJUST_TOLERANCE * max(abs(stored), 1.0)
+    return False
+
+
+def get_daily_bars(ticker: str, start_date, end_date, fetcher: Fetcher, market: str = "KR",
+                   adjusted: bool = True, db_path=None, today: Optional[str] = None) -> pd.DataFrame:
+    """Serve a (ticker, date range) window from disk, fetching only missing days.
+
+    Args:
+        ticker: Stock code / symbol
+        start_date, end_date: 'YYYYMMDD' or 'YYYY-MM-DD' (inclusive)
+        fetcher: fetcher(start, end) → date-indexed OHLCV frame, used for missing spans
+        market: "KR" or "US" (selects the session calendar day)
+        adjusted: adjusted-price series (stored separately from raw)
+        db_path: DB override (tests)
+        today: market-local 'YYYYMMDD' override (tests)
+
+    Returns:
+        DataFrame indexed by date with Open/High/Low/Close/Volume/Amount (available subset);
+        empty if nothing is stored and the fetch failed.
+    """
+    start = _norm_date(start_date)
+    end = _norm_date(end_date)
+    today = today or _market_today(market)
+    last_closed = _shift(today, -1)
+
+    conn = get_connection(db_path)
+    try:
+        cov = _get_coverage(conn, market, ticker, adjusted)
+        first, last, open_date, open_at = cov if cov else (None, None, None, None)
+
+        segments = []  # (seg_start, seg_end, kind)
+        if cov is None:
+            segments.append((start, end, "full"))
+        else:
+            if start < first:
+                # overlap the earliest stored bar: an answer with only that bar = before listing
+                earliest = _earliest_bar(conn, market, ticker, adjusted)
+                segments.append((start, earliest or _shift(first, -1), "head"))
+            if end > last:
+                open_fresh = (
+                    end >= today and last >= last_closed and open_date == today
+                    and open_at is not None and time.time() - open_at < OPEN_SESSION_TTL_SEC
+                )
+                if not open_fresh:
+                    segments.append((last, end, "tail"))  # overlap last_date for the adjustment check
+
+        for seg_start, seg_end, kind in segments:
+            try:
+                fetched = fetcher(seg_start, seg_end)
+            except Exception as e:
+                logger.warning(f"[DAILY-BAR-STORE] {market}:{ticker} fetch {seg_start}~{seg_end} failed: {e}; "
+                               f"serving stored bars")
+                continue
+
+            if kind == "tail" and _history_rewritten(conn, market, ticker, adjusted, last, fetched):
+                logger.info(f"[DAILY-BAR-STORE] {market}:{ticker} adjusted history changed; re-fetching {start}~{end}")
+                try:
+                    refetched = fetcher(start, end)
+                except Exception as e:
+                    refetched = None
+                    logger.warning(f"[DAILY-BAR-STORE] {market}:{ticker} re-fetch failed: {e}")
+                if refetched is None or refetched.empty:
+                    # keep the old bars until a full re-fetch succeeds (tail is retried next call)
+                    continue
+                first, last = _covered_from(start, refetched), min(end, last_closed)
+                if end >= today:
+                    open_date, open_at = today, time.time()
+                _replace_ticker(conn, market, ticker, adjusted, refetched,
+                                (first, last, open_date, open_at))
+                break
+
+            if fetched is None or fetched.empty:
+                # No answer (upstream outage or a real gap) — leave coverage untouched so
+                # the next call retries; only a non-empty answer extends first/last.
+                continue
+
+            upsert_bars(conn, market, ticker, fetched, adjusted)
+            returned_from = _covered_from(seg_start, fetched)
+            if kind == "head" and returned_from >= seg_end:
+                returned_from = seg_start   # nothing before the overlap bar: pre-listing range
+            first = min(first, returned_from) if first else returned_from
+            new_last = min(seg_end, last_closed)
+            last = max(last, new_last) if last else new_last
+            if seg_end >= today:
+                open_date, open_at = today, time.time()
+            _save_coverage(conn, market, ticker, adjusted, first, last, open_date, open_at)
+
+        return read_bars(conn, market, ticker, start, end, adjusted)
+    finally:
+        conn.close()
+
+
+def _covered_from(seg_start: str, fetched: pd.DataFrame) -> str:
+    """Earliest date a fetch answer covers: its first bar, or seg_start if only weekend days precede it."""
+    returned_from = _norm_date(fetched.index.min())
+    if returned_from > seg_start and len(pd.bdate_range(seg_start, _shift(returned_from, -1))) == 0:
+        return seg_start
+    return returned_from
+
+
+def _save_coverage(conn, market, ticker, adjusted, first, last, open_date, open_at) -> None:
+    with conn:
+        conn.execute(UPSERT_COVERAGE, (market, ticker, int(adjusted), first, last, open_date, open_at))
@@ -24,7 +24,9 @@ if TYPE_CHECKING:
 _configured: bool = False
 
 
-def spec_from_mcp_agent(agent: Any, *, model: str, params: LLMParams) -> AgentSpec:
+def spec_from_mcp_agent(
+    agent: Any, *, model: str, params: LLMParams, cacheable: bool = False
+) -> AgentSpec:
     """Build an AgentSpec from any object that duck-types an mcp_agent Agent.
 
     Reads:
@@ -38,6 +40,7 @@ def spec_from_mcp_agent(agent: Any, *, model: str, params: LLMParams) -> AgentSp
         agent:  Any object exposing .name, .instruction, and optionally .server_names.
         model:  Model identifier string (e.g. "gpt-5.4-mini").
         params: LLMParams instance with max_tokens / reasoning_effort / etc.
+        cacheable: Allow the response cache to replay this completion.
 
     Returns:
         A frozen AgentSpec ready to pass to any LLMBackend.run().
@@ -49,6 +52,7 @@ def spec_from_mcp_agent(agent: Any, *, model: str, params: LLMParams) -> AgentSp
         model=model,
         mcp_servers=tuple(server_names),
         params=params,
+        cacheable=cacheable,
     )
 
 
@@ -116,6 +120,11 @@ def get_llm_backend(registry: "McpServerRegistry") -> LLMBackend:
     - ``"openai_agents"`` → OpenAIAgentsBackend(registry)
     - anything else       → NotImplementedError (mcp_agent stays inline in callers)
 
+    The backend is wrapped by ``governor.GovernedLLMBackend`` (shared RPM/TPM
+    budget + usage metering) and then by ``response_cache.with_response_cache``
+    so specs marked ``cacheable`` are replayed from the local response cache
+    without spending budget (LLM_RESPONSE_CACHE=false disables).
+
     Args:
         registry: McpServerRegistry built by load_mcp_registry().
 
@@ -128,8 +137,10 @@ def get_llm_backend(registry: "McpServerRegistry") -> LLMBackend:
     backend_name = os.environ.get("LLM_BACKEND", "mcp_agent")
     if backend_name == "openai_agents":
         from cores.llm.backends.openai_agents_backend import OpenAIAgentsBackend
+        from cores.llm.governor import GovernedLLMBackend
+        from cores.llm.response_cache import with_response_cache
 
-        return OpenAIAgentsBackend(registry)
+        return with_response_cache(GovernedLLMBackend(OpenAIAgentsBackend(registry)))
     raise NotImplementedError(
         f"get_llm_backend: LLM_BACKEND={backend_name!r} is not handled here. "
         "The mcp_agent default path remains inline in the calling module."
@@ -0,0 +1,483 @@
+"""
+Process-wide LLM rate governor with token accounting.
+
+Every subsystem used to pick its own LLM parallelism (analysis sections,
+translation fan-out, bot commands) without coordinating against the provider's
+RPM/TPM limits, so the report pipeline defaulted to fully serial. The governor
+is the shared gate in front of every LLM call:
+
+- per-model budgets: requests/min and tokens/min, refilled continuously
+  (token bucket, capacity = one minute of quota);
+- priority classes: ``interactive`` (Telegram bot commands) is served before
+  ``batch``, and batch may only use ``batch_share`` of each budget so a user
+  command never waits behind a saturated batch;
+- usage metering: a call is admitted on an estimate (prompt chars / 4) and
+  reconciled against ``LLMResult.usage`` when it finishes;
+- optional cross-process budgets: with ``LLM_GOVERNOR_DB`` set, grants are
+  written to a shared SQLite ledger and budgets are computed over the last
+  minute of that ledger, so the orchestrator, trackers and bot share one quota
+  (ledger reads/writes run in a worker thread, never on the event loop).
+
+mcp_agent ``generate_str`` calls are reconciled from the AugmentedLLM token
+counter when the app context has one; otherwise TPM is charged on the estimate
+only and enforced exactly just for GovernedLLMBackend calls.
+
+Models without a configured limit are only metered (never delayed).
+
+Entry points:
+    get_governor()                    process singleton configured from env
+    GovernedLLMBackend(inner)         LLMBackend decorator (cores/llm/ports seam)
+    governed_generate_str(llm, ...)   same gate for mcp_agent AugmentedLLM calls
+    llm_priority("interactive")       context manager / set_default_priority()
+
+Env:
+    LLM_GOVERNOR_RPM / LLM_GOVERNOR_TPM   default per-model limits (0 = unlimited)
+    LLM_GOVERNOR_LIMITS                   per-model overrides "model=rpm:tpm,..."
+    LLM_GOVERNOR_BATCH_SHARE              share of each budget batch may use (0.8)
+    LLM_GOVERNOR_DB                       SQLite ledger path (cross-process mode)
+
+Only stdlib + cores.llm imports (same import-safety rule as agent_bridge).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from cores.llm.ports import AgentSpec, LLMBackend, LLMResult
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+_PRIORITY_RANK = {INTERACTIVE: 0, BATCH: 1}
+
+DEFAULT_BATCH_SHARE = 0.8
+_POLL_SEC = 0.5            # re-check interval while waiting on a shared (SQLite) budget
+_CHARS_PER_TOKEN = 4
+
+_default_priority = BATCH
+_priority_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("llm_priority", default=None)
+
+
+def set_default_priority(priority: str) -> None:
+    """Process default priority class (the Telegram bot sets ``interactive``)."""
+    global _default_priority
+    if priority not in _PRIORITY_RANK:
+        raise ValueError(f"unknown LLM priority: {priority!r}")
+    _default_priority = priority
+
+
+def current_priority() -> str:
+    return _priority_var.get() or _default_priority
+
+
+@contextlib.contextmanager
+def llm_priority(priority: str):
+    """Run the enclosed calls (and tasks created inside) under *priority*."""
+    if priority not in _PRIORITY_RANK:
+        raise ValueError(f"unknown LLM priority: {priority!r}")
+    token = _priority_var.set(priority)
+    try:
+        yield
+    finally:
+        _priority_var.reset(token)
+
+
+def estimate_tokens(*parts: Any) -> int:
+    """Rough prompt size (chars / 4) used to admit a call before usage is known."""
+    chars = sum(len(p if isinstance(p, str) else json.dumps(p, ensure_ascii=False, default=str))
+                for p in parts if p is not None)
+    return max(1, chars // _CHARS_PER_TOKEN)
+
+
+def usage_tokens(usage: Optional[dict]) -> Tuple[int, int]:
+    """(input, output) tokens from an LLMResult.usage dict (Responses or Chat naming)."""
+    if not usage:
+        return 0, 0
+    inp = usage.get("input_tokens", usage.get("prompt_tokens", 0)) or 0
+    out = usage.get("output_tokens", usage.get("completion_tokens", 0)) or 0
+    if not inp and not out:
+        inp = usage.get("total_tokens", 0) or 0
+    return int(inp), int(out)
+
+
+@dataclass(frozen=True)
+class ModelLimit:
+    rpm: float = 0.0   # requests per period; 0 = unlimited
+    tpm: float = 0.0   # tokens per period; 0 = unlimited
+
+
+def parse_limits(spec: str) -> Dict[str, ModelLimit]:
+    """``"gpt-5.4-mini=500:200000,gpt-5.5=100:30000"`` -> {model: ModelLimit}."""
+    limits = {}
+    for item in (spec or "").split(","):
+        if "=" not in item:
+            continue
+        model, values = item.split("=", 1)
+        rpm, _, tpm = values.partition(":")
+        limits[model.strip()] = ModelLimit(float(rpm or 0), float(tpm or 0))
+    return limits
+
+
+class _MemoryBudget:
+    """In-process token buckets per model: (requests, tokens) left, refilled per period."""
+
+    def __init__(self, period: float, clock: Callable[[], float]):
+        self.period = period
+        self._clock = clock
+        self._levels: Dict[str, list] = {}   # model -> [requests, tokens, updated_at]
+
+    def available(self, model: str, limit: ModelLimit) -> Tuple[float, float]:
+        now = self._clock()
+        level = self._levels.setdefault(model, [limit.rpm, limit.tpm, now])
+        elapsed = max(0.0, now - level[2])
+        level[0] = min(limit.rpm, level[0] + elapsed * limit.rpm / self.period)
+        level[1] = min(limit.tpm, level[1] + elapsed * limit.tpm / self.period)
+        level[2] = now
+        return level[0], level[1]
+
+    def consume(self, model: str, requests: float, tokens: float) -> None:
+        level = self._levels[model]
+        level[0] -= requests
+        level[1] -= tokens   # may go negative after reconciliation: a debt refilled over time
+
+
+class _SqliteBudget:
+    """Shared sliding-window budget over a SQLite grant ledger (cross-process mode)."""
+
+    def __init__(self, db_path: str, period: float, clock: Callable[[], float]):
+        self.db_path = db_path
+        self.period = period
+        self._clock = clock
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_governor_ledger ("
+                    "ts REAL NOT NULL, model TEXT NOT NULL, priority TEXT NOT NULL, "
+                    "requests INTEGER NOT NULL, tokens INTEGER NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_governor_ledger "
+                             "ON llm_governor_ledger (model, ts)")
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def available(self, model: str, limit: ModelLimit) -> Tuple[float, float]:
+        since = self._clock() - self.period
+        conn = self._connect()
+        try:
+            used_req, used_tok = conn.execute(
+                "SELECT COALESCE(SUM(requests), 0), COALESCE(SUM(tokens), 0) "
+                "FROM llm_governor_ledger WHERE model = ? AND ts > ?", (model, since)
+            ).fetchone()
+        finally:
+            conn.close()
+        return limit.rpm - used_req, limit.tpm - used_tok
+
+    def consume(self, model: str, requests: float, tokens: float, priority: str = BATCH) -> None:
+        now = self._clock()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("INSERT INTO llm_governor_ledger VALUES (?, ?, ?, ?, ?)",
+                             (now, model, priority, int(requests), int(tokens)))
+                conn.execute("DELETE FROM llm_governor_ledger WHERE ts < ?", (now - 10 * self.period,))
+        finally:
+            conn.close()
+
+
+@dataclass
+class Grant:
+    """One admitted call; the governor reconciles ``estimate`` with ``usage``."""
+
+    model: str
+    priority: str
+    estimate: int
+    waited: float = 0.0
+    usage: Optional[dict] = None
+
+
+@dataclass
+class _Meter:
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    unmetered: int = 0          # calls that finished without usage (estimate kept)
+    waits: int = 0
+    wait_sec: float = 0.0
+    by_priority: Dict[str, int] = field(default_factory=dict)
+
+
+class LLMGovernor:
+    """Admission control for LLM calls: per-model budgets + priority queue + metering."""
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, ModelLimit]] = None,
+        default_limit: Optional[ModelLimit] = None,
+        batch_share: float = DEFAULT_BATCH_SHARE,
+        db_path: Optional[str] = None,
+        period: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.limits = dict(limits or {})
+        self.default_limit = default_limit or ModelLimit()
+        self.batch_share = min(1.0, max(0.0, float(batch_share)))
+        self.period = float(period)
+        # the shared ledger needs wall-clock time; the in-process buckets any monotonic clock
+        self._budget = (_SqliteBudget(db_path, self.period, time.time) if db_path
+                        else _MemoryBudget(self.period, clock))
+        self._shared = bool(db_path)
+        self._clock = clock
+        self._seq = itertools.count()
+        # asyncio primitives bind to one event loop: one condition + wait queues per loop,
+        # budgets and meters shared by all of them (a thread lock guards the buckets)
+        self._loops: Dict[asyncio.AbstractEventLoop, Tuple[asyncio.Condition, Dict[str, list]]] = {}
+        self._lock = threading.Lock()
+        self._meters: Dict[str, _Meter] = {}
+
+    def limit_for(self, model: str) -> ModelLimit:
+        return self.limits.get(model, self.default_limit)
+
+    def _meter(self, model: str) -> _Meter:
+        return self._meters.setdefault(model, _Meter())
+
+    def _loop_state(self) -> Tuple[asyncio.Condition, Dict[str, list]]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._loops.get(loop)
+            if state is None:
+                for closed in [lp for lp in self._loops if lp.is_closed()]:
+                    del self._loops[closed]
+                state = self._loops[loop] = (asyncio.Condition(), {})
+        return state
+
+    async def _available(self, model: str, limit: ModelLimit) -> Tuple[float, float]:
+        if self._shared:
+            return await asyncio.to_thread(self._budget.available, model, limit)
+        with self._lock:
+            return self._budget.available(model, limit)
+
+    async def _consume(self, model: str, requests: float, tokens: float, priority: str) -> None:
+        if self._shared:
+            await asyncio.to_thread(self._budget.consume, model, requests, tokens, priority)
+        else:
+            with self._lock:
+                self._budget.consume(model, requests, tokens)
+
+    async def _admissible(self, model: str, limit: ModelLimit, priority: str, estimate: int) -> Tuple[bool, float]:
+        """(admit now?, seconds until it might be) for the head-of-queue waiter."""
+        reserve = 0.0 if priority == INTERACTIVE else 1.0 - self.batch_share
+        req_left, tok_left = await self._available(model, limit)
+        need_req = need_tok = 0.0
+        if limit.rpm > 0:
+            held_back = min(reserve * limit.rpm, max(0.0, limit.rpm - 1.0))   # keep one request admissible
+            need_req = max(0.0, 1.0 - (req_left - held_back))
+        if limit.tpm > 0:
+            cost = min(estimate, limit.tpm * (self.batch_share if reserve else 1.0))
+            need_tok = max(0.0, cost - (tok_left - reserve * limit.tpm))
+        if need_req <= 0 and need_tok <= 0:
+            return True, 0.0
+        wait = max(need_req * self.period / limit.rpm if limit.rpm > 0 else 0.0,
+                   need_tok * self.period / limit.tpm if limit.tpm > 0 else 0.0)
+        return False, min(wait, _POLL_SEC) if self._shared else wait
+
+    async def acquire(self, model: str, estimate: int, priority: Optional[str] = None) -> Grant:
+        """Wait until *model* has budget for one call of ~*estimate* tokens."""
+        priority = priority or current_priority()
+        grant = Grant(model=model, priority=priority, estimate=int(estimate))
+        limit = self.limit_for(model)
+        if limit.rpm <= 0 and limit.tpm <= 0:
+            return grant
+
+        cond, queues = self._loop_state()
+        entry = (_PRIORITY_RANK.get(priority, 1), next(self._seq))
+        queue = queues.setdefault(model, [])
+        started = self._clock()
+        async with cond:
+            heapq.heappush(queue, entry)
+            try:
+                while True:
+                    timeout = None
+                    if queue[0] == entry:
+                        ok, timeout = await self._admissible(model, limit, priority, grant.estimate)
+                        if ok:
+                            break
+                    try:
+                        await asyncio.wait_for(cond.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                queue.remove(entry)
+                heapq.heapify(queue)
+                cond.notify_all()
+            await self._consume(model, 1, grant.estimate, priority)
+        grant.waited = self._clock() - started
+        if grant.waited > 0.01:
+            meter = self._meter(model)
+            meter.waits += 1
+            meter.wait_sec += grant.waited
+            logger.info(f"[LLM_GOVERNOR] {model} {priority} call waited {grant.waited:.1f}s for budget")
+        return grant
+
+    def record(self, grant: Grant, usage: Optional[dict] = None) -> None:
+        """Meter a finished call and charge the difference between usage and estimate."""
+        delta = self._meter_usage(grant, usage)
+        if delta:
+            self._charge(grant, delta)
+
+    async def arecord(self, grant: Grant, usage: Optional[dict] = None) -> None:
+        """``record`` for coroutines: the shared-ledger correction is written off the event loop."""
+        delta = self._meter_usage(grant, usage)
+        if delta and self._shared:
+            await asyncio.to_thread(self._charge, grant, delta)
+        elif delta:
+            self._charge(grant, delta)
+
+    def _meter_usage(self, grant: Grant, usage: Optional[dict]) -> int:
+        """Update the meters; returns the token correction still to charge (0 = none)."""
+        usage = usage if usage is not None else grant.usage
+        meter = self._meter(grant.model)
+        meter.requests += 1
+        meter.by_priority[grant.priority] = meter.by_priority.get(grant.priority, 0) + 1
+        inp, out = usage_tokens(usage)
+        if not inp and not out:
+            meter.unmetered += 1
+            return 0
+        meter.input_tokens += inp
+        meter.output_tokens += out
+        return inp + out - grant.estimate if self.limit_for(grant.model).tpm > 0 else 0
+
+    def _charge(self, grant: Grant, delta: int) -> None:
+        if self._shared:
+            self._budget.consume(grant.model, 0, delta, grant.priority)
+        else:
+            with self._lock:
+                self._budget.available(grant.model, self.limit_for(grant.model))   # bring the bucket up to date first
+                self._budget.consume(grant.model, 0, delta)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, model: str, estimate: int, priority: Optional[str] = None):
+        """``async with governor.slot(model, est) as grant:`` — set ``grant.usage`` if known."""
+        grant = await self.acquire(model, estimate, priority)
+        try:
+            yield grant
+        finally:
+            await self.arecord(grant)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-model usage counters for logs / run summaries."""
+        return {
+            model: {
+                "requests": m.requests,
+                "input_tokens": m.input_tokens,
+                "output_tokens": m.output_tokens,
+                "total_tokens": m.input_tokens + m.output_tokens,
+                "unmetered": m.unmetered,
+                "waits": m.waits,
+                "wait_sec": round(m.wait_sec, 3),
+                "by_priority": dict(m.by_priority),
+            }
+            for model, m in self._meters.items()
+        }
+
+
+class GovernedLLMBackend(LLMBackend):
+    """LLMBackend decorator: every run() is admitted by the governor and metered.
+
+    ``name`` mirrors the wrapped backend so logs/config checks are unchanged.
+    """
+
+    def __init__(self, inner: LLMBackend, governor: Optional[LLMGovernor] = None) -> None:
+        self.inner = inner
+        self.governor = governor or get_governor()
+        self.name = inner.name
+
+    async def run(self, spec: AgentSpec, user_input: Any) -> LLMResult:
+        grant = await self.governor.acquire(spec.model, estimate_tokens(spec.instructions, user_input))
+        try:
+            result = await self.inner.run(spec, user_input)
+            grant.usage = result.usage
+            return result
+        finally:
+            await self.governor.arecord(grant)
+
+
+async def _token_usage(llm) -> Optional[Tuple[int, int]]:
+    """Cumulative (input, output) tokens of an AugmentedLLM; None without a token counter."""
+    getter = getattr(llm, "get_token_usage", None)
+    if getter is None:
+        return None
+    try:
+        usage = await getter()
+    except Exception as e:   # token tracking is best-effort, never fail the call over it
+        logger.debug(f"[LLM_GOVERNOR] token usage unavailable: {e}")
+        return None
+    if usage is None:
+        return None
+    return int(getattr(usage, "input_tokens", 0) or 0), int(getattr(usage, "output_tokens", 0) or 0)
+
+
+async def governed_generate_str(llm, *, message, request_params=None, priority: Optional[str] = None):
+    """``llm.generate_str`` (mcp_agent AugmentedLLM) behind the process governor.
+
+    The model comes from ``request_params.model``. Usage is the difference of the
+    LLM's token-counter totals around the call (all tool turns included); without
+    a token counter the call stays charged at the estimate. One generate_str
+    counts as one request even when it runs several tool turns.
+    """
+    model = getattr(request_params, "model", None) or "default"
+    async with get_governor().slot(model, estimate_tokens(message), priority) as grant:
+        before = await _token_usage(llm)
+        result = await llm.generate_str(message=message, request_params=request_params)
+        after = await _token_usage(llm)
+        if before is not None and after is not None and after != before:
+            grant.usage = {"input_tokens": after[0] - before[0], "output_tokens": after[1] - before[1]}
+        return result
+
+
+_GOVERNOR: Optional[LLMGovernor] = None
+
+
+def get_governor() -> LLMGovernor:
+    """Process-wide governor configured from the LLM_GOVERNOR_* env vars."""
+    global _GOVERNOR
+    if _GOVERNOR is None:
+        try:
+            default = ModelLimit(float(os.getenv("LLM_GOVERNOR_RPM", "0") or 0),
+                                 float(os.getenv("LLM_GOVERNOR_TPM", "0") or 0))
+            limits = parse_limits(os.getenv("LLM_GOVERNOR_LIMITS", ""))
+            share = float(os.getenv("LLM_GOVERNOR_BATCH_SHARE", DEFAULT_BATCH_SHARE))
+        except ValueError as e:
+            logger.warning(f"[LLM_GOVERNOR] invalid limits, metering only: {e}")
+            default, limits, share = ModelLimit(), {}, DEFAULT_BATCH_SHARE
+        db_path = os.getenv("LLM_GOVERNOR_DB") or None
+        try:
+            _GOVERNOR = LLMGovernor(limits, default, share, db_path)
+        except sqlite3.Error as e:
+            logger.warning(f"[LLM_GOVERNOR] ledger {db_path} unavailable, in-process budgets: {e}")
+            _GOVERNOR = LLMGovernor(limits, default, share)
+    return _GOVERNOR
+
+
+def reset_governor() -> None:
+    """Test/utility hook: drop the process governor (re-read env on next use)."""
+    global _GOVERNOR
+    _GOVERNOR = None
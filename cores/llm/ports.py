@@ -34,6 +34,8 @@ class AgentSpec:
     mcp_servers: logical server names that map to McpServerRegistry entries.
     output_schema: optional type hint for structured JSON output (used by
       backends that support it; ignored otherwise).
+    cacheable: the completion is deterministic enough to be replayed for the
+      same spec + input (see cores/llm/response_cache.py). Default False.
     """
 
     name: str
@@ -42,6 +44,7 @@ class AgentSpec:
     mcp_servers: tuple = ()
     output_schema: Optional[type] = None
     params: LLMParams = field(default_factory=LLMParams)
+    cacheable: bool = False
 
 
 @dataclass
@@ -0,0 +1,244 @@
+"""
+Response cache for the LLMBackend port — skip completions already paid for.
+
+CachingLLMBackend wraps any LLMBackend. For specs marked ``cacheable=True`` the
+result is looked up by a canonical hash of the AgentSpec (name, model,
+instructions, MCP servers, output schema, params) and the user input; a hit is
+returned without calling the wrapped backend. Other specs pass straight through.
+
+ResponseCache is the SQLite store behind it:
+- entries older than ``ttl_sec`` are treated as misses and purged,
+- beyond ``max_entries`` the least recently used entries are evicted,
+- hit / miss / store / eviction counters are kept per instance.
+
+Only stdlib + cores.llm imports (same import-safety rule as agent_bridge).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from cores.llm.ports import AgentSpec, LLMBackend, LLMResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent.parent / "llm_response_cache.db"
+DEFAULT_TTL_SEC = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 5000
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS llm_response_cache (
+    key          TEXT PRIMARY KEY,
+    agent_name   TEXT NOT NULL,
+    model        TEXT NOT NULL,
+    result_json  TEXT NOT NULL,
+    created_at   REAL NOT NULL,
+    last_used_at REAL NOT NULL
+)
+"""
+_CREATE_INDEX = "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_response_cache (last_used_at)"
+
+
+def cache_key(spec: AgentSpec, user_input: Any) -> str:
+    """Canonical SHA-256 of everything that determines the completion."""
+    payload = {
+        "name": spec.name,
+        "model": spec.model,
+        "instructions": spec.instructions,
+        "mcp_servers": list(spec.mcp_servers),
+        "output_schema": (
+            f"{spec.output_schema.__module__}.{spec.output_schema.__qualname__}"
+            if spec.output_schema is not None else None
+        ),
+        "params": dataclasses.asdict(spec.params),
+        "input": user_input,
+    }
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite store of LLMResults keyed by :func:`cache_key` (TTL + LRU size cap)."""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        ttl_sec: float = DEFAULT_TTL_SEC,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.ttl_sec = ttl_sec
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the store; the file and table are created on first use only."""
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute(_CREATE_TABLE)
+                conn.execute(_CREATE_INDEX)
+            self._initialized = True
+        return conn
+
+    def get(self, key: str) -> Optional[LLMResult]:
+        """Cached result for *key*, or None (miss / expired)."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute(
+                    "SELECT result_json, created_at FROM llm_response_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and now - row[1] >= self.ttl_sec:
+                    conn.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+                    row = None
+                if row is None:
+                    self.misses += 1
+                    return None
+                conn.execute("UPDATE llm_response_cache SET last_used_at = ? WHERE key = ?", (now, key))
+        finally:
+            conn.close()
+        self.hits += 1
+        data = json.loads(row[0])
+        return LLMResult(
+            text=data.get("text", ""),
+            structured=data.get("structured"),
+            response_id=data.get("response_id"),
+            usage=data.get("usage"),
+        )
+
+    def put(self, key: str, spec: AgentSpec, result: LLMResult) -> bool:
+        """Store *result*; False if it cannot be serialized (e.g. a pydantic object)."""
+        try:
+            result_json = json.dumps({
+                "text": result.text,
+                "structured": result.structured,
+                "response_id": result.response_id,
+                "usage": result.usage,
+            }, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return False
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_response_cache "
+                    "(key, agent_name, model, result_json, created_at, last_used_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, spec.name, spec.model, result_json, now, now),
+                )
+                self.stores += 1
+                self.evictions += conn.execute(
+                    "DELETE FROM llm_response_cache WHERE created_at <= ?", (now - self.ttl_sec,)
+                ).rowcount
+                self.evictions += conn.execute(
+                    "DELETE FROM llm_response_cache WHERE key IN ("
+                    "SELECT key FROM llm_response_cache ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                ).rowcount
+        finally:
+            conn.close()
+        return True
+
+    def delete(self, key: str) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses,
+                "stores": self.stores, "evictions": self.evictions}
+
+
+class CachingLLMBackend(LLMBackend):
+    """LLMBackend decorator serving cacheable specs from a :class:`ResponseCache`.
+
+    ``name`` mirrors the wrapped backend so logs/config checks are unchanged.
+    Cache read/write errors are logged and the call falls through to the
+    wrapped backend — the cache never fails a run.
+    """
+
+    def __init__(self, inner: LLMBackend, cache: ResponseCache) -> None:
+        self.inner = inner
+        self.cache = cache
+        self.name = inner.name
+
+    async def run(self, spec: AgentSpec, user_input: Any) -> LLMResult:
+        if not spec.cacheable:
+            return await self.inner.run(spec, user_input)
+
+        key = cache_key(spec, user_input)
+        try:
+            cached = self.cache.get(key)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"LLM response cache read failed ({spec.name}): {e}")
+            cached = None
+        if cached is not None:
+            logger.info(f"LLM response cache hit: {spec.name} ({spec.model})")
+            return cached
+
+        result = await self.inner.run(spec, user_input)
+        if result.text or result.structured is not None:
+            try:
+                self.cache.put(key, spec, result)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"LLM response cache write failed ({spec.name}): {e}")
+        return result
+
+    def invalidate(self, spec: AgentSpec, user_input: Any) -> None:
+        """Drop a cached result the caller could not use (e.g. unparseable output)."""
+        try:
+            self.cache.delete(cache_key(spec, user_input))
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"LLM response cache invalidate failed ({spec.name}): {e}")
+
+    def stats(self) -> Dict[str, int]:
+        return self.cache.stats()
+
+
+def response_cache_enabled() -> bool:
+    """LLM_RESPONSE_CACHE env flag; default ON (only cacheable specs are affected)."""
+    return os.getenv("LLM_RESPONSE_CACHE", "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+def with_response_cache(backend: LLMBackend) -> LLMBackend:
+    """Wrap *backend* in a CachingLLMBackend configured from the environment.
+
+    Env:
+        LLM_RESPONSE_CACHE              "false" returns *backend* unwrapped
+        LLM_RESPONSE_CACHE_PATH         SQLite path (default: <project>/llm_response_cache.db)
+        LLM_RESPONSE_CACHE_TTL_SEC      entry lifetime (default: 7 days)
+        LLM_RESPONSE_CACHE_MAX_ENTRIES  LRU size cap (default: 5000)
+    """
+    if not response_cache_enabled():
+        return backend
+    try:
+        cache = ResponseCache(
+            db_path=os.getenv("LLM_RESPONSE_CACHE_PATH") or None,
+            ttl_sec=float(os.getenv("LLM_RESPONSE_CACHE_TTL_SEC", DEFAULT_TTL_SEC)),
+            max_entries=int(os.getenv("LLM_RESPONSE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+        )
+    except ValueError as e:
+        logger.warning(f"LLM response cache misconfigured, running uncached: {e}")
+        return backend
+    return CachingLLMBackend(backend, cache)
@@ -0,0 +1,213 @@
+"""Tests for cores.llm.governor — budgets, priority classes, metering, shared ledger."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import cores.llm.governor as gov
+from cores.llm.fakes import FakeLLMBackend
+from cores.llm.governor import (
+    BATCH,
+    INTERACTIVE,
+    GovernedLLMBackend,
+    LLMGovernor,
+    ModelLimit,
+    llm_priority,
+    parse_limits,
+)
+from cores.llm.ports import AgentSpec, LLMResult
+
+MODEL = "gpt-5.4-mini"
+PERIOD = 0.4   # short budget window keeps the waits in milliseconds
+
+
+def _make_spec():
+    return AgentSpec(name="section_agent", instructions="analyse", model=MODEL)
+
+
+class TestBudgets:
+    @pytest.mark.asyncio
+    async def test_unlimited_model_is_only_metered(self):
+        governor = LLMGovernor(period=PERIOD)
+        for _ in range(50):
+            async with governor.slot(MODEL, 1000):
+                pass
+        snap = governor.snapshot()[MODEL]
+        assert snap["requests"] == 50 and snap["waits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_request_budget_spreads_calls_over_the_period(self):
+        governor = LLMGovernor({MODEL: ModelLimit(rpm=2)}, batch_share=1.0, period=PERIOD)
+        started = time.monotonic()
+        for _ in range(3):
+            await governor.acquire(MODEL, 10, BATCH)
+        # two calls fit the bucket, the third waits for half a period of refill
+        assert time.monotonic() - started >= PERIOD / 2 * 0.9
+
+    @pytest.mark.asyncio
+    async def test_reconciled_usage_is_charged_to_the_token_budget(self):
+        governor = LLMGovernor({MODEL: ModelLimit(tpm=1000)}, batch_share=1.0, period=PERIOD)
+        grant = await governor.acquire(MODEL, 100, BATCH)
+        governor.record(grant, {"input_tokens": 700, "output_tokens": 200})
+        started = time.monotonic()
+        await governor.acquire(MODEL, 500, BATCH)    # only ~100 tokens left after reconciliation
+        assert time.monotonic() - started >= PERIOD * 0.4 * 0.9
+        snap = governor.snapshot()[MODEL]
+        assert (snap["requests"], snap["input_tokens"], snap["output_tokens"]) == (1, 700, 200)
+
+    def test_parse_limits(self):
+        assert parse_limits("gpt-5.4-mini=500:200000, gpt-5.5=100") == {
+            "gpt-5.4-mini": ModelLimit(500, 200000),
+            "gpt-5.5": ModelLimit(100, 0),
+        }
+
+
+class TestPriority:
+    @pytest.mark.asyncio
+    async def test_interactive_call_is_served_before_queued_batch(self):
+        governor = LLMGovernor({MODEL: ModelLimit(rpm=1)}, batch_share=1.0, period=PERIOD)
+        await governor.acquire(MODEL, 10, BATCH)      # bucket now empty
+        order = []
+
+        async def call(tag, priority):
+            await governor.acquire(MODEL, 10, priority)
+            order.append(tag)
+
+        batch = [asyncio.create_task(call(f"batch{i}", BATCH)) for i in range(2)]
+        await asyncio.sleep(0)
+        with llm_priority(INTERACTIVE):
+            interactive = asyncio.create_task(call("bot", None))
+        await asyncio.gather(*batch, interactive)
+        assert order[0] == "bot"
+
+    @pytest.mark.asyncio
+    async def test_batch_leaves_headroom_for_interactive(self):
+        governor = LLMGovernor({MODEL: ModelLimit(rpm=10)}, batch_share=0.5, period=60)
+        for _ in range(5):
+            await governor.acquire(MODEL, 10, BATCH)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(governor.acquire(MODEL, 10, BATCH), 0.05)
+        await asyncio.wait_for(governor.acquire(MODEL, 10, INTERACTIVE), 0.05)
+
+
+class TestEventLoops:
+    def test_governor_survives_successive_event_loops(self):
+        governor = LLMGovernor({MODEL: ModelLimit(rpm=1)}, batch_share=1.0, period=0.1)
+
+        async def two_calls():                  # the second call waits on the condition
+            await governor.acquire(MODEL, 10, BATCH)
+            await governor.acquire(MODEL, 10, BATCH)
+
+        for _ in range(2):                      # e.g. two asyncio.run() calls in one batch script
+            asyncio.run(two_calls())
+        assert len(governor._loops) <= 1        # the finished loop's state is not kept alive
+
+
+class TestGovernedBackend:
+    @pytest.mark.asyncio
+    async def test_usage_from_llm_result_is_metered(self):
+        governor = LLMGovernor()
+        inner = FakeLLMBackend(lambda spec, text: LLMResult(
+            text="ok", usage={"prompt_tokens": 30, "completion_tokens": 12, "total_tokens": 42}))
+        backend = GovernedLLMBackend(inner, governor)
+        await backend.run(_make_spec(), "one")
+        await backend.run(_make_spec(), "two")
+        assert backend.name == "fake"
+        snap = governor.snapshot()[MODEL]
+        assert (snap["requests"], snap["total_tokens"], snap["unmetered"]) == (2, 84, 0)
+
+    @pytest.mark.asyncio
+    async def test_failed_call_is_still_counted(self):
+        governor = LLMGovernor()
+        backend = GovernedLLMBackend(FakeLLMBackend([]), governor)
+        with pytest.raises(IndexError):
+            await backend.run(_make_spec(), "x")
+        assert governor.snapshot()[MODEL]["unmetered"] == 1
+
+    @pytest.mark.asyncio
+    async def test_governed_generate_str_uses_request_model(self, monkeypatch):
+        governor = LLMGovernor()
+        monkeypatch.setattr(gov, "_GOVERNOR", governor)
+
+        class _Params:
+            model = "gpt-5.5"
+
+        class _LLM:
+            async def generate_str(self, message, request_params=None):
+                return message.upper()
+
+        assert await gov.governed_generate_str(_LLM(), message="hi", request_params=_Params()) == "HI"
+        assert governor.snapshot()["gpt-5.5"]["by_priority"] == {BATCH: 1}
+
+    @pytest.mark.asyncio
+    async def test_governed_generate_str_reconciles_token_counter_usage(self, monkeypatch):
+        governor = LLMGovernor({MODEL: ModelLimit(tpm=1000)}, batch_share=1.0, period=PERIOD)
+        monkeypatch.setattr(gov, "_GOVERNOR", governor)
+
+        class _Params:
+            model = MODEL
+
+        class _LLM:
+            total = SimpleNamespace(input_tokens=50, output_tokens=5)   # earlier calls on this LLM
+
+            async def get_token_usage(self):
+                return self.total
+
+            async def generate_str(self, message, request_params=None):
+                self.total = SimpleNamespace(input_tokens=750, output_tokens=205)
+                return "ok"
+
+        await gov.governed_generate_str(_LLM(), message="x" * 400, request_params=_Params())
+        snap = governor.snapshot()[MODEL]
+        assert (snap["input_tokens"], snap["output_tokens"], snap["unmetered"]) == (700, 200, 0)
+        started = time.monotonic()
+        await governor.acquire(MODEL, 500, BATCH)    # the 900 real tokens were charged, not the 100 estimate
+        assert time.monotonic() - started >= PERIOD * 0.4 * 0.9
+
+
+class TestSharedLedger:
+    @pytest.mark.asyncio
+    async def test_two_governors_share_one_budget(self, tmp_path):
+        db = str(tmp_path / "governor.db")
+        limits = {MODEL: ModelLimit(rpm=2)}
+        first = LLMGovernor(limits, batch_share=1.0, db_path=db, period=60)
+        second = LLMGovernor(limits, batch_share=1.0, db_path=db, period=60)
+        await first.acquire(MODEL, 10, BATCH)
+        await second.acquire(MODEL, 10, BATCH)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(first.acquire(MODEL, 10, BATCH), 0.2)
+
+    @pytest.mark.asyncio
+    async def test_ledger_io_runs_off_the_event_loop(self, tmp_path, monkeypatch):
+        governor = LLMGovernor({MODEL: ModelLimit(rpm=5, tpm=1000)}, batch_share=1.0,
+                               db_path=str(tmp_path / "governor.db"), period=60)
+        threads = set()
+        for name in ("available", "consume"):
+            original = getattr(governor._budget, name)
+
+            def traced(*args, _original=original, **kwargs):
+                threads.add(threading.get_ident())
+                return _original(*args, **kwargs)
+
+            monkeypatch.setattr(governor._budget, name, traced)
+        async with governor.slot(MODEL, 10) as grant:
+            grant.usage = {"input_tokens": 40, "output_tokens": 10}
+        assert threads and threading.get_ident() not in threads
+
+
+class TestGetGovernor:
+    def test_configured_from_env(self, monkeypatch):
+        monkeypatch.setenv("LLM_GOVERNOR_RPM", "60")
+        monkeypatch.setenv("LLM_GOVERNOR_LIMITS", "gpt-5.5=10:5000")
+        monkeypatch.delenv("LLM_GOVERNOR_DB", raising=False)
+        gov.reset_governor()
+        try:
+            governor = gov.get_governor()
+            assert governor is gov.get_governor()
+            assert governor.limit_for("gpt-5.5") == ModelLimit(10, 5000)
+            assert governor.limit_for(MODEL) == ModelLimit(60, 0)
+        finally:
+            gov.reset_governor()
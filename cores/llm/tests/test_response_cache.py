@@ -0,0 +1,119 @@
+"""Tests for cores.llm.response_cache — CachingLLMBackend over FakeLLMBackend."""
+
+import pytest
+
+import cores.llm.response_cache as rc
+from cores.llm.fakes import FakeLLMBackend
+from cores.llm.ports import AgentSpec, LLMParams, LLMResult
+from cores.llm.response_cache import CachingLLMBackend, ResponseCache, cache_key
+
+
+def _make_spec(cacheable=True, **params):
+    return AgentSpec(
+        name="trading_journal_agent",
+        instructions="write a journal",
+        model="gpt-5.4-mini",
+        mcp_servers=("sqlite",),
+        params=LLMParams(max_tokens=16000, **params),
+        cacheable=cacheable,
+    )
+
+
+def _echo(spec, user_input):
+    return LLMResult(text=f"reply to {user_input}", usage={"total_tokens": 42})
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(db_path=str(tmp_path / "cache.db"))
+
+
+class TestCachingBackend:
+    @pytest.mark.asyncio
+    async def test_second_identical_call_is_served_from_cache(self, cache):
+        inner = FakeLLMBackend([LLMResult(text="entry", usage={"total_tokens": 10})])
+        backend = CachingLLMBackend(inner, cache)
+        first = await backend.run(_make_spec(), "trade 40")
+        again = await backend.run(_make_spec(), "trade 40")
+        assert len(inner.calls) == 1
+        assert (again.text, again.usage) == (first.text, first.usage)
+        assert backend.stats() == {"hits": 1, "misses": 1, "stores": 1, "evictions": 0}
+
+    @pytest.mark.asyncio
+    async def test_cache_survives_a_new_process(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        await CachingLLMBackend(FakeLLMBackend(_echo), ResponseCache(path)).run(_make_spec(), "x")
+        inner = FakeLLMBackend(_echo)
+        result = await CachingLLMBackend(inner, ResponseCache(path)).run(_make_spec(), "x")
+        assert result.text == "reply to x" and inner.calls == []
+
+    @pytest.mark.asyncio
+    async def test_non_cacheable_spec_passes_through(self, cache):
+        inner = FakeLLMBackend(_echo)
+        backend = CachingLLMBackend(inner, cache)
+        for _ in range(2):
+            await backend.run(_make_spec(cacheable=False), "x")
+        assert len(inner.calls) == 2
+        assert backend.stats()["misses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_key_covers_params_and_input(self, cache):
+        inner = FakeLLMBackend(_echo)
+        backend = CachingLLMBackend(inner, cache)
+        await backend.run(_make_spec(), "x")
+        await backend.run(_make_spec(reasoning_effort="low"), "x")
+        await backend.run(_make_spec(), "y")
+        await backend.run(_make_spec(), [{"role": "user", "content": "x"}])
+        assert len(inner.calls) == 4
+        assert cache_key(_make_spec(), {"b": 1, "a": 2}) == cache_key(_make_spec(), {"a": 2, "b": 1})
+
+    @pytest.mark.asyncio
+    async def test_empty_result_is_not_cached_and_invalidate_forgets(self, cache):
+        inner = FakeLLMBackend([LLMResult(text=""), LLMResult(text="bad json"), LLMResult(text="ok")])
+        backend = CachingLLMBackend(inner, cache)
+        assert (await backend.run(_make_spec(), "x")).text == ""
+        assert (await backend.run(_make_spec(), "x")).text == "bad json"
+        backend.invalidate(_make_spec(), "x")
+        assert (await backend.run(_make_spec(), "x")).text == "ok"
+        assert len(inner.calls) == 3
+
+
+class TestResponseCacheEviction:
+    def test_entries_expire_after_ttl(self, tmp_path, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(rc.time, "time", lambda: now[0])
+        cache = ResponseCache(str(tmp_path / "c.db"), ttl_sec=60)
+        cache.put("k", _make_spec(), LLMResult(text="v"))
+        now[0] += 59
+        assert cache.get("k").text == "v"
+        now[0] += 2
+        assert cache.get("k") is None
+
+    def test_least_recently_used_entry_is_evicted(self, tmp_path, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(rc.time, "time", lambda: now[0])
+        cache = ResponseCache(str(tmp_path / "c.db"), max_entries=2)
+        for key in ("a", "b"):
+            now[0] += 1
+            cache.put(key, _make_spec(), LLMResult(text=key))
+        now[0] += 1
+        cache.get("a")                       # "b" is now least recently used
+        now[0] += 1
+        cache.put("c", _make_spec(), LLMResult(text="c"))
+        assert cache.get("b") is None
+        assert cache.get("a").text == "a" and cache.get("c").text == "c"
+        assert cache.evictions == 1
+
+
+class TestWithResponseCache:
+    def test_wraps_and_keeps_backend_name(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("LLM_RESPONSE_CACHE_PATH", str(tmp_path / "c.db"))
+        inner = FakeLLMBackend(_echo)
+        backend = rc.with_response_cache(inner)
+        assert isinstance(backend, CachingLLMBackend) and backend.name == "fake"
+        assert not (tmp_path / "c.db").exists()            # created on first use only
+
+    def test_disabled_returns_backend_unwrapped(self, monkeypatch):
+        monkeypatch.setenv("LLM_RESPONSE_CACHE", "false")
+        inner = FakeLLMBackend(_echo)
+        assert rc.with_response_cache(inner) is inner
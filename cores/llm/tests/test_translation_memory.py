@@ -0,0 +1,51 @@
+"""Tests for cores.llm.translation_memory — SQLite translation memory store."""
+
+from cores.llm import translation_memory as tm
+from cores.llm.translation_memory import TranslationMemory
+
+
+class TestTranslationMemory:
+    def test_keyed_by_language_pair_and_model(self, tmp_path):
+        path = str(tmp_path / "tm.db")
+        TranslationMemory(path).put_many([("반도체", "Semiconductor"), ("매수", "Buy")], "ko", "en", "gpt-5.4-nano")
+        memory = TranslationMemory(path)                          # new process, same file
+        assert memory.get_many(["반도체", "매수", "매도"], "ko", "en", "gpt-5.4-nano") == {
+            "반도체": "Semiconductor", "매수": "Buy"}
+        assert memory.get("반도체", "ko", "ja", "gpt-5.4-nano") is None
+        assert memory.get("반도체", "ko", "en", "gpt-5.5") is None
+        assert (memory.hits, memory.misses) == (2, 3)
+
+    def test_entries_unused_for_ttl_are_evicted(self, tmp_path, monkeypatch):
+        now = [1_000_000.0]
+        monkeypatch.setattr(tm.time, "time", lambda: now[0])
+        memory = TranslationMemory(str(tmp_path / "tm.db"), ttl_days=1)
+        memory.put("old", "OLD", "ko", "en", "m")
+        memory.put("used", "USED", "ko", "en", "m")
+        now[0] += 20 * 3600
+        assert memory.get("used", "ko", "en", "m") == "USED"     # refreshes last use
+        now[0] += 10 * 3600
+        memory.put("new", "NEW", "ko", "en", "m")
+        assert memory.get_many(["old", "used", "new"], "ko", "en", "m") == {"used": "USED", "new": "NEW"}
+
+    def test_empty_translations_are_not_stored(self, tmp_path):
+        memory = TranslationMemory(str(tmp_path / "tm.db"))
+        assert memory.put_many([("x", ""), ("", "y")], "ko", "en", "m") == 0
+        assert not (tmp_path / "tm.db").exists()                  # created on first write only
+
+
+class TestGetTranslationMemory:
+    def test_disabled_returns_none(self, monkeypatch):
+        monkeypatch.setenv("TRANSLATION_MEMORY_ENABLED", "false")
+        tm.reset_translation_memory()
+        assert tm.get_translation_memory() is None
+
+    def test_singleton_uses_env_path(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("TRANSLATION_MEMORY_ENABLED", raising=False)
+        monkeypatch.setenv("TRANSLATION_MEMORY_DB_PATH", str(tmp_path / "tm.db"))
+        tm.reset_translation_memory()
+        try:
+            memory = tm.get_translation_memory()
+            assert memory is tm.get_translation_memory()
+            assert str(memory.db_path) == str(tmp_path / "tm.db")
+        finally:
+            tm.reset_translation_memory()
@@ -0,0 +1,171 @@
+"""
+Persistent translation memory for LLM translations.
+
+The English dashboard (examples/translation_utils.DashboardTranslator) and the
+multi-language channel broadcasts (cores/agents/telegram_translator_agent)
+translate mostly the same Korean strings every run: sector names, lessons,
+rationales and company names that have not changed since yesterday. The memory
+stores each finished translation keyed by (source text hash, from_lang, to_lang,
+model), so callers only send unseen strings to the LLM.
+
+Entries not used for TRANSLATION_MEMORY_TTL_DAYS are evicted (checked on write,
+at most once per process per hour). Failed translations are never stored —
+callers only put() strings the LLM actually returned.
+
+Env:
+  TRANSLATION_MEMORY_ENABLED   "false" disables the memory (always translate)
+  TRANSLATION_MEMORY_DB_PATH   override store location (default: <project>/translation_memory.db)
+  TRANSLATION_MEMORY_TTL_DAYS  evict entries unused for this many days (default: 30)
+
+Only stdlib imports (same import-safety rule as agent_bridge).
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent.parent / "translation_memory.db"
+DEFAULT_TTL_DAYS = 30
+_EVICT_INTERVAL_SEC = 3600
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS translation_memory (
+    key          TEXT PRIMARY KEY,
+    from_lang    TEXT NOT NULL,
+    to_lang      TEXT NOT NULL,
+    model        TEXT NOT NULL,
+    translation  TEXT NOT NULL,
+    created_at   REAL NOT NULL,
+    last_used_at REAL NOT NULL
+)
+"""
+_CREATE_INDEX = "CREATE INDEX IF NOT EXISTS idx_translation_memory_last_used ON translation_memory (last_used_at)"
+
+
+def is_enabled() -> bool:
+    return os.getenv("TRANSLATION_MEMORY_ENABLED", "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+def memory_key(text: str, from_lang: str, to_lang: str, model: str) -> str:
+    """SHA-256 of the source text plus the language pair and model."""
+    blob = "\x1f".join((from_lang, to_lang, model, text))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class TranslationMemory:
+    """SQLite store of finished translations with last-use eviction."""
+
+    def __init__(self, db_path: Optional[str] = None, ttl_days: Optional[float] = None):
+        self.db_path = Path(db_path or os.getenv("TRANSLATION_MEMORY_DB_PATH") or DEFAULT_DB_PATH)
+        if ttl_days is None:
+            ttl_days = float(os.getenv("TRANSLATION_MEMORY_TTL_DAYS", DEFAULT_TTL_DAYS))
+        self.ttl_sec = ttl_days * 86400
+        self.hits = 0
+        self.misses = 0
+        self._initialized = False
+        self._last_evict = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the store; the file and table are created on first use only."""
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute(_CREATE_TABLE)
+                conn.execute(_CREATE_INDEX)
+            self._initialized = True
+        return conn
+
+    def get_many(self, texts: Iterable[str], from_lang: str, to_lang: str, model: str) -> Dict[str, str]:
+        """{source text: translation} for the texts already in memory."""
+        keys = {memory_key(t, from_lang, to_lang, model): t for t in dict.fromkeys(texts)}
+        if not keys:
+            return {}
+        found: Dict[str, str] = {}
+        now = time.time()
+        key_list = list(keys)
+        conn = self._connect()
+        try:
+            with conn:
+                for i in range(0, len(key_list), 500):   # stay under SQLite's variable limit
+                    chunk = key_list[i:i + 500]
+                    marks = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT key, translation FROM translation_memory WHERE key IN ({marks})", chunk
+                    ).fetchall()
+                    for key, translation in rows:
+                        found[keys[key]] = translation
+                    conn.execute(
+                        f"UPDATE translation_memory SET last_used_at = ? WHERE key IN ({marks})", [now] + chunk
+                    )
+        finally:
+            conn.close()
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def get(self, text: str, from_lang: str, to_lang: str, model: str) -> Optional[str]:
+        return self.get_many([text], from_lang, to_lang, model).get(text)
+
+    def put_many(self, pairs: Iterable[Tuple[str, str]], from_lang: str, to_lang: str, model: str) -> int:
+        """Store (source, translation) pairs; returns the number written."""
+        now = time.time()
+        rows = [
+            (memory_key(src, from_lang, to_lang, model), from_lang, to_lang, model, dst, now, now)
+            for src, dst in pairs if src and dst
+        ]
+        if not rows:
+            return 0
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO translation_memory "
+                    "(key, from_lang, to_lang, model, translation, created_at, last_used_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                if now - self._last_evict >= _EVICT_INTERVAL_SEC:
+                    evicted = conn.execute(
+                        "DELETE FROM translation_memory WHERE last_used_at < ?", (now - self.ttl_sec,)
+                    ).rowcount
+                    self._last_evict = now
+                    if evicted:
+                        logger.info(f"Translation memory: evicted {evicted} entries unused for {self.ttl_sec / 86400:g} days")
+        finally:
+            conn.close()
+        return len(rows)
+
+    def put(self, text: str, translation: str, from_lang: str, to_lang: str, model: str) -> None:
+        self.put_many([(text, translation)], from_lang, to_lang, model)
+
+
+_MEMORY: Optional[TranslationMemory] = None
+
+
+def get_translation_memory() -> Optional[TranslationMemory]:
+    """Process-wide memory, or None when TRANSLATION_MEMORY_ENABLED is off or misconfigured."""
+    global _MEMORY
+    if not is_enabled():
+        return None
+    if _MEMORY is None:
+        try:
+            _MEMORY = TranslationMemory()
+        except ValueError as e:
+            logger.warning(f"Translation memory misconfigured, disabled: {e}")
+            return None
+    return _MEMORY
+
+
+def reset_translation_memory() -> None:
+    """Test/utility hook: drop the process memory (re-read env on next use)."""
+    global _MEMORY
+    _MEMORY = None
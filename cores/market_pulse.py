@@ -65,7 +65,7 @@ Missing-volume handling summary:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 # --------------------------------------------------------------------------- #
 # Constants (IBD/O'Neil — see module docstring table; mirror data_prefetch.py)  #
@@ -94,6 +94,9 @@ CORRECTION: str = "CORRECTION"
 
 PulseState = str  # semantic alias: one of UPTREND / UNDER_PRESSURE / CORRECTION
 
+# snapshot() format version; from_snapshot() rejects anything else.
+SNAPSHOT_VERSION: int = 1
+
 
 @dataclass(frozen=True)
 class DailyBar:
@@ -164,12 +167,21 @@ class MarketPulse:
     Feed index daily bars in chronological order via :meth:`feed`; it returns the
     current :data:`PulseState` after each bar. State depends only on the bars fed
     so far (as-of semantics), so replaying a fixed sequence is deterministic.
+
+    :meth:`snapshot` captures the machine as a JSON-serializable dict and
+    :meth:`from_snapshot` restores it; feeding the remaining bars into a restored
+    machine yields exactly the states of an uninterrupted replay. Only the trailing
+    DISTRIBUTION_WINDOW + 1 bars are kept in a snapshot — nothing older can
+    influence a later state.
     """
 
     def __init__(self) -> None:
         self._closes: List[float] = []
         self._vols: List[Optional[float]] = []
         self._dates: List[str] = []
+        # Bars dropped before _closes[0] (restored snapshots keep only the tail).
+        # Bar indices below (_dd_window_start, _last_exit_bar) are absolute.
+        self._offset: int = 0
         self._state: PulseState = UPTREND
         self._last_dd: int = 0
         # DD window reset point (absolute bar index); bumped after an FTD.
@@ -189,6 +201,8 @@ class MarketPulse:
         # the market must make a NEW >=10% decline from post-exit levels before it
         # can re-trigger (standard trailing correction/bear labeling; anti-flap).
         self._reference_peak: Optional[float] = None
+        # Absolute index of the bar on which the last CORRECTION exit happened.
+        self._last_exit_bar: Optional[int] = None
 
     @property
     def state(self) -> PulseState:
@@ -198,12 +212,82 @@ class MarketPulse:
     def distribution_days(self) -> int:
         return self._last_dd
 
+    @property
+    def bars_seen(self) -> int:
+        return self._offset + len(self._closes)
+
+    @property
+    def last_date(self) -> Optional[str]:
+        return self._dates[-1] if self._dates else None
+
+    @property
+    def sessions_since_correction_exit(self) -> Optional[int]:
+        """Sessions since the most recent CORRECTION exit (0 on the exit session).
+
+        Same result as ``regime_policy._sessions_since_correction_exit`` over the
+        full state history: ``None`` while in CORRECTION or if no exit happened.
+        """
+        if self._state == CORRECTION or self._last_exit_bar is None:
+            return None
+        return self.bars_seen - 1 - self._last_exit_bar
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-serializable checkpoint of the machine (see :meth:`from_snapshot`)."""
+        tail = DISTRIBUTION_WINDOW + 1
+        return {
+            "version": SNAPSHOT_VERSION,
+            "bars_seen": self.bars_seen,
+            "dates": self._dates[-tail:],
+            "closes": self._closes[-tail:],
+            "volumes": self._vols[-tail:],
+            "state": self._state,
+            "last_dd": self._last_dd,
+            "dd_window_start": self._dd_window_start,
+            "correction_low": self._correction_low,
+            "rally_active": self._rally_active,
+            "rally_day": self._rally_day,
+            "rally_start_low": self._rally_start_low,
+            "pre_correction_peak": self._pre_correction_peak,
+            "reference_peak": self._reference_peak,
+            "last_exit_bar": self._last_exit_bar,
+        }
+
+    @classmethod
+    def from_snapshot(cls, snap: Dict[str, Any]) -> "MarketPulse":
+        """Restore a machine from :meth:`snapshot` output.
+
+        Raises:
+            ValueError: unknown snapshot version or inconsistent bar lists.
+        """
+        if snap.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"unsupported MarketPulse snapshot version: {snap.get('version')!r}")
+        dates, closes, vols = list(snap["dates"]), list(snap["closes"]), list(snap["volumes"])
+        bars_seen = int(snap["bars_seen"])
+        if not (len(dates) == len(closes) == len(vols)) or len(closes) > bars_seen:
+            raise ValueError("inconsistent MarketPulse snapshot bar lists")
+        mp = cls()
+        mp._dates = dates
+        mp._closes = [float(c) for c in closes]
+        mp._vols = [None if v is None else float(v) for v in vols]
+        mp._offset = bars_seen - len(closes)
+        mp._state = snap["state"]
+        mp._last_dd = int(snap["last_dd"])
+        mp._dd_window_start = int(snap["dd_window_start"])
+        mp._correction_low = snap["correction_low"]
+        mp._rally_active = bool(snap["rally_active"])
+        mp._rally_day = int(snap["rally_day"])
+        mp._rally_start_low = snap["rally_start_low"]
+        mp._pre_correction_peak = snap["pre_correction_peak"]
+        mp._reference_peak = snap["reference_peak"]
+        mp._last_exit_bar = snap["last_exit_bar"]
+        return mp
+
     def feed(self, bar: DailyBar) -> PulseState:
         """Ingest one bar (chronological) and return the resulting state."""
         self._dates.append(bar.date)
         self._closes.append(float(bar.close))
         self._vols.append(None if bar.volume is None else float(bar.volume))
-        n = len(self._closes)
+        n = self.bars_seen
         cur = self._closes[-1]
 
         # Rev.2: maintain the rolling reference peak (max close since start or the
@@ -213,7 +297,8 @@ class MarketPulse:
             self._reference_peak = cur
 
         dd = _count_distribution_days(
-            self._closes, self._vols, DISTRIBUTION_WINDOW, self._dd_window_start
+            self._closes, self._vols, DISTRIBUTION_WINDOW,
+            max(0, self._dd_window_start - self._offset),
         )
         self._last_dd = dd
 
@@ -314,6 +399,7 @@ class MarketPulse:
         """Shared CORRECTION exit (FTD or price-recovery): UPTREND + DD reset."""
         self._state = UPTREND
         self._dd_window_start = n  # exclude all DDs up to and including today
+        self._last_exit_bar = n - 1
         self._last_dd = 0
         self._rally_active = False
         self._rally_day = 0
@@ -0,0 +1,205 @@
+"""
+market_snapshot_cache.py — Date-keyed on-disk cache of KR whole-market frames.
+
+trigger_batch (morning + afternoon runs) and performance_tracker_batch each pull
+the same whole-market frames (get_market_ohlcv_by_ticker, get_market_cap_by_ticker)
+for a trade date within minutes or hours of each other. get_frame() keeps one
+file per (kind, trade date) so every job on the host shares a single download.
+
+Files:
+  <cache dir>/<kind>_<YYYYMMDD>.parquet   (pickle when no parquet engine is installed)
+
+Freshness:
+  A frame fetched after the session closed (KRX market time, FINAL_AFTER) is final
+  and kept permanently. A frame fetched earlier — today's intraday snapshot — is
+  re-fetched once it is older than MARKET_SNAPSHOT_TTL_SEC, and the first fetch
+  after the close replaces it with the final frame.
+
+Final "ohlcv" frames are not kept as files: they go to the daily-bar store
+(cores/daily_bar_store, raw bars + daily_bar_snapshots), the same sessions the RS
+universe close matrix reads, so there is one copy of each closed session. They
+are served back with the store's columns (Open, High, Low, Close, Volume, Amount)
+indexed by "Ticker". Only intraday ohlcv frames and the other kinds (market cap)
+live in the cache directory.
+
+Empty frames are never cached. When the upstream fetch fails and an expired frame
+is on disk, the stale frame is returned instead of raising.
+
+Env:
+  MARKET_SNAPSHOT_CACHE_ENABLED  "false" disables the cache (callers fetch directly)
+  MARKET_SNAPSHOT_CACHE_DIR      override cache location (default: <project>/market_snapshots)
+  MARKET_SNAPSHOT_TTL_SEC        intraday snapshot TTL in seconds (default: 900)
+"""
+
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from cores import daily_bar_store
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_CACHE_DIR = PROJECT_ROOT / "market_snapshots"
+
+DEFAULT_TTL_SEC = 900
+STORE_KIND = "ohlcv"  # final frames of this kind live in the daily-bar store (KR, raw bars)
+FINAL_AFTER = "1600"  # KRX closes 15:30; closing prices are settled by 16:00 KST
+_MARKET_TZ = ZoneInfo("Asia/Seoul")
+
+try:
+    import pyarrow  # noqa: F401
+    _EXT = "parquet"
+except ImportError:
+    try:
+        import fastparquet  # noqa: F401
+        _EXT = "parquet"
+    except ImportError:
+        _EXT = "pkl"
+
+
+def is_enabled() -> bool:
+    return os.getenv("MARKET_SNAPSHOT_CACHE_ENABLED", "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _get_cache_dir(cache_dir=None) -> Path:
+    if cache_dir is not None:
+        return Path(cache_dir)
+    return Path(os.getenv("MARKET_SNAPSHOT_CACHE_DIR") or DEFAULT_CACHE_DIR)
+
+
+def _ttl_sec() -> float:
+    try:
+        return float(os.getenv("MARKET_SNAPSHOT_TTL_SEC", DEFAULT_TTL_SEC))
+    except (TypeError, ValueError):
+        return DEFAULT_TTL_SEC
+
+
+def _norm_date(value) -> str:
+    """'YYYY-MM-DD' / 'YYYYMMDD' / datetime → 'YYYYMMDD'."""
+    if hasattr(value, "strftime"):
+        return value.strftime("%Y%m%d")
+    return str(value).replace("-", "")[:8]
+
+
+def snapshot_path(kind: str, trade_date, cache_dir=None) -> Path:
+    return _get_cache_dir(cache_dir) / f"{kind}_{_norm_date(trade_date)}.{_EXT}"
+
+
+def is_final(trade_date, fetched_at: float) -> bool:
+    """True if a frame fetched at fetched_at (epoch) holds the closed session's data."""
+    fetched = datetime.fromtimestamp(fetched_at, _MARKET_TZ)
+    day = fetched.strftime("%Y%m%d")
+    date_str = _norm_date(trade_date)
+    return day > date_str or (day == date_str and fetched.strftime("%H%M") >= FINAL_AFTER)
+
+
+def _read(path: Path) -> Optional[pd.DataFrame]:
+    try:
+        return pd.read_parquet(path) if _EXT == "parquet" else pd.read_pickle(path)
+    except Exception as e:
+        logger.warning(f"[SNAPSHOT-CACHE] unreadable {path.name}: {e}")
+        return None
+
+
+def _write(path: Path, df: pd.DataFrame) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        if _EXT == "parquet":
+            df.to_parquet(tmp)
+        else:
+            df.to_pickle(tmp)
+        os.replace(tmp, path)  # atomic: concurrent jobs never see a partial file
+    except Exception as e:
+        logger.warning(f"[SNAPSHOT-CACHE] could not write {path.name}: {e}")
+        tmp.unlink(missing_ok=True)
+
+
+def _read_store(trade_date, db_path=None) -> Optional[pd.DataFrame]:
+    try:
+        conn = daily_bar_store.get_connection(db_path)
+        try:
+            return daily_bar_store.read_market_snapshot(conn, "KR", trade_date, adjusted=False)
+        finally:
+            conn.close()
+    except Exception as e:
+        logger.warning(f"[SNAPSHOT-CACHE] daily-bar store unreadable: {e}")
+        return None
+
+
+def _write_store(trade_date, df: pd.DataFrame, db_path=None) -> bool:
+    try:
+        conn = daily_bar_store.get_connection(db_path)
+        try:
+            daily_bar_store.upsert_market_snapshot(conn, "KR", trade_date, df, adjusted=False, final=True)
+        finally:
+            conn.close()
+        return True
+    except Exception as e:
+        logger.warning(f"[SNAPSHOT-CACHE] could not store {_norm_date(trade_date)} snapshot: {e}")
+        return False
+
+
+def get_frame(kind: str, trade_date, fetcher: Callable[[], pd.DataFrame],
+              cache_dir=None, now: Optional[float] = None, db_path=None) -> pd.DataFrame:
+    """Serve a whole-market frame for (kind, trade_date) from disk, fetching when needed.
+
+    Args:
+        kind: Frame kind, part of the file name (e.g. "ohlcv", "cap_ALL")
+        trade_date: 'YYYYMMDD' or 'YYYY-MM-DD'
+        fetcher: fetcher() → the frame, called on a miss or an expired intraday frame
+        cache_dir: Cache directory override (tests)
+        now: epoch override (tests)
+        db_path: Daily-bar store override for final ohlcv frames (tests)
+
+    Returns:
+        The cached or freshly fetched frame (whatever fetcher returns when it is empty).
+    """
+    if not is_enabled():
+        return fetcher()
+
+    now = time.time() if now is None else now
+    use_store = kind == STORE_KIND and daily_bar_store.is_enabled()
+    if use_store:
+        stored = _read_store(trade_date, db_path)
+        if stored is not None and not stored.empty:
+            logger.debug(f"[SNAPSHOT-CACHE] store hit {kind} {_norm_date(trade_date)}")
+            return stored
+
+    path = snapshot_path(kind, trade_date, cache_dir)
+    stale = None
+    if path.exists():
+        mtime = path.stat().st_mtime
+        cached = _read(path)
+        if cached is not None:
+            if is_final(trade_date, mtime) or now - mtime < _ttl_sec():
+                logger.debug(f"[SNAPSHOT-CACHE] hit {path.name}")
+                return cached
+            stale = cached
+
+    try:
+        df = fetcher()
+    except Exception as e:
+        if stale is None:
+            raise
+        logger.warning(f"[SNAPSHOT-CACHE] {kind} {_norm_date(trade_date)} fetch failed: {e}; "
+                       f"serving stale snapshot")
+        return stale
+
+    if df is not None and not df.empty:
+        if use_store and is_final(trade_date, now) and _write_store(trade_date, df, db_path):
+            path.unlink(missing_ok=True)   # drop the superseded intraday file
+        else:
+            _write(path, df)
+    elif stale is not None:
+        logger.warning(f"[SNAPSHOT-CACHE] {kind} {_norm_date(trade_date)} fetch returned no rows; "
+                       f"serving stale snapshot")
+        return stale
+    return df
@@ -5,9 +5,10 @@ production orchestrators. It answers three questions, and nothing else:
 
   1. :func:`decide_batch_policy` — given (market, batch_mode, pulse_state), should
      THIS analysis batch run, or rest? Pure, table-driven, no I/O, no env reads.
-  2. :func:`get_market_pulse_state` — compute the CURRENT pulse state by replaying
-     :class:`cores.market_pulse.MarketPulse` over the last ~400 calendar days of
-     index bars. Fail-open: ANY error returns ``None`` (never raises).
+  2. :func:`get_market_pulse_state` — compute the CURRENT pulse state with
+     :class:`cores.market_pulse.MarketPulse`, resuming from the per-market
+     checkpoint of the last closed session (first run: a ~400 calendar day
+     replay). Fail-open: ANY error returns ``None`` (never raises).
   3. :func:`market_pulse_mode` — read the ``MARKET_PULSE_MODE`` env flag
      (``shadow`` | ``live`` | ``off``; default ``shadow``).
 
@@ -40,9 +41,11 @@ file path even when ``sys.path`` shadowing (prism-us/cores) would otherwise win.
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -78,9 +81,21 @@ _UNDER_PRESSURE_REST_BATCHES: dict[str, frozenset[str]] = {}
 _STATE_CACHE: dict = {}
 
 # Item 4: post-FTD pilot re-exposure cache (per-process). True/False memoized so
-# the ~400d index replay runs at most once per market per process. Fail-open False.
+# the index fetch runs at most once per market per process. Fail-open False.
 _PILOT_CACHE: dict = {}
 
+# Per-process MarketPulse shared by the state and pilot checks (one fetch per market).
+_PULSE_CACHE: dict = {}
+
+# Cross-process MarketPulse checkpoints: one JSON snapshot per (market, last closed
+# session) so each new process only fetches and feeds the bars since then instead
+# of replaying ~400 days. MARKET_PULSE_CHECKPOINT=false disables (full replay).
+DEFAULT_CHECKPOINT_DIR = Path(__file__).parent.parent / "market_pulse_state"
+_CHECKPOINT_KEEP = 10            # newest checkpoint files kept per market
+_FULL_REPLAY_DAYS = 400          # calendar days fetched when there is no checkpoint
+_CHECKPOINT_CLOSE_TOLERANCE = 1e-6
+_MARKET_TZ = {"kr": "Asia/Seoul", "us": "America/New_York"}
+
 
 @dataclass(frozen=True)
 class BatchPolicy:
@@ -283,8 +298,9 @@ def _df_to_bars(df, close_col: str, vol_col: Optional[str], DailyBar):
     return bars
 
 
-def _fetch_kr_bars(DailyBar):
-    """KOSPI index (1001) ~400d daily OHLCV via the authenticated KRX client.
+def _fetch_kr_bars(DailyBar, days: int = _FULL_REPLAY_DAYS):
+    """KOSPI index (1001) daily OHLCV for the last ``days`` calendar days via the
+    authenticated KRX client.
 
     Mirrors tools/market_pulse_backtest.py:fetch_kr_bars but with a 400-day window
     (~2 yearly chunks; the KRX API rejects a 6y single request with INVALIDPERIOD2,
@@ -297,7 +313,7 @@ def _fetch_kr_bars(DailyBar):
     get_index_ohlcv_by_date = sc.get_index_ohlcv_by_date
 
     end_dt = datetime.now()
-    start_dt = end_dt - timedelta(days=400)
+    start_dt = end_dt - timedelta(days=days)
     chunks = []
     y = start_dt.year
     while y <= end_dt.year:
@@ -321,13 +337,20 @@ def _fetch_kr_bars(DailyBar):
     return _df_to_bars(df, close_col, vol_col, DailyBar)
 
 
-def _fetch_us_bars(DailyBar):
-    """S&P 500 (^GSPC) daily via yfinance (period=2y ~ the 400d window)."""
+def _fetch_us_bars(DailyBar, days: Optional[int] = None):
+    """S&P 500 (^GSPC) daily via yfinance (period=2y ~ the 400d window, or the
+    last ``days`` calendar days)."""
     import pandas as pd
     import yfinance as yf
+    from datetime import datetime, timedelta
 
-    df = yf.download("^GSPC", period="2y", interval="1d",
-                     auto_adjust=True, progress=False)
+    if days is None:
+        df = yf.download("^GSPC", period="2y", interval="1d",
+                         auto_adjust=True, progress=False)
+    else:
+        start = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        df = yf.download("^GSPC", start=start, interval="1d",
+                         auto_adjust=True, progress=False)
     if isinstance(df.columns, pd.MultiIndex):
         df.columns = df.columns.get_level_values(0)
     df = df.dropna(how="all")
@@ -337,16 +360,136 @@ def _fetch_us_bars(DailyBar):
     return _df_to_bars(df.sort_index(), "Close", vol_col, DailyBar)
 
 
+def pulse_checkpoint_enabled() -> bool:
+    """Return False when MARKET_PULSE_CHECKPOINT is falsy (0/false/no/off). Default ON."""
+    return os.getenv("MARKET_PULSE_CHECKPOINT", "true").strip().lower() not in (
+        "0", "false", "no", "off"
+    )
+
+
+def _checkpoint_dir() -> Path:
+    return Path(os.getenv("MARKET_PULSE_CHECKPOINT_DIR") or DEFAULT_CHECKPOINT_DIR)
+
+
+def _market_today(m: str) -> str:
+    """Market-local date 'YYYY-MM-DD' (bars on/after it are not closed yet)."""
+    from datetime import datetime
+    from zoneinfo import ZoneInfo
+
+    return datetime.now(ZoneInfo(_MARKET_TZ.get(m, "Asia/Seoul"))).strftime("%Y-%m-%d")
+
+
+def _load_checkpoint(m: str) -> Optional[dict]:
+    """Newest checkpoint for ``m`` (``pulse_<m>_<YYYYMMDD>.json``) or None."""
+    files = sorted(_checkpoint_dir().glob(f"pulse_{m}_*.json"))
+    if not files:
+        return None
+    try:
+        return json.loads(files[-1].read_text(encoding="utf-8"))
+    except Exception as e:  # noqa: BLE001 - unreadable => full replay
+        logger.warning("[MARKET_PULSE] unreadable checkpoint %s: %s", files[-1].name, e)
+        return None
+
+
+def _save_checkpoint(m: str, snap: dict) -> None:
+    """Write the snapshot under its last session date; prune old files. Never raises."""
+    try:
+        directory = _checkpoint_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"pulse_{m}_{snap['dates'][-1].replace('-', '')}.json"
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(snap), encoding="utf-8")
+        os.replace(tmp, path)
+        for old in sorted(directory.glob(f"pulse_{m}_*.json"))[:-_CHECKPOINT_KEEP]:
+            old.unlink(missing_ok=True)
+    except Exception as e:  # noqa: BLE001 - checkpoint is an optimization only
+        logger.warning("[MARKET_PULSE] checkpoint save failed for %s: %s", m, e)
+
+
+def _resume_from_checkpoint(m: str, MarketPulse, DailyBar, fetch, today: str):
+    """(MarketPulse restored from the checkpoint, bars after its last session),
+    or (None, None) when there is no usable checkpoint.
+
+    The fetch starts at the checkpoint's last session; that overlap bar must
+    still carry the stored close, otherwise (index revised, gap in the data) the
+    caller falls back to a full replay. Fetch errors propagate (fail-open upstream).
+    """
+    from datetime import date
+
+    snap = _load_checkpoint(m)
+    if snap is None:
+        return None, None
+    try:
+        mp = MarketPulse.from_snapshot(snap)
+        last = mp.last_date
+        gap = (date.fromisoformat(today) - date.fromisoformat(last)).days
+    except Exception as e:  # noqa: BLE001 - corrupt checkpoint => full replay
+        logger.warning("[MARKET_PULSE] %s checkpoint unusable (%s); full replay", m, e)
+        return None, None
+    if gap > _FULL_REPLAY_DAYS:
+        return None, None
+
+    bars = fetch(DailyBar, days=gap + 1)
+    overlap = [b for b in bars if b.date == last]
+    stored = snap["closes"][-1]
+    if not overlap or abs(overlap[0].close - stored) > _CHECKPOINT_CLOSE_TOLERANCE * max(abs(stored), 1.0):
+        logger.info("[MARKET_PULSE] %s checkpoint %s does not match fetched bars; full replay", m, last)
+        return None, None
+    return mp, [b for b in bars if b.date > last]
+
+
+def _compute_pulse(m: str, use_cache: bool = True):
+    """MarketPulse for ``m`` ("kr" | "us") fed through the latest index bar.
+
+    Resumes from the newest checkpoint and feeds only the bars since then; with
+    no usable checkpoint it replays ~400 calendar days. Closed sessions (before
+    the market-local today) are fed first and checkpointed; today's in-progress
+    bar is fed afterwards so it never ends up in a checkpoint. Memoized per
+    process (:data:`_PULSE_CACHE`). Raises on fetch errors (callers fail open).
+    """
+    if use_cache and m in _PULSE_CACHE:
+        return _PULSE_CACHE[m]
+
+    mp_mod = _load_root_cores("market_pulse")
+    MarketPulse = mp_mod.MarketPulse
+    DailyBar = mp_mod.DailyBar
+    fetch = _fetch_kr_bars if m == "kr" else _fetch_us_bars
+    today = _market_today(m)
+    use_checkpoint = pulse_checkpoint_enabled()
+
+    mp, bars = (None, None)
+    if use_checkpoint:
+        mp, bars = _resume_from_checkpoint(m, MarketPulse, DailyBar, fetch, today)
+    if mp is None:
+        bars = fetch(DailyBar)
+        if not bars or len(bars) < 30:
+            raise RuntimeError(f"insufficient index bars: {len(bars) if bars else 0}")
+        mp = MarketPulse()
+
+    closed = [b for b in bars if b.date < today]
+    for bar in closed:
+        mp.feed(bar)
+    if use_checkpoint and closed:
+        _save_checkpoint(m, mp.snapshot())
+    for bar in bars[len(closed):]:
+        mp.feed(bar)
+
+    _PULSE_CACHE[m] = mp
+    return mp
+
+
 def get_market_pulse_state(market: str, use_cache: bool = True) -> Optional[str]:
     """Compute the current Market Pulse state for ``market`` ("kr" | "us").
 
-    Replays :class:`cores.market_pulse.MarketPulse` over ~400 calendar days of
-    index bars and returns the final state string (UPTREND / UNDER_PRESSURE /
-    CORRECTION). Memoized per process (:data:`_STATE_CACHE`).
+    Runs :class:`cores.market_pulse.MarketPulse` through the latest index bar
+    (:func:`_compute_pulse`: checkpoint + new bars, or a ~400 calendar day replay)
+    and returns the final state string (UPTREND / UNDER_PRESSURE / CORRECTION).
+    Memoized per process (:data:`_STATE_CACHE`).
 
     NOTE: 400 days is enough for current-state purposes (the rolling peak / DD
     window reference stays inside this window). A state read near the window edge
     can differ slightly from a full 6-year replay — acceptable for policy use.
+    Checkpoints only extend the history the machine has seen.
 
     Fail-open: ANY exception (network, auth, missing data, import) is logged as a
     warning and returns ``None`` (cached), so this never raises into a production
@@ -357,26 +500,12 @@ def get_market_pulse_state(market: str, use_cache: bool = True) -> Optional[str]
         return _STATE_CACHE[m]
 
     try:
-        mp_mod = _load_root_cores("market_pulse")
-        MarketPulse = mp_mod.MarketPulse
-        DailyBar = mp_mod.DailyBar
-
-        if m == "kr":
-            bars = _fetch_kr_bars(DailyBar)
-        elif m == "us":
-            bars = _fetch_us_bars(DailyBar)
-        else:
+        if m not in ("kr", "us"):
             logger.warning("[MARKET_PULSE] unknown market %r -> None", market)
             _STATE_CACHE[m] = None
             return None
 
-        if not bars or len(bars) < 30:
-            raise RuntimeError(f"insufficient index bars: {len(bars) if bars else 0}")
-
-        mp = MarketPulse()
-        state: Optional[str] = None
-        for bar in bars:
-            state = mp.feed(bar)
+        state: Optional[str] = _compute_pulse(m, use_cache).state
         _STATE_CACHE[m] = state
         return state
     except Exception as e:  # noqa: BLE001 - fail-open, never raise
@@ -390,6 +519,7 @@ def _reset_state_cache() -> None:
     """Test/utility hook: clear the memoized pulse-state + pilot caches."""
     _STATE_CACHE.clear()
     _PILOT_CACHE.clear()
+    _PULSE_CACHE.clear()
 
 
 # --------------------------------------------------------------------------- #
@@ -450,8 +580,9 @@ def is_pilot_window(sessions_ago: Optional[int], flag_on: Optional[bool] = None)
 def pilot_reexposure_active(market: str, use_cache: bool = True) -> bool:
     """Return True when the pilot new-entry throttle applies for ``market`` ("kr" | "us").
 
-    Flag OFF -> False (no replay, zero cost). Otherwise replays MarketPulse over
-    ~400d of index bars, finds the last CORRECTION exit, and checks the window.
+    Flag OFF -> False (no replay, zero cost). Otherwise runs MarketPulse through
+    the latest index bar (:func:`_compute_pulse`, shared with the state check),
+    takes the sessions since the last CORRECTION exit, and checks the window.
     Memoized per process (:data:`_PILOT_CACHE`). Fail-open: ANY error -> False
     (정상 진입), so this never raises into a production buy path.
     """
@@ -461,25 +592,12 @@ def pilot_reexposure_active(market: str, use_cache: bool = True) -> bool:
     if use_cache and m in _PILOT_CACHE:
         return _PILOT_CACHE[m]
     try:
-        mp_mod = _load_root_cores("market_pulse")
-        MarketPulse = mp_mod.MarketPulse
-        DailyBar = mp_mod.DailyBar
-
-        if m == "kr":
-            bars = _fetch_kr_bars(DailyBar)
-        elif m == "us":
-            bars = _fetch_us_bars(DailyBar)
-        else:
+        if m not in ("kr", "us"):
             logger.warning("[PULSE_PILOT] unknown market %r -> full size", market)
             _PILOT_CACHE[m] = False
             return False
 
-        if not bars or len(bars) < 30:
-            raise RuntimeError(f"insufficient index bars: {len(bars) if bars else 0}")
-
-        mp = MarketPulse()
-        states = [mp.feed(bar) for bar in bars]
-        ago = _sessions_since_correction_exit(states)
+        ago = _compute_pulse(m, use_cache).sessions_since_correction_exit
         active = is_pilot_window(ago, flag_on=True)
         _PILOT_CACHE[m] = active
         return active
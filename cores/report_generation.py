@@ -4,6 +4,7 @@ from mcp_agent.workflows.llm.augmented_llm import RequestParams
 from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
 
 from cores.openai_error_logging import log_openai_error
+from cores.llm.governor import governed_generate_str
 
 
 # Language name mapping for report generation
@@ -103,7 +104,8 @@ async def generate_report(agent, section, company_name, company_code, reference_
 """
 
     try:
-        report = await llm.generate_str(
+        report = await governed_generate_str(
+            llm,
             message=message,
             request_params=RequestParams(
                 model="gpt-5.4-mini",
@@ -197,7 +199,8 @@ async def generate_market_report(agent, section, reference_date, logger, languag
 """
 
     try:
-        report = await llm.generate_str(
+        report = await governed_generate_str(
+            llm,
             message=message,
             request_params=RequestParams(
                 model="gpt-5.4-mini",
@@ -311,7 +314,8 @@ Comprehensive Analysis Report:
         )
 
         llm = await summary_agent.attach_llm(OpenAIAugmentedLLM)
-        executive_summary = await llm.generate_str(
+        executive_summary = await governed_generate_str(
+            llm,
             message=message,
             request_params=RequestParams(
                 model="gpt-5.4-mini",
@@ -548,7 +552,8 @@ Please present a consistent and executable investment strategy that investors ca
         )
 
         llm = await investment_strategy_agent.attach_llm(OpenAIAugmentedLLM)
-        investment_strategy = await llm.generate_str(
+        investment_strategy = await governed_generate_str(
+            llm,
             message=message,
             request_params=RequestParams(
                 model="gpt-5.4-mini",
@@ -0,0 +1,77 @@
+"""
+Bounded-concurrency helpers for the report pipeline.
+
+StockAnalysisOrchestrator used to analyze the selected tickers strictly one
+after another (each run is minutes of mostly waiting on LLM/MCP calls). These
+helpers let it analyze a few tickers at once:
+
+- report_parallelism: the single PRISM_PARALLEL_REPORT setting, shared by the
+  orchestrator (tickers in flight) and cores.analysis (parallel sections).
+- run_bounded: run a coroutine per item with at most N in flight and hand each
+  finished result to a callback so post-processing (PDF, summary) overlaps the
+  remaining analyses.
+
+Provider rate limits are not handled here: every LLM call of an analysis or a
+Telegram summary is admitted by cores.llm.governor, whatever the concurrency.
+"""
+import asyncio
+import logging
+import os
+from typing import Any, Awaitable, Callable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+def report_parallelism() -> int:
+    """
+    Parse PRISM_PARALLEL_REPORT.
+
+    - "false" / unset / "0": 0 - serial sections, one ticker at a time
+    - "true" / "1":          1 - parallel sections, one ticker at a time
+    - N >= 2:                N - parallel sections, N tickers at a time
+
+    Unparseable values fall back to 0 (the safe serial mode).
+    """
+    raw = os.getenv("PRISM_PARALLEL_REPORT", "false").strip().lower()
+    if raw in ("", "false", "no", "off"):
+        return 0
+    if raw in ("true", "yes", "on"):
+        return 1
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(f"Invalid PRISM_PARALLEL_REPORT={raw!r}, using serial mode")
+        return 0
+
+
+async def run_bounded(
+    items: Sequence[Any],
+    worker: Callable[[int, Any], Awaitable[Any]],
+    concurrency: int = 1,
+    on_result: Optional[Callable[[int, Any, Any], Awaitable[None]]] = None,
+) -> List[Any]:
+    """
+    Run worker(index, item) for every item, at most `concurrency` at a time.
+
+    on_result(index, item, result) is awaited as soon as that item finishes.
+    Results are returned in input order; a worker exception is logged and its
+    result is None.
+    """
+    semaphore = asyncio.Semaphore(max(1, int(concurrency)))
+    results: List[Any] = [None] * len(items)
+
+    async def _run(index: int, item: Any) -> None:
+        async with semaphore:
+            try:
+                results[index] = await worker(index, item)
+            except Exception as e:
+                logger.error(f"Pipeline job {index + 1}/{len(items)} failed: {e}")
+                results[index] = None
+        if on_result is not None:
+            try:
+                await on_result(index, item, results[index])
+            except Exception as e:
+                logger.error(f"Pipeline callback for job {index + 1}/{len(items)} failed: {e}")
+
+    await asyncio.gather(*(_run(i, item) for i, item in enumerate(items)))
+    return results
@@ -1,7 +1,7 @@
 """
 O'Neil 다개월 가중 RS Rating — 공용 순수 모듈
 =================================================
-데이터소스 비의존. pandas만 사용. IO/로깅 없음.
+데이터소스 비의존. pandas/numpy만 사용. IO/로깅 없음.
 
 IBD 근사식 (William J. O'Neil, CANSLIM):
   raw = 2*R63 + R126 + R189 + R252
@@ -9,12 +9,21 @@ IBD 근사식 (William J. O'Neil, CANSLIM):
 
 용도: KR/US 스크리닝 RS Score 계산 (Phase B SHADOW-gate).
      백테스트 근거: PR #436 (KR/US 모두 현행 60d 단일수익률 대비 우위 확인).
+
+배치 API (전 시장 유니버스 랭킹용):
+  oneil_weighted_returns(date×ticker 종가 행렬) → ticker별 raw (1회 벡터 연산)
+  rs_ratings(행렬)                              → raw + 1~99 백분위 (유니버스 내)
+  universe_percentile_ratings(후보 raw, 유니버스 raw) → 후보를 시장 분포 대비 백분위로
 """
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
+ONEIL_OFFSETS = (63, 126, 189, 252)
+ONEIL_WEIGHTS = (2.0, 1.0, 1.0, 1.0)
+
 
 def oneil_weighted_return(closes: pd.Series) -> float | None:
     """O'Neil 다개월 가중 수익률 (raw RS Rating 원재료).
@@ -65,12 +74,85 @@ def percentile_ratings(raw: dict[str, float]) -> dict[str, float]:
     if len(raw) == 1:
         return {next(iter(raw)): 50.0}
 
-    tickers = list(raw.keys())
-    values = list(raw.values())
-    n = len(values)
-    result: dict[str, float] = {}
-    for ticker, val in zip(tickers, values):
-        rank = sum(1 for v in values if v <= val)
-        pct = max(1.0, min(99.0, rank / n * 99.0))
-        result[ticker] = float(pct)
-    return result
+    values = np.fromiter(raw.values(), dtype=float, count=len(raw))
+    pct = _percentiles(values, values)
+    return {ticker: float(p) for ticker, p in zip(raw.keys(), pct)}
+
+
+def oneil_weighted_returns(closes: pd.DataFrame) -> pd.Series:
+    """oneil_weighted_return 의 배치판: date×ticker 종가 행렬 → ticker별 raw.
+
+    컬럼마다 oneil_weighted_return(closes[col]) 와 동일한 값 — 각 종목의 유효(non-NaN)
+    종가만 기준으로 n거래일 전을 센다(거래정지/신규상장으로 행 수가 달라도 동일).
+
+    Parameters
+    ----------
+    closes : pd.DataFrame
+        index=날짜, columns=ticker. 방어적으로 index 오름차순 정렬 후 사용.
+
+    Returns
+    -------
+    pd.Series
+        ticker → raw. 히스토리 부족(유효 종가 <= 252)이면 NaN.
+    """
+    if closes.empty:
+        return pd.Series(dtype=float)
+    values = closes.sort_index().to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    # 유효 종가를 원래 순서대로 위로 모은다 (stable sort) → 종목별 마지막 유효값 기준 오프셋 인덱싱
+    order = np.argsort(~valid, axis=0, kind="stable")
+    packed = np.take_along_axis(values, order, axis=0)
+    count = valid.sum(axis=0)
+    enough = count > max(ONEIL_OFFSETS)
+    cols = np.arange(values.shape[1])
+    last = np.where(enough, count - 1, 0)
+    p0 = packed[last, cols]
+
+    raw = np.zeros(values.shape[1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for n, weight in zip(ONEIL_OFFSETS, ONEIL_WEIGHTS):
+            p_n = packed[np.where(enough, last - n, 0), cols]
+            raw += weight * np.where(p_n > 0, (p0 - p_n) / p_n, 0.0)
+    return pd.Series(np.where(enough, raw, np.nan), index=closes.columns, dtype=float)
+
+
+def _percentiles(values: np.ndarray, universe: np.ndarray) -> np.ndarray:
+    """values 각각의 유니버스 내 1~99 백분위 (rank = universe 중 <= 값의 개수)."""
+    ranks = np.searchsorted(np.sort(universe), values, side="right")
+    return np.clip(ranks / len(universe) * 99.0, 1.0, 99.0)
+
+
+def rs_ratings(closes: pd.DataFrame) -> pd.DataFrame:
+    """date×ticker 종가 행렬 → ticker별 oneil_raw + rs_rating(1~99, 행렬 전체 대비).
+
+    percentile_ratings 와 동일한 백분위/동점 규칙. 히스토리 부족 종목은 제외.
+
+    Returns
+    -------
+    pd.DataFrame
+        index=ticker, columns=["oneil_raw", "rs_rating"].
+    """
+    raw = oneil_weighted_returns(closes).dropna()
+    if raw.empty:
+        return pd.DataFrame(columns=["oneil_raw", "rs_rating"], dtype=float)
+    if len(raw) == 1:
+        pct = np.array([50.0])
+    else:
+        pct = _percentiles(raw.to_numpy(), raw.to_numpy())
+    return pd.DataFrame({"oneil_raw": raw, "rs_rating": pct}, index=raw.index)
+
+
+def universe_percentile_ratings(raw: dict[str, float], universe_raw: pd.Series) -> dict[str, float]:
+    """후보 raw → 시장 유니버스 raw 분포 대비 1~99 백분위.
+
+    후보끼리가 아니라 전 시장(예: KOSPI+KOSDAQ, S&P500+NASDAQ100) 대비 순위 —
+    IBD RS Rating 정의. 동점/클리핑 규칙은 percentile_ratings 와 동일
+    (rank = 유니버스 중 raw <= 값의 개수). 유니버스가 비면 percentile_ratings 로 대체.
+    """
+    if not raw:
+        return {}
+    universe = pd.Series(universe_raw, dtype=float).dropna().to_numpy()
+    if len(universe) == 0:
+        return percentile_ratings(raw)
+    pct = _percentiles(np.fromiter(raw.values(), dtype=float, count=len(raw)), universe)
+    return {ticker: float(p) for ticker, p in zip(raw.keys(), pct)}
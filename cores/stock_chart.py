@@ -413,6 +413,19 @@ from krx_data_client import (
     get_index_ohlcv_by_date,
 )
 
+from cores import daily_bar_store
+
+
+def _fetch_daily_ohlcv(ticker, start_date, end_date, adjusted=True):
+    """Daily OHLCV via the local daily-bar store (only missing days hit KRX)."""
+    if not daily_bar_store.is_enabled():
+        return get_market_ohlcv_by_date(start_date, end_date, ticker, adjusted=adjusted)
+    return daily_bar_store.get_daily_bars(
+        ticker, start_date, end_date,
+        fetcher=lambda start, end: get_market_ohlcv_by_date(start, end, ticker, adjusted=adjusted),
+        adjusted=adjusted,
+    )
+
 # Professional chart style configuration
 sns.set_context("paper", font_scale=1.2)
 warnings.filterwarnings('ignore')
@@ -487,7 +500,7 @@ def create_price_chart(ticker, company_name=None, days=730, save_path=None, adju
             company_name = ticker
 
     # Fetch stock data
-    df = get_market_ohlcv_by_date(start_date, end_date, ticker, adjusted=adjusted)
+    df = _fetch_daily_ohlcv(ticker, start_date, end_date, adjusted=adjusted)
 
     if df is None or len(df) == 0:
         logger.info(f"No data available for {ticker}.")
@@ -1613,7 +1626,7 @@ def create_oneil_daily_chart(
         except Exception:
             company_name = ticker
 
-    df = get_market_ohlcv_by_date(start_date, end_date, ticker, adjusted=adjusted)
+    df = _fetch_daily_ohlcv(ticker, start_date, end_date, adjusted=adjusted)
     if df is None or len(df) == 0:
         logger.info(f"[ONEIL] No daily data for {ticker}.")
         return None
@@ -1747,7 +1760,7 @@ def create_oneil_weekly_chart(
         except Exception:
             company_name = ticker
 
-    daily = get_market_ohlcv_by_date(start_date, end_date, ticker, adjusted=adjusted)
+    daily = _fetch_daily_ohlcv(ticker, start_date, end_date, adjusted=adjusted)
     if daily is None or len(daily) == 0:
         logger.info(f"[ONEIL] No daily data for {ticker} (weekly).")
         return None
@@ -37,6 +37,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from events.jeoningu_trading_db import JeoninguTradingDB
 from events.jeoningu_price_fetcher import get_current_price
+from cores.llm.governor import governed_generate_str
 
 # Setup directories
 DATA_DIR = Path(__file__).parent
@@ -232,7 +233,8 @@ Output only one of: "Own Opinion" or "Interview"
 
                 async with app.run() as _:
                     llm = await agent.attach_llm(OpenAIAugmentedLLM)
-                    result = await llm.generate_str(
+                    result = await governed_generate_str(
+                        llm,
                         message="Analyze the above title and output only 'Own Opinion' or 'Interview'.",
                         request_params=RequestParams(
                             model="gpt-4.1-mini",  # Better instruction following than nano ($0.40/1M in, $1.60/1M out)
@@ -521,7 +523,8 @@ Output must follow the JSON schema below (pure JSON only, no markdown code block
 
             async with app.run() as _:
                 llm = await agent.attach_llm(OpenAIAugmentedLLM)
-                result = await llm.generate_str(
+                result = await governed_generate_str(
+                    llm,
                     message="Analyze the video according to the instructions above and output the contrarian investment strategy in JSON format.",
                     request_params=RequestParams(
                         model="gpt-4.1",
@@ -0,0 +1,181 @@
+"""
+Materialized state for the dashboard JSON generators (incremental refresh).
+
+generate_dashboard_json.py / generate_us_dashboard_json.py run from cron every few
+minutes, but most sections (trading history, watchlist, journal insights,
+performance analysis) only change when the trading agents write to the DB. The
+state file keeps each section's last result next to a fingerprint of the tables
+it reads; a section is recomputed only when one of those fingerprints changed.
+
+- table fingerprint: row count, max rowid and per-column totals (numeric sum /
+  text length) in a single SQL scan — catches inserts, deletes and in-place
+  updates without parsing any rows in Python;
+- index series (KOSPI/KOSDAQ, S&P 500/NASDAQ) are merged by date, so only the
+  last few sessions are re-downloaded;
+- every section is still recomputed at least every DASHBOARD_STATE_MAX_AGE_SEC.
+
+Sections with live inputs (holdings days, today's AI decisions, KIS account,
+jeoningu live price) are not cached.
+
+Env:
+    DASHBOARD_INCREMENTAL          "false" recomputes everything (default: true)
+    DASHBOARD_STATE_DIR            state directory (default: <project>/dashboard_state)
+    DASHBOARD_STATE_MAX_AGE_SEC    forced full refresh interval (default: 3600)
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+STATE_VERSION = 1
+DEFAULT_MAX_AGE_SEC = 3600
+SERIES_OVERLAP = 5   # sessions re-fetched at the end of a cached index series (revisions / today)
+
+
+def is_enabled() -> bool:
+    """DASHBOARD_INCREMENTAL env flag; default ON."""
+    return os.getenv("DASHBOARD_INCREMENTAL", "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+def state_dir() -> Path:
+    return Path(os.getenv("DASHBOARD_STATE_DIR") or PROJECT_ROOT / "dashboard_state")
+
+
+def table_fingerprint(conn: sqlite3.Connection, table: str) -> Optional[List[Any]]:
+    """Cheap change signature of *table*; None if the table does not exist."""
+    try:
+        columns = conn.execute(f"PRAGMA table_info({table})").fetchall()
+        if not columns:
+            return None
+        parts = ["COUNT(*)", "MAX(rowid)"]
+        for col in columns:
+            name, col_type = col[1], (col[2] or "").upper()
+            if any(t in col_type for t in ("INT", "REAL", "NUM", "FLOA", "DOUB", "BOOL")):
+                parts.append(f'TOTAL("{name}")')
+            else:
+                parts.append(f'TOTAL(LENGTH("{name}"))')
+        row = conn.execute(f"SELECT {', '.join(parts)} FROM {table}").fetchone()
+        return list(row)
+    except sqlite3.Error as e:
+        logger.warning(f"Fingerprint failed for {table}: {e}")
+        return None
+
+
+def merge_series(cached: List[Dict], fresh: List[Dict], key: str = "date") -> List[Dict]:
+    """Date-keyed union of two series; *fresh* wins on overlapping dates."""
+    merged = {item[key]: item for item in cached}
+    merged.update((item[key], item) for item in fresh)
+    return [merged[k] for k in sorted(merged)]
+
+
+def cumulative_realized_profit(trading_history: List[Dict], market_data: List[Dict],
+                               start_date: str, slots: int = 10) -> List[Dict]:
+    """Cumulative realized profit per market date, in one merge pass over both series.
+
+    ``market_data`` must be sorted by date; trades are keyed by the date part of
+    ``sell_date``. The simulator return is the profit sum spread over ``slots``.
+    """
+    sells = sorted(
+        ((t['sell_date'].split(' ')[0], t.get('profit_rate', 0) or 0)
+         for t in trading_history if t.get('sell_date')),
+        key=lambda s: s[0],
+    )
+    result = []
+    i, cumulative = 0, 0.0
+    for market_item in market_data:
+        date = market_item.get('date', '')
+        while i < len(sells) and sells[i][0] <= date:
+            cumulative += sells[i][1]
+            i += 1
+        if date < start_date:
+            continue
+        result.append({
+            'date': date,
+            'cumulative_realized_profit': cumulative,
+            'prism_simulator_return': cumulative / slots,
+        })
+    return result
+
+
+class DashboardState:
+    """Section results + table fingerprints persisted between generator runs."""
+
+    def __init__(self, name: str, directory: Optional[Path] = None, enabled: Optional[bool] = None,
+                 max_age_sec: Optional[float] = None, clock: Callable[[], float] = time.time):
+        self.path = Path(directory or state_dir()) / f"{name}.json"
+        self.enabled = is_enabled() if enabled is None else enabled
+        if max_age_sec is None:
+            max_age_sec = float(os.getenv("DASHBOARD_STATE_MAX_AGE_SEC", DEFAULT_MAX_AGE_SEC))
+        self.max_age_sec = max_age_sec
+        self._clock = clock
+        self.hits: List[str] = []
+        self.misses: List[str] = []
+        self._data = {"version": STATE_VERSION, "sections": {}, "series": {}}
+        if self.enabled:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dashboard state unreadable, full refresh: {e}")
+            return
+        if data.get("version") == STATE_VERSION:
+            self._data = data
+
+    def section(self, key: str, conn: sqlite3.Connection, tables: List[str], compute: Callable[[], Any]) -> Any:
+        """Cached result of *compute* while none of *tables* changed."""
+        fingerprint = {t: table_fingerprint(conn, t) for t in tables}
+        entry = self._data["sections"].get(key)
+        if (self.enabled and entry is not None and entry["fingerprint"] == fingerprint
+                and self._clock() - entry["computed_at"] < self.max_age_sec):
+            self.hits.append(key)
+            return entry["value"]
+        value = compute()
+        self.misses.append(key)
+        self._data["sections"][key] = {"fingerprint": fingerprint, "computed_at": self._clock(), "value": value}
+        return value
+
+    def series(self, key: str, fetch: Callable[[Optional[str]], List[Dict]]) -> List[Dict]:
+        """Date-keyed series extended incrementally: ``fetch(since)`` gets only the tail.
+
+        ``since`` is None on the first run (full history). An empty fetch keeps the
+        cached series.
+        """
+        entry = self._data["series"].get(key) if self.enabled else None
+        cached = entry["items"] if entry else []
+        fresh_enough = entry is not None and self._clock() - entry["full_at"] < self.max_age_sec * 24
+        since = cached[-SERIES_OVERLAP]["date"] if cached and fresh_enough and len(cached) >= SERIES_OVERLAP else None
+        fresh = fetch(since)
+        if not fresh:
+            return cached
+        if since is None:
+            items, full_at = fresh, self._clock()
+        else:
+            items, full_at = merge_series(cached, fresh), entry["full_at"]
+        self._data["series"][key] = {"items": items, "full_at": full_at}
+        return items
+
+    def save(self) -> None:
+        """Persist atomically (tmp file + rename); failures only cost the next run a full refresh."""
+        if not self.enabled:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Dashboard state not saved: {e}")
+        logger.info(f"Dashboard sections reused: {self.hits or '-'}, recomputed: {self.misses or '-'}")
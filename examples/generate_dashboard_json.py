@@ -60,6 +60,8 @@ except ImportError:
     TRANSLATION_AVAILABLE = False
     logger.warning("Translation utility not found. English translation disabled.")
 
+from dashboard_state import DashboardState, cumulative_realized_profit
+
 # Load configuration file
 CONFIG_FILE = TRADING_DIR / "config" / "kis_devlp.yaml"
 try:
@@ -92,6 +94,9 @@ class DashboardDataGenerator:
         self.output_path = output_path
         self.trading_mode = trading_mode if trading_mode is not None else _cfg.get("default_mode", "demo")
         self.enable_translation = enable_translation and TRANSLATION_AVAILABLE
+
+        # 증분 갱신 상태 (테이블이 바뀐 섹션만 재계산)
+        self.state = DashboardState("kr_dashboard")
         
         # Initialize translator
         if self.enable_translation:
@@ -301,10 +306,14 @@ class DashboardDataGenerator:
         
         return watchlist
     
-    def get_market_condition(self, conn) -> List[Dict]:
-        """시장 상황 데이터 가져오기 - pykrx를 사용하여 Season2 시작(2025-09-29)부터 데이터 수집"""
+    def get_market_condition(self, conn, since: str = None) -> List[Dict]:
+        """시장 상황 데이터 가져오기 - pykrx를 사용하여 Season2 시작(2025-09-29)부터 데이터 수집
+
+        since(YYYY-MM-DD)가 주어지면 그 날짜부터만 조회 (증분 갱신)
+        """
         # Season2 시작일
         SEASON2_START_DATE = "20250929"
+        start_date = since.replace("-", "") if since else SEASON2_START_DATE
 
         if not PYKRX_AVAILABLE:
             logger.warning("pykrx를 사용할 수 없습니다. DB에서 데이터를 가져옵니다.")
@@ -314,13 +323,13 @@ class DashboardDataGenerator:
             # 오늘 날짜
             today = datetime.now().strftime("%Y%m%d")
 
-            logger.info(f"pykrx로 시장 지수 데이터 조회 중... ({SEASON2_START_DATE} ~ {today})")
+            logger.info(f"pykrx로 시장 지수 데이터 조회 중... ({start_date} ~ {today})")
 
             # KOSPI 지수 데이터 가져오기 (ticker: 1001)
-            kospi_df = stock.get_index_ohlcv_by_date(SEASON2_START_DATE, today, "1001")
+            kospi_df = stock.get_index_ohlcv_by_date(start_date, today, "1001")
 
             # KOSDAQ 지수 데이터 가져오기 (ticker: 2001)
-            kosdaq_df = stock.get_index_ohlcv_by_date(SEASON2_START_DATE, today, "2001")
+            kosdaq_df = stock.get_index_ohlcv_by_date(start_date, today, "2001")
 
             if kospi_df.empty or kosdaq_df.empty:
                 logger.warning("pykrx에서 지수 데이터를 가져오지 못했습니다. DB fallback.")
@@ -532,55 +541,11 @@ class DashboardDataGenerator:
 
         - 10개 슬롯 기준으로 수익률 계산 (매도된 종목의 profit_rate 합계 / 10)
         - 각 시장 거래일에 맞춰 해당일까지의 누적 수익률 반환
+        - 매도일/거래일 정렬 후 단일 병합 패스 (O(거래일 + 거래 수))
         """
         SEASON2_START_DATE = "2025-09-29"
 
-        # 거래 이력을 날짜 기준으로 정렬 (sell_date 기준)
-        sorted_trades = sorted(
-            [t for t in trading_history if t.get('sell_date')],
-            key=lambda x: x.get('sell_date', '')
-        )
-
-        # 날짜별 누적 수익률 계산
-        cumulative_profit = 0.0
-        cumulative_by_date = {}
-
-        for trade in sorted_trades:
-            sell_date = trade.get('sell_date', '')
-            if sell_date:
-                # datetime 형식일 수 있으므로 날짜만 추출
-                if ' ' in sell_date:
-                    sell_date = sell_date.split(' ')[0]
-
-                profit_rate = trade.get('profit_rate', 0)
-                cumulative_profit += profit_rate
-                cumulative_by_date[sell_date] = cumulative_profit
-
-        # 시장 데이터의 각 날짜에 맞춰 프리즘 수익률 데이터 생성
-        result = []
-        last_cumulative = 0.0
-
-        for market_item in market_data:
-            date = market_item.get('date', '')
-
-            if date < SEASON2_START_DATE:
-                continue
-
-            # 해당 날짜까지의 누적 실현 수익률 찾기
-            for trade_date, cum_profit in cumulative_by_date.items():
-                if trade_date <= date:
-                    last_cumulative = cum_profit
-
-            # 10개 슬롯 기준 수익률 계산
-            prism_return = last_cumulative / 10
-
-            result.append({
-                'date': date,
-                'cumulative_realized_profit': last_cumulative,
-                'prism_simulator_return': prism_return
-            })
-
-        return result
+        return cumulative_realized_profit(trading_history, market_data, SEASON2_START_DATE)
     
     def get_operating_costs(self) -> Dict:
         """프로젝트 운영 비용 데이터 반환"""
@@ -1457,10 +1422,18 @@ class DashboardDataGenerator:
             logger.info("데이터 수집 시작...")
             
             # 각 테이블 데이터 수집
+            # 보유일수·당일 판단처럼 시점에 따라 바뀌는 데이터는 매번 조회,
+            # 이력성 섹션은 관련 테이블이 바뀐 경우에만 재계산 (dashboard_state)
+            state = self.state
             holdings = self.get_stock_holdings(conn)
-            trading_history = self.get_trading_history(conn)
-            watchlist = self.get_watchlist_history(conn)
-            market_condition = self.get_market_condition(conn)
+            trading_history = state.section(
+                'trading_history', conn, ['trading_history'],
+                lambda: self.get_trading_history(conn))
+            watchlist = state.section(
+                'watchlist', conn, ['watchlist_history'],
+                lambda: self.get_watchlist_history(conn))
+            market_condition = state.series(
+                'market_condition', lambda since: self.get_market_condition(conn, since))
             holding_decisions = self.get_holding_decisions(conn)
             
             # 한국투자증권 실전투자 데이터 수집
@@ -1472,14 +1445,21 @@ class DashboardDataGenerator:
             jeoningu_lab = self.get_jeoningu_data(conn)
 
             # 매매 인사이트 데이터 수집
-            trading_insights = self.get_trading_insights(conn)
+            trading_insights = dict(state.section(
+                'trading_insights', conn, ['trading_principles', 'trading_journal', 'trading_intuitions'],
+                lambda: self.get_trading_insights(conn)))
 
             # 성과 분석 데이터 수집 및 trading_insights에 추가
-            performance_analysis = self.get_performance_analysis(conn)
+            performance_analysis = state.section(
+                'performance_analysis', conn, ['analysis_performance_tracker', 'trading_history'],
+                lambda: self.get_performance_analysis(conn))
             trading_insights['performance_analysis'] = performance_analysis
 
             # 트리거 신뢰도 교차 분석
-            trigger_reliability = self.get_trigger_reliability(conn)
+            trigger_reliability = state.section(
+                'trigger_reliability', conn,
+                ['analysis_performance_tracker', 'trading_history', 'trading_principles'],
+                lambda: self.get_trigger_reliability(conn))
             trading_insights['trigger_reliability'] = trigger_reliability
 
             # 요약 통계 계산
@@ -1519,6 +1499,7 @@ class DashboardDataGenerator:
             }
             
             conn.close()
+            state.save()
             
             logger.info(f"데이터 수집 완료: 보유 {len(holdings)}개, 실전 {len(real_portfolio)}개, 거래 {len(trading_history)}건, 관망 {len(watchlist)}개")
             if jeoningu_lab.get('enabled'):
@@ -78,6 +78,8 @@ except ImportError:
     TRANSLATION_AVAILABLE = False
     logger.warning("Translation utility not found. English translation will be disabled.")
 
+from dashboard_state import DashboardState, cumulative_realized_profit
+
 # Config file loading (same as KR dashboard - shared KIS credentials)
 CONFIG_FILE = TRADING_DIR / "config" / "kis_devlp.yaml"
 try:
@@ -132,6 +134,9 @@ class USDashboardDataGenerator:
         self.enable_translation = enable_translation and TRANSLATION_AVAILABLE
         self._primary_account_key = self._get_primary_account_key()
 
+        # Incremental refresh state (only sections whose tables changed are recomputed)
+        self.state = DashboardState("us_dashboard")
+
         # Initialize translator
         if self.enable_translation:
             try:
@@ -524,26 +529,30 @@ class USDashboardDataGenerator:
 
         return watchlist
 
-    def get_us_market_condition(self) -> List[Dict]:
-        """Get US market condition data - S&P 500 and NASDAQ from yfinance"""
+    def get_us_market_condition(self, since: str = None) -> List[Dict]:
+        """Get US market condition data - S&P 500 and NASDAQ from yfinance
+
+        With since (YYYY-MM-DD) only sessions from that date on are fetched (incremental refresh).
+        """
         if not YFINANCE_AVAILABLE:
             logger.warning("yfinance not available. Cannot fetch market data.")
             return []
 
         try:
             # Use US Season1 start date
-            start_date = self.US_SEASON1_START_DATE.replace("-", "")
+            fetch_start = since or self.US_SEASON1_START_DATE
+            start_date = fetch_start.replace("-", "")
             today = datetime.now().strftime("%Y%m%d")
 
             logger.info(f"Fetching US market index data... ({start_date} ~ {today})")
 
             # S&P 500 index data (ticker: ^GSPC)
             sp500 = yf.Ticker("^GSPC")
-            sp500_df = sp500.history(start=self.US_SEASON1_START_DATE, end=datetime.now().strftime("%Y-%m-%d"))
+            sp500_df = sp500.history(start=fetch_start, end=datetime.now().strftime("%Y-%m-%d"))
 
             # NASDAQ index data (ticker: ^IXIC)
             nasdaq = yf.Ticker("^IXIC")
-            nasdaq_df = nasdaq.history(start=self.US_SEASON1_START_DATE, end=datetime.now().strftime("%Y-%m-%d"))
+            nasdaq_df = nasdaq.history(start=fetch_start, end=datetime.now().strftime("%Y-%m-%d"))
 
             if sp500_df.empty or nasdaq_df.empty:
                 logger.warning("Failed to fetch US index data from yfinance.")
@@ -1271,58 +1280,16 @@ class USDashboardDataGenerator:
 
         - Calculate profit rate based on 10 slots (sum of profit_rate from sold stocks / 10)
         - Return cumulative profit for each market trading day
+        - Single merge pass over sorted sells and market dates (O(days + trades))
         """
         if not market_data:
             return []
 
-        # Sort trading history by date (sell_date)
-        sorted_trades = sorted(
-            [t for t in trading_history if t.get('sell_date')],
-            key=lambda x: x.get('sell_date', '')
-        )
-
-        # Calculate cumulative profit by date
-        cumulative_profit = 0.0
-        cumulative_by_date = {}
-
-        for trade in sorted_trades:
-            sell_date = trade.get('sell_date', '')
-            if sell_date:
-                # Extract date only if datetime format
-                if ' ' in sell_date:
-                    sell_date = sell_date.split(' ')[0]
-
-                profit_rate = trade.get('profit_rate', 0)
-                cumulative_profit += profit_rate
-                cumulative_by_date[sell_date] = cumulative_profit
-
-        # Generate Prism profit data for each market data date
-        result = []
-        last_cumulative = 0.0
-
-        for market_item in market_data:
-            date = market_item.get('date', '')
-
-            if date < self.US_SEASON1_START_DATE:
-                continue
-
-            # Find cumulative realized profit up to this date
-            for trade_date, cum_profit in cumulative_by_date.items():
-                if trade_date <= date:
-                    last_cumulative = cum_profit
-
-            # Calculate profit based on 10 slots
-            prism_return = last_cumulative / 10
-
-            result.append({
-                'date': date,
-                'cumulative_realized_profit': last_cumulative,
-                'prism_simulator_return': prism_return
-            })
+        result = cumulative_realized_profit(trading_history, market_data, self.US_SEASON1_START_DATE)
 
         # Include trades after the last market data date in the final entry
-        if result and cumulative_by_date:
-            final_cumulative = cumulative_by_date[max(cumulative_by_date.keys())]
+        if result:
+            final_cumulative = sum(t.get('profit_rate', 0) or 0 for t in trading_history if t.get('sell_date'))
             if final_cumulative != result[-1]['cumulative_realized_profit']:
                 result[-1]['cumulative_realized_profit'] = final_cumulative
                 result[-1]['prism_simulator_return'] = final_cumulative / 10
@@ -1339,21 +1306,34 @@ class USDashboardDataGenerator:
             logger.info("Starting US data collection...")
 
             # Collect data from each table
+            # Time-dependent data (holding days, latest AI decisions) is read every run;
+            # history sections are recomputed only when their tables changed (dashboard_state)
+            state = self.state
             holdings = self.get_us_stock_holdings(conn)
-            trading_history = self.get_us_trading_history(conn)
-            watchlist = self.get_us_watchlist_history(conn)
+            trading_history = state.section(
+                'trading_history', conn, ['us_trading_history'],
+                lambda: self.get_us_trading_history(conn))
+            watchlist = state.section(
+                'watchlist', conn, ['us_watchlist_history'],
+                lambda: self.get_us_watchlist_history(conn))
             holding_decisions = self.get_us_holding_decisions(conn)
-            market_condition = self.get_us_market_condition()
+            market_condition = state.series('market_condition', self.get_us_market_condition)
 
             # Get US trading insights
-            trading_insights = self.get_us_trading_insights(conn)
+            trading_insights = dict(state.section(
+                'trading_insights', conn, ['trading_principles', 'trading_journal', 'trading_intuitions'],
+                lambda: self.get_us_trading_insights(conn)))
 
             # Get US performance analysis and add to trading_insights
-            performance_analysis = self.get_us_performance_analysis(conn)
+            performance_analysis = state.section(
+                'performance_analysis', conn, ['us_analysis_performance_tracker', 'us_trading_history'],
+                lambda: self.get_us_performance_analysis(conn))
             trading_insights['performance_analysis'] = performance_analysis
 
             # US trigger reliability cross-analysis
-            trigger_reliability = self.get_us_trigger_reliability(conn)
+            trigger_reliability = state.section(
+                'trigger_reliability', conn, ['us_analysis_performance_tracker', 'us_trading_history'],
+                lambda: self.get_us_trigger_reliability(conn))
             trading_insights['trigger_reliability'] = trigger_reliability
 
             # Get KIS US real trading data
@@ -1408,6 +1388,7 @@ class USDashboardDataGenerator:
             }
 
             conn.close()
+            state.save()
 
             logger.info(f"US data collection complete: Holdings {len(holdings)}, Real {len(real_portfolio)}, Trades {len(trading_history)}, Watchlist {len(watchlist)}")
 
@@ -2,16 +2,24 @@
 """
 Dashboard Data Translation Utilities
 AI-based dashboard data translation utilities
+
+Finished translations are kept in the persistent translation memory
+(cores/llm/translation_memory), so each run only sends strings that were never
+translated before (or were evicted) to the LLM.
 """
 import asyncio
 import json
 import logging
-from typing import Dict, Any, List
+import sqlite3
+from typing import Dict, Any, Iterable, List, Tuple
 
 from mcp_agent.agents.agent import Agent
 from mcp_agent.workflows.llm.augmented_llm import RequestParams
 from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
 
+from cores.llm.governor import governed_generate_str
+from cores.llm.translation_memory import get_translation_memory
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +38,9 @@ class DashboardTranslator:
         # Translation cache (prevent re-translating identical text)
         self.translation_cache = {}
 
+        # Persistent translation memory shared across runs (None when disabled)
+        self.memory = get_translation_memory()
+
         # Create translation agent
         self.translation_agent = Agent(
             name="translation_agent",
@@ -53,6 +64,25 @@ Return ONLY the translated text without explanations or comments.
 """
         )
     
+    def _recall(self, texts: Iterable[str], from_lang: str, to_lang: str) -> Dict[str, str]:
+        """Translations already in the translation memory ({source: translation})"""
+        if self.memory is None:
+            return {}
+        try:
+            return self.memory.get_many(texts, from_lang, to_lang, self.model)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Translation memory read failed: {str(e)}")
+            return {}
+
+    def _remember(self, pairs: List[Tuple[str, str]], from_lang: str, to_lang: str) -> None:
+        """Store finished translations in the translation memory"""
+        if self.memory is None or not pairs:
+            return
+        try:
+            self.memory.put_many(pairs, from_lang, to_lang, self.model)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Translation memory write failed: {str(e)}")
+
     async def translate_text(self, text: str, from_lang: str = "ko", to_lang: str = "en") -> str:
         """
         Translate single text
@@ -73,10 +103,16 @@ Return ONLY the translated text without explanations or comments.
         if cache_key in self.translation_cache:
             logger.debug(f"Returning translation from cache: {text[:30]}...")
             return self.translation_cache[cache_key]
+
+        remembered = self._recall([text], from_lang, to_lang).get(text)
+        if remembered is not None:
+            self.translation_cache[cache_key] = remembered
+            return remembered
         
         try:
             llm = await self.translation_agent.attach_llm(OpenAIAugmentedLLM)
-            translated = await llm.generate_str(
+            translated = await governed_generate_str(
+                llm,
                 message=f"Translate the following Korean text to English:\n\n{text}",
                 request_params=RequestParams(
                     model=self.model,
@@ -89,6 +125,8 @@ Return ONLY the translated text without explanations or comments.
 
             # Save to cache
             self.translation_cache[cache_key] = translated
+            if translated:
+                self._remember([(text, translated)], from_lang, to_lang)
 
             logger.debug(f"Translation completed: {text[:30]}... -> {translated[:30]}...")
             return translated
@@ -101,6 +139,8 @@ Return ONLY the translated text without explanations or comments.
         """
         Batch translation (translate multiple texts at once - saves tokens)
 
+        Texts found in the translation memory are not sent; duplicates are sent once.
+
         Args:
             texts: List of texts to translate
             from_lang: Source language
@@ -123,16 +163,25 @@ Return ONLY the translated text without explanations or comments.
         if not valid_texts:
             return texts
 
+        known = self._recall(valid_texts, from_lang, to_lang)
+        pending = [t for t in dict.fromkeys(valid_texts) if t not in known]
+        if not pending:
+            result = list(texts)
+            for valid_idx, text in zip(valid_indices, valid_texts):
+                result[valid_idx] = known[text]
+            return result
+
         try:
             # Bundle in JSON format for single translation
             batch_input = []
-            for i, text in enumerate(valid_texts):
+            for i, text in enumerate(pending):
                 batch_input.append(f"[{i+1}] {text}")
 
             batch_text = "\n\n".join(batch_input)
             
             llm = await self.translation_agent.attach_llm(OpenAIAugmentedLLM)
-            translated_batch = await llm.generate_str(
+            translated_batch = await governed_generate_str(
+                llm,
                 message=f"""Translate the following numbered Korean texts to English.
 Maintain the numbering format [1], [2], etc. in your response.
 
@@ -155,13 +204,21 @@ Return the translations in the same numbered format.""",
             for num, content in matches:
                 translated_dict[int(num)] = content.strip()
 
-            # Validate and construct result
-            result = list(texts)  # Copy original
-            for i, valid_idx in enumerate(valid_indices):
-                if (i + 1) in translated_dict:
-                    result[valid_idx] = translated_dict[i + 1]
+            # Validate and remember new translations
+            new_pairs = []
+            for i, text in enumerate(pending):
+                if translated_dict.get(i + 1):
+                    known[text] = translated_dict[i + 1]
+                    new_pairs.append((text, known[text]))
                 else:
                     logger.warning(f"Translation result missing: index {i+1}")
+            self._remember(new_pairs, from_lang, to_lang)
+
+            # Construct result
+            result = list(texts)  # Copy original
+            for valid_idx, text in zip(valid_indices, valid_texts):
+                if text in known:
+                    result[valid_idx] = known[text]
 
             return result
 
@@ -380,24 +437,25 @@ Return the translations in the same numbered format.""",
         if not texts_to_translate:
             return data
 
+        # Only unique texts missing from the translation memory go to the LLM
+        unique_texts = list(dict.fromkeys(texts_to_translate))
+        translations = self._recall(unique_texts, "ko", "en")
+        pending = [t for t in unique_texts if t not in translations]
+        logger.info(f"{len(unique_texts)} unique texts: {len(translations)} from translation memory, {len(pending)} to translate")
+
         # Batch translation (split if too many at once)
         BATCH_SIZE = 50  # Maximum 50 at a time
-        all_translated = []
 
-        for i in range(0, len(texts_to_translate), BATCH_SIZE):
-            batch = texts_to_translate[i:i+BATCH_SIZE]
-            logger.info(f"Translating batch ({i+1}~{min(i+BATCH_SIZE, len(texts_to_translate))}/{len(texts_to_translate)})")
+        for i in range(0, len(pending), BATCH_SIZE):
+            batch = pending[i:i+BATCH_SIZE]
+            logger.info(f"Translating batch ({i+1}~{min(i+BATCH_SIZE, len(pending))}/{len(pending)})")
             translated_batch = await self.translate_batch(batch)
-            all_translated.extend(translated_batch)
+            translations.update(zip(batch, translated_batch))
 
         # Apply translated texts
-        for (obj, key), translated in zip(text_locations, all_translated):
-            if isinstance(key, int):
-                # List item
-                obj[key] = translated
-            else:
-                # Dictionary item
-                obj[key] = translated
+        for (obj, key), text in zip(text_locations, texts_to_translate):
+            # List item (int key) or dictionary item
+            obj[key] = translations.get(text, text)
 
         return data
 
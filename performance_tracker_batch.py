@@ -17,9 +17,11 @@ import sqlite3
 import argparse
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
+from cores import daily_bar_store, market_snapshot_cache
+
 # Logging setup
 logging.basicConfig(
     level=logging.INFO,
@@ -39,6 +41,7 @@ DB_PATH = PROJECT_ROOT / "stock_tracking_db.sqlite"
 try:
     from krx_data_client import (
         get_market_ohlcv_by_date,
+        get_market_ohlcv_by_ticker,
         get_nearest_business_day_in_a_week,
     )
     KRX_AVAILABLE = True
@@ -133,7 +136,13 @@ class PerformanceTrackerBatch:
             today = datetime.now().strftime("%Y%m%d")
             week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y%m%d")
 
-            df = get_market_ohlcv_by_date(week_ago, today, ticker)
+            if daily_bar_store.is_enabled():
+                df = daily_bar_store.get_daily_bars(
+                    ticker, week_ago, today,
+                    fetcher=lambda start, end: get_market_ohlcv_by_date(start, end, ticker),
+                )
+            else:
+                df = get_market_ohlcv_by_date(week_ago, today, ticker)
 
             if df is None or df.empty:
                 logger.warning(f"[{ticker}] No price data available")
@@ -148,6 +157,48 @@ class PerformanceTrackerBatch:
             logger.error(f"[{ticker}] Price query failed: {e}")
             return None
 
+    def get_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """Query current prices for many stocks from one whole-market snapshot
+
+        Loads get_market_ohlcv_by_ticker for the latest business day once (shared
+        with trigger_batch through market_snapshot_cache) and resolves every
+        ticker from it. Tickers missing from the snapshot (or all of them, if the
+        snapshot fails) fall back to get_current_price.
+
+        Args:
+            tickers: Stock codes (6 digits)
+
+        Returns:
+            {ticker: close price} for tickers with a price
+        """
+        tickers = list(dict.fromkeys(tickers))
+        prices: Dict[str, float] = {}
+        if not tickers:
+            return prices
+
+        if KRX_AVAILABLE:
+            try:
+                trade_date = get_nearest_business_day_in_a_week(self.today_yyyymmdd, prev=True)
+                df = market_snapshot_cache.get_frame(
+                    "ohlcv", trade_date, lambda: get_market_ohlcv_by_ticker(trade_date))
+                if df is not None and not df.empty:
+                    close_col = 'Close' if 'Close' in df.columns else '종가'
+                    for ticker in tickers:
+                        if ticker in df.index:
+                            close = float(df.loc[ticker, close_col])
+                            if close > 0:
+                                prices[ticker] = close
+                logger.info(f"Market snapshot {trade_date}: {len(prices)}/{len(tickers)} tickers resolved")
+            except Exception as e:
+                logger.warning(f"Market snapshot failed, falling back to per-ticker queries: {e}")
+
+        for ticker in tickers:
+            if ticker not in prices:
+                price = self.get_current_price(ticker)
+                if price is not None:
+                    prices[ticker] = price
+        return prices
+
     def calculate_days_elapsed(self, analyzed_date: str) -> int:
         """Calculate days elapsed since analysis date
 
@@ -262,6 +313,45 @@ class PerformanceTrackerBatch:
         finally:
             conn.close()
 
+    def apply_updates_bulk(self, items: List[Tuple[int, Dict[str, Any]]]) -> bool:
+        """Apply updates for many records in one transaction
+
+        Records are grouped by their set of updated columns so each group is a
+        single executemany. All-or-nothing: on error nothing is committed.
+
+        Args:
+            items: [(record_id, updates), ...]
+
+        Returns:
+            Success status
+        """
+        items = [(record_id, updates) for record_id, updates in items if updates]
+        if not items:
+            return True
+
+        if self.dry_run:
+            for record_id, updates in items:
+                logger.info(f"[DRY-RUN] ID {record_id}: {updates}")
+            return True
+
+        groups: Dict[Tuple[str, ...], List[List[Any]]] = {}
+        for record_id, updates in items:
+            groups.setdefault(tuple(updates.keys()), []).append(list(updates.values()) + [record_id])
+
+        conn = self.connect_db()
+        try:
+            with conn:
+                for columns, rows in groups.items():
+                    set_clause = ", ".join([f"{k} = ?" for k in columns])
+                    query = f"UPDATE analysis_performance_tracker SET {set_clause} WHERE id = ?"
+                    conn.executemany(query, rows)
+            return True
+        except Exception as e:
+            logger.error(f"Bulk DB update failed ({len(items)} records): {e}")
+            return False
+        finally:
+            conn.close()
+
     def run(self) -> Dict[str, Any]:
         """Execute batch
 
@@ -294,17 +384,15 @@ class PerformanceTrackerBatch:
             logger.info("No stocks to track.")
             return stats
 
-        # Process each stock
+        # Select records due for a 7/14/30-day update
+        due = []
         for record in targets:
             ticker = record['ticker']
             company_name = record['company_name']
             trigger_type = record['trigger_type'] or 'unknown'
-            analyzed_date = record['analyzed_date']
-            analyzed_price = record['analyzed_price']
-            was_traded = record['was_traded']
 
             # Calculate days elapsed
-            days_elapsed = self.calculate_days_elapsed(analyzed_date)
+            days_elapsed = self.calculate_days_elapsed(record['analyzed_date'])
 
             # Skip if tracking already completed for this period
             should_update = False
@@ -321,9 +409,17 @@ class PerformanceTrackerBatch:
                 continue
 
             logger.info(f"[{ticker}] {company_name}: {days_elapsed} days elapsed, trigger={trigger_type}")
+            due.append((record, days_elapsed))
 
-            # Query current price
-            current_price = self.get_current_price(ticker)
+        # One market snapshot for every distinct ticker
+        prices = self.get_current_prices([record['ticker'] for record, _ in due])
+
+        pending = []
+        for record, days_elapsed in due:
+            ticker = record['ticker']
+            analyzed_price = record['analyzed_price']
+
+            current_price = prices.get(ticker)
             if current_price is None:
                 logger.warning(f"[{ticker}] Price query failed, skipping")
                 stats['errors'] += 1
@@ -331,7 +427,7 @@ class PerformanceTrackerBatch:
 
             # Calculate return
             return_rate = self.calculate_return(analyzed_price, current_price)
-            logger.info(f"  Analyzed: {analyzed_price:,.0f} → Current: {current_price:,.0f} ({return_rate*100:+.2f}%)")
+            logger.info(f"  [{ticker}] Analyzed: {analyzed_price:,.0f} → Current: {current_price:,.0f} ({return_rate*100:+.2f}%)")
 
             # Determine updates
             updates = self.update_tracking_record(
@@ -340,19 +436,22 @@ class PerformanceTrackerBatch:
                 current_price,
                 analyzed_price
             )
+            pending.append((record, updates, return_rate))
 
-            # Apply DB updates
-            if self.apply_updates(record['id'], updates):
+        # Apply DB updates (single transaction)
+        if self.apply_updates_bulk([(record['id'], updates) for record, updates, _ in pending]):
+            for record, updates, return_rate in pending:
                 stats['updated'] += 1
 
                 # Statistics by trigger type
+                trigger_type = record['trigger_type'] or 'unknown'
                 if trigger_type not in stats['by_trigger_type']:
                     stats['by_trigger_type'][trigger_type] = {'count': 0, 'returns': []}
                 stats['by_trigger_type'][trigger_type]['count'] += 1
                 stats['by_trigger_type'][trigger_type]['returns'].append(return_rate)
 
                 # Classify traded/watched
-                if was_traded:
+                if record['was_traded']:
                     stats['by_decision']['traded'] += 1
                 else:
                     stats['by_decision']['watched'] += 1
@@ -360,8 +459,8 @@ class PerformanceTrackerBatch:
                 # Count completed
                 if updates.get('tracking_status') == 'completed':
                     stats['completed'] += 1
-            else:
-                stats['errors'] += 1
+        else:
+            stats['errors'] += len(pending)
 
         # Summary
         logger.info("="*60)
@@ -0,0 +1,91 @@
+"""
+Price snapshot — per-cycle memo of current prices for a set of holdings
+
+The holdings passes (StockTrackingAgent.update_holdings, USStockTrackingAgent,
+tools/hardstop_seller, tools/trend_exit_seller) used to ask for the current
+price one row at a time, so pyramided tickers with several rows were fetched
+once per row and every lookup waited for the previous one.
+
+PriceSnapshot is created once per cycle with the caller's price source:
+    - fetch(ticker) -> price            (async, one ticker)
+    - bulk(tickers) -> {ticker: price}  (optional, e.g. one whole-market frame)
+prefetch() resolves all distinct tickers up front — bulk first, then the rest
+concurrently (bounded) — and get() returns the memoized value. Concurrent get()
+calls for the same ticker share one in-flight fetch. A price <= 0 means "no
+price" (callers keep their previous value) and is memoized too, so a failing
+ticker is not retried for every row in the same cycle.
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 8
+
+
+class PriceSnapshot:
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[float]],
+        bulk: Optional[Callable[[List[str]], Awaitable[Dict[str, float]]]] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        self._fetch = fetch
+        self._bulk = bulk
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._prices: Dict[str, float] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.fetches = 0
+
+    @property
+    def prices(self) -> Dict[str, float]:
+        return dict(self._prices)
+
+    async def prefetch(self, tickers: Iterable[str]) -> Dict[str, float]:
+        """Resolve every distinct ticker once; returns {ticker: price} for them."""
+        wanted = list(dict.fromkeys(t for t in tickers if t))
+        missing = [t for t in wanted if t not in self._prices and t not in self._inflight]
+        if missing and self._bulk is not None:
+            try:
+                found = await self._bulk(missing)
+            except Exception as e:
+                logger.warning(f"Bulk price snapshot failed, falling back per ticker: {e}")
+                found = {}
+            # a ticker the bulk source answered (even with 0 = its own fallbacks
+            # failed) is settled; only tickers it did not cover go per ticker
+            for ticker, price in (found or {}).items():
+                if ticker in missing:
+                    self._prices[ticker] = float(price or 0)
+        await asyncio.gather(*(self.get(t) for t in wanted))
+        return {t: self._prices.get(t, 0.0) for t in wanted}
+
+    async def get(self, ticker: str) -> float:
+        if ticker in self._prices:
+            return self._prices[ticker]
+        fut = self._inflight.get(ticker)
+        if fut is None:
+            fut = self._inflight[ticker] = asyncio.get_running_loop().create_future()
+            price = 0.0
+            try:
+                async with self._semaphore:
+                    self.fetches += 1
+                    price = float(await self._fetch(ticker) or 0)
+            except Exception as e:
+                logger.warning(f"{ticker} price fetch failed: {e}")
+            finally:
+                # waiters are released even if this caller was cancelled
+                self._inflight.pop(ticker, None)
+                if not fut.done():
+                    fut.set_result(price)
+            self._prices.setdefault(ticker, price)
+            return price
+        return await asyncio.shield(fut)
+
+
+def trader_quote_fetch(trader) -> Callable[[str], Awaitable[float]]:
+    """fetch() over a KIS trader's blocking get_current_price (run in a worker thread)."""
+    async def _fetch(ticker: str) -> float:
+        info = await asyncio.to_thread(trader.get_current_price, ticker)
+        return float((info or {}).get("current_price", 0) or 0)
+    return _fetch
@@ -18,6 +18,9 @@
 # 후보 메뉴: 그리드 스윕이 아니라 LLM 이 낼 법한 경계 인접값 10개 고정
 # (이 실험의 목적은 더 좋은 파라미터 찾기가 아니라 루프 동역학 측정이다).
 #
+# 실행 결과는 backtest.walkforward 가 (config, 데이터 지문, 구간, 초기자본) 단위로
+# state/walkforward_cache.db 에 메모이즈 — 재실행 시 데이터/설정이 바뀐 구간만 재시뮬.
+#
 # 실행: cd prism-btc && ../.venv/bin/python -m analysis.autoloop_walkforward
 from __future__ import annotations
 
@@ -29,7 +32,8 @@ from pathlib import Path
 import pandas as pd
 
 from collector.store import get_connection
-from backtest.engine import run_backtest
+from backtest import walkforward
+from backtest.engine import load_market_data
 from research import overrides
 from research.factory import evaluate_gate
 import research.factory as factory
@@ -54,35 +58,40 @@ MIN_OOS_TRADES_SIM = 5  # 6mo OOS 창 보정
 OUT_JSON = Path(__file__).parent / "results_autoloop_wf.json"
 OUT_MD = Path(__file__).resolve().parent.parent.parent / "tasks" / "btc_autoloop_walkforward.md"
 
-_run_cache: dict = {}
+_market_data = None
+_wf_cache = None
+
 
+def _data():
+    """klines 1회 로드 (kline 캐시 attach) — 모든 실행이 공유."""
+    global _market_data
+    if _market_data is None:
+        conn = get_connection(None)
+        try:
+            _market_data = load_market_data(conn)
+        finally:
+            conn.close()
+    return _market_data
 
-def _cfg_key(cfg: dict) -> tuple:
-    return tuple(sorted(cfg.items()))
+
+def _cache() -> walkforward.WindowCache:
+    global _wf_cache
+    if _wf_cache is None:
+        _wf_cache = walkforward.WindowCache()
+    return _wf_cache
 
 
 def _full_run(cfg: dict, start: str, end: str):
-    """(cfg, 구간) 백테스트 1회 — 캐시. (trade_logs, equity_curve) 반환."""
-    key = (_cfg_key(cfg), start, end)
-    if key in _run_cache:
-        return _run_cache[key]
-    conn = get_connection(None)
-    try:
-        with overrides.apply(cfg):
-            state = run_backtest(conn, pd.Timestamp(start, tz="UTC"),
-                                 pd.Timestamp(end, tz="UTC"),
-                                 initial_equity=INITIAL_EQUITY)
-    finally:
-        conn.close()
-    trades = [{"exit_time": t.exit_time, "net_pnl": t.net_pnl,
-               "r_multiple": t.r_multiple} for t in state.trade_logs]
-    curve = [(ts, v) for ts, v in state.equity_curve]
-    liq = sum(1 for t in state.trade_logs
-              if getattr(t, "exit_reason", "") == "liq_forced_reduce")
-    _run_cache[key] = (trades, curve, liq)
-    print(f"  run cfg={dict(cfg) or 'frozen'} {start}~{end}: "
-          f"{len(trades)} trades", flush=True)
-    return _run_cache[key]
+    """(cfg, 구간) 백테스트 1회 — 디스크 캐시. (trades, equity_curve, liq) 반환."""
+    misses = _cache().misses
+    res = walkforward.run_window(_data(), cfg, walkforward.Window(start, end),
+                                 INITIAL_EQUITY, cache=_cache())
+    trades = res["trades"]
+    liq = sum(1 for t in trades if t.get("exit_reason", "") == "liq_forced_reduce")
+    if _cache().misses > misses:
+        print(f"  run cfg={dict(cfg) or 'frozen'} {start}~{end}: "
+              f"{len(trades)} trades", flush=True)
+    return trades, res["equity_curve"], liq
 
 
 def _window_metrics(trades: list, curve: list, liq: int,
@@ -175,26 +184,19 @@ def simulate_loop() -> tuple[dict, list]:
 
 def splice_forward(champions_at: dict, arm_frozen: bool) -> dict:
     """반기 에라를 자본 이월로 이어붙여 전진 성적 산출."""
-    boundaries = EVENTS + [SIM_END]
+    windows = walkforward.windows_from_boundaries(EVENTS + [SIM_END])
+    plan = [(w, {} if arm_frozen else champions_at[w.start]) for w in windows]
+    results = walkforward.walk_forward(_data(), plan, INITIAL_EQUITY,
+                                       carry_equity=True, cache=_cache())
     equity = INITIAL_EQUITY
     curve_all: list[tuple[pd.Timestamp, float]] = []
     trades_all: list[dict] = []
-    for i in range(len(EVENTS)):
-        t0, t1 = boundaries[i], boundaries[i + 1]
-        cfg = {} if arm_frozen else champions_at[EVENTS[i]]
-        conn = get_connection(None)
-        try:
-            with overrides.apply(cfg):
-                state = run_backtest(conn, pd.Timestamp(t0, tz="UTC"),
-                                     pd.Timestamp(t1, tz="UTC"),
-                                     initial_equity=equity)
-        finally:
-            conn.close()
-        for t in state.trade_logs:
-            trades_all.append({"net_pnl": t.net_pnl, "r": t.r_multiple})
-        curve_all.extend((pd.Timestamp(ts), v) for ts, v in state.equity_curve)
-        equity = state.equity_curve[-1][1] if state.equity_curve else equity
-        print(f"  era {t0}~{t1} cfg={cfg or 'frozen'}: equity -> {equity:.0f}", flush=True)
+    for (w, cfg), res in zip(plan, results):
+        for t in res["trades"]:
+            trades_all.append({"net_pnl": t["net_pnl"], "r": t["r_multiple"]})
+        curve_all.extend((pd.Timestamp(ts), v) for ts, v in res["equity_curve"])
+        equity = res["final_equity"]
+        print(f"  era {w.start}~{w.end} cfg={cfg or 'frozen'}: equity -> {equity:.0f}", flush=True)
     # 메트릭
     vals = [v for _, v in curve_all]
     peak = vals[0]
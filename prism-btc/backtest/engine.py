@@ -1,15 +1,22 @@
 # backtest/engine.py — Event-driven backtester for prism-btc (§3 of D3 spec)
 from __future__ import annotations
 
+import bisect
 import sqlite3
 import logging
 from dataclasses import dataclass, field
 from datetime import timezone
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
+import numpy as np
 import pandas as pd
 
-from engine.indicators import add_indicators
-from engine.regime import build_snapshot, RegimeSnapshot
+from engine.indicators import add_indicators, atr as calc_atr
+from engine.regime import (
+    build_snapshot,
+    regime_series,
+    RegimeSeries,
+    RegimeSnapshot,
+)
 from engine.signal import generate_signal, check_exit_signal, Signal
 from engine.sizing import (
     SizingResult,
@@ -49,6 +56,16 @@ ENTRY_ORDER_EXPIRY_BARS: int = 2
 # 4h당 1회 하드캡 바이패스). 기본 False = 동결 전략과 바이트 동일. 라이브 미사용.
 ENTRY_EVAL_EVERY_BAR: bool = False
 
+# 배열 fast path: 시뮬 30m 봉마다의 TF별 확정 캔들 개수를 한 번에(searchsorted)
+# 계산하고 지표 컬럼을 NumPy 배열로 읽는다 (봉당 DataFrame 슬라이스 0회).
+# TradeLog/equity_curve 는 슬라이스 경로와 바이트 동일 — False 는 동등성 검증용 레퍼런스.
+ARRAY_FAST_PATH: bool = True
+
+# 파일 market DB 면 klines+지표를 DB 옆 .npy 메모리맵 캐시(backtest/kline_cache)로
+# attach — SQL→DataFrame 변환/add_indicators 는 지문(max open_time, 행 수) 변경 시에만.
+# False = 매번 SQLite 에서 재로드 (기존 경로).
+KLINE_CACHE: bool = True
+
 TRAILING_TF = "12h"
 
 # BE stop + trailing activate only after price reaches this R multiple
@@ -57,6 +74,10 @@ TRAILING_TF = "12h"
 # TP1 partial close (1/3 at 1R) is unchanged; only BE/trailing are delayed.
 BE_TRAIL_ACTIVATE_R: float = 1.5
 
+# 명시 config 키 (run_backtest(config=...)) — research.overrides.TUNABLES 와 동일한 이름.
+# 연구 스윕/공장은 모듈 글로벌을 패치하지 않고 이 dict 로 전달해 프로세스 병렬이 가능하다.
+CONFIG_KEYS = ("ENTRY_SCORE_MIN", "TS_MIN", "BE_TRAIL_ACTIVATE_R", "TRAILING_TF")
+
 # Liquidation buffer monitoring threshold (50% of entry→liq gap)
 LIQ_MONITOR_FRAC: float = 0.50
 
@@ -206,6 +227,44 @@ def _load_tf_data(conn: sqlite3.Connection, tf: str) -> pd.DataFrame:
     return df
 
 
+@dataclass
+class MarketData:
+    """Klines (indicators precomputed) + funding rows, loaded once and reusable across runs."""
+    tf_data: dict[str, pd.DataFrame]
+    funding_times: list[int] = field(default_factory=list)
+    funding_rates: list[float] = field(default_factory=list)
+
+
+def load_market_data(conn: sqlite3.Connection, use_cache: Optional[bool] = None) -> MarketData:
+    """Load every TF (+ add_indicators) and the funding table from the market DB.
+
+    use_cache (None → KLINE_CACHE): attach the memory-mapped kline cache next to
+    a file DB instead of re-reading SQLite. Frames are then read-only views.
+    """
+    # Precompute indicators per TF (O(n) once instead of O(n^2) per-bar
+    # recomputation). Safe: SMA/ATR are causal, and _get_tf_slice always
+    # returns a prefix of these frames, so per-row values are identical.
+    tf_data = None
+    if KLINE_CACHE if use_cache is None else use_cache:
+        from backtest import kline_cache
+        tf_data = kline_cache.load_tf_data(conn, ALL_TFS)
+    if tf_data is None:
+        tf_data = {tf: add_indicators(_load_tf_data(conn, tf)) for tf in ALL_TFS}
+    data = MarketData(tf_data=tf_data)
+
+    # 실펀딩 데이터 로드 (있으면 sign-aware, 없으면 기존 비관 고정값 폴백).
+    # 실측: 2020~2026 평균 +0.0121%/8h, 양수 84% — 숏은 대부분 기간 펀딩 수취.
+    try:
+        for ft, fr in conn.execute(
+            "SELECT funding_time, rate FROM funding ORDER BY funding_time"
+        ):
+            data.funding_times.append(int(ft))
+            data.funding_rates.append(float(fr))
+    except Exception:
+        pass  # 테이블 없음 → 폴백
+    return data
+
+
 # Cache of candle end-times (int64 ns) per loaded TF frame — hot-path helper
 # for _get_tf_slice. Keyed by (id(df), tf); frames live for the whole run.
 _END_NS_CACHE: dict = {}
@@ -268,6 +327,165 @@ def _build_snapshot_at(
         return None
 
 
+def _closed_counts(tf_data: dict[str, pd.DataFrame], times_ns: np.ndarray) -> dict[str, np.ndarray]:
+    """Per TF, the number of closed candles at each time (one vectorized searchsorted)."""
+    closed = {}
+    for tf in ALL_TFS:
+        df = tf_data.get(tf)
+        if df is None or df.empty:
+            closed[tf] = np.zeros(len(times_ns), dtype=np.int64)
+            continue
+        ends = (df.index + TF_DURATION.get(tf, pd.Timedelta(0))).as_unit("ns").asi8
+        closed[tf] = ends.searchsorted(times_ns, side="right")
+    return closed
+
+
+_SNAPSHOT_COLUMNS = ("open", "high", "low", "close", "ma10", "ma35", "atr14")
+
+
+def _regime_from_closed(
+    tf_data: dict[str, pd.DataFrame],
+    times: pd.DatetimeIndex,
+    closed: dict[str, np.ndarray],
+) -> RegimeSeries:
+    valid = np.ones(len(times), dtype=bool)
+    rows: dict[str, dict[str, np.ndarray]] = {}
+    for tf in ALL_TFS:
+        valid &= closed[tf] >= MIN_ROWS
+        df = tf_data.get(tf)
+        if df is None or df.empty:
+            nan = np.full(len(times), np.nan)
+            rows[tf] = {c: nan for c in _SNAPSHOT_COLUMNS}
+            continue
+        last = np.maximum(closed[tf] - 1, 0)
+        rows[tf] = {c: df[c].to_numpy()[last] for c in _SNAPSHOT_COLUMNS}
+    return regime_series(times, rows, valid)
+
+
+def build_snapshots(
+    tf_data: dict[str, pd.DataFrame],
+    times,
+) -> RegimeSeries:
+    """
+    Regime at every evaluation time at once — the vectorized _build_snapshot_at.
+
+    tf_data frames must carry precomputed indicators (load_market_data /
+    add_indicators). `times` are UTC timestamps (e.g. 30m open times);
+    `.snapshot(i)` equals _build_snapshot_at(tf_data, times[i]), and
+    `.alignment_score` / `.trend` / `.candle_position` are the arrays.
+    """
+    times = pd.DatetimeIndex(times)
+    if times.tz is None:
+        times = times.tz_localize("UTC")
+    closed = _closed_counts(tf_data, times.as_unit("ns").asi8)
+    return _regime_from_closed(tf_data, times, closed)
+
+
+class _BarFeed:
+    """
+    Closed-candle inputs for each simulated 30m bar (snapshot, trailing MA,
+    last confirmed 4h candle, 1h entry inputs).
+
+    fast=False reads them through _get_tf_slice (pandas prefix slices).
+    fast=True precomputes, per TF, the closed-candle count for every sim bar
+    with one vectorized searchsorted and reads the precomputed indicator
+    columns as NumPy arrays; the regime of every sim bar comes from one
+    build_snapshots pass. Indicators are causal, so row k-1 of the full
+    frame equals the last row of the k-candle slice — results are identical.
+    """
+
+    _COLUMNS = ("open", "high", "low", "close", "ma10", "ma35", "atr14")
+
+    def __init__(self, tf_data: dict[str, pd.DataFrame], sim_index: pd.DatetimeIndex, fast: bool,
+                 trailing_tf: Optional[str] = None):
+        self.tf_data = tf_data
+        self.fast = fast
+        self.trailing_tf = trailing_tf or TRAILING_TF
+        self.closed: dict[str, np.ndarray] = {}
+        self.open_ns: dict[str, np.ndarray] = {}
+        self.cols: dict[str, dict[str, np.ndarray]] = {}
+        self.regime: Optional[RegimeSeries] = None
+        if not fast:
+            return
+        self.closed = _closed_counts(tf_data, sim_index.as_unit("ns").asi8)
+        for tf in ALL_TFS:
+            df = tf_data.get(tf)
+            if df is None or df.empty:
+                continue
+            self.open_ns[tf] = df.index.as_unit("ns").asi8
+            self.cols[tf] = {c: df[c].to_numpy() for c in self._COLUMNS}
+        self.regime = _regime_from_closed(tf_data, sim_index, self.closed)
+
+    def snapshot(self, bar_idx: int, bar_time: pd.Timestamp) -> Optional[RegimeSnapshot]:
+        if not self.fast:
+            return _build_snapshot_at(self.tf_data, bar_time)
+        return self.regime.snapshot(bar_idx)
+
+    def trailing_ma(self, bar_idx: int, bar_time: pd.Timestamp) -> float | None:
+        """MA10 of the last closed trailing-TF candle (None below 10 candles)."""
+        if not self.fast:
+            tf_trail = _get_tf_slice(self.tf_data, bar_time, self.trailing_tf)
+            if len(tf_trail) >= 10:
+                _ma = tf_trail["close"].rolling(10).mean().iloc[-1]
+                if not pd.isna(_ma):
+                    return float(_ma)
+            return None
+        k = self.closed[self.trailing_tf][bar_idx]
+        if k >= 10:
+            _ma = self.cols[self.trailing_tf]["ma10"][k - 1]
+            if not pd.isna(_ma):
+                return float(_ma)
+        return None
+
+    def last_closed_open_ns(self, tf: str, bar_idx: int, bar_time: pd.Timestamp) -> int | None:
+        """open_time (ns) of the last closed `tf` candle, None if there is none yet."""
+        if not self.fast:
+            sliced = _get_tf_slice(self.tf_data, bar_time, tf)
+            return None if sliced.empty else int(sliced.index[-1].value)
+        k = self.closed[tf][bar_idx]
+        return int(self.open_ns[tf][k - 1]) if k > 0 else None
+
+    def entry_inputs_1h(
+        self, bar_idx: int, bar_time: pd.Timestamp, side: str, entry_price: float,
+    ) -> tuple[float, float, float]:
+        """(atr_1h, swing_ref, ma35_1h) for sizing, with the fixed fallbacks."""
+        if not self.fast:
+            tf_1h_slice = _get_tf_slice(self.tf_data, bar_time, "1h")
+            n = len(tf_1h_slice)
+            atr_1h_val = entry_price * 0.02
+            if n >= 14:
+                atr_series = calc_atr(tf_1h_slice, 14)
+                if not pd.isna(atr_series.iloc[-1]):
+                    atr_1h_val = float(atr_series.iloc[-1])
+            if n >= 10:
+                if side == "long":
+                    swing_ref = float(tf_1h_slice["low"].iloc[-10:].min())
+                else:
+                    swing_ref = float(tf_1h_slice["high"].iloc[-10:].max())
+            else:
+                swing_ref = entry_price * (0.98 if side == "long" else 1.02)
+            if n >= 35:
+                ma35_1h = float(tf_1h_slice["close"].rolling(35).mean().iloc[-1])
+            else:
+                ma35_1h = entry_price
+            return atr_1h_val, swing_ref, ma35_1h
+
+        n = self.closed["1h"][bar_idx]
+        c = self.cols.get("1h")
+        atr_1h_val = entry_price * 0.02
+        if n >= 14 and not pd.isna(c["atr14"][n - 1]):
+            atr_1h_val = float(c["atr14"][n - 1])
+        if n >= 10:
+            if side == "long":
+                swing_ref = float(c["low"][n - 10:n].min())
+            else:
+                swing_ref = float(c["high"][n - 10:n].max())
+        else:
+            swing_ref = entry_price * (0.98 if side == "long" else 1.02)
+        ma35_1h = float(c["ma35"][n - 1]) if n >= 35 else entry_price
+        return atr_1h_val, swing_ref, ma35_1h
+
+
 # ---------------------------------------------------------------------------
 # Trade execution helpers
 # ---------------------------------------------------------------------------
@@ -379,6 +597,9 @@ def run_backtest(
     start_ts: pd.Timestamp,
     end_ts: pd.Timestamp,
     initial_equity: float = 10_000.0,
+    fast: Optional[bool] = None,
+    config: Optional[dict[str, Any]] = None,
+    data: Optional[MarketData] = None,
 ) -> BacktestState:
     """
     Event-driven backtest over 30m bars in [start_ts, end_ts).
@@ -387,31 +608,38 @@ def run_backtest(
     1. Check pending entry order fill (next bar after signal)
     2. For each open position: SL/TP/trailing/funding
     3. Build snapshot, generate signal, create pending order
-    """
-    # Load all data once and precompute indicators per TF (O(n) once instead of
-    # O(n^2) per-bar recomputation). Safe: SMA/ATR are causal, and _get_tf_slice
-    # always returns a prefix of these frames, so per-row values are identical.
-    tf_data: dict[str, pd.DataFrame] = {}
-    for tf in ALL_TFS:
-        tf_data[tf] = add_indicators(_load_tf_data(conn, tf))
 
-    # 실펀딩 데이터 로드 (있으면 sign-aware, 없으면 기존 비관 고정값 폴백).
-    # 실측: 2020~2026 평균 +0.0121%/8h, 양수 84% — 숏은 대부분 기간 펀딩 수취.
-    funding_times: list[int] = []
-    funding_rates: list[float] = []
-    try:
-        for ft, fr in conn.execute(
-            "SELECT funding_time, rate FROM funding ORDER BY funding_time"
-        ):
-            funding_times.append(int(ft))
-            funding_rates.append(float(fr))
-    except Exception:
-        pass  # 테이블 없음 → 폴백
+    fast: array fast path (see _BarFeed); None → ARRAY_FAST_PATH.
+    config: explicit overrides keyed by CONFIG_KEYS (missing keys → module
+        globals / engine.config). Lets concurrent runs differ without patching.
+    data: preloaded MarketData (conn is then unused) — reuse across runs.
+    """
+    cfg = dict(config or {})
+    unknown = sorted(set(cfg) - set(CONFIG_KEYS))
+    if unknown:
+        raise ValueError(f"unknown backtest config keys: {unknown}")
+    be_trail_activate_r = cfg.get("BE_TRAIL_ACTIVATE_R", BE_TRAIL_ACTIVATE_R)
+    trailing_tf = cfg.get("TRAILING_TF", TRAILING_TF)
+    entry_score_min = cfg.get("ENTRY_SCORE_MIN")
+    ts_min = cfg.get("TS_MIN")
+
+    if data is None:
+        data = load_market_data(conn)
+    tf_data = data.tf_data
+    funding_times = data.funding_times
+    funding_rates = data.funding_rates
 
     # Get 30m bars in range
     bars_30m = tf_data["30m"]
     mask = (bars_30m.index >= start_ts) & (bars_30m.index < end_ts)
     sim_bars = bars_30m[mask]
+    feed = _BarFeed(tf_data, sim_bars.index, ARRAY_FAST_PATH if fast is None else fast,
+                    trailing_tf=trailing_tf)
+    sim_ns = sim_bars.index.as_unit("ns").asi8
+    sim_open = sim_bars["open"].to_numpy()
+    sim_high = sim_bars["high"].to_numpy()
+    sim_low = sim_bars["low"].to_numpy()
+    sim_close = sim_bars["close"].to_numpy()
 
     state = BacktestState(equity=initial_equity)
     state.equity_curve.append((str(start_ts), initial_equity))
@@ -426,11 +654,11 @@ def run_backtest(
     # 미체결 만료 후에도 신규 진입 재평가를 금지한다. (피라미딩 트랜치 추가는 별개 — 미적용)
     last_new_entry_eval_4h_ns: int | None = None
 
-    for bar_idx, (bar_time, bar) in enumerate(sim_bars.iterrows()):
-        bar_open = bar["open"]
-        bar_high = bar["high"]
-        bar_low = bar["low"]
-        bar_close = bar["close"]
+    for bar_idx, bar_time in enumerate(sim_bars.index):
+        bar_open = sim_open[bar_idx]
+        bar_high = sim_high[bar_idx]
+        bar_low = sim_low[bar_idx]
+        bar_close = sim_close[bar_idx]
         bar_time_str = str(bar_time)
 
         # --- 1. Check pending order fill ---
@@ -488,8 +716,7 @@ def run_backtest(
             funding_sign_aware = bool(funding_times)
             if funding_due:
                 if funding_sign_aware:
-                    import bisect
-                    fi = bisect.bisect_right(funding_times, int(bar_time.value // 1_000_000)) - 1
+                    fi = bisect.bisect_right(funding_times, int(sim_ns[bar_idx] // 1_000_000)) - 1
                     funding_rate = funding_rates[fi] if fi >= 0 else abs(FUNDING_RATE)
                 else:
                     funding_rate = abs(FUNDING_RATE)
@@ -499,11 +726,7 @@ def run_backtest(
             # Trailing MA injected so core stays pandas-free (TRAILING_TF MA10).
             trailing_ma: float | None = None
             if pos.trailing_active:
-                tf_trail = _get_tf_slice(tf_data, bar_time, TRAILING_TF)
-                if len(tf_trail) >= 10:
-                    _ma = tf_trail["close"].rolling(10).mean().iloc[-1]
-                    if not pd.isna(_ma):
-                        trailing_ma = float(_ma)
+                trailing_ma = feed.trailing_ma(bar_idx, bar_time)
 
             pos_view = PositionView(
                 side=pos.side,
@@ -523,7 +746,7 @@ def run_backtest(
                 funding_rate=funding_rate,
                 funding_sign_aware=funding_sign_aware,
                 trailing_ma=trailing_ma,
-                be_trail_activate_r=BE_TRAIL_ACTIVATE_R,
+                be_trail_activate_r=be_trail_activate_r,
                 liq_monitor_frac=LIQ_MONITOR_FRAC,
             )
 
@@ -588,11 +811,9 @@ def run_backtest(
 
         # --- 3a. Detect 4h candle confirmation (라운드2 #3 cadence gate) ---
         # Update every bar regardless of position state so the tracker never lags.
-        slice_4h = _get_tf_slice(tf_data, bar_time, "4h")
         new_4h_confirmed = False
-        cur_4h_ns: int | None = None
-        if not slice_4h.empty:
-            cur_4h_ns = int(slice_4h.index[-1].value)
+        cur_4h_ns = feed.last_closed_open_ns("4h", bar_idx, bar_time)
+        if cur_4h_ns is not None:
             if last_confirmed_4h_ns is None:
                 # Prime the tracker on the first valid bar without firing an entry.
                 last_confirmed_4h_ns = cur_4h_ns
@@ -603,7 +824,7 @@ def run_backtest(
         # --- 3. Generate new signal ---
         # Only enter new position if no pending order and <= 1 open position (simple mode)
         if state.pending_order is None and len(state.positions) < 3:
-            snapshot = _build_snapshot_at(tf_data, bar_time)
+            snapshot = feed.snapshot(bar_idx, bar_time)
             if snapshot is not None:
                 # Check exit signals for existing positions
                 for pos in list(state.positions):
@@ -632,7 +853,7 @@ def run_backtest(
                 # candle (라운드2 #3). 30m/1h cadence does not open new entries.
                 # ENTRY_EVAL_EVERY_BAR 는 연구 전용 훅 (기본 False = 기존과 바이트 동일).
                 _eval_entry = new_4h_confirmed or ENTRY_EVAL_EVERY_BAR
-                sig = generate_signal(snapshot) if _eval_entry else Signal(
+                sig = generate_signal(snapshot, entry_score_min, ts_min) if _eval_entry else Signal(
                     side="none", strength=0.0, reason="4h 미확정 — 진입평가 보류"
                 )
                 if sig.side != "none":
@@ -662,28 +883,11 @@ def run_backtest(
                             else REENTRY_COOLDOWN_BARS
                         )
 
-                        # Derive pandas inputs (어댑터가 tf_data 소유 → 여기서 슬라이스).
+                        # Derive 1h inputs (어댑터가 tf_data 소유 → 여기서 도출).
                         entry_price = bar_close  # limit at close price (post-only)
-                        tf_1h_slice = _get_tf_slice(tf_data, bar_time, "1h")
-                        if len(tf_1h_slice) >= 14:
-                            from engine.indicators import atr as calc_atr
-                            atr_series = calc_atr(tf_1h_slice, 14)
-                            atr_1h_val = float(atr_series.iloc[-1]) if not pd.isna(atr_series.iloc[-1]) else entry_price * 0.02
-                        else:
-                            atr_1h_val = entry_price * 0.02
-
-                        if len(tf_1h_slice) >= 10:
-                            if sig.side == "long":
-                                swing_ref = float(tf_1h_slice["low"].iloc[-10:].min())
-                            else:
-                                swing_ref = float(tf_1h_slice["high"].iloc[-10:].max())
-                        else:
-                            swing_ref = entry_price * (0.98 if sig.side == "long" else 1.02)
-
-                        if len(tf_1h_slice) >= 35:
-                            ma35_1h = float(tf_1h_slice["close"].rolling(35).mean().iloc[-1])
-                        else:
-                            ma35_1h = entry_price
+                        atr_1h_val, swing_ref, ma35_1h = feed.entry_inputs_1h(
+                            bar_idx, bar_time, sig.side, entry_price,
+                        )
 
                         intent = evaluate_entry(
                             sig,
@@ -714,20 +918,9 @@ def run_backtest(
                         # Pyramid: derive inputs then delegate the gate+sizing decision.
                         avg_entry = sum(p.entry_price for p in same_side) / len(same_side)
                         entry_price = bar_close
-                        tf_1h_slice = _get_tf_slice(tf_data, bar_time, "1h")
-                        atr_1h_val = entry_price * 0.02
-                        if len(tf_1h_slice) >= 14:
-                            from engine.indicators import atr as calc_atr
-                            atr_series = calc_atr(tf_1h_slice, 14)
-                            if not pd.isna(atr_series.iloc[-1]):
-                                atr_1h_val = float(atr_series.iloc[-1])
-
-                        if sig.side == "long":
-                            swing_ref = float(tf_1h_slice["low"].iloc[-10:].min()) if len(tf_1h_slice) >= 10 else entry_price * 0.98
-                        else:
-                            swing_ref = float(tf_1h_slice["high"].iloc[-10:].max()) if len(tf_1h_slice) >= 10 else entry_price * 1.02
-
-                        ma35_1h = float(tf_1h_slice["close"].rolling(35).mean().iloc[-1]) if len(tf_1h_slice) >= 35 else entry_price
+                        atr_1h_val, swing_ref, ma35_1h = feed.entry_inputs_1h(
+                            bar_idx, bar_time, sig.side, entry_price,
+                        )
 
                         intent = evaluate_entry(
                             sig,
@@ -758,11 +951,10 @@ def run_backtest(
 
     # Close any remaining positions at last bar close
     if not sim_bars.empty:
-        last_bar = sim_bars.iloc[-1]
         last_time = str(sim_bars.index[-1])
         for pos in list(state.positions):
             _close_position(
-                pos, last_bar["close"], last_time, "end_of_period", state,
+                pos, sim_close[-1], last_time, "end_of_period", state,
                 fee_rate=TAKER_FEE, bar_idx=len(sim_bars) - 1,
             )
         state.positions.clear()
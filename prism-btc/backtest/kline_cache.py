@@ -0,0 +1,143 @@
+# backtest/kline_cache.py — 메모리맵 멀티 TF kline 캐시 (SQL→DataFrame 변환 1회)
+#
+# run_backtest / research.sweep 워커 / journal CLI 는 매번 _load_tf_data 로 전 TF 를
+# pd.read_sql_query → open_time 파싱 → add_indicators 까지 다시 했다 (수십만 행).
+#
+# 여기서는 TF별로 한 번만 변환해 market DB 옆에 .npy 로 떨군다:
+#   <db 디렉터리>/<db 이름>.kline_cache/<tf>-<max_open_time>-<rows>.npy
+#     values : float64 (9, n) — open/high/low/close/volume/turnover/ma10/ma35/atr14
+#     .time  : int64  (n,)   — open_time (UTC ns)
+# 지문 = 확정봉 (max(open_time), 행 수). 파일명에 지문이 들어가므로 메타 파일이 없고,
+# 워커 여러 개가 동시에 재빌드해도 같은 이름엔 같은 내용 → os.replace 로 원자 교체.
+# 확정봉의 값만 정정되는 경우(지문 불변)는 감지하지 않는다 — 그땐 refresh=True.
+# 옛 지문 파일은 빌드 중에 지우지 않는다 (같은 파일을 막 열려던 다른 프로세스가
+# FileNotFoundError). 정리는 load_tf_data 끝의 prune 이 따로 하고, 그 사이에 파일을
+# 잃은 reader 는 지문을 다시 읽어 재빌드한다.
+#
+# attach 는 np.load(mmap_mode="r") 로 열어 DataFrame 이 memmap 을 그대로 감싼다
+# (zero-copy, 읽기 전용). 프로세스 풀 워커들이 같은 페이지 캐시를 공유한다.
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from engine.indicators import add_indicators
+
+log = logging.getLogger("backtest.kline_cache")
+
+COLUMNS = ["open", "high", "low", "close", "volume", "turnover", "ma10", "ma35", "atr14"]
+
+
+def db_file(conn: sqlite3.Connection) -> Optional[Path]:
+    """conn 의 main DB 파일 경로. 인메모리/임시 DB 면 None (캐시 불가)."""
+    for _, name, path in conn.execute("PRAGMA database_list"):
+        if name == "main":
+            return Path(path) if path else None
+    return None
+
+
+def cache_dir_for(db_path: str | Path) -> Path:
+    db_path = Path(db_path)
+    return db_path.with_name(db_path.name + ".kline_cache")
+
+
+def fingerprint(conn: sqlite3.Connection, tf: str) -> tuple[int, int]:
+    """확정봉 (max(open_time), 행 수) — 캐시 무효화 키."""
+    max_ot, rows = conn.execute(
+        "SELECT MAX(open_time), COUNT(*) FROM klines WHERE timeframe=? AND confirmed=1",
+        (tf,)).fetchone()
+    return (int(max_ot) if max_ot is not None else -1, int(rows))
+
+
+def _paths(cache_dir: Path, tf: str, fp: tuple[int, int]) -> tuple[Path, Path]:
+    stem = f"{tf}-{fp[0]}-{fp[1]}"
+    return cache_dir / f"{stem}.npy", cache_dir / f"{stem}.time.npy"
+
+
+def _save_atomic(path: Path, arr: np.ndarray) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, arr)
+    os.replace(tmp, path)
+
+
+def _build(conn: sqlite3.Connection, cache_dir: Path, tf: str, fp: tuple[int, int]) -> None:
+    from backtest.engine import _load_tf_data
+    df = add_indicators(_load_tf_data(conn, tf))
+    values = np.ascontiguousarray(df[COLUMNS].to_numpy(dtype=np.float64).T)
+    times = df.index.as_unit("ns").asi8.astype(np.int64)
+    values_path, times_path = _paths(cache_dir, tf, fp)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _save_atomic(times_path, times)
+    _save_atomic(values_path, values)   # values 가 마지막 — 존재하면 완성본
+    log.info("kline cache rebuilt: %s %d rows", tf, fp[1])
+
+
+def _attach(values_path: Path, times_path: Path) -> pd.DataFrame:
+    values = np.load(values_path, mmap_mode="r")
+    times = np.load(times_path, mmap_mode="r")
+    index = pd.DatetimeIndex(times.view("M8[ns]"), name="open_time").tz_localize("UTC")
+    return pd.DataFrame(values.T, index=index, columns=COLUMNS, copy=False)
+
+
+def load_tf(conn: sqlite3.Connection, tf: str, cache_dir: str | Path,
+            refresh: bool = False) -> pd.DataFrame:
+    """tf 의 전 확정봉 + 지표 (add_indicators(_load_tf_data) 와 같은 프레임, 읽기 전용)."""
+    cache_dir = Path(cache_dir)
+    fp = fingerprint(conn, tf)
+    values_path, times_path = _paths(cache_dir, tf, fp)
+    if refresh or not values_path.exists():
+        _build(conn, cache_dir, tf, fp)
+    try:
+        return _attach(values_path, times_path)
+    except FileNotFoundError:
+        # exists() 와 attach 사이에 다른 프로세스의 prune 이 지웠다 → 지문 재확인 후 재빌드
+        fp = fingerprint(conn, tf)
+        values_path, times_path = _paths(cache_dir, tf, fp)
+        _build(conn, cache_dir, tf, fp)
+        return _attach(values_path, times_path)
+
+
+def prune(conn: sqlite3.Connection, tf: str, cache_dir: str | Path) -> int:
+    """현재 지문보다 오래된 tf 캐시 파일 삭제. 지운 파일 수 반환.
+
+    더 새로운 지문(이 conn 보다 최신 DB 를 본 프로세스가 만든 것)은 남긴다.
+    mmap 중인 파일을 지워도 POSIX 에선 안전하고, 열기 직전이던 reader 는 load_tf 가 재빌드한다.
+    """
+    cur_ot, cur_rows = fingerprint(conn, tf)
+    removed = 0
+    for path in Path(cache_dir).glob(f"{tf}-*.npy"):
+        parts = path.name.split(".")[0].split("-")
+        try:
+            max_ot, rows = int(parts[-2]), int(parts[-1])
+        except (IndexError, ValueError):
+            continue
+        if (max_ot, rows) == (cur_ot, cur_rows) or max_ot > cur_ot or rows > cur_rows:
+            continue
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def load_tf_data(conn: sqlite3.Connection, tfs: list[str],
+                 cache_dir: str | Path | None = None,
+                 refresh: bool = False) -> Optional[dict[str, pd.DataFrame]]:
+    """전 TF 캐시 attach. cache_dir 미지정 시 DB 파일 옆 — 인메모리 DB 면 None."""
+    if cache_dir is None:
+        path = db_file(conn)
+        if path is None:
+            return None
+        cache_dir = cache_dir_for(path)
+    tf_data = {tf: load_tf(conn, tf, cache_dir, refresh=refresh) for tf in tfs}
+    for tf in tfs:
+        prune(conn, tf, cache_dir)
+    return tf_data
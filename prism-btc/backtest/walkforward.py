@@ -0,0 +1,215 @@
+# backtest/walkforward.py — 워크포워드 윈도우 실행 + 디스크 메모이제이션
+#
+# analysis/autoloop_walkforward 는 후보 config × 이벤트 구간마다 전 히스토리를
+# 다시 백테스트했다 (인-스크립트 dict 캐시 → 프로세스 끝나면 소멸). 콜렉터가 하루치
+# 봉을 추가한 뒤 재실행하면 수백 번의 실행을 처음부터 반복한다.
+#
+# 윈도우 결과를 (config 해시, 데이터 지문, 윈도우, 초기자본) 키로 SQLite 에 저장한다:
+#   - config 해시  : 명시 config + 전략 모듈 상수/소스 (엔진 수정 시 자동 무효화)
+#   - 데이터 지문  : end 이전 확정봉(전 TF OHLCV) + 펀딩 행의 sha256.
+#                    백테스트는 인과적이므로 end 이후 데이터 추가는 키를 바꾸지 않는다
+#                    → 일일 업데이트 후 재실행 시 end 가 최신인 윈도우만 재시뮬레이션.
+#   - 초기자본     : 자본 이월 체인(walk_forward carry)에서 앞 윈도우가 바뀌면 뒤도 재계산.
+# 결과는 트레이드 로그(asdict) + 일간 에쿼티 곡선 + compute_metrics — JSON 한 행.
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from backtest.engine import MarketData, compute_metrics, run_backtest
+
+log = logging.getLogger("backtest.walkforward")
+
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS walkforward_windows (
+    config_hash    TEXT NOT NULL,
+    data_fp        TEXT NOT NULL,
+    start          TEXT NOT NULL,
+    end            TEXT NOT NULL,
+    initial_equity TEXT NOT NULL,
+    result_json    TEXT NOT NULL,
+    created_at     TEXT NOT NULL DEFAULT (datetime('now')),
+    PRIMARY KEY (config_hash, data_fp, start, end, initial_equity)
+)
+"""
+
+_PKG_ROOT = Path(__file__).resolve().parent.parent
+# 결과에 영향을 주는 전략 코드 — 소스/상수가 바뀌면 모든 캐시 키가 바뀐다
+_STRATEGY_SOURCES = ("backtest/engine.py", "engine/*.py", "core/*.py")
+_STRATEGY_MODULES = ("backtest.engine", "engine.", "core.")
+# 결과와 무관한 실행 경로 토글 (바이트 동일 보장) — 키에서 제외
+_NON_SEMANTIC = {"ARRAY_FAST_PATH", "KLINE_CACHE"}
+_PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def _default_cache_path() -> Path:
+    return _PKG_ROOT / "state" / "walkforward_cache.db"
+
+
+@dataclass(frozen=True)
+class Window:
+    """[start, end) 백테스트 구간 (UTC 날짜/시각 문자열)."""
+    start: str
+    end: str
+
+
+def windows_from_boundaries(boundaries: list[str]) -> list[Window]:
+    """[b0, b1, b2, ...] → [Window(b0,b1), Window(b1,b2), ...] (연속 에라)."""
+    return [Window(a, b) for a, b in zip(boundaries, boundaries[1:])]
+
+
+# ---------------------------------------------------------------------------
+# 캐시 키
+# ---------------------------------------------------------------------------
+
+def strategy_fingerprint() -> str:
+    """전략 소스 파일 + 로드된 전략 모듈의 대문자 상수 (연구 훅 패치 포함)."""
+    h = hashlib.sha256()
+    for pattern in _STRATEGY_SOURCES:
+        for path in sorted(_PKG_ROOT.glob(pattern)):
+            h.update(path.relative_to(_PKG_ROOT).as_posix().encode())
+            h.update(path.read_bytes())
+    for name in sorted(sys.modules):
+        if not (name == _STRATEGY_MODULES[0] or name.startswith(_STRATEGY_MODULES[1:])):
+            continue
+        consts = {k: v for k, v in vars(sys.modules[name]).items()
+                  if k.isupper() and not k.startswith("_") and k not in _NON_SEMANTIC
+                  and isinstance(v, (bool, int, float, str, tuple, dict, pd.Timedelta))}
+        h.update(f"{name}:{sorted(consts.items(), key=lambda kv: kv[0])!r}".encode())
+    return h.hexdigest()
+
+
+def config_hash(config: Optional[dict[str, Any]], strategy_fp: Optional[str] = None) -> str:
+    payload = json.dumps(sorted((config or {}).items()), default=str)
+    return hashlib.sha256(
+        f"{payload}|{strategy_fp or strategy_fingerprint()}".encode()).hexdigest()
+
+
+def data_fingerprint(data: MarketData, end: pd.Timestamp) -> str:
+    """end 이전 데이터만의 지문 — [start, end) 실행이 읽을 수 있는 전부."""
+    end = pd.Timestamp(end)
+    end_ns = end.as_unit("ns").value
+    h = hashlib.sha256()
+    for tf in sorted(data.tf_data):
+        df = data.tf_data[tf]
+        n = int(np.searchsorted(df.index.as_unit("ns").asi8, end_ns, side="left"))
+        h.update(f"{tf}:{n}".encode())
+        h.update(np.ascontiguousarray(df.index.as_unit("ns").asi8[:n]).tobytes())
+        for col in _PRICE_COLUMNS:
+            h.update(np.ascontiguousarray(df[col].to_numpy(dtype=np.float64)[:n]).tobytes())
+    end_ms = end_ns // 1_000_000
+    k = int(np.searchsorted(np.asarray(data.funding_times, dtype=np.int64), end_ms, side="left"))
+    h.update(np.asarray(data.funding_times[:k], dtype=np.int64).tobytes())
+    h.update(np.asarray(data.funding_rates[:k], dtype=np.float64).tobytes())
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# 결과 저장소
+# ---------------------------------------------------------------------------
+
+class WindowCache:
+    """walkforward_windows 테이블 — 윈도우 결과 JSON. hits/misses 는 호출 통계."""
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path is not None else _default_cache_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(CREATE_TABLE)
+        self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[str, str, str, str, str]) -> Optional[dict]:
+        row = self.conn.execute(
+            "SELECT result_json FROM walkforward_windows WHERE config_hash=? AND data_fp=? "
+            "AND start=? AND end=? AND initial_equity=?", key).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: tuple[str, str, str, str, str], result: dict) -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO walkforward_windows "
+                "(config_hash, data_fp, start, end, initial_equity, result_json) "
+                "VALUES (?,?,?,?,?,?)", (*key, json.dumps(result, default=_json_default)))
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def _json_default(v):
+    if hasattr(v, "item"):  # numpy 스칼라
+        return v.item()
+    return str(v)
+
+
+# ---------------------------------------------------------------------------
+# 실행
+# ---------------------------------------------------------------------------
+
+def simulate(data: MarketData, config: Optional[dict[str, Any]], window: Window,
+             initial_equity: float) -> dict:
+    """윈도우 1회 백테스트 → {trades, equity_curve, final_equity, metrics} (캐시 없음)."""
+    state = run_backtest(None, pd.Timestamp(window.start, tz="UTC"),
+                         pd.Timestamp(window.end, tz="UTC"),
+                         initial_equity=initial_equity, config=config, data=data)
+    return {
+        "trades": [asdict(t) for t in state.trade_logs],
+        "equity_curve": [[str(ts), float(v)] for ts, v in state.equity_curve],
+        "final_equity": float(state.equity_curve[-1][1]) if state.equity_curve else initial_equity,
+        "metrics": compute_metrics(state, initial_equity),
+    }
+
+
+def run_window(data: MarketData, config: Optional[dict[str, Any]], window: Window,
+               initial_equity: float, cache: Optional[WindowCache] = None,
+               strategy_fp: Optional[str] = None) -> dict:
+    """캐시 조회 → 없으면 simulate 후 저장. cache=None 이면 항상 시뮬레이션."""
+    if cache is None:
+        return json.loads(json.dumps(simulate(data, config, window, initial_equity),
+                                     default=_json_default))
+    key = (config_hash(config, strategy_fp),
+           data_fingerprint(data, pd.Timestamp(window.end, tz="UTC")),
+           window.start, window.end, repr(float(initial_equity)))
+    hit = cache.get(key)
+    if hit is not None:
+        cache.hits += 1
+        return hit
+    cache.misses += 1
+    result = simulate(data, config, window, initial_equity)
+    cache.put(key, result)
+    log.info("walkforward: simulated %s~%s cfg=%s (%d trades)",
+             window.start, window.end, dict(config or {}) or "frozen", len(result["trades"]))
+    return cache.get(key)   # 저장본과 같은 JSON 형태로 반환 (hit/miss 동일 타입)
+
+
+def walk_forward(data: MarketData, plan: list[tuple[Window, Optional[dict[str, Any]]]],
+                 initial_equity: float, carry_equity: bool = True,
+                 cache: Optional[WindowCache] = None) -> list[dict]:
+    """(윈도우, config) 계획을 순서대로 실행.
+
+    carry_equity=True: 각 윈도우의 초기자본 = 직전 윈도우 final_equity (자본 이월 —
+    앞 윈도우가 재계산되어 값이 바뀌면 뒤 윈도우 키도 바뀐다).
+    """
+    strategy_fp = strategy_fingerprint()
+    equity = initial_equity
+    results = []
+    for window, config in plan:
+        res = run_window(data, config, window, equity, cache=cache, strategy_fp=strategy_fp)
+        results.append(res)
+        if carry_equity:
+            equity = res["final_equity"]
+    if cache is not None:
+        log.info("walkforward: %d windows, %d cached, %d simulated",
+                 len(plan), cache.hits, cache.misses)
+    return results
@@ -22,6 +22,22 @@ CREATE TABLE IF NOT EXISTS klines (
 )
 """
 
+# Incremental indicator carry (live/indicator_cache.py). One row per confirmed
+# kline already folded into the state; atr_ewm/n_obs let a restart resume the
+# Wilder ATR in O(new candles) without replaying the whole history.
+CREATE_INDICATOR_TABLE = """
+CREATE TABLE IF NOT EXISTS kline_indicators (
+    timeframe  TEXT    NOT NULL,
+    open_time  INTEGER NOT NULL,
+    ma10       REAL,
+    ma35       REAL,
+    atr14      REAL,
+    atr_ewm    REAL    NOT NULL,
+    n_obs      INTEGER NOT NULL,
+    PRIMARY KEY (timeframe, open_time)
+)
+"""
+
 UPSERT = """
 INSERT INTO klines (timeframe, open_time, open, high, low, close, volume, turnover, confirmed)
 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -52,6 +68,7 @@ def get_connection(db_path: str | Path | None = None) -> sqlite3.Connection:
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA synchronous=NORMAL")
     conn.execute(CREATE_TABLE)
+    conn.execute(CREATE_INDICATOR_TABLE)
     conn.commit()
     return conn
 
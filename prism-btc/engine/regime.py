@@ -5,8 +5,9 @@ import json
 import logging
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
-from typing import Literal
+from typing import Literal, Optional
 
+import numpy as np
 import pandas as pd
 
 from engine.config import (
@@ -143,6 +144,14 @@ def _candle_position(
     return "between"
 
 
+_BULLISH_POSITIONS = frozenset({
+    "break_ma10_up", "break_ma35_up", "support_ma10", "support_ma35", "above_all"
+})
+_BEARISH_POSITIONS = frozenset({
+    "break_ma10_down", "break_ma35_down", "resist_ma10", "resist_ma35", "below_all"
+})
+
+
 def _candle_aligns_with_trend(position: CandlePosition, trend: TrendState) -> int:
     """
     +1 if candle position supports the trend direction.
@@ -152,22 +161,15 @@ def _candle_aligns_with_trend(position: CandlePosition, trend: TrendState) -> in
     if trend == "flat":
         return 0
 
-    bullish_positions = {
-        "break_ma10_up", "break_ma35_up", "support_ma10", "support_ma35", "above_all"
-    }
-    bearish_positions = {
-        "break_ma10_down", "break_ma35_down", "resist_ma10", "resist_ma35", "below_all"
-    }
-
     if trend == "up":
-        if position in bullish_positions:
+        if position in _BULLISH_POSITIONS:
             return 1
-        if position in bearish_positions:
+        if position in _BEARISH_POSITIONS:
             return -1
     else:  # down
-        if position in bearish_positions:
+        if position in _BEARISH_POSITIONS:
             return 1
-        if position in bullish_positions:
+        if position in _BULLISH_POSITIONS:
             return -1
     return 0
 
@@ -205,19 +207,38 @@ def build_tf_state(df: pd.DataFrame) -> TFState:
     if "ma10" not in df.columns or "atr14" not in df.columns:
         df = add_indicators(df)
     last = df.iloc[-1]
-    ma10 = last["ma10"]
-    ma35 = last["ma35"]
-    close = last["close"]
-    atr14 = last["atr14"]
+    return tf_state_from_values(
+        open_=last["open"],
+        high=last["high"],
+        low=last["low"],
+        close=last["close"],
+        ma10=last["ma10"],
+        ma35=last["ma35"],
+        atr14=last["atr14"],
+    )
+
 
+def tf_state_from_values(
+    open_: float,
+    high: float,
+    low: float,
+    close: float,
+    ma10: float,
+    ma35: float,
+    atr14: float,
+) -> TFState:
+    """
+    TFState from the last confirmed candle's OHLC + precomputed indicators.
+    Shared by build_tf_state and the backtest array fast path (no DataFrame).
+    """
     if pd.isna(ma10) or pd.isna(ma35) or pd.isna(atr14):
         raise ValueError("Insufficient data to compute indicators (need >= 35 rows)")
 
     trend = _trend(ma10, ma35, close)
     position = _candle_position(
-        open_=last["open"],
-        high=last["high"],
-        low=last["low"],
+        open_=open_,
+        high=high,
+        low=low,
         close=close,
         ma10=ma10,
         ma35=ma35,
@@ -270,3 +291,152 @@ def build_snapshot(
         alignment_score=score,
         evaluated_at=evaluated_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
     )
+
+
+# ---------------------------------------------------------------------------
+# Vectorized (many evaluation times at once)
+# ---------------------------------------------------------------------------
+# Same rules as _trend / _candle_position / _score_tf, applied elementwise to
+# arrays of "last confirmed candle" values. Comparisons and arithmetic follow
+# the scalar code operation by operation, so labels and alignment scores are
+# bit-identical to build_snapshot on the same candles.
+
+def trend_array(ma10: np.ndarray, ma35: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """Elementwise _trend → array of "up" / "down" / "flat"."""
+    gap_ratio = np.abs(ma10 - ma35) / close
+    return np.where(gap_ratio < FLAT_THRESHOLD, "flat", np.where(ma10 > ma35, "up", "down"))
+
+
+def candle_position_array(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    ma10: np.ndarray,
+    ma35: np.ndarray,
+) -> np.ndarray:
+    """Elementwise _candle_position (same priority order) → array of CandlePosition."""
+    body_low = np.minimum(open_, close)
+    body_high = np.maximum(open_, close)
+    ma10_lo = ma10 * (1 - TOUCH_TOL)
+    ma10_hi = ma10 * (1 + TOUCH_TOL)
+    ma35_lo = ma35 * (1 - TOUCH_TOL)
+    ma35_hi = ma35 * (1 + TOUCH_TOL)
+    rules = [
+        ((open_ < ma10) & (close > ma10), "break_ma10_up"),
+        ((open_ > ma10) & (close < ma10), "break_ma10_down"),
+        ((open_ < ma35) & (close > ma35), "break_ma35_up"),
+        ((open_ > ma35) & (close < ma35), "break_ma35_down"),
+        (low > np.maximum(ma10, ma35), "above_all"),
+        (high < np.minimum(ma10, ma35), "below_all"),
+        ((body_low >= ma10) & (low <= ma10_hi), "support_ma10"),
+        ((body_high <= ma10) & (high >= ma10_lo), "resist_ma10"),
+        ((body_low >= ma35) & (low <= ma35_hi), "support_ma35"),
+        ((body_high <= ma35) & (high >= ma35_lo), "resist_ma35"),
+    ]
+    return np.select([c for c, _ in rules], [label for _, label in rules], default="between")
+
+
+def score_tf_array(tf: str, trend: np.ndarray, position: np.ndarray) -> np.ndarray:
+    """Elementwise _score_tf → float64 contribution of one TF."""
+    w = TF_WEIGHTS[tf]
+    trend_direction = np.where(trend == "up", 1, np.where(trend == "down", -1, 0))
+    bullish = np.isin(position, list(_BULLISH_POSITIONS))
+    bearish = np.isin(position, list(_BEARISH_POSITIONS))
+    candle_align = np.where(bullish, 1, np.where(bearish, -1, 0)) * trend_direction
+    base = trend_direction * w
+    bonus = (trend_direction * candle_align * w).astype(np.float64) * CANDLE_BONUS_FRAC
+    return base + bonus
+
+
+_TF_STATE_INPUTS = ("open", "high", "low", "close", "ma10", "ma35", "atr14")
+
+
+@dataclass
+class RegimeSeries:
+    """Regime at many evaluation times (one row per time).
+
+    `rows[tf][col]` are the raw values of the last confirmed candle of each TF
+    at each time (open/high/low/close/ma10/ma35/atr14); `trend`/`candle_position`
+    are label arrays and `alignment_score` is NaN where `valid` is False
+    (a TF below its minimum history). `tf_ok[tf]` is False where that TF's
+    indicators are NaN — build_snapshot skips such a TF, and so does the score.
+    """
+    times: pd.DatetimeIndex
+    valid: np.ndarray
+    alignment_score: np.ndarray
+    trend: dict[str, np.ndarray]
+    candle_position: dict[str, np.ndarray]
+    tf_ok: dict[str, np.ndarray]
+    rows: dict[str, dict[str, np.ndarray]]
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def snapshot(self, i: int) -> Optional[RegimeSnapshot]:
+        """RegimeSnapshot at times[i] (None if invalid) — equal to build_snapshot."""
+        if not self.valid[i]:
+            return None
+        tf_states: dict[str, TFState] = {}
+        for tf, cols in self.rows.items():
+            if not self.tf_ok[tf][i]:
+                continue
+            tf_states[tf] = TFState(
+                trend=str(self.trend[tf][i]),
+                candle_position=str(self.candle_position[tf][i]),
+                ma10=round(cols["ma10"][i], 4),
+                ma35=round(cols["ma35"][i], 4),
+                close=round(cols["close"][i], 4),
+                atr14=round(cols["atr14"][i], 4),
+            )
+        evaluated_at = self.times[i].to_pydatetime().replace(tzinfo=timezone.utc)
+        return RegimeSnapshot(
+            tf_states=tf_states,
+            alignment_score=float(self.alignment_score[i]),
+            evaluated_at=evaluated_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Flat table: alignment_score + <tf>_trend / <tf>_position / <tf>_close ... columns."""
+        out = {"valid": self.valid, "alignment_score": self.alignment_score}
+        for tf, cols in self.rows.items():
+            out[f"{tf}_trend"] = self.trend[tf]
+            out[f"{tf}_position"] = self.candle_position[tf]
+            for col in ("close", "ma10", "ma35", "atr14"):
+                out[f"{tf}_{col}"] = cols[col]
+        return pd.DataFrame(out, index=self.times)
+
+
+def regime_series(
+    times: pd.DatetimeIndex,
+    rows: dict[str, dict[str, np.ndarray]],
+    valid: np.ndarray,
+) -> RegimeSeries:
+    """
+    Build a RegimeSeries from per-TF last-confirmed-candle arrays.
+    `rows` iteration order is the TF order of the resulting snapshots.
+    """
+    n = len(times)
+    raw = np.zeros(n, dtype=np.float64)
+    trend: dict[str, np.ndarray] = {}
+    position: dict[str, np.ndarray] = {}
+    tf_ok: dict[str, np.ndarray] = {}
+    for tf, cols in rows.items():
+        o, h, l, c = cols["open"], cols["high"], cols["low"], cols["close"]
+        ma10, ma35, atr14 = cols["ma10"], cols["ma35"], cols["atr14"]
+        tf_ok[tf] = ~(np.isnan(ma10) | np.isnan(ma35) | np.isnan(atr14))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            trend[tf] = trend_array(ma10, ma35, c)
+            position[tf] = candle_position_array(o, h, l, c, ma10, ma35)
+        raw = raw + np.where(tf_ok[tf], score_tf_array(tf, trend[tf], position[tf]), 0.0)
+    max_raw = MAX_WEIGHT_SUM * (1 + CANDLE_BONUS_FRAC)
+    score = np.clip((raw / max_raw) * 100.0, -100.0, 100.0)
+    return RegimeSeries(
+        times=times,
+        valid=valid,
+        alignment_score=np.where(valid, score, np.nan),
+        trend=trend,
+        candle_position=position,
+        tf_ok=tf_ok,
+        rows=rows,
+    )
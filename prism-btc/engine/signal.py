@@ -136,14 +136,18 @@ def trend_strength(state: TFState) -> float:
     return abs(state.ma10 - state.ma35) / state.atr14
 
 
-def chop_filter_passed(tf_states: dict[str, TFState]) -> bool:
+def chop_filter_passed(tf_states: dict[str, TFState], ts_min: float | None = None) -> bool:
     """추세강도 게이트: TS_GATE_TFS(4h·1d) 두 TF 모두 trend_strength >= TS_MIN.
 
     하나라도 미달이거나 상태가 없으면 횡보로 보고 신규 진입 금지.
     보유 포지션 관리에는 영향을 주지 않는다(호출처에서 진입에만 사용).
+    ts_min: 명시 config (연구 스윕) — None 이면 engine.config.TS_MIN.
     """
     from engine.config import TS_MIN, TS_GATE_TFS
 
+    if ts_min is not None:
+        TS_MIN = ts_min
+
     for tf in TS_GATE_TFS:
         state = tf_states.get(tf)
         if state is None:
@@ -153,16 +157,24 @@ def chop_filter_passed(tf_states: dict[str, TFState]) -> bool:
     return True
 
 
-def generate_signal(snapshot: RegimeSnapshot) -> Signal:
+def generate_signal(
+    snapshot: RegimeSnapshot,
+    entry_score_min: float | None = None,
+    ts_min: float | None = None,
+) -> Signal:
     """
     RegimeSnapshot → Signal.
 
     롱: alignment_score >= +ENTRY_SCORE_MIN AND 장기TF 가중 방향 양수 AND 단기(30m/1h) 지지/돌파
     숏: 대칭
     |score| < ENTRY_SCORE_MIN → none
+    entry_score_min/ts_min: 명시 config (연구 스윕) — None 이면 engine.config 값.
     """
     from engine.config import ENTRY_SCORE_MIN
 
+    if entry_score_min is not None:
+        ENTRY_SCORE_MIN = entry_score_min
+
     score = snapshot.alignment_score
     tf_states = snapshot.tf_states
     abs_score = abs(score)
@@ -172,7 +184,7 @@ def generate_signal(snapshot: RegimeSnapshot) -> Signal:
                       reason=f"score={score:.1f} < {ENTRY_SCORE_MIN:.0f}, 횡보관망")
 
     # 라운드2 #1: 횡보 필터 — 4h·1d 추세강도 게이트. 둘 다 통과해야 신규 진입.
-    if not chop_filter_passed(tf_states):
+    if not chop_filter_passed(tf_states, ts_min):
         return Signal(side="none", strength=abs_score, reason="추세강도 미달(횡보 게이트)")
 
     if score >= ENTRY_SCORE_MIN:
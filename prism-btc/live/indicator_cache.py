@@ -0,0 +1,142 @@
+# live/indicator_cache.py — 라이브 틱용 증분 지표 캐시
+#
+# runner.tick 은 매 30m 틱마다 전 TF 전체 히스토리를 읽어 add_indicators 를 다시
+# 돌렸다 (새 확정봉은 1~2개뿐인데 O(전체 히스토리) — DB 가 커질수록 틱 지연/메모리 증가).
+#
+# 여기서는 TF별 IndicatorState(MA10/MA35 윈도우 합 + Wilder ATR carry)를
+# market.db 의 kline_indicators 테이블에 영속한다:
+#   1. 마지막 처리 행의 (atr_ewm, n_obs) + 직전 35개 종가로 상태 복원
+#   2. 그 이후의 새 확정봉만 상태에 공급 → kline_indicators 에 추가  (O(새 봉))
+#   3. 최근 KEEP_ROWS 행만 klines ⨝ kline_indicators 로 읽어 tf_data 구성 (고정 크기)
+# 최초 1회(테이블 비어 있음)만 전체 히스토리를 스트리밍 재생한다.
+# collector/backfill 이 마지막 처리 행 뒤쪽(과거)에 구멍을 메운 봉을 넣으면 klines 와
+# kline_indicators 행 수가 어긋난다 — 그 경우 가장 이른 불일치 시점부터 다시 쌓는다
+# (이후 ATR carry 가 전부 달라지므로).
+#
+# 산출 DataFrame 은 add_indicators 결과와 같은 컬럼 — build_snapshot/_get_tf_slice/
+# ShadowAdapter/journal 이 그대로 소비한다 (build_tf_state 는 precomputed 컬럼 사용).
+from __future__ import annotations
+
+import logging
+import math
+import sqlite3
+
+import pandas as pd
+
+from backtest.engine import ALL_TFS
+from engine.incremental import IndicatorState, MA_SLOW
+
+log = logging.getLogger("live.indicator_cache")
+
+# TF별 유지 행 수 (메모리/지연 상한). 스냅샷은 MIN_ROWS(50)만 필요하지만,
+# journal 은 종결 트레이드의 진입~청산 30m 구간과 진입 시점 스냅샷을 재구성하므로
+# 30m 180일 / 1w ~4년을 남긴다. 1h 는 진입 입력 ATR 을 슬라이스에서 재계산하므로
+# EWM 초기값 영향이 사라질 만큼 길게 (13/14)^4320 ≈ 0.
+KEEP_ROWS: dict[str, int] = {
+    "30m": 8640, "1h": 4320, "4h": 1080, "12h": 720, "1d": 400, "1w": 200,
+}
+
+_COLUMNS = ["open", "high", "low", "close", "volume", "turnover", "ma10", "ma35", "atr14"]
+
+
+def _nullable(v: float):
+    return None if math.isnan(v) else v
+
+
+def _last_row(conn: sqlite3.Connection, tf: str):
+    return conn.execute(
+        "SELECT open_time, atr_ewm, n_obs FROM kline_indicators "
+        "WHERE timeframe=? ORDER BY open_time DESC LIMIT 1", (tf,)).fetchone()
+
+
+def _first_mismatch(conn: sqlite3.Connection, tf: str, last_ot: int) -> int | None:
+    """last_ot 이전에서 klines(확정) 와 kline_indicators 가 어긋나는 가장 이른 open_time.
+
+    행 수가 같으면 None (평소 틱은 인덱스 COUNT 2회로 끝난다).
+    """
+    n_klines = conn.execute(
+        "SELECT COUNT(*) FROM klines WHERE timeframe=? AND confirmed=1 AND open_time<=?",
+        (tf, last_ot)).fetchone()[0]
+    n_ind = conn.execute(
+        "SELECT COUNT(*) FROM kline_indicators WHERE timeframe=? AND open_time<=?",
+        (tf, last_ot)).fetchone()[0]
+    if n_klines == n_ind:
+        return None
+    missing = conn.execute(   # 백필로 뒤늦게 들어온 봉
+        "SELECT MIN(k.open_time) FROM klines k LEFT JOIN kline_indicators i "
+        "ON i.timeframe = k.timeframe AND i.open_time = k.open_time "
+        "WHERE k.timeframe=? AND k.confirmed=1 AND k.open_time<=? AND i.open_time IS NULL",
+        (tf, last_ot)).fetchone()[0]
+    orphan = conn.execute(    # 사라졌거나 미확정으로 바뀐 봉
+        "SELECT MIN(i.open_time) FROM kline_indicators i LEFT JOIN klines k "
+        "ON k.timeframe = i.timeframe AND k.open_time = i.open_time AND k.confirmed=1 "
+        "WHERE i.timeframe=? AND k.open_time IS NULL", (tf,)).fetchone()[0]
+    found = [t for t in (missing, orphan) if t is not None]
+    return min(found) if found else None
+
+
+def advance(conn: sqlite3.Connection, tf: str) -> int:
+    """kline_indicators 를 tf 의 최신 확정봉까지 전진. 추가된 행 수 반환."""
+    last = _last_row(conn, tf)
+    if last is not None:
+        gap = _first_mismatch(conn, tf, last[0])
+        if gap is not None:
+            with conn:
+                dropped = conn.execute("DELETE FROM kline_indicators WHERE timeframe=? AND open_time>=?",
+                                       (tf, gap)).rowcount
+            log.info("indicator cache rebuild: %s from open_time=%d (%d rows dropped)", tf, gap, dropped)
+            last = _last_row(conn, tf)
+    if last is None:
+        state, last_ot = IndicatorState(), None
+    else:
+        last_ot, atr_ewm, n_obs = last
+        closes = [r[0] for r in conn.execute(
+            "SELECT close FROM klines WHERE timeframe=? AND confirmed=1 AND open_time<=? "
+            "ORDER BY open_time DESC LIMIT ?", (tf, last_ot, MA_SLOW))]
+        state = IndicatorState.resume(closes[::-1], atr_ewm, n_obs)
+
+    new = conn.execute(
+        "SELECT open_time, high, low, close FROM klines "
+        "WHERE timeframe=? AND confirmed=1 AND open_time>? ORDER BY open_time",
+        (tf, -1 if last_ot is None else last_ot)).fetchall()
+    if not new:
+        return 0
+    rows = []
+    for open_time, high, low, close in new:
+        ma10, ma35, atr14 = state.update(high, low, close)
+        rows.append((tf, open_time, _nullable(ma10), _nullable(ma35), _nullable(atr14),
+                     state.atr_ewm, state.n_obs))
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO kline_indicators "
+            "(timeframe, open_time, ma10, ma35, atr14, atr_ewm, n_obs) VALUES (?,?,?,?,?,?,?)",
+            rows)
+    if last_ot is None:
+        log.info("indicator cache cold start: %s %d rows", tf, len(rows))
+    return len(rows)
+
+
+def load_tail(conn: sqlite3.Connection, tf: str, keep: int) -> pd.DataFrame:
+    """최근 keep 개 확정봉 + 지표 (oldest first, add_indicators 와 같은 컬럼)."""
+    rows = conn.execute(
+        "SELECT k.open_time, k.open, k.high, k.low, k.close, k.volume, k.turnover, "
+        "i.ma10, i.ma35, i.atr14 "
+        "FROM klines k JOIN kline_indicators i "
+        "ON i.timeframe = k.timeframe AND i.open_time = k.open_time "
+        "WHERE k.timeframe=? AND k.confirmed=1 ORDER BY k.open_time DESC LIMIT ?",
+        (tf, keep)).fetchall()[::-1]
+    df = pd.DataFrame([r[1:] for r in rows], columns=_COLUMNS, dtype=float)
+    df.index = pd.to_datetime([r[0] for r in rows], unit="ms", utc=True)
+    df.index.name = "open_time"
+    return df
+
+
+def refresh_tf_data(conn: sqlite3.Connection,
+                    keep_rows: dict[str, int] | None = None) -> dict[str, pd.DataFrame]:
+    """전 TF 증분 갱신 후 고정 크기 tf_data 반환 (runner.tick 의 add_indicators 대체)."""
+    keep_rows = keep_rows or KEEP_ROWS
+    tf_data = {}
+    for tf in ALL_TFS:
+        advance(conn, tf)
+        tf_data[tf] = load_tail(conn, tf, keep_rows.get(tf, KEEP_ROWS["30m"]))
+    return tf_data
@@ -168,31 +168,47 @@ def _excursion(trade: dict, bars_30m: pd.DataFrame, risk_usd: Optional[float]) -
     return out
 
 
-def _snapshot_context(tf_data: Optional[dict], at_time: str) -> Optional[dict]:
-    """진입/청산 시점 레짐 스냅샷 재구성 — 결정적 (같은 klines → 같은 스냅샷).
+def _regime_contexts(tf_data: Optional[dict], times: list[str]) -> dict[str, Optional[dict]]:
+    """여러 시점의 레짐 컨텍스트를 한 번에 — build_snapshots 1회 (시점별 재구성 없음).
 
-    엔진이 그 봉에서 본 것과 동일한 _build_snapshot_at 호출. TF 데이터 부족 시 None.
+    엔진이 그 봉에서 본 것과 동일한 스냅샷 (_build_snapshot_at 과 같음).
+    TF 데이터 부족/파싱 실패 시점은 None.
     """
-    if not tf_data:
-        return None
+    out: dict[str, Optional[dict]] = {t: None for t in times}
+    if not tf_data or not times:
+        return out
     try:
-        from backtest.engine import _build_snapshot_at
+        from backtest.engine import build_snapshots
         from engine.signal import trend_strength
-        snap = _build_snapshot_at(tf_data, pd.Timestamp(at_time))
-        if snap is None:
-            return None
-        ctx = {
-            "alignment_score": round(snap.alignment_score, 2),
-            "trend_strength_4h": round(trend_strength(snap.tf_states["4h"]), 3)
-            if "4h" in snap.tf_states else None,
-            "trend_strength_1d": round(trend_strength(snap.tf_states["1d"]), 3)
-            if "1d" in snap.tf_states else None,
-            "tf_trends": {tf: s.trend for tf, s in snap.tf_states.items()},
-        }
-        return ctx
+        parsed: dict[str, pd.Timestamp] = {}
+        for t in dict.fromkeys(times):
+            try:
+                ts = pd.Timestamp(t)
+                parsed[t] = ts.tz_localize("UTC") if ts.tz is None else ts.tz_convert("UTC")
+            except (ValueError, TypeError) as exc:
+                log.warning("snapshot context: bad time %r: %s", t, exc)
+        keys = list(parsed)
+        series = build_snapshots(tf_data, [parsed[t] for t in keys])
+        for i, t in enumerate(keys):
+            snap = series.snapshot(i)
+            if snap is None:
+                continue
+            out[t] = {
+                "alignment_score": round(snap.alignment_score, 2),
+                "trend_strength_4h": round(trend_strength(snap.tf_states["4h"]), 3)
+                if "4h" in snap.tf_states else None,
+                "trend_strength_1d": round(trend_strength(snap.tf_states["1d"]), 3)
+                if "1d" in snap.tf_states else None,
+                "tf_trends": {tf: s.trend for tf, s in snap.tf_states.items()},
+            }
     except Exception as exc:  # noqa: BLE001 — 컨텍스트는 부가정보, 실패해도 facts 는 진행
-        log.warning("snapshot context failed at %s: %s", at_time, exc)
-        return None
+        log.warning("snapshot context failed: %s", exc)
+    return out
+
+
+def _snapshot_context(tf_data: Optional[dict], at_time: str) -> Optional[dict]:
+    """진입/청산 시점 레짐 스냅샷 재구성 — 결정적 (같은 klines → 같은 스냅샷)."""
+    return _regime_contexts(tf_data, [at_time])[at_time]
 
 
 def _backtest_baseline(net_r: Optional[float]) -> dict:
@@ -225,8 +241,12 @@ def _backtest_baseline(net_r: Optional[float]) -> dict:
     return base
 
 
-def extract_facts(trade: dict, tf_data: Optional[dict] = None) -> dict:
-    """종결 트레이드 1건의 결정적 사실 추출. 부검 수치의 유일한 출처."""
+def extract_facts(trade: dict, tf_data: Optional[dict] = None,
+                  contexts: Optional[dict] = None) -> dict:
+    """종결 트레이드 1건의 결정적 사실 추출. 부검 수치의 유일한 출처.
+
+    contexts: _regime_contexts 로 미리 계산한 {시각: 컨텍스트} (배치 처리용).
+    """
     risk_usd = _initial_risk_usd(trade)
     net_r = trade.get("r_multiple")
     gross_r = trade.get("gross_r_multiple")
@@ -265,8 +285,10 @@ def extract_facts(trade: dict, tf_data: Optional[dict] = None) -> dict:
             "funding_paid": trade.get("funding_paid"),
         },
         "excursion": _excursion(trade, bars_30m, risk_usd),
-        "entry_context": _snapshot_context(tf_data, trade["entry_time"]),
-        "exit_context": _snapshot_context(tf_data, trade["exit_time"]),
+        "entry_context": (contexts[trade["entry_time"]] if contexts is not None
+                          else _snapshot_context(tf_data, trade["entry_time"])),
+        "exit_context": (contexts[trade["exit_time"]] if contexts is not None
+                         else _snapshot_context(tf_data, trade["exit_time"])),
         "baseline": _backtest_baseline(net_r),
     }
     return facts
@@ -415,8 +437,11 @@ def process_pending(conn: sqlite3.Connection, tf_data: Optional[dict] = None,
     ensure_journal_schema(conn)
     result = {"facts_created": 0, "analyzed": 0, "failed": 0, "lessons": 0}
 
-    for trade in _trades_without_journal(conn, mode):
-        facts = extract_facts(trade, tf_data)
+    trades = _trades_without_journal(conn, mode)
+    contexts = _regime_contexts(
+        tf_data, [t[k] for t in trades for k in ("entry_time", "exit_time")])
+    for trade in trades:
+        facts = extract_facts(trade, tf_data, contexts)
         _insert_facts(conn, mode, trade, facts)
         result["facts_created"] += 1
         tracking.log_event(
@@ -497,11 +522,10 @@ def weekly_digest(conn: sqlite3.Connection, mode: str = "shadow") -> dict:
 def _load_tf_data_for_cli(market_db_path=None) -> Optional[dict]:
     try:
         from collector.store import get_connection as market_connection
-        from backtest.engine import _load_tf_data, ALL_TFS
-        from engine.indicators import add_indicators
+        from backtest.engine import load_market_data
         mconn = market_connection(market_db_path)
         try:
-            return {tf: add_indicators(_load_tf_data(mconn, tf)) for tf in ALL_TFS}
+            return load_market_data(mconn).tf_data
         finally:
             mconn.close()
     except Exception as exc:  # noqa: BLE001
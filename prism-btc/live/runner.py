@@ -6,7 +6,8 @@
 # tick 순서:
 #   1. update_all()  — market.db 증분 갱신 (실패 시 이번 틱 스킵 + 이벤트 기록)
 #   2. 새 확정 30m 봉이 있으면:
-#        지표/스냅샷 빌드 (backtest 헬퍼 재사용) → exits 평가/집행 → 진입 평가
+#        지표 증분 갱신 (live/indicator_cache — 새 봉만, 고정 크기 tail) →
+#        스냅샷 빌드 (backtest 헬퍼 재사용) → exits 평가/집행 → 진입 평가
 #        (4h 하드캡 + 쿨다운) → DB 기록
 #   3. btc_events 에 하트비트 기록
 #
@@ -22,10 +23,10 @@ import pandas as pd
 
 from collector.store import get_connection as market_connection
 from collector.update import update_all
-from backtest.engine import _load_tf_data, _get_tf_slice, ALL_TFS
-from engine.indicators import add_indicators
+from backtest.engine import _get_tf_slice
 
 from live import tracking
+from live.indicator_cache import refresh_tf_data
 from live.shadow import ShadowAdapter, _load_funding
 
 log = logging.getLogger("live.runner")
@@ -89,10 +90,12 @@ def tick(mode: str = "shadow", market_db_path=None, root_db_path=None) -> dict:
         root_conn.close()
         return result
 
-    # --- 2. 지표/스냅샷용 tf_data 빌드 (backtest 헬퍼 재사용 — confirmed=1 만) ---
+    # --- 2. 지표/스냅샷용 tf_data 빌드 (confirmed=1 만) ---
+    # 증분: 새 확정봉만 지표 상태에 공급하고 최근 KEEP_ROWS 만 읽는다 — 틱 지연/메모리는
+    # market.db 크기와 무관하게 일정 (전체 재계산은 최초 1회 콜드 스타트뿐).
     market_conn = market_connection(market_db_path)
     try:
-        tf_data = {tf: add_indicators(_load_tf_data(market_conn, tf)) for tf in ALL_TFS}
+        tf_data = refresh_tf_data(market_conn)
         funding_times, funding_rates = _load_funding(market_conn)
     finally:
         market_conn.close()
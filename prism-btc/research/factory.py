@@ -105,25 +105,14 @@ def _clean(metrics: dict) -> dict:
     return out
 
 
-def _run_period(market_db_path: Optional[str], start: str, end: str) -> dict:
-    from collector.store import get_connection
-    from backtest.engine import run_backtest, compute_metrics
-    conn = get_connection(market_db_path)
-    try:
-        state = run_backtest(conn, pd.Timestamp(start, tz="UTC"),
-                             pd.Timestamp(end, tz="UTC"),
-                             initial_equity=INITIAL_EQUITY)
-    finally:
-        conn.close()
-    return _clean(compute_metrics(state, INITIAL_EQUITY))
-
-
 def _run_train_oos(market_db_path: Optional[str], cfg: dict[str, Any]) -> tuple[dict, dict]:
-    """주어진 오버라이드 세트로 train/OOS 두 구간 실행 (적용 후 원상복원)."""
-    oos_end = pd.Timestamp.now("UTC").strftime("%Y-%m-%d")
-    with overrides.apply(cfg):
-        m_train = _run_period(market_db_path, *TRAIN_PERIOD)
-        m_oos = _run_period(market_db_path, OOS_START, oos_end)
+    """주어진 오버라이드 세트로 train/OOS 두 구간 실행.
+
+    config 는 run_backtest(config=...) 로 명시 전달 (모듈 글로벌 패치 없음) —
+    klines 는 1회 로드해 두 구간이 공유. 병렬 그리드는 research.sweep.
+    """
+    from research import sweep
+    m_train, m_oos = sweep.run_jobs(market_db_path, sweep.make_jobs([cfg]), workers=1)
     return m_train, m_oos
 
 
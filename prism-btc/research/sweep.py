@@ -0,0 +1,225 @@
+# research/sweep.py — 병렬 파라미터 스윕 (override 세트 × 구간 → 프로세스 풀)
+#
+#   python -m research.sweep --full --steps 4 --workers 8 --out sweep.json
+#   python -m research.sweep --grid TS_MIN=2.0,2.5,3.0 TRAILING_TF=12h,1d
+#
+# overrides.apply 는 모듈 글로벌을 패치하므로 한 프로세스에서 두 config 를 동시에
+# 돌릴 수 없다. 스윕은 config 를 run_backtest(config=...) 로 명시 전달하고,
+# 워커마다 klines 를 1회 로드(MarketData)해 모든 잡에 재사용한다.
+#
+# 판정은 factory.evaluate_gate 그대로 — baseline 대비 각 variant 의 게이트 결과를
+# 한 곳(run_sweep 반환값)에 모은다. 스윕은 DB 에 아무것도 기록/활성화하지 않는다
+# (자동 반영은 여전히 factory 의 화이트리스트 가설 경로로만).
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from research import factory, overrides
+
+log = logging.getLogger("research.sweep")
+
+# 워커 프로세스 전역: initializer 가 1회 로드 (잡마다 재로드 금지)
+_WORKER_DATA = None
+
+
+@dataclass(frozen=True)
+class SweepJob:
+    """한 번의 백테스트: config(검증된 오버라이드) × 구간."""
+    config: tuple[tuple[str, Any], ...]   # 정렬된 (param, value) — 해시/피클 안전
+    period: str                            # "train" | "oos" | 임의 라벨
+    start: str
+    end: str
+
+    @property
+    def config_dict(self) -> dict[str, Any]:
+        return dict(self.config)
+
+
+def _freeze(cfg: dict[str, Any]) -> tuple[tuple[str, Any], ...]:
+    return tuple(sorted((p, overrides.validate(p, v)) for p, v in cfg.items()))
+
+
+def default_periods() -> dict[str, tuple[str, str]]:
+    """factory 와 동일한 train/OOS 구간."""
+    oos_end = pd.Timestamp.now("UTC").strftime("%Y-%m-%d")
+    return {"train": factory.TRAIN_PERIOD, "oos": (factory.OOS_START, oos_end)}
+
+
+def make_jobs(configs: list[dict[str, Any]],
+              periods: Optional[dict[str, tuple[str, str]]] = None) -> list[SweepJob]:
+    """config × period 잡 목록 (화이트리스트 검증 — 범위 밖은 OverrideError)."""
+    periods = periods or default_periods()
+    return [SweepJob(_freeze(cfg), name, start, end)
+            for cfg in configs for name, (start, end) in periods.items()]
+
+
+# ---------------------------------------------------------------------------
+# 실행기
+# ---------------------------------------------------------------------------
+
+def _init_worker(market_db_path: Optional[str]) -> None:
+    global _WORKER_DATA
+    from collector.store import get_connection
+    from backtest.engine import load_market_data
+    conn = get_connection(market_db_path)
+    try:
+        _WORKER_DATA = load_market_data(conn)
+    finally:
+        conn.close()
+
+
+def _run_job(job: SweepJob) -> dict:
+    from backtest.engine import run_backtest, compute_metrics
+    state = run_backtest(None, pd.Timestamp(job.start, tz="UTC"),
+                         pd.Timestamp(job.end, tz="UTC"),
+                         initial_equity=factory.INITIAL_EQUITY,
+                         config=job.config_dict, data=_WORKER_DATA)
+    return factory._clean(compute_metrics(state, factory.INITIAL_EQUITY))
+
+
+def run_jobs(market_db_path: Optional[str], jobs: list[SweepJob],
+             workers: Optional[int] = None) -> list[dict]:
+    """잡 목록 실행 → 메트릭 리스트 (입력 순서 유지).
+
+    workers<=1 (또는 잡 1개) 는 현재 프로세스에서 순차 실행 — klines 1회 로드.
+    그 외는 ProcessPoolExecutor — 워커마다 initializer 에서 1회 로드.
+    """
+    global _WORKER_DATA
+    if not jobs:
+        return []
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(jobs) == 1:
+        prev = _WORKER_DATA
+        try:
+            _init_worker(market_db_path)
+            return [_run_job(j) for j in jobs]
+        finally:
+            _WORKER_DATA = prev
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs)),
+                             initializer=_init_worker,
+                             initargs=(market_db_path,)) as pool:
+        return list(pool.map(_run_job, jobs))
+
+
+# ---------------------------------------------------------------------------
+# 그리드 + 판정 수집
+# ---------------------------------------------------------------------------
+
+def tunable_space(steps: int = 5) -> dict[str, list]:
+    """TUNABLES 전 범위: float 는 [lo, hi] 등간격 steps 개, enum 은 전체 choices."""
+    space: dict[str, list] = {}
+    for param, t in overrides.TUNABLES.items():
+        if t.kind == "float":
+            space[param] = [round(float(v), 4) for v in np.linspace(t.lo, t.hi, steps)]
+        else:
+            space[param] = list(t.choices)
+    return space
+
+
+def grid(space: dict[str, list]) -> list[dict[str, Any]]:
+    """카테시안 곱 (각 값은 화이트리스트 검증)."""
+    params = sorted(space)
+    values = [[overrides.validate(p, v) for v in space[p]] for p in params]
+    return [dict(zip(params, combo)) for combo in itertools.product(*values)]
+
+
+def run_sweep(market_db_path: Optional[str], configs: list[dict[str, Any]],
+              baseline: Optional[dict[str, Any]] = None,
+              workers: Optional[int] = None,
+              periods: Optional[dict[str, tuple[str, str]]] = None) -> dict:
+    """baseline + 각 config 를 train/OOS 로 병렬 실행하고 evaluate_gate 결과를 모은다.
+
+    반환: {"baseline": {config, train, oos},
+           "results": [{config, train, oos, passed, checks}, ...]}  — 합격 우선, train PF 내림차순.
+    """
+    baseline = dict(baseline or {})
+    periods = periods or default_periods()
+    if set(periods) != {"train", "oos"}:
+        raise ValueError("periods 는 train/oos 두 구간이어야 evaluate_gate 판정 가능")
+    all_cfgs = [baseline] + [c for c in configs if _freeze(c) != _freeze(baseline)]
+    jobs = make_jobs(all_cfgs, periods)
+    log.info("sweep: %d configs × %d periods = %d jobs", len(all_cfgs), len(periods), len(jobs))
+    metrics = run_jobs(market_db_path, jobs, workers)
+    by_key = {(j.config, j.period): m for j, m in zip(jobs, metrics)}
+
+    base_key = _freeze(baseline)
+    base_train, base_oos = by_key[(base_key, "train")], by_key[(base_key, "oos")]
+    results = []
+    for cfg in all_cfgs[1:]:
+        key = _freeze(cfg)
+        var_train, var_oos = by_key[(key, "train")], by_key[(key, "oos")]
+        passed, checks = factory.evaluate_gate(base_train, var_train, base_oos, var_oos)
+        results.append({"config": dict(key), "train": var_train, "oos": var_oos,
+                        "passed": passed, "checks": checks})
+    results.sort(key=lambda r: (not r["passed"], -float(r["train"]["profit_factor"])))
+    return {"baseline": {"config": dict(base_key), "train": base_train, "oos": base_oos},
+            "results": results}
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _parse_grid(items: list[str]) -> dict[str, list]:
+    space = {}
+    for item in items:
+        param, _, values = item.partition("=")
+        if not values:
+            raise SystemExit(f"--grid 형식: PARAM=v1,v2 (받음: {item!r})")
+        space[param] = [v.strip() for v in values.split(",") if v.strip()]
+    return space
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="prism-btc 병렬 파라미터 스윕")
+    parser.add_argument("--grid", nargs="*", default=[], help="PARAM=v1,v2 ...")
+    parser.add_argument("--full", action="store_true", help="TUNABLES 전 범위 그리드")
+    parser.add_argument("--steps", type=int, default=5, help="--full float 분할 수")
+    parser.add_argument("--workers", type=int, default=None, help="기본: CPU 코어 수")
+    parser.add_argument("--mode", default="shadow", help="baseline = 이 모드의 챔피언")
+    parser.add_argument("--root-db", default=None)
+    parser.add_argument("--market-db", default=None)
+    parser.add_argument("--out", default=None, help="결과 JSON 경로")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    space = tunable_space(args.steps) if args.full else _parse_grid(args.grid)
+    if not space:
+        print("--grid 또는 --full 필요")
+        return 1
+    from live import tracking
+    conn = tracking.get_connection(args.root_db)
+    try:
+        champion = overrides.load_active(conn, args.mode)
+    finally:
+        conn.close()
+
+    configs = [{**champion, **cfg} for cfg in grid(space)]
+    res = run_sweep(args.market_db, configs, baseline=champion, workers=args.workers)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(res, f, ensure_ascii=False, indent=2)
+    b = res["baseline"]
+    print(f"baseline {b['config'] or '(동결)'}: train PF {b['train']['profit_factor']} "
+          f"/ OOS PF {b['oos']['profit_factor']}")
+    for r in res["results"][:20]:
+        print(f"{'PASS' if r['passed'] else 'fail'}  {r['config']}  "
+              f"train PF {r['train']['profit_factor']} ret {r['train']['total_return_pct']}% "
+              f"MDD {r['train']['mdd_pct']}%  | OOS PF {r['oos']['profit_factor']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,13 +9,17 @@ from datetime import timezone
 from unittest.mock import patch, MagicMock
 
 from backtest.engine import (
+    _BarFeed,
     _get_tf_slice,
     _build_snapshot_at,
+    build_snapshots,
     compute_metrics,
     BacktestState,
     TradeLog,
     run_backtest,
+    ALL_TFS as ENGINE_TFS,
 )
+from engine.indicators import add_indicators
 from engine.sizing import approx_liq_price, _sl_passes_buffer, LIQ_BUFFER_MIN_FRAC
 
 ALL_TFS = ("30m", "1h", "4h", "12h", "1d", "1w")
@@ -431,3 +435,101 @@ class TestRound3LiqApproachMeasurement:
         assert classified <= state.liq_approach_count
         assert metrics["liq_reduce_would_be_sl"] >= 0
         assert metrics["liq_reduce_ended_win"] >= 0
+
+
+# ---------------------------------------------------------------------------
+# 배열 fast path == 슬라이스 경로 (TradeLog/equity_curve 바이트 동일)
+# ---------------------------------------------------------------------------
+
+def _make_random_walk_db(days: int = 420, seed: int = 5) -> sqlite3.Connection:
+    """Regime-switching 30m random walk, resampled to every TF (+ funding table)."""
+    rng = np.random.default_rng(seed)
+    n = days * 48
+    idx = pd.date_range("2021-01-01", periods=n, freq="30min", tz="UTC")
+    drift = np.repeat(rng.choice([-0.0012, 0.0, 0.0012], size=n // 480 + 1), 480)[:n]
+    close = 30000 * np.exp(np.cumsum(drift + rng.normal(0, 0.006, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.002, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.002, n)))
+    bars = pd.DataFrame({"open": open_, "high": high, "low": low, "close": close,
+                         "volume": 1.0, "turnover": 1.0}, index=idx)
+
+    conn = _make_in_memory_db()
+    conn.execute("DELETE FROM klines")
+    rules = {"30m": "30min", "1h": "1h", "4h": "4h", "12h": "12h", "1d": "1D", "1w": "W-MON"}
+    for tf, rule in rules.items():
+        agg = bars.resample(rule, label="left", closed="left").agg(
+            {"open": "first", "high": "max", "low": "min", "close": "last",
+             "volume": "sum", "turnover": "sum"}).dropna()
+        conn.executemany(
+            "INSERT INTO klines VALUES (?,?,?,?,?,?,?,?,1)",
+            [(tf, int(t), *r) for t, r in zip(agg.index.as_unit("ms").asi8, agg.itertuples(index=False))],
+        )
+    conn.execute("CREATE TABLE funding (funding_time INTEGER, rate REAL)")
+    ft = pd.date_range("2021-01-01", periods=days * 3, freq="8h", tz="UTC").as_unit("ms").asi8
+    conn.executemany("INSERT INTO funding VALUES (?,?)",
+                     [(int(t), float(r)) for t, r in zip(ft, rng.normal(0.0001, 0.0002, len(ft)))])
+    conn.commit()
+    return conn
+
+
+class TestArrayFastPath:
+    def test_closed_counts_match_slices(self):
+        tf_data = {tf: add_indicators(df) for tf, df in _make_tf_data(n_30m=400).items()}
+        sim_index = tf_data["30m"].index[100:160]
+        feed = _BarFeed(tf_data, sim_index, fast=True)
+        for i, t in enumerate(sim_index):
+            for tf in ENGINE_TFS:
+                assert feed.closed[tf][i] == len(_get_tf_slice(tf_data, t, tf)), (tf, t)
+
+    def test_fast_path_byte_identical(self):
+        conn = _make_random_walk_db()
+        start_ts = pd.Timestamp("2022-01-10", tz="UTC")
+        end_ts = pd.Timestamp("2022-02-24", tz="UTC")
+        slow = run_backtest(conn, start_ts, end_ts, fast=False)
+        fast = run_backtest(conn, start_ts, end_ts, fast=True)
+        conn.close()
+
+        assert len(slow.trade_logs) >= 5
+        assert {t.exit_reason for t in slow.trade_logs} >= {"sl", "be"}  # 트레일링 경로 포함
+        assert repr(fast.trade_logs) == repr(slow.trade_logs)
+        assert repr(fast.equity_curve) == repr(slow.equity_curve)
+        assert (fast.equity, fast.total_fees, fast.total_funding) == (
+            slow.equity, slow.total_fees, slow.total_funding)
+
+
+class TestBuildSnapshots:
+    def test_matches_per_bar_snapshots(self):
+        conn = _make_random_walk_db()
+        from backtest.engine import load_market_data
+        tf_data = load_market_data(conn).tf_data
+        times = tf_data["30m"].index[-4000::5]   # 1w 최소 이력(50주) 경계 포함
+        series = build_snapshots(tf_data, times)
+
+        assert len(series) == len(times)
+        n_valid = 0
+        for i, t in enumerate(times):
+            ref = _build_snapshot_at(tf_data, t)
+            got = series.snapshot(i)
+            assert (got is None) == (ref is None) == (not series.valid[i]), t
+            if ref is None:
+                assert np.isnan(series.alignment_score[i])
+                continue
+            n_valid += 1
+            assert repr(got) == repr(ref)
+            assert series.alignment_score[i] == ref.alignment_score
+            for tf, st in ref.tf_states.items():
+                assert series.trend[tf][i] == st.trend
+                assert series.candle_position[tf][i] == st.candle_position
+        assert n_valid > len(times) // 2
+
+        frame = series.to_frame()
+        assert list(frame.index) == list(times)
+        assert {"alignment_score", "4h_trend", "1d_position", "1w_atr14"} <= set(frame.columns)
+
+    def test_naive_times_are_utc(self):
+        tf_data = {tf: add_indicators(df) for tf, df in _make_tf_data(n_30m=400).items()}
+        t = tf_data["30m"].index[-1]
+        series = build_snapshots(tf_data, [t.tz_localize(None)])
+        assert series.times[0] == t
+
@@ -0,0 +1,127 @@
+# tests/test_indicator_cache.py — 증분 지표 엔진 (engine.incremental + live.indicator_cache)
+#
+# 핵심 검증 대상:
+#   1. IndicatorState == add_indicators (ATR 비트 동일, MA 는 MA_PARITY_RTOL 이내)
+#      MA: 증분 쪽은 fsum(정확 반올림), pandas rolling 은 보정 누적합이라 약 20% 값이
+#      마지막 1~2 ulp 다르다 (상대오차 <= 3e-16, 히스토리 길이에 따라 커지지 않음).
+#   2. advance: 새 확정봉만 처리 (O(새 봉)), 재시작 후 복원 == 한 번에 재생,
+#      마지막 처리 봉 뒤쪽으로 백필된 봉은 그 지점부터 재계산
+#   3. refresh_tf_data: 고정 크기 tail, 스냅샷 == 전체 히스토리 스냅샷
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from backtest.engine import ALL_TFS, _build_snapshot_at, _load_tf_data
+from collector.store import CREATE_INDICATOR_TABLE
+from engine.incremental import MA_PARITY_RTOL, IndicatorState
+from engine.indicators import add_indicators
+from live import indicator_cache
+from tests.test_backtest import _make_random_walk_db
+
+
+def _db(days: int = 420):
+    conn = _make_random_walk_db(days=days)
+    conn.execute(CREATE_INDICATOR_TABLE)
+    return conn
+
+
+def _assert_matches_full(tail: pd.DataFrame, full: pd.DataFrame) -> None:
+    ref = full.loc[tail.index]
+    pd.testing.assert_frame_equal(tail[["open", "high", "low", "close"]],
+                                  ref[["open", "high", "low", "close"]], check_freq=False)
+    np.testing.assert_array_equal(tail["atr14"].to_numpy(), ref["atr14"].to_numpy())
+    for col in ("ma10", "ma35"):
+        np.testing.assert_allclose(tail[col].to_numpy(), ref[col].to_numpy(), rtol=MA_PARITY_RTOL)
+
+
+def test_state_matches_add_indicators():
+    conn = _db(days=60)
+    df = add_indicators(_load_tf_data(conn, "30m"))
+    st = IndicatorState()
+    out = np.array([st.update(h, l, c) for h, l, c in zip(df["high"], df["low"], df["close"])])
+    got = pd.DataFrame(out, index=df.index, columns=["ma10", "ma35", "atr14"])
+    for col in ("ma10", "ma35", "atr14"):
+        assert got[col].isna().equals(df[col].isna())
+    np.testing.assert_array_equal(got["atr14"].to_numpy(), df["atr14"].to_numpy())
+    for col in ("ma10", "ma35"):
+        np.testing.assert_allclose(got[col].to_numpy(), df[col].to_numpy(), rtol=MA_PARITY_RTOL)
+
+
+def test_ma_drift_does_not_grow_with_history():
+    conn = _db()
+    df = add_indicators(_load_tf_data(conn, "30m"))
+    st = IndicatorState()
+    out = np.array([st.update(h, l, c) for h, l, c in zip(df["high"], df["low"], df["close"])])
+    for i, col in enumerate(("ma10", "ma35")):
+        rel = np.abs(out[:, i] - df[col].to_numpy()) / np.abs(df[col].to_numpy())
+        head, tail = np.nanmax(rel[:1000]), np.nanmax(rel[-1000:])
+        assert tail <= MA_PARITY_RTOL and head <= MA_PARITY_RTOL
+        assert tail <= 4 * np.finfo(float).eps    # 2만 봉 뒤에도 ulp 수준
+
+
+def test_advance_processes_only_new_bars_and_resumes():
+    conn = _db(days=60)
+    full = add_indicators(_load_tf_data(conn, "1h"))
+    # 마지막 3개 확정봉을 "아직 도착 전" 으로 만든다
+    hidden = [int(t.value // 1_000_000) for t in full.index[-3:]]
+    conn.executemany("UPDATE klines SET confirmed=0 WHERE timeframe='1h' AND open_time=?",
+                     [(t,) for t in hidden])
+
+    assert indicator_cache.advance(conn, "1h") == len(full) - 3   # 콜드 스타트 1회
+    assert indicator_cache.advance(conn, "1h") == 0                # 새 봉 없음
+
+    conn.execute("UPDATE klines SET confirmed=1 WHERE timeframe='1h' AND open_time=?", (hidden[0],))
+    assert indicator_cache.advance(conn, "1h") == 1
+    conn.executemany("UPDATE klines SET confirmed=1 WHERE timeframe='1h' AND open_time=?",
+                     [(t,) for t in hidden[1:]])
+    assert indicator_cache.advance(conn, "1h") == 2
+
+    tail = indicator_cache.load_tail(conn, "1h", 500)
+    assert len(tail) == 500 and tail.index[-1] == full.index[-1]
+    _assert_matches_full(tail, full)
+
+
+def test_backfilled_bars_behind_last_row_are_rebuilt():
+    conn = _db(days=60)
+    full = add_indicators(_load_tf_data(conn, "1h"))
+    # 중간 5봉이 빠진 채로 콜드 스타트 → 이후 collector/backfill 이 구멍을 메운 상황
+    gap = [int(t.value // 1_000_000) for t in full.index[200:205]]
+    saved = conn.execute(
+        f"SELECT * FROM klines WHERE timeframe='1h' AND open_time IN ({','.join('?' * 5)})",
+        gap).fetchall()
+    conn.executemany("DELETE FROM klines WHERE timeframe='1h' AND open_time=?", [(t,) for t in gap])
+    assert indicator_cache.advance(conn, "1h") == len(full) - 5
+
+    conn.executemany(f"INSERT INTO klines VALUES ({','.join('?' * len(saved[0]))})", saved)
+    assert indicator_cache.advance(conn, "1h") == len(full) - 200   # 구멍부터 끝까지 재계산
+    assert indicator_cache.advance(conn, "1h") == 0
+
+    tail = indicator_cache.load_tail(conn, "1h", len(full))
+    assert len(tail) == len(full)
+    _assert_matches_full(tail, full)
+
+    # 확정봉이 사라진 경우(orphan 지표 행)도 그 지점부터 다시 쌓는다
+    conn.execute("DELETE FROM klines WHERE timeframe='1h' AND open_time=?", (gap[0],))
+    assert indicator_cache.advance(conn, "1h") == len(full) - 201
+    n_ind = conn.execute("SELECT COUNT(*) FROM kline_indicators WHERE timeframe='1h'").fetchone()[0]
+    assert n_ind == len(full) - 1
+
+
+def test_refresh_tail_is_bounded_and_snapshot_matches():
+    conn = _db()
+    keep = {tf: 120 for tf in ALL_TFS}
+    tf_data = indicator_cache.refresh_tf_data(conn, keep_rows=keep)
+    full = {tf: add_indicators(_load_tf_data(conn, tf)) for tf in ALL_TFS}
+
+    for tf in ALL_TFS:
+        assert len(tf_data[tf]) == min(120, len(full[tf]))
+        assert list(tf_data[tf].columns) == list(full[tf].columns)
+        _assert_matches_full(tf_data[tf], full[tf])
+
+    at = full["30m"].index[-1]
+    snap_tail = _build_snapshot_at(tf_data, at)
+    snap_full = _build_snapshot_at(full, at)
+    assert snap_tail is not None
+    assert snap_tail.tf_states == snap_full.tf_states
+    assert snap_tail.alignment_score == snap_full.alignment_score
@@ -131,6 +131,20 @@ class TestExtractFacts:
         assert facts["entry_context"] is None
         assert facts["exit_context"] is None
 
+    def test_batched_contexts_match_engine_snapshot(self):
+        from backtest.engine import _build_snapshot_at, load_market_data
+        from tests.test_backtest import _make_random_walk_db
+        tf_data = load_market_data(_make_random_walk_db()).tf_data
+        times = [str(t) for t in tf_data["30m"].index[[100, -200, -50]]] + ["not-a-time"]
+        ctx = journal._regime_contexts(tf_data, times)
+        assert ctx[times[0]] is None                 # 1w 이력 부족
+        assert ctx["not-a-time"] is None
+        for t in times[1:3]:
+            snap = _build_snapshot_at(tf_data, pd.Timestamp(t))
+            assert ctx[t]["alignment_score"] == round(snap.alignment_score, 2)
+            assert ctx[t]["tf_trends"] == {tf: s.trend for tf, s in snap.tf_states.items()}
+            assert journal._snapshot_context(tf_data, t) == ctx[t]
+
 
 # ---------------------------------------------------------------------------
 # 파이프라인 — facts 저장 / LLM 모킹 / 실패 경로
@@ -0,0 +1,112 @@
+# tests/test_kline_cache.py — 메모리맵 kline 캐시 (backtest.kline_cache)
+#
+# 핵심 검증 대상:
+#   1. attach 결과 == add_indicators(_load_tf_data) (값/인덱스 동일, 읽기 전용 memmap)
+#   2. 지문(max open_time, 행 수) 불변이면 재빌드 없음, 새 확정봉이면 해당 TF 만 재빌드
+#   3. load_market_data 캐시 경로 == SQLite 경로 (백테스트 결과 동일)
+#   4. 옛 지문 파일은 빌드가 아니라 prune 이 지우고, 파일을 잃은 reader 는 재빌드
+from __future__ import annotations
+
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from backtest import kline_cache
+from backtest.engine import ALL_TFS, _load_tf_data, load_market_data, run_backtest
+from engine.indicators import add_indicators
+from tests.test_backtest import _make_random_walk_db
+
+
+def _file_db(tmp_path, days: int = 120) -> sqlite3.Connection:
+    src = _make_random_walk_db(days=days)
+    conn = sqlite3.connect(str(tmp_path / "market.db"))
+    src.backup(conn)
+    src.close()
+    return conn
+
+
+def test_attach_matches_sql_and_is_memmapped(tmp_path):
+    conn = _file_db(tmp_path)
+    tf_data = kline_cache.load_tf_data(conn, ALL_TFS)
+    for tf in ALL_TFS:
+        ref = add_indicators(_load_tf_data(conn, tf))
+        pd.testing.assert_frame_equal(tf_data[tf], ref, check_freq=False)
+    arr = tf_data["30m"]["close"].to_numpy()
+    assert not arr.flags.writeable
+    mm = arr
+    while mm is not None and not isinstance(mm, np.memmap):
+        mm = mm.base
+    assert isinstance(mm, np.memmap)   # 복사본이 아니라 memmap 뷰
+    assert kline_cache.load_tf_data(sqlite3.connect(":memory:"), ALL_TFS) is None
+
+
+def test_rebuild_only_on_fingerprint_change(tmp_path):
+    conn = _file_db(tmp_path)
+    cache_dir = kline_cache.cache_dir_for(tmp_path / "market.db")
+    kline_cache.load_tf_data(conn, ALL_TFS)
+    before = {p.name: p.stat().st_mtime_ns for p in cache_dir.glob("*.npy")}
+    assert len(before) == 2 * len(ALL_TFS)
+
+    kline_cache.load_tf_data(conn, ALL_TFS)
+    assert {p.name: p.stat().st_mtime_ns for p in cache_dir.glob("*.npy")} == before
+
+    # 1h 확정봉 1개 추가 → 1h 만 새 지문 파일, 옛 파일은 prune 때 정리
+    last = conn.execute("SELECT MAX(open_time) FROM klines WHERE timeframe='1h'").fetchone()[0]
+    conn.execute("INSERT INTO klines VALUES ('1h', ?, 100, 101, 99, 100.5, 1, 100, 1)",
+                 (last + 3_600_000,))
+    conn.commit()
+    df = kline_cache.load_tf(conn, "1h", cache_dir)
+    assert df.index[-1] == pd.Timestamp(last + 3_600_000, unit="ms", tz="UTC")
+    after = {p.name: p.stat().st_mtime_ns for p in cache_dir.glob("*.npy")}
+    assert set(before) < set(after)            # 빌드는 옛 파일을 건드리지 않는다
+    assert all(name.startswith("1h-") for name in set(after) - set(before))
+
+    kline_cache.load_tf_data(conn, ALL_TFS)
+    pruned = {p.name: p.stat().st_mtime_ns for p in cache_dir.glob("*.npy")}
+    changed = set(pruned) ^ set(before)
+    assert changed and all(name.startswith("1h-") for name in changed)
+    assert len(pruned) == len(before)
+
+
+def test_reader_rebuilds_when_files_vanish_before_attach(tmp_path, monkeypatch):
+    conn = _file_db(tmp_path)
+    cache_dir = kline_cache.cache_dir_for(tmp_path / "market.db")
+    kline_cache.load_tf(conn, "4h", cache_dir)
+    real_attach = kline_cache._attach
+    calls = []
+
+    def racing_attach(values_path, times_path):
+        if not calls:   # exists() 통과 직후 다른 프로세스의 prune 이 지운 상황
+            for p in cache_dir.glob("4h-*.npy"):
+                p.unlink()
+        calls.append(values_path)
+        return real_attach(values_path, times_path)
+
+    monkeypatch.setattr(kline_cache, "_attach", racing_attach)
+    df = kline_cache.load_tf(conn, "4h", cache_dir)
+    assert len(calls) == 2
+    pd.testing.assert_frame_equal(df, add_indicators(_load_tf_data(conn, "4h")), check_freq=False)
+
+
+def test_prune_keeps_current_and_newer_fingerprints(tmp_path):
+    conn = _file_db(tmp_path)
+    cache_dir = kline_cache.cache_dir_for(tmp_path / "market.db")
+    kline_cache.load_tf(conn, "1d", cache_dir)
+    max_ot, rows = kline_cache.fingerprint(conn, "1d")
+    for fp in ((max_ot - 86_400_000, rows - 1), (max_ot + 86_400_000, rows + 1)):
+        for p in kline_cache._paths(cache_dir, "1d", fp):
+            p.write_bytes(b"")
+    assert kline_cache.prune(conn, "1d", cache_dir) == 2     # 옛 지문 2파일만
+    names = sorted(p.name for p in cache_dir.glob("1d-*.npy"))
+    assert names == sorted(p.name for fp in ((max_ot, rows), (max_ot + 86_400_000, rows + 1))
+                           for p in kline_cache._paths(cache_dir, "1d", fp))
+
+
+def test_backtest_same_with_and_without_cache(tmp_path):
+    conn = _file_db(tmp_path, days=420)
+    start, end = pd.Timestamp("2022-01-10", tz="UTC"), pd.Timestamp("2022-02-24", tz="UTC")
+    cached = run_backtest(None, start, end, data=load_market_data(conn, use_cache=True))
+    plain = run_backtest(None, start, end, data=load_market_data(conn, use_cache=False))
+    assert repr(cached.trade_logs) == repr(plain.trade_logs)
+    assert repr(cached.equity_curve) == repr(plain.equity_curve)
@@ -12,6 +12,10 @@ from engine.regime import (
     _trend,
     _candle_position,
     _candle_aligns_with_trend,
+    _score_tf,
+    trend_array,
+    candle_position_array,
+    score_tf_array,
 )
 from engine.config import TF_WEIGHTS
 
@@ -271,3 +275,36 @@ class TestBuildSnapshot:
         t = datetime(2024, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
         snap = build_snapshot(all_tfs_flat(), evaluated_at=t)
         assert snap.evaluated_at == "2024-06-01T12:00:00Z"
+
+
+
+class TestVectorized:
+    """trend_array / candle_position_array / score_tf_array == scalar rules, elementwise."""
+
+    def _candles(self, n: int = 4000):
+        rng = np.random.default_rng(7)
+        ma10 = 100 + rng.normal(0, 1.0, n)
+        ma35 = 100 + rng.normal(0, 1.0, n)
+        open_ = 100 + rng.normal(0, 1.0, n)
+        close = 100 + rng.normal(0, 1.0, n)
+        high = np.maximum(open_, close) + rng.exponential(0.3, n)
+        low = np.minimum(open_, close) - rng.exponential(0.3, n)
+        # 터치 밴드 경계 케이스: low/high 를 MA 바로 위/아래에 둔다
+        touch = rng.random(n) < 0.3
+        low[touch] = np.minimum(np.minimum(open_, close), ma10 * 1.0005)[touch]
+        return open_, high, low, close, ma10, ma35
+
+    def test_labels_and_scores_match_scalar(self):
+        o, h, l, c, m10, m35 = self._candles()
+        trends = trend_array(m10, m35, c)
+        positions = candle_position_array(o, h, l, c, m10, m35)
+        for i in range(len(c)):
+            assert trends[i] == _trend(m10[i], m35[i], c[i])
+            assert positions[i] == _candle_position(o[i], h[i], l[i], c[i], m10[i], m35[i])
+        assert len(set(positions)) == 11   # 모든 캔들 위치가 등장
+        for tf in TF_WEIGHTS:
+            scores = score_tf_array(tf, trends, positions)
+            for i in range(0, len(c), 7):
+                st = TFState(str(trends[i]), str(positions[i]), m10[i], m35[i], c[i], 1.0)
+                assert scores[i] == _score_tf(tf, st)
+
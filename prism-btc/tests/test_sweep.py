@@ -0,0 +1,94 @@
+# tests/test_sweep.py — 병렬 파라미터 스윕 (research.sweep) 테스트
+#
+# 핵심 검증 대상:
+#   1. 명시 config == overrides.apply 글로벌 패치 (같은 결과, 글로벌 불변)
+#   2. 프로세스 풀 결과 == 순차 결과 (잡 순서 유지)
+#   3. run_sweep 이 baseline 대비 evaluate_gate 결과를 한 곳에 모은다
+#   4. 그리드는 화이트리스트 밖 값을 만들 수 없다
+from __future__ import annotations
+
+import sqlite3
+
+import pandas as pd
+import pytest
+
+import backtest.engine as be
+import engine.config as ec
+from backtest.engine import load_market_data, run_backtest
+from research import factory, overrides, sweep
+from tests.test_backtest import _make_random_walk_db
+
+START, END = "2022-01-10", "2022-02-24"
+PERIODS = {"train": (START, "2022-02-05"), "oos": ("2022-02-05", END)}
+
+
+@pytest.fixture(scope="module")
+def market_db(tmp_path_factory):
+    path = tmp_path_factory.mktemp("sweep") / "market.db"
+    src = _make_random_walk_db()
+    dst = sqlite3.connect(str(path))
+    src.backup(dst)
+    src.close()
+    dst.close()
+    return str(path)
+
+
+@pytest.mark.parametrize("cfg", [
+    {"TS_MIN": 3.0},
+    {"ENTRY_SCORE_MIN": 55.0},
+    {"TRAILING_TF": "1d", "BE_TRAIL_ACTIVATE_R": 1.0},
+])
+def test_explicit_config_matches_patched_globals(market_db, cfg):
+    conn = sqlite3.connect(market_db)
+    data = load_market_data(conn)
+    conn.close()
+    start, end = pd.Timestamp(START, tz="UTC"), pd.Timestamp(END, tz="UTC")
+    before = (ec.TS_MIN, ec.ENTRY_SCORE_MIN, be.TRAILING_TF, be.BE_TRAIL_ACTIVATE_R)
+
+    explicit = run_backtest(None, start, end, config=cfg, data=data)
+    assert (ec.TS_MIN, ec.ENTRY_SCORE_MIN, be.TRAILING_TF, be.BE_TRAIL_ACTIVATE_R) == before
+    with overrides.apply(cfg):
+        patched = run_backtest(None, start, end, data=data)
+    baseline = run_backtest(None, start, end, data=data)
+
+    assert repr(explicit.trade_logs) == repr(patched.trade_logs)
+    assert repr(explicit.equity_curve) == repr(patched.equity_curve)
+    assert repr(explicit.trade_logs) != repr(baseline.trade_logs)  # config 가 실제로 효과
+
+
+def test_unknown_config_key_rejected():
+    with pytest.raises(ValueError):
+        run_backtest(None, pd.Timestamp(START, tz="UTC"), pd.Timestamp(END, tz="UTC"),
+                     config={"RISK_PER_TRADE": 0.05}, data=be.MarketData(tf_data={}))
+
+
+def test_pool_matches_serial(market_db):
+    jobs = sweep.make_jobs([{}, {"TS_MIN": 3.0}], PERIODS)
+    serial = sweep.run_jobs(market_db, jobs, workers=1)
+    pooled = sweep.run_jobs(market_db, jobs, workers=2)
+    assert pooled == serial
+    assert [j.period for j in jobs] == ["train", "oos", "train", "oos"]
+
+
+def test_run_sweep_collects_gate_results(market_db):
+    configs = [{"TS_MIN": 3.0}, {"TRAILING_TF": "4h"}, {}]  # {} == baseline → 제외
+    res = sweep.run_sweep(market_db, configs, baseline={}, workers=1, periods=PERIODS)
+
+    assert res["baseline"]["config"] == {}
+    assert {tuple(r["config"].items()) for r in res["results"]} == {
+        (("TS_MIN", 3.0),), (("TRAILING_TF", "4h"),)}
+    base = res["baseline"]
+    for r in res["results"]:
+        passed, checks = factory.evaluate_gate(base["train"], r["train"], base["oos"], r["oos"])
+        assert (r["passed"], r["checks"]) == (passed, checks)
+
+
+def test_grid_is_whitelisted():
+    space = sweep.tunable_space(steps=3)
+    assert space["TS_MIN"] == [1.5, 2.75, 4.0]
+    assert space["TRAILING_TF"] == ["4h", "12h", "1d"]
+    assert len(sweep.grid(space)) == 3 * 3 * 3 * 3
+    with pytest.raises(overrides.OverrideError):
+        sweep.grid({"TS_MIN": [99.0]})
+    with pytest.raises(overrides.OverrideError):
+        sweep.make_jobs([{"TRAILING_TF": "1w"}], PERIODS)
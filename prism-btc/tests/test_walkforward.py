@@ -0,0 +1,87 @@
+# tests/test_walkforward.py — 워크포워드 윈도우 메모이제이션 (backtest.walkforward)
+#
+# 핵심 검증 대상:
+#   1. 캐시 결과 == 직접 run_backtest (히트 시 재시뮬레이션 없음)
+#   2. end 이후 데이터 추가 → 기존 윈도우는 히트, 새 데이터를 포함한 윈도우만 재계산
+#   3. config / 윈도우 내부 데이터 변경 → 미스
+#   4. 자본 이월 체인: 마지막 윈도우 config 만 바꾸면 그 1개만 재계산
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+import backtest.engine as be
+from backtest import walkforward
+from backtest.engine import load_market_data, run_backtest
+from backtest.walkforward import Window
+from tests.test_backtest import _make_random_walk_db
+
+BOUNDS = ["2022-01-10", "2022-01-25", "2022-02-09", "2022-02-24"]
+
+
+@pytest.fixture()
+def cache(tmp_path):
+    c = walkforward.WindowCache(tmp_path / "wf.db")
+    yield c
+    c.close()
+
+
+def _data(conn):
+    return load_market_data(conn, use_cache=False)
+
+
+def test_cached_result_matches_direct_run(cache, monkeypatch):
+    data = _data(_make_random_walk_db())
+    w = Window("2022-01-10", "2022-02-24")
+    first = walkforward.run_window(data, {"TS_MIN": 3.0}, w, 10_000.0, cache=cache)
+    state = run_backtest(None, pd.Timestamp(w.start, tz="UTC"), pd.Timestamp(w.end, tz="UTC"),
+                         config={"TS_MIN": 3.0}, data=data)
+    assert [t["trade_id"] for t in first["trades"]] == [t.trade_id for t in state.trade_logs]
+    assert [t["net_pnl"] for t in first["trades"]] == [t.net_pnl for t in state.trade_logs]
+    assert first["equity_curve"] == [[str(ts), v] for ts, v in state.equity_curve]
+    assert first["final_equity"] == state.equity_curve[-1][1]
+
+    monkeypatch.setattr(walkforward, "run_backtest", lambda *a, **k: pytest.fail("re-simulated"))
+    again = walkforward.run_window(data, {"TS_MIN": 3.0}, w, 10_000.0, cache=cache)
+    assert again == first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_appended_data_only_invalidates_windows_that_see_it(cache):
+    conn = _make_random_walk_db()
+    plan = [(w, {}) for w in walkforward.windows_from_boundaries(BOUNDS)]
+    walkforward.walk_forward(_data(conn), plan, 10_000.0, cache=cache)
+    assert cache.misses == 3
+
+    # 마지막 윈도우 end 이후의 새 30m 봉 — 어떤 윈도우에도 보이지 않는다
+    conn.execute("DELETE FROM klines WHERE open_time >= ?",
+                 (int(pd.Timestamp("2022-02-20", tz="UTC").value // 1_000_000),))
+    cache.hits = cache.misses = 0
+    plan2 = plan[:2] + [(Window(BOUNDS[2], "2022-02-20"), {})]
+    walkforward.walk_forward(_data(conn), plan2, 10_000.0, cache=cache)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # 윈도우 내부 값 정정 → 그 윈도우부터 (지문 + 이월 자본) 재계산
+    conn.execute("UPDATE klines SET close = close * 1.01 WHERE timeframe='1d' AND open_time = ?",
+                 (int(pd.Timestamp("2022-01-30", tz="UTC").value // 1_000_000),))
+    cache.hits = cache.misses = 0
+    walkforward.walk_forward(_data(conn), plan2, 10_000.0, cache=cache)
+    assert cache.hits == 1 and cache.misses == 2
+
+
+def test_config_and_strategy_constants_are_part_of_the_key(cache, monkeypatch):
+    data = _data(_make_random_walk_db())
+    windows = walkforward.windows_from_boundaries(BOUNDS)
+    walkforward.walk_forward(data, [(w, {}) for w in windows], 10_000.0, cache=cache)
+
+    cache.hits = cache.misses = 0
+    plan = [(w, {}) for w in windows[:-1]] + [(windows[-1], {"TRAILING_TF": "1d"})]
+    walkforward.walk_forward(data, plan, 10_000.0, cache=cache)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    cache.hits = cache.misses = 0
+    monkeypatch.setattr(be, "ARRAY_FAST_PATH", False)        # 결과 무관 토글 — 히트
+    walkforward.run_window(data, {}, windows[0], 10_000.0, cache=cache)
+    monkeypatch.setattr(be, "REENTRY_COOLDOWN_BARS", 4)       # 전략 상수 — 미스
+    walkforward.run_window(data, {}, windows[0], 10_000.0, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -17,5 +17,14 @@ _spec.loader.exec_module(_mod)  # type: ignore[union-attr]
 
 oneil_weighted_return = _mod.oneil_weighted_return
 percentile_ratings = _mod.percentile_ratings
+oneil_weighted_returns = _mod.oneil_weighted_returns
+rs_ratings = _mod.rs_ratings
+universe_percentile_ratings = _mod.universe_percentile_ratings
 
-__all__ = ["oneil_weighted_return", "percentile_ratings"]
+__all__ = [
+    "oneil_weighted_return",
+    "percentile_ratings",
+    "oneil_weighted_returns",
+    "rs_ratings",
+    "universe_percentile_ratings",
+]
@@ -324,6 +324,52 @@ def get_multi_day_ohlcv(ticker: str, end_date: str, days: int = 10) -> pd.DataFr
         return pd.DataFrame()
 
 
+def get_close_matrix(tickers: List[str], end_date: str, days: int = 260) -> pd.DataFrame:
+    """
+    Get a date x ticker matrix of adjusted closes in one batched download.
+
+    Used as the RS Rating universe (rank candidates against the whole
+    ticker universe instead of among themselves).
+
+    Args:
+        tickers: Ticker symbols
+        end_date: End date in YYYYMMDD format
+        days: Number of trading days to retrieve
+
+    Returns:
+        DataFrame (index: dates, columns: tickers); empty on failure
+    """
+    if not tickers:
+        return pd.DataFrame()
+
+    end_dt = datetime.datetime.strptime(end_date, '%Y%m%d')
+    start_dt = end_dt - datetime.timedelta(days=days * 2)  # Extra buffer for non-trading days
+
+    try:
+        data = yf.download(
+            list(tickers),
+            start=start_dt.strftime('%Y-%m-%d'),
+            end=(end_dt + datetime.timedelta(days=1)).strftime('%Y-%m-%d'),
+            progress=False,
+            threads=True,
+            auto_adjust=True,
+        )
+
+        if data.empty:
+            logger.warning(f"No close matrix data for {end_date}")
+            return pd.DataFrame()
+
+        closes = data["Close"]
+        if isinstance(closes, pd.Series):
+            closes = closes.to_frame(name=list(tickers)[0])
+
+        return closes.tail(days)
+
+    except Exception as e:
+        logger.error(f"Error getting close matrix: {e}")
+        return pd.DataFrame()
+
+
 def get_market_cap_df(tickers: List[str] = None) -> pd.DataFrame:
     """
     Get market capitalization data for all tickers.
@@ -1,9 +1,11 @@
+import asyncio
 import atexit
 import importlib.util
 import sqlite3
 import sys
 import tempfile
 import textwrap
+import time
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -210,6 +212,41 @@ async def test_multi_account_us_context_fans_out_orders_but_reads_primary(monkey
         assert trader.get_holding_quantity("AAPL") == 2
 
 
+@pytest.mark.asyncio
+async def test_multi_account_us_orders_run_concurrently_with_bound(monkeypatch):
+    state = {"in_flight": 0, "peak": 0}
+
+    class SlowUSTrader(FakeUSTrader):
+        async def async_buy_stock(self, ticker, buy_amount=None, exchange=None, timeout=30.0, limit_price=None):
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.1)
+            state["in_flight"] -= 1
+            if self.account_name == "us-broken":
+                raise RuntimeError("order rejected by gateway")
+            return {"success": True, "ticker": ticker, "quantity": 2,
+                    "estimated_amount": 200.0, "message": "ok"}
+
+    accounts = [
+        {"name": name, "account_key": f"vps:{name}:01", "product": "01"}
+        for name in ("us-a", "us-b", "us-broken")
+    ]
+    monkeypatch.setattr(ust, "USStockTrading", SlowUSTrader)
+    monkeypatch.setattr(ust.ka, "get_configured_accounts", lambda **kwargs: accounts)
+    monkeypatch.setattr(ust.ka, "resolve_account", lambda **kwargs: accounts[0])
+
+    trader = ust.MultiAccountUSStockTrading(mode="demo", order_concurrency=3)
+    started = time.monotonic()
+    result = await trader.async_buy_stock("AAPL", exchange="NASD")
+
+    assert time.monotonic() - started < 0.25          # all three accounts in one wave
+    assert state["peak"] == 3
+    assert [r["account_name"] for r in result["account_results"]] == ["us-a", "us-b", "us-broken"]
+    assert result["successful_accounts"] == ["us-a", "us-b"]
+    assert result["failed_accounts"] == ["us-broken"]
+    assert result["quantity"] == 4 and result["total_amount"] == 400.0
+
+
 def test_us_trader_uses_account_buy_amount_override(monkeypatch):
     account = {
         "name": "us-override",
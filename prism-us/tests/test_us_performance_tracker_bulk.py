@@ -0,0 +1,100 @@
+"""Tests for us_performance_tracker_batch bulk yfinance download + single-transaction updates.
+
+yfinance is replaced with a fake module — no network.
+Run with:  python -m pytest tests/test_us_performance_tracker_bulk.py -q  (from prism-us/)
+"""
+
+import importlib.util
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+PRISM_US_DIR = Path(__file__).parent.parent
+
+
+def _load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+us_schema = _load_module("prism_us_tracking_db_schema_perf", PRISM_US_DIR / "tracking" / "db_schema.py")
+uptb = _load_module("prism_us_performance_tracker_batch", PRISM_US_DIR / "us_performance_tracker_batch.py")
+
+
+def _days_ago(n: int) -> str:
+    return (datetime.now() - timedelta(days=n)).strftime("%Y-%m-%d")
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "tracking.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute(us_schema.TABLE_US_PERFORMANCE_TRACKER)
+    rows = [
+        ("AAPL", "Apple", _days_ago(8), 200.0, 210.0, 180.0, _days_ago(8)),
+        ("AAPL", "Apple", _days_ago(31), 150.0, None, None, _days_ago(31)),
+        ("MSFT", "Microsoft", _days_ago(15), 400.0, None, 410.0, _days_ago(15)),
+        ("OLDCO", "Delisted", _days_ago(9), 10.0, None, None, _days_ago(9)),
+    ]
+    conn.executemany(
+        "INSERT INTO us_analysis_performance_tracker "
+        "(ticker, company_name, analysis_date, analysis_price, target_price, stop_loss, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)", rows,
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def fake_yf(monkeypatch):
+    calls = {"download": [], "ticker": []}
+    index = pd.to_datetime(["2026-10-14", "2026-10-15", "2026-10-16"])
+    columns = pd.MultiIndex.from_tuples(
+        [("Close", "AAPL"), ("Close", "MSFT"), ("Close", "OLDCO"), ("Open", "AAPL"),
+         ("Open", "MSFT"), ("Open", "OLDCO")],
+        names=["Price", "Ticker"],
+    )
+    data = pd.DataFrame(
+        [[220.0, 405.0, None, 1, 1, None],
+         [221.0, 404.0, None, 1, 1, None],
+         [222.0, None, None, 1, 1, None]],      # MSFT has no bar for the last day yet
+        index=index, columns=columns,
+    )
+
+    def download(tickers, **kwargs):
+        calls["download"].append(list(tickers))
+        return data
+
+    def ticker(symbol):
+        calls["ticker"].append(symbol)
+        return SimpleNamespace(info={}, history=lambda period: pd.DataFrame())
+
+    monkeypatch.setattr(uptb, "YFINANCE_AVAILABLE", True)
+    monkeypatch.setattr(uptb, "yf", SimpleNamespace(download=download, Ticker=ticker), raising=False)
+    return calls
+
+
+def test_one_download_resolves_all_targets(db_path, fake_yf):
+    stats = uptb.USPerformanceTrackerBatch(db_path=db_path).run()
+
+    assert fake_yf["download"] == [["AAPL", "MSFT", "OLDCO"]]
+    assert fake_yf["ticker"] == ["OLDCO"]                # per-ticker fallback only for the miss
+    assert (stats["updated"], stats["errors"], stats["completed"]) == (3, 1, 1)
+
+    conn = sqlite3.connect(db_path)
+    rows = {r[0]: r[1:] for r in conn.execute(
+        "SELECT id, price_7d, price_14d, price_30d, hit_target, hit_stop_loss, tracking_status "
+        "FROM us_analysis_performance_tracker"
+    )}
+    conn.close()
+    assert rows[1] == (222.0, None, None, 1, 0, "in_progress")
+    assert rows[2] == (222.0, 222.0, 222.0, 0, 0, "completed")
+    assert rows[3] == (404.0, 404.0, None, 0, 1, "in_progress")
+    assert rows[4] == (None, None, None, 0, 0, "pending")
@@ -108,6 +108,7 @@ class USJournalManager:
             create_trading_journal_agent = _journal_module.create_trading_journal_agent
             from mcp_agent.workflows.llm.augmented_llm import RequestParams
             from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
+            from cores.llm.governor import governed_generate_str
 
             ticker = stock_data.get('ticker', '')
             company_name = stock_data.get('company_name', '')
@@ -136,7 +137,8 @@ class USJournalManager:
                     scenario_data, sell_price, profit_rate, holding_days, sell_reason
                 )
 
-                response = await llm.generate_str(
+                response = await governed_generate_str(
+                    llm,
                     message=prompt,
                     request_params=RequestParams(model="gpt-5.4-mini", reasoning_effort="none", maxTokens=16000)
                 )
@@ -312,9 +312,18 @@ class USStockTrading:
         )
 
     def _request(self, api_url: str, tr_id: str, params: Dict[str, Any], **kwargs):
-        with ka.get_trading_env_lock():
-            self._activate_account()
-            return ka._url_fetch(api_url, tr_id, "", params, **kwargs)
+        # Throttle on this account's bucket before taking the shared env lock, so a
+        # throttled account does not hold the lock while other accounts wait on it.
+        account, paper = f"{self.trenv.my_acct}-{self.trenv.my_prod}", self.env == "vps"
+        ka.acquire_transport_token(account, paper=paper)
+        try:
+            with ka.get_trading_env_lock():
+                self._activate_account()
+                return ka._url_fetch(api_url, tr_id, "", params, **kwargs)
+        finally:
+            # If activation or the fetch failed before sending, the token is still queued
+            # and would let this thread's next call skip the bucket - drop it.
+            ka.release_transport_token(account, paper=paper)
 
     def _probe_exchange(self, ticker: str) -> Optional[str]:
         """
@@ -2012,11 +2021,18 @@ class USStockTrading:
 class MultiAccountUSStockTrading:
     """Fan out trading orders to all configured US accounts for the current mode."""
 
-    def __init__(self, mode: str, buy_amount: float = None, auto_trading: bool = USStockTrading.AUTO_TRADING, product_code: str = "01"):
+    # Accounts ordering at the same time (kis_devlp.yaml: multi_account_order_concurrency).
+    # Each account has its own trader locks and KIS rate-limit bucket, and waits for its
+    # bucket before taking the shared env lock, so a throttled account does not hold the
+    # others back. The HTTP calls themselves still pass through that lock one at a time.
+    ORDER_CONCURRENCY = int(_cfg.get("multi_account_order_concurrency", 4))
+
+    def __init__(self, mode: str, buy_amount: float = None, auto_trading: bool = USStockTrading.AUTO_TRADING, product_code: str = "01", order_concurrency: Optional[int] = None):
         self.mode = mode
         self.buy_amount = buy_amount
         self.auto_trading = auto_trading
         self.product_code = str(product_code)
+        self.order_concurrency = max(1, int(order_concurrency or self.ORDER_CONCURRENCY))
 
         svr = "vps" if mode == "demo" else "prod"
         self.account_configs = ka.get_configured_accounts(svr=svr, product=self.product_code, market="us")
@@ -2049,43 +2065,62 @@ class MultiAccountUSStockTrading:
                               exchange: str = None, timeout: float = 30.0, limit_price: Optional[float] = None) -> Dict[str, Any]:
         if not self.account_configs:
             return self._aggregate_results(ticker, [], action="buy")
-        results = []
-        for account in self.account_configs:
-            trader = self._get_trader(account)
-            result = await trader.async_buy_stock(
+        return await self._fan_out(
+            ticker,
+            "buy",
+            lambda trader: trader.async_buy_stock(
                 ticker=ticker,
                 buy_amount=buy_amount,
                 exchange=exchange,
                 timeout=timeout,
                 limit_price=limit_price,
-            )
-            result["account_name"] = account["name"]
-            result["account_key"] = account["account_key"]
-            results.append(result)
-
-        return self._aggregate_results(ticker, results, action="buy")
+            ),
+        )
 
     async def async_sell_stock(self, ticker: str, exchange: str = None,
                                timeout: float = 30.0, limit_price: Optional[float] = None,
                                use_moo: bool = False, quantity: Optional[int] = None) -> Dict[str, Any]:
         if not self.account_configs:
             return self._aggregate_results(ticker, [], action="sell")
-        results = []
-        for account in self.account_configs:
-            trader = self._get_trader(account)
-            result = await trader.async_sell_stock(
+        return await self._fan_out(
+            ticker,
+            "sell",
+            lambda trader: trader.async_sell_stock(
                 ticker=ticker,
                 exchange=exchange,
                 timeout=timeout,
                 limit_price=limit_price,
                 use_moo=use_moo,
                 quantity=quantity,
-            )
+            ),
+        )
+
+    async def _fan_out(self, ticker: str, action: str, order) -> Dict[str, Any]:
+        """
+        Run order(trader) for every account concurrently (at most order_concurrency
+        at once). Results keep account order; an account that raises is reported
+        as a failed result instead of aborting the others.
+        """
+        semaphore = asyncio.Semaphore(self.order_concurrency)
+
+        async def _run(account: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    result = await order(self._get_trader(account))
+                except Exception as e:
+                    logger.error(f"[{account['name']}] {action} {ticker} failed: {e}")
+                    result = {
+                        "success": False,
+                        "ticker": ticker,
+                        "quantity": 0,
+                        "message": f"{action} error: {e}",
+                    }
             result["account_name"] = account["name"]
             result["account_key"] = account["account_key"]
-            results.append(result)
+            return result
 
-        return self._aggregate_results(ticker, results, action="sell")
+        results = await asyncio.gather(*(_run(account) for account in self.account_configs))
+        return self._aggregate_results(ticker, list(results), action=action)
 
     def get_portfolio(self) -> List[Dict[str, Any]]:
         return self._get_primary_trader().get_portfolio()
@@ -18,7 +18,7 @@ import sqlite3
 import argparse
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
 # Project paths
@@ -201,6 +201,48 @@ class USPerformanceTrackerBatch:
             logger.error(f"[{ticker}] Price fetch failed: {e}")
             return None
 
+    def get_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """
+        Get current prices for many stocks with one multi-ticker yfinance download.
+
+        Tickers missing from the download (or all of them, if it fails) fall back
+        to get_current_price.
+
+        Args:
+            tickers: Stock ticker symbols
+
+        Returns:
+            {ticker: price in USD} for tickers with a price
+        """
+        tickers = list(dict.fromkeys(tickers))
+        prices: Dict[str, float] = {}
+        if not tickers:
+            return prices
+
+        if YFINANCE_AVAILABLE:
+            try:
+                data = yf.download(tickers, period="5d", auto_adjust=False,
+                                   progress=False, threads=True)
+                if data is not None and not data.empty:
+                    closes = data['Close']
+                    if not hasattr(closes, 'columns'):  # single ticker, flat columns
+                        closes = closes.to_frame(tickers[0])
+                    for ticker in tickers:
+                        if ticker in closes.columns:
+                            series = closes[ticker].dropna()
+                            if not series.empty and float(series.iloc[-1]) > 0:
+                                prices[ticker] = float(series.iloc[-1])
+                logger.info(f"Bulk download: {len(prices)}/{len(tickers)} tickers resolved")
+            except Exception as e:
+                logger.warning(f"Bulk download failed, falling back to per-ticker queries: {e}")
+
+        for ticker in tickers:
+            if ticker not in prices:
+                price = self.get_current_price(ticker)
+                if price is not None:
+                    prices[ticker] = price
+        return prices
+
     def calculate_days_elapsed(self, analysis_date: str) -> int:
         """
         Calculate days elapsed since analysis.
@@ -326,6 +368,46 @@ class USPerformanceTrackerBatch:
         finally:
             conn.close()
 
+    def apply_updates_bulk(self, items: List[Tuple[int, Dict[str, Any]]]) -> bool:
+        """
+        Apply updates for many records in one transaction.
+
+        Records are grouped by their set of updated columns so each group is a
+        single executemany. All-or-nothing: on error nothing is committed.
+
+        Args:
+            items: [(record_id, updates), ...]
+
+        Returns:
+            Success status
+        """
+        items = [(record_id, updates) for record_id, updates in items if updates]
+        if not items:
+            return True
+
+        if self.dry_run:
+            for record_id, updates in items:
+                logger.info(f"[DRY-RUN] ID {record_id}: {updates}")
+            return True
+
+        groups: Dict[Tuple[str, ...], List[List[Any]]] = {}
+        for record_id, updates in items:
+            groups.setdefault(tuple(updates.keys()), []).append(list(updates.values()) + [record_id])
+
+        conn = self.connect_db()
+        try:
+            with conn:
+                for columns, rows in groups.items():
+                    set_clause = ", ".join([f"{k} = ?" for k in columns])
+                    query = f"UPDATE us_analysis_performance_tracker SET {set_clause} WHERE id = ?"
+                    conn.executemany(query, rows)
+            return True
+        except Exception as e:
+            logger.error(f"Bulk DB update failed ({len(items)} records): {e}")
+            return False
+        finally:
+            conn.close()
+
     def run(self) -> Dict[str, Any]:
         """
         Execute batch processing.
@@ -362,17 +444,15 @@ class USPerformanceTrackerBatch:
             logger.info("No stocks to track.")
             return stats
 
-        # Process each stock
+        # Select records due for a 7/14/30-day update
+        due = []
         for record in targets:
             ticker = record['ticker']
             company_name = record['company_name']
             trigger_type = record['trigger_type'] or 'unknown'
-            analysis_date = record['analysis_date']
-            analysis_price = record['analysis_price']
-            was_traded = record.get('was_traded', 0)
 
             # Calculate days elapsed
-            days_elapsed = self.calculate_days_elapsed(analysis_date)
+            days_elapsed = self.calculate_days_elapsed(record['analysis_date'])
 
             # Check if update is needed
             should_update = False
@@ -389,9 +469,17 @@ class USPerformanceTrackerBatch:
                 continue
 
             logger.info(f"[{ticker}] {company_name}: elapsed {days_elapsed} days, trigger={trigger_type}")
+            due.append((record, days_elapsed))
 
-            # Get current price
-            current_price = self.get_current_price(ticker)
+        # One multi-ticker download for every distinct ticker
+        prices = self.get_current_prices([record['ticker'] for record, _ in due])
+
+        pending = []
+        for record, days_elapsed in due:
+            ticker = record['ticker']
+            analysis_price = record['analysis_price']
+
+            current_price = prices.get(ticker)
             if current_price is None:
                 logger.warning(f"[{ticker}] Price fetch failed, skipping")
                 stats['errors'] += 1
@@ -399,7 +487,7 @@ class USPerformanceTrackerBatch:
 
             # Calculate return rate
             return_rate = self.calculate_return(analysis_price, current_price)
-            logger.info(f"  Analysis: ${analysis_price:.2f} -> Current: ${current_price:.2f} ({return_rate*100:+.2f}%)")
+            logger.info(f"  [{ticker}] Analysis: ${analysis_price:.2f} -> Current: ${current_price:.2f} ({return_rate*100:+.2f}%)")
 
             # Determine updates
             updates = self.update_tracking_record(
@@ -408,19 +496,22 @@ class USPerformanceTrackerBatch:
                 current_price,
                 analysis_price
             )
+            pending.append((record, updates, return_rate))
 
-            # Apply updates
-            if self.apply_updates(record['id'], updates):
+        # Apply updates (single transaction)
+        if self.apply_updates_bulk([(record['id'], updates) for record, updates, _ in pending]):
+            for record, updates, return_rate in pending:
                 stats['updated'] += 1
 
                 # Trigger type statistics
+                trigger_type = record['trigger_type'] or 'unknown'
                 if trigger_type not in stats['by_trigger_type']:
                     stats['by_trigger_type'][trigger_type] = {'count': 0, 'returns': []}
                 stats['by_trigger_type'][trigger_type]['count'] += 1
                 stats['by_trigger_type'][trigger_type]['returns'].append(return_rate)
 
                 # Traded/Watched classification
-                if was_traded:
+                if record.get('was_traded', 0):
                     stats['by_decision']['traded'] += 1
                 else:
                     stats['by_decision']['watched'] += 1
@@ -428,8 +519,8 @@ class USPerformanceTrackerBatch:
                 # Completed count
                 if updates.get('tracking_status') == 'completed':
                     stats['completed'] += 1
-            else:
-                stats['errors'] += 1
+        else:
+            stats['errors'] += len(pending)
 
         # Summary
         logger.info("=" * 60)
@@ -36,6 +36,9 @@ PRISM_US_DIR = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 sys.path.insert(0, str(PRISM_US_DIR))
 
+import report_manifest  # project root (US/KR report cache index)
+from cores.llm.governor import governed_generate_str
+
 # Load openai_debug from project root via importlib (prism-us/cores/ shadows root cores/)
 _spec = _ilu.spec_from_file_location("cores.openai_debug", PROJECT_ROOT / "cores" / "openai_debug.py")
 if _spec and _spec.loader:
@@ -303,7 +306,8 @@ class USStockAnalysisOrchestrator:
 
                 from mcp_agent.workflows.llm.augmented_llm import RequestParams
                 llm = await agent.attach_llm(OpenAIAugmentedLLM)
-                result = await llm.generate_str(
+                result = await governed_generate_str(
+                    llm,
                     message=f"Execute US stock market macro analysis for {reference_date} and output JSON.",
                     request_params=RequestParams(
                         model="gpt-5.4-mini",
@@ -495,6 +499,9 @@ class USStockAnalysisOrchestrator:
                 if report and len(report.strip()) > 0:
                     with open(output_file, "w", encoding="utf-8") as f:
                         f.write(report)
+                    report_manifest.record_report("us", ticker, output_file,
+                                                  company_name=company_name, mode=mode,
+                                                  report_date=reference_date)
                     logger.info(f"[{idx}/{len(tickers)}] Report generation complete: {company_name}({ticker}) - {len(report)} characters")
                     successful_reports.append(output_file)
                 else:
@@ -530,6 +537,7 @@ class USStockAnalysisOrchestrator:
 
                 # Convert markdown to PDF
                 markdown_to_pdf(report_path, pdf_file, 'playwright', add_theme=True, enable_watermark=False)
+                report_manifest.record_pdf(report_path, pdf_file)
 
                 logger.info(f"PDF conversion complete: {pdf_file}")
                 pdf_paths.append(pdf_file)
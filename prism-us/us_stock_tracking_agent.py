@@ -93,6 +93,9 @@ del _ilu, _spec, _mod
 _prism_us_dir = Path(__file__).parent
 sys.path.insert(0, str(_prism_us_dir))
 
+from price_snapshot import PriceSnapshot  # project root (shared with KR)
+from cores.llm.governor import governed_generate_str
+
 
 # =============================================================================
 # Helper function to import modules from main project cores/ (avoid namespace collision)
@@ -245,8 +248,9 @@ async def get_current_stock_price(cursor, ticker: str, account_key: str | None =
     MAX_RETRIES = 3
     for attempt in range(MAX_RETRIES):
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            # blocking HTTP in a worker thread so a per-cycle PriceSnapshot can
+            # resolve several tickers concurrently
+            info = await asyncio.to_thread(lambda: yf.Ticker(ticker).info)
             current_price = info.get('regularMarketPrice', 0) or info.get('previousClose', 0)
 
             if current_price > 0:
@@ -961,7 +965,8 @@ class USStockTrackingAgent:
             scenario_json = None
             for attempt in range(1, max_attempts + 1):
                 try:
-                    response = await llm.generate_str(
+                    response = await governed_generate_str(
+                        llm,
                         message=prompt_message,
                         request_params=RequestParams(
                             model="gpt-5.5",
@@ -1711,7 +1716,8 @@ Use yahoo_finance and sqlite tools to check latest data, then decide whether to
 **Important**: If stop loss/target price adjustment is needed, return it via portfolio_adjustment JSON only. Do NOT directly UPDATE the DB.
 """
 
-            response = await llm.generate_str(
+            response = await governed_generate_str(
+                llm,
                 message=prompt_message,
                 request_params=RequestParams(model="gpt-5.5", maxTokens=30000)
             )
@@ -2403,6 +2409,11 @@ Use yahoo_finance and sqlite tools to check latest data, then decide whether to
             # already removed, so skip them when the loop reaches them.
             fully_exited_tickers: set = set()
 
+            # Current prices once per cycle: distinct tickers fetched concurrently,
+            # pyramided rows of the same ticker reuse the memoized quote.
+            price_snapshot = PriceSnapshot(self._get_current_stock_price)
+            await price_snapshot.prefetch(h.get('ticker') for h in holdings)
+
             for stock in holdings:
                 ticker = stock.get('ticker')
                 company_name = stock.get('company_name')
@@ -2413,7 +2424,7 @@ Use yahoo_finance and sqlite tools to check latest data, then decide whether to
                     continue
 
                 # Query current stock price
-                current_price = await self._get_current_stock_price(ticker)
+                current_price = await price_snapshot.get(ticker)
 
                 if current_price <= 0:
                     old_price = stock.get('current_price', 0)
@@ -48,6 +48,8 @@ if _error_spec and _error_spec.loader:
     _error_spec.loader.exec_module(_error_mod)
     log_openai_error = _error_mod.log_openai_error
 
+from cores.llm.governor import governed_generate_str
+
 # MCPApp instance
 app = MCPApp(name="us_telegram_summary")
 
@@ -487,7 +489,8 @@ Report Content:
             prompt_message += "\nNote: This stock was detected 10 minutes after market open. Current conditions may differ."
 
         # Generate telegram message using evaluator-optimizer workflow
-        response = await evaluator_optimizer.generate_str(
+        response = await governed_generate_str(
+            evaluator_optimizer,
             message=prompt_message,
             request_params=RequestParams(
                 model="gpt-5.4-mini",
@@ -38,13 +38,19 @@ from cores.us_surge_detector import (
     get_snapshot,
     get_previous_snapshot,
     get_multi_day_ohlcv,
+    get_close_matrix,
     get_major_tickers,
     get_nearest_business_day,
     apply_absolute_filters,
     normalize_and_score,
     enhance_dataframe,
 )
-from cores.rs_rating import oneil_weighted_return, percentile_ratings
+from cores.rs_rating import (
+    oneil_weighted_return,
+    oneil_weighted_returns,
+    percentile_ratings,
+    universe_percentile_ratings,
+)
 
 # Logger setup
 logger = logging.getLogger(__name__)
@@ -1123,7 +1129,8 @@ def get_us_sector_map(tickers: list) -> dict:
 
 
 def select_final_tickers(triggers: dict, trade_date: str = None, use_hybrid: bool = True,
-                         lookback_days: int = 10, macro_context: dict = None) -> dict:
+                         lookback_days: int = 10, macro_context: dict = None,
+                         rs_universe_raw: pd.Series = None) -> dict:
     """
     Aggregate selected stocks from all triggers and make final selection.
 
@@ -1138,6 +1145,8 @@ def select_final_tickers(triggers: dict, trade_date: str = None, use_hybrid: boo
         trade_date: Reference trading date (required for hybrid mode)
         use_hybrid: Whether to use hybrid selection (default: True)
         lookback_days: Number of past days for agent scoring
+        rs_universe_raw: Universe-wide O'Neil raw scores (ticker -> raw); when given, the
+            RS percentile ranks candidates against the universe instead of each other
 
     Returns:
         Dict of final selected stocks
@@ -1191,7 +1200,14 @@ def select_final_tickers(triggers: dict, trade_date: str = None, use_hybrid: boo
         _rs_rating_enabled = os.getenv("RS_RATING_ENABLED", "false").strip().lower() == "true"
         _oneil_raw_map = {t: s["oneil_raw"] for t, s in screening_signals.items()
                           if s.get("oneil_raw") is not None}
-        _oneil_pct_map = percentile_ratings(_oneil_raw_map) if _oneil_raw_map else {}
+        if not _oneil_raw_map:
+            _oneil_pct_map = {}
+        elif rs_universe_raw is not None and len(rs_universe_raw) > 0:
+            _oneil_pct_map = universe_percentile_ratings(_oneil_raw_map, rs_universe_raw)
+            logger.info(f"[RS-RATING] Ranked {len(_oneil_raw_map)} candidates against "
+                        f"{len(rs_universe_raw)}-ticker universe")
+        else:
+            _oneil_pct_map = percentile_ratings(_oneil_raw_map)
         if not _rs_rating_enabled:
             for _ticker, pct in _oneil_pct_map.items():
                 logger.info("[RS-RATING][SHADOW] %s oneil_pct=%.0f cur_rs=%.2f",
@@ -1473,8 +1489,19 @@ def run_batch(trigger_time: str, log_level: str = "INFO", output_file: str = Non
                 company = df.loc[ticker, "CompanyName"] if "CompanyName" in df.columns else ""
                 logger.info(f"  - {ticker} ({company})")
 
+    # RS universe (RS_RATING_UNIVERSE=market): rank candidates against all S&P 500 + NASDAQ-100 tickers
+    rs_universe_raw = None
+    if os.getenv("RS_RATING_UNIVERSE", "candidates").strip().lower() == "market":
+        try:
+            matrix = get_close_matrix(tickers, trade_date, RS_RATING_LOOKBACK_DAYS)
+            rs_universe_raw = oneil_weighted_returns(matrix).dropna()
+            logger.info(f"RS universe raw scores: {len(rs_universe_raw)} tickers")
+        except Exception as e:
+            logger.warning(f"RS universe load failed; ranking among candidates: {e}")
+
     # Final selection
-    final_results = select_final_tickers(triggers, trade_date=trade_date, macro_context=macro_context)
+    final_results = select_final_tickers(triggers, trade_date=trade_date, macro_context=macro_context,
+                                         rs_universe_raw=rs_universe_raw)
 
     # Save to JSON if requested
     if output_file:
@@ -17,6 +17,9 @@ from mcp_agent.agents.agent import Agent
 from mcp_agent.app import MCPApp
 from mcp_agent.workflows.llm.augmented_llm import RequestParams
 from mcp_agent.workflows.llm.augmented_llm_anthropic import AnthropicAugmentedLLM
+from cores.llm.governor import governed_generate_str
+
+import report_manifest
 
 # Logger setup
 logger = logging.getLogger(__name__)
@@ -120,34 +123,28 @@ def get_cached_us_report(ticker: str) -> tuple:
     Returns:
         tuple: (is_cached, content, md_path, pdf_path)
     """
-    # Find all report files starting with the ticker
-    report_files = list(US_REPORTS_DIR.glob(f"{ticker}_*.md"))
-
-    if not report_files:
+    # Manifest lookup (indexed, freshness from recorded creation time)
+    entry = report_manifest.latest_report(
+        "us", ticker, seed_dirs=(US_REPORTS_DIR, US_PDF_REPORTS_DIR)
+    )
+    if entry is None:
         return False, "", None, None
 
-    # Sort by latest
-    latest_file = max(report_files, key=lambda p: p.stat().st_mtime)
-
-    # Check if file was created within 24 hours
-    file_age = datetime.now() - datetime.fromtimestamp(latest_file.stat().st_mtime)
-    if file_age.days >= 1:  # Don't use files older than 24 hours as cache
+    latest_file = Path(entry["md_path"])
+    try:
+        with open(latest_file, "r", encoding="utf-8") as f:
+            content = f.read()
+    except FileNotFoundError:
+        report_manifest.forget(latest_file)
         return False, "", None, None
 
-    # Check if corresponding PDF file exists
-    pdf_file = None
-    pdf_files = list(US_PDF_REPORTS_DIR.glob(f"{ticker}_*.pdf"))
-    if pdf_files:
-        pdf_file = max(pdf_files, key=lambda p: p.stat().st_mtime)
-
-    with open(latest_file, "r", encoding="utf-8") as f:
-        content = f.read()
+    pdf_file = Path(entry["pdf_path"]) if entry["pdf_path"] else None
 
     # Generate PDF if it doesn't exist
-    if not pdf_file:
-        # Extract company name (filename format: {ticker}_{name}_{date}_analysis.md)
-        parts = os.path.basename(latest_file).split('_')
-        company_name = parts[1] if len(parts) > 1 else ticker
+    if not pdf_file or not pdf_file.exists():
+        if pdf_file:
+            report_manifest.forget_pdf(latest_file)  # PDF deleted since it was recorded
+        company_name = entry["company_name"] or ticker
         pdf_file = save_us_pdf_report(ticker, company_name, latest_file)
 
     return True, content, latest_file, pdf_file
@@ -173,6 +170,8 @@ def save_us_report(ticker: str, company_name: str, content: str) -> Path:
     with open(filepath, "w", encoding="utf-8") as f:
         f.write(content)
 
+    report_manifest.record_report("us", ticker, filepath, company_name=safe_company_name,
+                                  mode="analysis", report_date=reference_date)
     logger.info(f"US 보고서 저장 완료: {filepath}")
     return filepath
 
@@ -203,6 +202,7 @@ def save_us_pdf_report(ticker: str, company_name: str, md_path: Path) -> Path:
         logger.error(f"Error converting US PDF: {e}")
         raise
 
+    report_manifest.record_pdf(md_path, pdf_path)
     return pdf_path
 
 
@@ -349,6 +349,7 @@ def save_pdf_report(stock_code: str, company_name: str, md_path: Path) -> Path:
         logger.error(f"PDF 변환 중 오류: {e}")
         raise
 
+    report_manifest.record_pdf(md_path, pdf_path)
     return pdf_path
 
 
@@ -358,33 +359,28 @@ def get_cached_report(stock_code: str) -> tuple:
     Returns:
         tuple: (is_cached, content, md_path, pdf_path)
     """
-    # Find all report files starting with stock code
-    report_files = list(REPORTS_DIR.glob(f"{stock_code}_*.md"))
-
-    if not report_files:
+    # Manifest lookup (indexed, freshness from recorded creation time)
+    entry = report_manifest.latest_report(
+        "kr", stock_code, seed_dirs=(REPORTS_DIR, PDF_REPORTS_DIR)
+    )
+    if entry is None:
         return False, "", None, None
 
-    # Sort by latest
-    latest_file = max(report_files, key=lambda p: p.stat().st_mtime)
-
-    # Check if file was created within 24 hours
-    file_age = datetime.now() - datetime.fromtimestamp(latest_file.stat().st_mtime)
-    if file_age.days >= 1:  # Don't use files older than 24 hours as cache
+    latest_file = Path(entry["md_path"])
+    try:
+        with open(latest_file, "r", encoding="utf-8") as f:
+            content = f.read()
+    except FileNotFoundError:
+        report_manifest.forget(latest_file)
         return False, "", None, None
 
-    # Check if corresponding PDF file exists
-    pdf_file = None
-    pdf_files = list(PDF_REPORTS_DIR.glob(f"{stock_code}_*.pdf"))
-    if pdf_files:
-        pdf_file = max(pdf_files, key=lambda p: p.stat().st_mtime)
-
-    with open(latest_file, "r", encoding="utf-8") as f:
-        content = f.read()
+    pdf_file = Path(entry["pdf_path"]) if entry["pdf_path"] else None
 
     # Generate PDF if it doesn't exist
-    if not pdf_file:
-        # Extract company name (filename format: {code}_{name}_{date}_analysis.md)
-        company_name = os.path.basename(latest_file).split('_')[1]
+    if not pdf_file or not pdf_file.exists():
+        if pdf_file:
+            report_manifest.forget_pdf(latest_file)  # PDF deleted since it was recorded
+        company_name = entry["company_name"] or stock_code
         pdf_file = save_pdf_report(stock_code, company_name, latest_file)
 
     return True, content, latest_file, pdf_file
@@ -399,6 +395,8 @@ def save_report(stock_code: str, company_name: str, content: str) -> Path:
     with open(filepath, "w", encoding="utf-8") as f:
         f.write(content)
 
+    report_manifest.record_report("kr", stock_code, filepath, company_name=company_name,
+                                  mode="analysis", report_date=reference_date)
     return filepath
 
 
@@ -734,7 +732,8 @@ async def generate_follow_up_response(ticker, ticker_name, conversation_context,
         llm = await agent.attach_llm(AnthropicAugmentedLLM)
 
         # 응답 생성
-        response = await llm.generate_str(
+        response = await governed_generate_str(
+            llm,
             message="""사용자의 추가 질문에 대해 답변해주세요.
                     
                     이전 대화를 참고하되, 사용자의 새 질문에 집중하여 답변하세요.
@@ -931,7 +930,8 @@ async def generate_evaluation_response(ticker, ticker_name, avg_price, period, t
                 report_content = f.read()
 
         # 응답 생성
-        response = await llm.generate_str(
+        response = await governed_generate_str(
+            llm,
             message=f"""보고서를 바탕으로 종목 평가 응답을 생성해 주세요.
 
                     ## 참고 자료
@@ -1128,7 +1128,8 @@ async def generate_us_evaluation_response(ticker, ticker_name, avg_price, period
         llm = await agent.attach_llm(AnthropicAugmentedLLM)
 
         # 응답 생성
-        response = await llm.generate_str(
+        response = await governed_generate_str(
+            llm,
             message=f"""미국 주식 {ticker_name}({ticker})에 대한 종목 평가 응답을 생성해 주세요.
 
                     먼저 yahoo_finance 도구를 사용하여 최신 주가 데이터, 기관 투자자 정보, 애널리스트 추천을 조회하고,
@@ -1225,7 +1226,8 @@ async def generate_us_follow_up_response(ticker, ticker_name, conversation_conte
         llm = await agent.attach_llm(AnthropicAugmentedLLM)
 
         # Generate response
-        response = await llm.generate_str(
+        response = await governed_generate_str(
+            llm,
             message="""사용자의 추가 질문에 대해 답변해주세요.
 
                     이전 대화를 참고하되, 사용자의 새 질문에 집중하여 답변하세요.
@@ -1345,7 +1347,8 @@ async def generate_journal_conversation_response(
         llm = await agent.attach_llm(AnthropicAugmentedLLM)
 
         # Generate response
-        response = await llm.generate_str(
+        response = await governed_generate_str(
+            llm,
             message=f"""사용자 메시지: {user_message}
 
 위 메시지에 자연스럽게 응답해주세요. 사용자의 과거 기록(저널, 평가 등)을 참고하여 개인화된 답변을 제공하세요.""",
@@ -1436,7 +1439,8 @@ async def generate_firecrawl_search_response(search_query: str, analysis_prompt:
 
         llm = await agent.attach_llm(AnthropicAugmentedLLM)
 
-        response = await llm.generate_str(
+        response = await governed_generate_str(
+            llm,
             message=f"다음은 웹 검색 결과입니다:\n\n{context}\n\n---\n\n{analysis_prompt}",
             request_params=RequestParams(
                 model="claude-sonnet-5",
@@ -1543,7 +1547,8 @@ async def generate_firecrawl_followup_response(
         )
 
         llm = await agent.attach_llm(AnthropicAugmentedLLM)
-        response = await llm.generate_str(
+        response = await governed_generate_str(
+            llm,
             message=user_question,
             request_params=RequestParams(
                 model="claude-sonnet-5",
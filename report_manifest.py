@@ -0,0 +1,231 @@
+"""
+Report manifest — index of generated report files for cache lookups
+
+get_cached_report / get_cached_us_report used to glob the reports directory
+for `{code}_*.md`, stat every match, then glob the PDF directory the same way.
+With thousands of accumulated reports every /report request paid that scan.
+
+The manifest is a small SQLite table keyed by (market, code, report_date, mode)
+holding the markdown/PDF paths and creation time. Writers register files as
+they save them (report_generator.save_*, the KR/US orchestrators), and cache
+lookups become one indexed query — freshness comes from the stored created_at,
+not from stat().
+
+On first use the manifest is seeded once from the existing report directories.
+"""
+import logging
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_DB_PATH = Path(__file__).parent / "report_manifest.sqlite"
+CACHE_MAX_AGE_SECONDS = 24 * 3600
+
+# {code}_{name}_{YYYYMMDD}_{mode...}.md  (name may itself contain underscores)
+_REPORT_NAME_RE = re.compile(r"^(?P<code>[^_]+)_(?P<name>.+)_(?P<date>\d{8})_(?P<mode>.+)$")
+# translated copies: {stem}_{lang}.md — not primary reports
+_TRANSLATED_RE = re.compile(r"_(en|ja|zh|es|ko)$")
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS report_manifest (
+    market       TEXT NOT NULL,
+    code         TEXT NOT NULL,
+    report_date  TEXT NOT NULL,
+    mode         TEXT NOT NULL,
+    company_name TEXT,
+    md_path      TEXT NOT NULL,
+    pdf_path     TEXT,
+    created_at   REAL NOT NULL,
+    PRIMARY KEY (market, code, report_date, mode)
+)
+"""
+
+_CREATE_SEEDED = """
+CREATE TABLE IF NOT EXISTS report_manifest_seeded (
+    market    TEXT PRIMARY KEY,
+    seeded_at REAL NOT NULL
+)
+"""
+
+_ready_paths: Set[str] = set()
+_seeded: Set[Tuple[str, str]] = set()
+_seed_lock = threading.Lock()
+
+
+@contextmanager
+def _connect() -> Iterator[sqlite3.Connection]:
+    """Short-lived connection (safe from worker threads); commits on success."""
+    path = str(MANIFEST_DB_PATH)
+    conn = sqlite3.connect(path, timeout=10)
+    try:
+        if path not in _ready_paths:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_CREATE_TABLE)
+            conn.execute(_CREATE_SEEDED)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_rm_latest "
+                         "ON report_manifest(market, code, created_at DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_rm_md ON report_manifest(md_path)")
+            _ready_paths.add(path)
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def parse_report_name(path) -> Optional[Dict[str, str]]:
+    """Split a report file name into code / name / date / mode (None if it does not match)."""
+    stem = Path(path).stem
+    if _TRANSLATED_RE.search(stem):
+        return None
+    m = _REPORT_NAME_RE.match(stem)
+    return m.groupdict() if m else None
+
+
+def record_report(market: str, code: str, md_path, company_name: Optional[str] = None,
+                  mode: Optional[str] = None, report_date: Optional[str] = None,
+                  created_at: Optional[float] = None) -> None:
+    """Register a saved markdown report (mode/date default to what the file name says)."""
+    md_path = Path(md_path).resolve()
+    parsed = parse_report_name(md_path) or {}
+    mode = mode or parsed.get("mode", "analysis")
+    report_date = report_date or parsed.get("date") or datetime.now().strftime("%Y%m%d")
+    try:
+        with _connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO report_manifest
+                    (market, code, report_date, mode, company_name, md_path, pdf_path, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, NULL, ?)
+                ON CONFLICT(market, code, report_date, mode) DO UPDATE SET
+                    company_name = excluded.company_name,
+                    md_path      = excluded.md_path,
+                    pdf_path     = CASE WHEN md_path = excluded.md_path THEN pdf_path END,
+                    created_at   = excluded.created_at
+                """,
+                (market, code, report_date, mode, company_name, str(md_path),
+                 created_at if created_at is not None else time.time()),
+            )
+    except sqlite3.Error as e:
+        logger.warning(f"report manifest update failed for {md_path}: {e}")
+
+
+def record_pdf(md_path, pdf_path) -> None:
+    """Attach a generated PDF to the manifest entry of its markdown report."""
+    try:
+        with _connect() as conn:
+            conn.execute(
+                "UPDATE report_manifest SET pdf_path=? WHERE md_path=?",
+                (str(Path(pdf_path).resolve()), str(Path(md_path).resolve())),
+            )
+    except sqlite3.Error as e:
+        logger.warning(f"report manifest PDF update failed for {md_path}: {e}")
+
+
+def forget_pdf(md_path) -> None:
+    """Clear the PDF link of an entry whose PDF has disappeared."""
+    try:
+        with _connect() as conn:
+            conn.execute("UPDATE report_manifest SET pdf_path=NULL WHERE md_path=?",
+                         (str(Path(md_path).resolve()),))
+    except sqlite3.Error as e:
+        logger.warning(f"report manifest PDF clear failed for {md_path}: {e}")
+
+
+def forget(md_path) -> None:
+    """Drop an entry whose file has disappeared."""
+    try:
+        with _connect() as conn:
+            conn.execute("DELETE FROM report_manifest WHERE md_path=?",
+                         (str(Path(md_path).resolve()),))
+    except sqlite3.Error as e:
+        logger.warning(f"report manifest delete failed for {md_path}: {e}")
+
+
+def latest_report(market: str, code: str, max_age_seconds: float = CACHE_MAX_AGE_SECONDS,
+                  seed_dirs: Optional[Tuple[Path, Path]] = None) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Newest report for (market, code) created within max_age_seconds, or None.
+
+    Returns {"md_path", "pdf_path", "company_name", "mode", "report_date"}.
+    seed_dirs=(reports_dir, pdf_dir) seeds the manifest from disk once per market
+    (files written before the manifest existed).
+    """
+    if seed_dirs is not None:
+        _seed_once(market, *seed_dirs)
+    cutoff = time.time() - max_age_seconds
+    try:
+        with _connect() as conn:
+            row = conn.execute(
+                """
+                SELECT md_path, pdf_path, company_name, mode, report_date
+                FROM report_manifest
+                WHERE market=? AND code=? AND created_at >= ?
+                ORDER BY created_at DESC
+                LIMIT 1
+                """,
+                (market, code, cutoff),
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning(f"report manifest lookup failed for {market}:{code}: {e}")
+        return None
+    if row is None:
+        return None
+    return dict(zip(("md_path", "pdf_path", "company_name", "mode", "report_date"), row))
+
+
+def seed_from_dirs(market: str, reports_dir: Path, pdf_dir: Path) -> int:
+    """Register every report file found on disk (one-time migration). Returns rows written."""
+    rows = []
+    for md in Path(reports_dir).glob("*.md"):
+        parsed = parse_report_name(md)
+        if parsed is None:
+            continue
+        pdf = Path(pdf_dir) / f"{md.stem}.pdf"
+        rows.append((market, parsed["code"], parsed["date"], parsed["mode"], parsed["name"],
+                     str(md.resolve()), str(pdf.resolve()) if pdf.exists() else None,
+                     md.stat().st_mtime))
+    if not rows:
+        return 0
+    with _connect() as conn:
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO report_manifest
+                (market, code, report_date, mode, company_name, md_path, pdf_path, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+    logger.info(f"report manifest seeded with {len(rows)} {market} reports from {reports_dir}")
+    return len(rows)
+
+
+def _seed_once(market: str, reports_dir: Path, pdf_dir: Path) -> None:
+    key = (market, str(MANIFEST_DB_PATH))
+    if key in _seeded:
+        return
+    with _seed_lock:
+        if key in _seeded:
+            return
+        try:
+            with _connect() as conn:
+                done = conn.execute(
+                    "SELECT 1 FROM report_manifest_seeded WHERE market=?", (market,)
+                ).fetchone()
+            if not done:
+                seed_from_dirs(market, reports_dir, pdf_dir)
+                with _connect() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO report_manifest_seeded (market, seeded_at) "
+                        "VALUES (?, ?)", (market, time.time()),
+                    )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"report manifest seeding failed for {market}: {e}")
+        _seeded.add(key)
+
@@ -24,6 +24,9 @@ from datetime import datetime
 from pathlib import Path
 
 from cores.openai_error_logging import log_openai_error
+from cores.llm.governor import governed_generate_str
+from cores.report_pipeline import report_parallelism, run_bounded
+import report_manifest
 
 # Logger configuration
 logging.basicConfig(
@@ -41,6 +44,11 @@ REPORTS_DIR = Path("reports")
 TELEGRAM_MSGS_DIR = Path("telegram_messages")
 PDF_REPORTS_DIR = Path("pdf_reports")
 
+# Tickers analyzed at once, from PRISM_PARALLEL_REPORT (false/true = 1, the previous
+# serial behavior; N >= 2 = N tickers). The LLM calls themselves are paced by
+# cores.llm.governor, so more tickers in flight never means more than its budget.
+REPORT_CONCURRENCY = max(1, report_parallelism())
+
 # Create directories
 REPORTS_DIR.mkdir(exist_ok=True)
 TELEGRAM_MSGS_DIR.mkdir(exist_ok=True)
@@ -334,7 +342,8 @@ class StockAnalysisOrchestrator:
 
                 from mcp_agent.workflows.llm.augmented_llm import RequestParams
                 llm = await agent.attach_llm(OpenAIAugmentedLLM)
-                result = await llm.generate_str(
+                result = await governed_generate_str(
+                    llm,
                     message=f"{reference_date} 기준 한국 주식시장 거시경제 분석을 수행하고 JSON으로 출력하세요.",
                     request_params=RequestParams(
                         model="gpt-5.4-mini",
@@ -527,8 +536,12 @@ class StockAnalysisOrchestrator:
                 report_file = Path(report_path)
                 pdf_file = PDF_REPORTS_DIR / f"{report_file.stem}.pdf"
 
-                # Convert markdown to PDF
-                markdown_to_pdf(report_path, pdf_file, 'playwright', add_theme=True, enable_watermark=False)
+                # Convert markdown to PDF (worker thread - keeps concurrent analyses running)
+                await asyncio.to_thread(
+                    markdown_to_pdf, report_path, pdf_file, 'playwright',
+                    add_theme=True, enable_watermark=False
+                )
+                report_manifest.record_pdf(report_path, pdf_file)
 
                 logger.info(f"PDF conversion complete: {pdf_file}")
                 pdf_paths.append(pdf_file)
@@ -1103,8 +1116,16 @@ class StockAnalysisOrchestrator:
             else:
                 logger.warning(f"Trigger results file not found: {results_file}")
 
-            # 2. Generate reports - important: await added here!
-            report_paths = await self.generate_reports(tickers, mode, timeout=600, language=language, macro_context=macro_context)
+            # 2. Generate reports. Each finished report is converted to PDF (and its
+            # telegram summary generated) while the remaining tickers are analyzed.
+            post_tasks = {}
+
+            async def _on_report(report_path):
+                post_tasks[report_path] = asyncio.create_task(
+                    self._post_process_report(report_path, language))
+
+            report_paths = await self.generate_reports(tickers, mode, timeout=600, language=language,
+                                                       macro_context=macro_context, on_report=_on_report)
             if not report_paths:
                 logger.warning("No reports generated. Terminating process.")
                 return
@@ -1116,15 +1137,16 @@ class StockAnalysisOrchestrator:
             except Exception as _e:
                 logger.warning(f"Archive ingest hook skipped: {_e}")
 
-            # 3. PDF conversion
-            pdf_paths = await self.convert_to_pdf(report_paths)
+            # 3-4. PDF conversion + telegram messages (started per report above)
+            pdf_paths, message_paths = [], []
+            for report_path in report_paths:
+                pdfs, messages = await post_tasks[report_path]
+                pdf_paths.extend(pdfs)
+                message_paths.extend(messages)
 
-            # 4-5. Generate and send telegram messages (only when telegram is enabled)
+            # 5. Send telegram messages and PDFs (only when telegram is enabled)
             if self.telegram_config.use_telegram:
-                logger.info("Telegram enabled - proceeding with message generation and transmission steps")
-
-                # 4. Generate telegram messages
-                message_paths = await self.generate_telegram_messages(pdf_paths, language)
+                logger.info("Telegram enabled - proceeding with message transmission step")
 
                 # 5. Send telegram messages and PDFs
                 await self.send_telegram_messages(message_paths, pdf_paths, report_paths)
@@ -1211,72 +1233,101 @@ class StockAnalysisOrchestrator:
                 self._broadcast_tasks.clear()
                 logger.info("All broadcast translation tasks completed")
 
-    async def generate_reports(self, tickers, mode, timeout: int = None, language: str = "ko", macro_context: dict = None) -> list:
+    async def _post_process_report(self, report_path, language: str = "ko"):
         """
-        Generate reports serially for all stocks.
-        Process one stock at a time to prevent OpenAI rate limit issues.
+        PDF conversion and telegram summary for one finished report.
+
+        Returns:
+            tuple: (pdf_paths, message_paths) - empty lists on failure/telegram off
+        """
+        pdf_paths = await self.convert_to_pdf([report_path])
+        message_paths = []
+        if pdf_paths and self.telegram_config.use_telegram:
+            message_paths = await self.generate_telegram_messages(pdf_paths, language)
+        return pdf_paths, message_paths
+
+    async def _analyze_ticker(self, idx, total, ticker_info, mode, language, macro_context):
+        """Analyze one stock and save its report. Returns the report path or None."""
+        # If ticker_info is a dict
+        if isinstance(ticker_info, dict):
+            ticker = ticker_info.get('code')
+            # Use 'or' to handle both None and empty string cases
+            company_name = ticker_info.get('name') or f"Stock_{ticker}"
+        else:
+            ticker = ticker_info
+            company_name = f"Stock_{ticker}"
+
+        logger.info(f"[{idx}/{total}] Starting stock analysis: {company_name}({ticker})")
+
+        # Set output file path
+        reference_date = datetime.now().strftime("%Y%m%d")
+        output_file = str(REPORTS_DIR / f"{ticker}_{company_name}_{reference_date}_{mode}_gpt5.4-mini.md")
+
+        try:
+            # Import function directly from main.py
+            from cores.main import analyze_stock
+
+            # Use await directly since already in async environment
+            logger.info(f"[{idx}/{total}] Starting analyze_stock function call")
+            report = await analyze_stock(
+                company_code=ticker,
+                company_name=company_name,
+                reference_date=reference_date,
+                language=language,
+                macro_context=macro_context
+            )
+
+            # Save result
+            if report and len(report.strip()) > 0:
+                with open(output_file, "w", encoding="utf-8") as f:
+                    f.write(report)
+                report_manifest.record_report("kr", ticker, output_file, company_name=company_name,
+                                              mode=mode, report_date=reference_date)
+                logger.info(f"[{idx}/{total}] Report generation complete: {company_name}({ticker}) - {len(report)} characters")
+                return output_file
+            logger.error(f"[{idx}/{total}] Report generation failed: {company_name}({ticker}) - empty content")
+
+        except Exception as e:
+            logger.error(f"[{idx}/{total}] Error during analysis: {company_name}({ticker}) - {str(e)}")
+            import traceback
+            logger.error(traceback.format_exc())
+        return None
+
+    async def generate_reports(self, tickers, mode, timeout: int = None, language: str = "ko",
+                               macro_context: dict = None, on_report=None) -> list:
+        """
+        Generate reports for all stocks, REPORT_CONCURRENCY at a time.
+        Every LLM call made by an analysis is admitted by the LLM rate governor, so
+        concurrency only adds overlap, not provider load; concurrency 1 is the serial mode.
 
         Args:
             tickers: List of stocks to analyze
             mode: Execution mode
             timeout: Timeout (seconds)
             language: Analysis language ("ko" or "en")
+            on_report: Optional async callback(report_path), awaited as soon as
+                each report is saved (used to overlap PDF/telegram steps)
 
         Returns:
-            list: List of successful report paths
+            list: List of successful report paths (in ticker order)
         """
 
-        logger.info(f"Starting report generation for {len(tickers)} stocks (serial processing)")
-
-        successful_reports = []
-
-        # Process each stock sequentially
-        for idx, ticker_info in enumerate(tickers, 1):
-            # If ticker_info is a dict
-            if isinstance(ticker_info, dict):
-                ticker = ticker_info.get('code')
-                # Use 'or' to handle both None and empty string cases
-                company_name = ticker_info.get('name') or f"Stock_{ticker}"
-            else:
-                ticker = ticker_info
-                company_name = f"Stock_{ticker}"
-
-            logger.info(f"[{idx}/{len(tickers)}] Starting stock analysis: {company_name}({ticker})")
-
-            # Set output file path
-            reference_date = datetime.now().strftime("%Y%m%d")
-            output_file = str(REPORTS_DIR / f"{ticker}_{company_name}_{reference_date}_{mode}_gpt5.4-mini.md")
-
-            try:
-                # Import function directly from main.py
-                from cores.main import analyze_stock
-
-                # Use await directly since already in async environment
-                logger.info(f"[{idx}/{len(tickers)}] Starting analyze_stock function call")
-                report = await analyze_stock(
-                    company_code=ticker,
-                    company_name=company_name,
-                    reference_date=reference_date,
-                    language=language,
-                    macro_context=macro_context
-                )
+        total = len(tickers)
+        logger.info(f"Starting report generation for {total} stocks "
+                    f"(concurrency: {REPORT_CONCURRENCY})")
 
-                # Save result
-                if report and len(report.strip()) > 0:
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write(report)
-                    logger.info(f"[{idx}/{len(tickers)}] Report generation complete: {company_name}({ticker}) - {len(report)} characters")
-                    successful_reports.append(output_file)
-                else:
-                    logger.error(f"[{idx}/{len(tickers)}] Report generation failed: {company_name}({ticker}) - empty content")
+        async def _worker(i, ticker_info):
+            return await self._analyze_ticker(i + 1, total, ticker_info, mode, language, macro_context)
 
-            except Exception as e:
-                logger.error(f"[{idx}/{len(tickers)}] Error during analysis: {company_name}({ticker}) - {str(e)}")
-                import traceback
-                logger.error(traceback.format_exc())
+        async def _finished(i, ticker_info, report_path):
+            if report_path and on_report is not None:
+                await on_report(report_path)
 
+        results = await run_bounded(tickers, _worker, concurrency=REPORT_CONCURRENCY,
+                                    on_result=_finished)
+        successful_reports = [path for path in results if path]
 
-        logger.info(f"Report generation complete: {len(successful_reports)}/{len(tickers)} successful")
+        logger.info(f"Report generation complete: {len(successful_reports)}/{total} successful")
 
         return successful_reports
 
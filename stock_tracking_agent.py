@@ -46,6 +46,7 @@ from cores.llm.openai_responses_llm import OpenAIResponsesLLM as OpenAIAugmented
 
 # Core agent imports
 from cores.openai_error_logging import log_openai_error
+from cores.llm.governor import governed_generate_str
 from cores.agents.trading_agents import create_trading_scenario_agent
 from cores.utils import parse_llm_json
 
@@ -69,6 +70,7 @@ from tracking import (
     add_sector_column_if_missing,
     extract_ticker_info,
     get_current_stock_price,
+    get_current_stock_prices,
     get_trading_value_rank_change,
     is_ticker_in_holdings,
     get_current_slots_count,
@@ -84,6 +86,7 @@ from tracking import (
     TelegramSender,
 )
 from trading import kis_auth as ka
+from price_snapshot import PriceSnapshot
 
 # Create MCPApp instance
 app = MCPApp(name="stock_tracking")
@@ -240,6 +243,11 @@ class StockTrackingAgent:
         account_key, _ = self._account_scope()
         return await get_current_stock_price(self.cursor, ticker, account_key=account_key)
 
+    async def _get_current_stock_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """Get current prices from one market snapshot (delegates to tracking.helpers)"""
+        account_key, _ = self._account_scope()
+        return await get_current_stock_prices(self.cursor, tickers, account_key=account_key)
+
     async def _get_trading_value_rank_change(self, ticker: str) -> Tuple[float, str]:
         """Calculate trading value ranking change (delegates to tracking.helpers)"""
         return await get_trading_value_rank_change(ticker)
@@ -559,7 +567,8 @@ class StockTrackingAgent:
                 {report_content}
                 """
 
-            response = await llm.generate_str(
+            response = await governed_generate_str(
+                llm,
                 message=prompt_message,
                 request_params=RequestParams(
                     model="gpt-5.5",
@@ -1583,12 +1592,19 @@ class StockTrackingAgent:
             pass_total_qty: Dict[str, int] = {}   # ticker -> snapshot total qty
             pass_sold_qty: Dict[str, int] = {}    # ticker -> cumulative ordered qty
 
+            # Current prices once per cycle: one whole-market frame for all distinct
+            # tickers (pyramided rows share it), per-ticker lookup only for misses.
+            price_snapshot = PriceSnapshot(
+                self._get_current_stock_price, bulk=self._get_current_stock_prices
+            )
+            await price_snapshot.prefetch(h.get('ticker') for h in holdings)
+
             for stock in holdings:
                 ticker = stock.get('ticker')
                 company_name = stock.get('company_name')
 
                 # Query current stock price
-                current_price = await self._get_current_stock_price(ticker)
+                current_price = await price_snapshot.get(ticker)
 
                 if current_price <= 0:
                     old_price = stock.get('current_price', 0)
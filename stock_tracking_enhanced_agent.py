@@ -13,6 +13,7 @@ import traceback
 
 from mcp_agent.workflows.llm.augmented_llm import RequestParams
 from cores.llm.openai_responses_llm import OpenAIResponsesLLM as OpenAIAugmentedLLM
+from cores.llm.governor import governed_generate_str
 
 # Import core agents
 from cores.agents.trading_agents import create_sell_decision_agent
@@ -1084,7 +1085,8 @@ class EnhancedStockTrackingAgent(StockTrackingAgent):
                 **Important**: If stop loss/target price adjustment is needed, return it via portfolio_adjustment JSON only. Do NOT directly UPDATE the DB.
                 """
 
-            response = await llm.generate_str(
+            response = await governed_generate_str(
+                llm,
                 message=prompt_message,
                 request_params=RequestParams(
                     model="gpt-5.5",
@@ -17,7 +17,6 @@ import signal
 import traceback
 from datetime import datetime
 from pathlib import Path
-from queue import Queue
 
 from dotenv import load_dotenv
 from telegram import Update, InputFile, InlineKeyboardButton, InlineKeyboardMarkup
@@ -27,9 +26,7 @@ from telegram.ext import (
 )
 from telegram.request import HTTPXRequest
 
-from analysis_manager import (
-    AnalysisRequest, analysis_queue, start_background_worker
-)
+from analysis_manager import AnalysisRequest, AnalysisScheduler
 # Internal module imports
 from report_generator import (
     generate_evaluation_response, get_cached_report, generate_follow_up_response,
@@ -41,6 +38,7 @@ from report_generator import (
 from tracking.user_memory import UserMemoryManager
 from firecrawl_client import firecrawl_agent
 from cores.disclaimer_utils import strip_trailing_disclaimer as _strip_trailing_disclaimer
+from cores.llm.governor import INTERACTIVE, set_default_priority
 from datetime import timedelta
 from dataclasses import dataclass
 from typing import Dict, Optional
@@ -475,9 +473,6 @@ class TelegramAIBot:
         # Manage pending analysis requests
         self.pending_requests = {}
 
-        # Add result processing queue
-        self.result_queue = Queue()
-        
         # Add conversation context storage
         self.conversation_contexts: Dict[int, ConversationContext] = {}
 
@@ -509,8 +504,8 @@ class TelegramAIBot:
         self.application = Application.builder().token(self.token).request(request).build()
         self.setup_handlers()
 
-        # Start background worker
-        start_background_worker(self)
+        # Analysis job scheduler (concurrent slots, results delivered via callback)
+        self.analysis_scheduler = AnalysisScheduler(on_complete=self.deliver_analysis_result)
 
         self.scheduler = AsyncIOScheduler()
         self.scheduler.add_job(self.load_stock_map, "interval", hours=12)
@@ -1715,7 +1710,7 @@ class TelegramAIBot:
         else:
             # New analysis needed
             self.pending_requests[request.id] = request
-            analysis_queue.put(request)
+            self.analysis_scheduler.submit(request)
 
         return ConversationHandler.END
 
@@ -2580,7 +2575,7 @@ class TelegramAIBot:
         else:
             # New analysis needed - add to queue
             self.pending_requests[request.id] = request
-            analysis_queue.put(request)
+            self.analysis_scheduler.submit(request)
 
         return ConversationHandler.END
 
@@ -3688,37 +3683,11 @@ class TelegramAIBot:
                 "⚠️ 추가 질문 처리 중 오류가 발생했습니다. 다시 시도해주세요."
             )
 
-    async def process_results(self):
-        """Check items to process from result queue"""
-        logger.info("Result processing task started")
-        while not self.stop_event.is_set():
-            try:
-                # Process if queue is not empty
-                if not self.result_queue.empty():
-                    # Process only one request at a time without internal loop
-                    request_id = self.result_queue.get()
-                    logger.info(f"Retrieved item from result queue: {request_id}")
-
-                    if request_id in self.pending_requests:
-                        request = self.pending_requests[request_id]
-                        # Send result (safe because running in main event loop)
-                        await self.send_report_result(request)
-                        logger.info(f"Result sent successfully: {request.id} ({request.company_name})")
-                    else:
-                        logger.warning(f"Request ID not in pending_requests: {request_id}")
-
-                    # Mark queue task as complete
-                    self.result_queue.task_done()
-                
-                # Wait briefly (reduce CPU usage)
-                await asyncio.sleep(0.5)
-                
-            except Exception as e:
-                logger.error(f"Error processing result: {str(e)}")
-                logger.error(traceback.format_exc())
-
-            # Wait briefly
-            await asyncio.sleep(1)
+    async def deliver_analysis_result(self, request: AnalysisRequest):
+        """AnalysisScheduler completion callback — send the result to the requester"""
+        self.pending_requests.pop(request.id, None)
+        await self.send_report_result(request)
+        logger.info(f"Result sent successfully: {request.id} ({request.company_name})")
 
     async def run(self):
         """Run bot"""
@@ -3741,9 +3710,6 @@ class TelegramAIBot:
         await self.application.start()
         await self.application.updater.start_polling()
 
-        # Add task for result processing
-        asyncio.create_task(self.process_results())
-
         logger.info("Telegram AI conversational bot has started.")
 
         try:
@@ -3797,6 +3763,9 @@ async def main():
     for s in signals:
         loop.add_signal_handler(s, create_signal_handler(s))
 
+    # bot commands are served ahead of batch jobs sharing the LLM budget
+    set_default_priority(INTERACTIVE)
+
     bot = TelegramAIBot()
     await bot.run()
 
@@ -16,6 +16,7 @@ from mcp_agent.workflows.evaluator_optimizer.evaluator_optimizer import (
 )
 
 from cores.openai_error_logging import log_openai_error
+from cores.llm.governor import governed_generate_str
 
 
 def _extract_last_valid_json(text: str) -> str:
@@ -64,7 +65,7 @@ class _RobustEvaluatorLLM:
         except Exception as e:
             log_openai_error(logger, e, "telegram summary evaluator structured generation")
             logger.warning(f"generate_structured failed ({e}), retrying with JSON extraction fallback")
-            text = await self._llm.generate_str(message=message, request_params=request_params)
+            text = await governed_generate_str(self._llm, message=message, request_params=request_params)
             candidate = _extract_last_valid_json(text)
             try:
                 data = json.loads(candidate)
@@ -289,7 +290,8 @@ class TelegramSummaryGenerator:
             prompt_message += "\n⚠️ 주의: 본 정보는 장 시작 후 10분 시점 데이터입니다. 현재 상황과 다를 수 있습니다."
 
         # Generate Telegram message using evaluation-optimization workflow
-        response = await evaluator_optimizer.generate_str(
+        response = await governed_generate_str(
+            evaluator_optimizer,
             message=prompt_message,
             request_params=RequestParams(
                 model="gpt-5.4-mini",
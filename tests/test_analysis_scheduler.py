@@ -0,0 +1,122 @@
+"""Unit tests for analysis_manager.AnalysisScheduler (telegram_ai_bot /report jobs).
+
+The blocking report runner is faked with a short sleep — no subprocess / LLM.
+Run with:  python -m pytest tests/test_analysis_scheduler.py -q
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from analysis_manager import AnalysisRequest, AnalysisScheduler
+
+
+class FakeRunner:
+    """Blocking runner (called via asyncio.to_thread) that records start order."""
+
+    def __init__(self, seconds: float = 0.05):
+        self.seconds = seconds
+        self.started = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: AnalysisRequest) -> None:
+        with self._lock:
+            self.started.append((request.user_id, request.stock_code))
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.seconds)
+        with self._lock:
+            self.in_flight -= 1
+        if request.stock_code == "BAD":
+            raise RuntimeError("subprocess died")
+        request.status = "completed"
+        request.result = f"report {request.stock_code}"
+        request.pdf_path = f"/tmp/{request.stock_code}.pdf"
+
+
+def _req(user, code, market="kr"):
+    return AnalysisRequest(stock_code=code, company_name=code, chat_id=user,
+                           user_id=user, market_type=market)
+
+
+async def _drain(scheduler, delivered, expected):
+    while len(delivered) < expected:
+        await asyncio.sleep(0.01)
+
+
+def test_slots_and_round_robin_across_users():
+    runner = FakeRunner()
+    delivered = []
+
+    async def on_complete(request):
+        delivered.append(request)
+
+    async def _go():
+        scheduler = AnalysisScheduler(on_complete, concurrency=2, runner=runner)
+        for code in ("A1", "A2", "A3", "A4"):      # user 1 floods the queue first
+            scheduler.submit(_req(1, code))
+        scheduler.submit(_req(2, "B1"))
+        scheduler.submit(_req(3, "C1"))
+        await _drain(scheduler, delivered, 6)
+        return scheduler
+
+    scheduler = asyncio.run(_go())
+    assert runner.peak == 2
+    # A1, A2 take both free slots; afterwards users 2 and 3 go before A3/A4
+    assert runner.started[:2] == [(1, "A1"), (1, "A2")]
+    assert runner.started[2:4] == [(2, "B1"), (3, "C1")]
+    assert all(r.status == "completed" for r in delivered)
+    assert scheduler.running == 0 and scheduler.queued == 0
+
+
+def test_duplicate_ticker_requests_share_one_analysis():
+    runner = FakeRunner()
+    delivered = []
+
+    async def on_complete(request):
+        delivered.append(request)
+
+    async def _go():
+        scheduler = AnalysisScheduler(on_complete, concurrency=1, runner=runner)
+        first = _req(1, "005930")
+        assert scheduler.submit(first) is False
+        assert scheduler.submit(_req(2, "005930")) is True        # coalesced
+        assert scheduler.submit(_req(3, "005930", market="us")) is False
+        await _drain(scheduler, delivered, 3)
+        # after completion the same ticker starts a fresh analysis
+        assert scheduler.submit(_req(4, "005930")) is False
+        await _drain(scheduler, delivered, 4)
+
+    asyncio.run(_go())
+    assert runner.started == [(1, "005930"), (3, "005930"), (4, "005930")]
+    shared = [r for r in delivered if r.market_type == "kr"][:2]
+    assert {r.user_id for r in shared} == {1, 2}
+    assert all(r.result == "report 005930" and r.pdf_path for r in shared)
+
+
+def test_runner_error_is_delivered_as_failure_and_slot_is_freed():
+    runner = FakeRunner(seconds=0.01)
+    delivered = []
+
+    async def on_complete(request):
+        delivered.append(request)
+        if request.stock_code == "OK":
+            raise RuntimeError("telegram send failed")   # logged, not fatal
+
+    async def _go():
+        scheduler = AnalysisScheduler(on_complete, concurrency=1, runner=runner)
+        scheduler.submit(_req(1, "BAD"))
+        scheduler.submit(_req(2, "BAD"))
+        scheduler.submit(_req(3, "OK"))
+        scheduler.submit(_req(4, "LAST"))
+        await _drain(scheduler, delivered, 4)
+
+    asyncio.run(_go())
+    bad = [r for r in delivered if r.stock_code == "BAD"]
+    assert [r.status for r in bad] == ["failed", "failed"]
+    assert "subprocess died" in bad[1].result
+    assert delivered[-1].stock_code == "LAST" and delivered[-1].status == "completed"
@@ -0,0 +1,106 @@
+"""Tests for cores.archive.embedding.BatchingEmbedder and the embedding_cache table.
+
+Uses FakeEmbeddingBackend — no OpenAI calls.
+Run with:  python -m pytest tests/test_batching_embedder.py -q
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from cores.archive import persistent_insights as pi
+from cores.archive import vector_index
+from cores.archive.archive_db import init_db
+from cores.archive.embedding import (
+    BatchingEmbedder,
+    FakeEmbeddingBackend,
+    decode_embedding,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    vector_index.reset_indexes()
+    path = str(tmp_path / "archive.db")
+    asyncio.run(init_db(path))
+    yield path
+    vector_index.reset_indexes()
+
+
+def test_concurrent_requests_coalesce_into_one_call(db_path):
+    backend = FakeEmbeddingBackend()
+    embedder = BatchingEmbedder(backend, db_path=db_path)
+
+    async def _go():
+        return await asyncio.gather(
+            embedder.embed("삼성전자 HBM 전망"),
+            embedder.embed("rates outlook"),
+            embedder.embed("삼성전자 HBM 전망"),        # duplicate shares the future
+            embedder.embed("   "),                      # blank → None, never sent
+            embedder.embed_many(["rates outlook", "bank dividends"]),
+        )
+
+    a, b, a2, blank, many = asyncio.run(_go())
+    assert backend.calls == [["삼성전자 HBM 전망", "rates outlook", "bank dividends"]]
+    assert a == a2 and many[0] == b and blank is None
+    np.testing.assert_array_equal(decode_embedding(a), backend.vector("삼성전자 HBM 전망"))
+
+
+def test_cache_persists_across_embedders_and_batches_split(db_path):
+    first = FakeEmbeddingBackend()
+    texts = [f"question {i}" for i in range(5)]
+    asyncio.run(BatchingEmbedder(first, db_path=db_path, max_batch=2).embed_many(texts))
+    assert [len(c) for c in first.calls] == [2, 2, 1]
+
+    second = FakeEmbeddingBackend()
+    embedder = BatchingEmbedder(second, db_path=db_path)
+    blobs = asyncio.run(embedder.embed_many(texts + ["new one"]))
+    assert second.calls == [["new one"]]
+    assert (embedder.cache_hits, embedder.api_calls) == (5, 1)
+    assert all(blobs)
+
+
+def test_backend_failure_yields_none_and_is_not_cached(db_path):
+    class Broken(FakeEmbeddingBackend):
+        async def embed(self, texts):
+            raise RuntimeError("rate limited")
+
+    assert asyncio.run(BatchingEmbedder(Broken(), db_path=db_path).embed("x")) is None
+    backend = FakeEmbeddingBackend()
+    assert asyncio.run(BatchingEmbedder(backend, db_path=db_path).embed("x")) is not None
+    assert backend.calls == [["x"]]
+
+
+def test_backfill_reuses_cache_without_api_calls(db_path):
+    takeaways = [["HBM 수요 견조"], ["금리 인하 기대"], []]
+
+    async def _go():
+        ids = []
+        for i, kt in enumerate(takeaways):
+            ids.append(await pi.save_insight(
+                user_id=1, chat_id=1, question=f"q{i}", answer=f"answer {i}",
+                key_takeaways=kt, tools_used=[], tickers_mentioned=[],
+                evidence_report_ids=[], model_used="test", db_path=db_path,
+            ))
+        # the same texts were embedded before (e.g. at save time on another host)
+        warm = BatchingEmbedder(FakeEmbeddingBackend(), db_path=db_path)
+        await warm.embed_many([pi.insight_embedding_text(kt, f"answer {i}")
+                               for i, kt in enumerate(takeaways)])
+
+        backend = FakeEmbeddingBackend()
+        filled = await pi.backfill_embeddings(
+            BatchingEmbedder(backend, db_path=db_path), batch_size=2, db_path=db_path,
+        )
+        assert filled == 3 and backend.calls == []
+        assert await pi.backfill_embeddings(
+            BatchingEmbedder(backend, db_path=db_path), db_path=db_path) == 0
+
+        hits = await pi.search_insights(
+            "zzz", backend.vector("answer 2").tobytes(), db_path=db_path,
+        )
+        assert hits[0].id == ids[2]
+
+    asyncio.run(_go())
@@ -0,0 +1,229 @@
+"""
+tests/test_daily_bar_store.py — 로컬 일봉 저장소 (cores/daily_bar_store) 테스트
+
+Covers:
+  (1) 최초 요청은 전체 fetch, 같은 구간 재요청은 디스크에서 (fetch 0회).
+  (2) 증분: 더 과거(head) / 더 최근(tail) 구간만 fetch.
+  (3) 당일(장중) 봉은 TTL 내 재사용, TTL 지나면 재조회.
+  (4) 수정주가 이력 변경(overlap 종가 불일치) → 종목 재적재 (재조회 실패 시 기존 봉 유지).
+  (5) fetch 실패 → 디스크 데이터(stale) 반환, 예외 없음. 빈 head 응답은 coverage 미확정.
+      건수 제한으로 잘린 응답은 실제 받은 첫 봉까지만 coverage (KIS 100건 페이지 조회).
+  (6) RS 유니버스 종가 행렬: 마감 세션 스냅샷은 1회만 다운로드.
+
+네트워크 의존 없음 — fetcher 스텁 + tmp_path DB.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from cores import daily_bar_store
+
+
+def _bars(start: str, end: str, scale: float = 1.0) -> pd.DataFrame:
+    idx = pd.bdate_range(start, end)
+    closes = (np.arange(len(idx)) + 100.0) * scale
+    return pd.DataFrame(
+        {"Open": closes, "High": closes + 1, "Low": closes - 1, "Close": closes,
+         "Volume": 1000.0, "Amount": closes * 1000},
+        index=idx,
+    )
+
+
+class _Fetcher:
+    """KRX 스타일 fetcher 스텁: 전체 히스토리에서 요청 구간만 잘라 반환."""
+
+    def __init__(self, history: pd.DataFrame):
+        self.history = history
+        self.calls = []
+        self.fail = False
+
+    def __call__(self, start: str, end: str) -> pd.DataFrame:
+        self.calls.append((start, end))
+        if self.fail:
+            raise RuntimeError("KRX down")
+        return self.history.loc[pd.Timestamp(start):pd.Timestamp(end)]
+
+
+@pytest.fixture
+def db(tmp_path):
+    return tmp_path / "bars.db"
+
+
+HISTORY = _bars("2024-01-01", "2024-06-28")
+TODAY = "20240628"
+
+
+def _get(fetcher, db, start, end, today=TODAY, adjusted=True):
+    return daily_bar_store.get_daily_bars("005930", start, end, fetcher=fetcher,
+                                          db_path=db, today=today, adjusted=adjusted)
+
+
+def test_repeat_window_served_from_disk(db):
+    fetcher = _Fetcher(HISTORY)
+    first = _get(fetcher, db, "20240201", "20240430")
+    again = _get(fetcher, db, "20240301", "20240415")
+
+    assert fetcher.calls == [("20240201", "20240430")]
+    pd.testing.assert_frame_equal(first, HISTORY.loc["2024-02-01":"2024-04-30"], check_freq=False)
+    pd.testing.assert_frame_equal(again, HISTORY.loc["2024-03-01":"2024-04-15"], check_freq=False)
+
+
+def test_only_missing_head_and_tail_are_fetched(db):
+    fetcher = _Fetcher(HISTORY)
+    _get(fetcher, db, "20240301", "20240331")
+    out = _get(fetcher, db, "20240201", "20240430")
+
+    assert fetcher.calls == [("20240301", "20240331"),
+                             ("20240201", "20240301"),   # head (overlaps earliest stored bar)
+                             ("20240331", "20240430")]   # tail (overlaps last_date)
+    pd.testing.assert_frame_equal(out, HISTORY.loc["2024-02-01":"2024-04-30"], check_freq=False)
+
+
+def test_open_session_bar_refreshed_after_ttl(db, monkeypatch):
+    fetcher = _Fetcher(HISTORY)
+    _get(fetcher, db, "20240601", TODAY)
+    _get(fetcher, db, "20240601", TODAY)
+    assert len(fetcher.calls) == 1  # 당일 봉 TTL 내 재사용
+
+    monkeypatch.setattr(daily_bar_store, "OPEN_SESSION_TTL_SEC", -1)
+    _get(fetcher, db, "20240601", TODAY)
+    assert fetcher.calls[-1] == ("20240627", TODAY)  # 마감된 마지막 날부터 당일까지만
+
+
+def test_adjusted_history_change_reloads_ticker(db):
+    fetcher = _Fetcher(HISTORY.loc[:"2024-05-31"])
+    _get(fetcher, db, "20240401", "20240531")
+
+    fetcher.history = _bars("2024-01-01", "2024-06-28", scale=0.5)  # 2:1 분할 → 과거 수정주가 변경
+    out = _get(fetcher, db, "20240401", "20240628")
+
+    assert fetcher.calls[-1] == ("20240401", "20240628")
+    pd.testing.assert_frame_equal(out, fetcher.history.loc["2024-04-01":"2024-06-28"], check_freq=False)
+
+
+def test_fetch_failure_serves_stale_bars(db):
+    fetcher = _Fetcher(HISTORY)
+    _get(fetcher, db, "20240401", "20240531")
+
+    fetcher.fail = True
+    out = _get(fetcher, db, "20240401", TODAY)
+    pd.testing.assert_frame_equal(out, HISTORY.loc["2024-04-01":"2024-05-31"], check_freq=False)
+
+    assert _get(fetcher, db, "20230101", "20230131").empty  # 저장분 없음 + 실패 → 빈 df
+
+
+def test_failed_refetch_after_adjustment_keeps_stored_bars(db):
+    fetcher = _Fetcher(HISTORY.loc[:"2024-05-31"])
+    _get(fetcher, db, "20240401", "20240531")
+
+    split = _bars("2024-01-01", "2024-06-28", scale=0.5)   # 분할 감지 후 전체 재조회는 실패
+
+    def tail_then_outage(start, end):
+        fetcher.calls.append((start, end))
+        if start == "20240531":
+            return split.loc[pd.Timestamp(start):pd.Timestamp(end)]
+        raise RuntimeError("KRX down")
+
+    out = daily_bar_store.get_daily_bars("005930", "20240401", "20240628", fetcher=tail_then_outage,
+                                         db_path=db, today=TODAY)
+    pd.testing.assert_frame_equal(out, HISTORY.loc["2024-04-01":"2024-05-31"], check_freq=False)
+
+
+def test_empty_head_is_retried_and_pre_listing_head_is_final(db):
+    listed = _Fetcher(HISTORY.loc["2024-03-04":])          # 2024-03-04 상장
+    _get(listed, db, "20240304", "20240329")
+
+    listed.history = pd.DataFrame()                         # KRX + FDR 모두 빈 응답 (장애)
+    _get(listed, db, "20240201", "20240329")
+    listed.history = HISTORY.loc["2024-03-04":]
+    _get(listed, db, "20240201", "20240329")
+    assert listed.calls[1:] == [("20240201", "20240304")] * 2   # 장애 후 재시도
+
+    _get(listed, db, "20240201", "20240329")               # overlap 봉만 응답 → 상장 전 구간 확정
+    assert len(listed.calls) == 3
+
+
+def test_row_capped_answer_only_covers_returned_bars(db):
+    fetcher = _Fetcher(HISTORY)
+    capped = lambda start, end: fetcher(start, end).iloc[-20:]   # 최근 20봉만 (KIS 스타일 건수 제한)
+
+    _get(capped, db, "20240101", "20240628")
+    out = _get(fetcher, db, "20240101", "20240628")
+
+    assert fetcher.calls[-1] == ("20240101", "20240603")   # 잘린 head 재조회 (첫 저장 봉 overlap)
+    pd.testing.assert_frame_equal(out, HISTORY, check_freq=False)
+
+
+def test_kis_daily_frame_pages_past_the_100_row_cap():
+    from types import SimpleNamespace
+    from cores.archive.data_enricher import KRDataEnricher
+
+    days = pd.bdate_range("2024-01-01", "2024-08-30")
+    requests = []
+
+    class _Trading:
+        def _request(self, api_url, tr_id, params):
+            requests.append((params["fid_input_date_1"], params["fid_input_date_2"]))
+            window = [d for d in days if params["fid_input_date_1"] <= d.strftime("%Y%m%d")
+                      <= params["fid_input_date_2"]][::-1][:100]       # newest first, 100 max
+            items = [{"stck_bsop_date": d.strftime("%Y%m%d"), "stck_clpr": "100"} for d in window]
+            return SimpleNamespace(isOK=lambda: True, getBody=lambda: SimpleNamespace(output2=items))
+
+    enricher = KRDataEnricher.__new__(KRDataEnricher)
+    enricher._get_trading = lambda: _Trading()
+    df = enricher._sync_fetch_daily_frame("005930", "2024-01-02", "2024-08-30")
+
+    assert len(requests) == 2
+    assert df.index[0] == pd.Timestamp("2024-01-02") and len(df) == len(days) - 1
+
+
+def test_adjusted_and_raw_series_are_separate(db):
+    adj = _Fetcher(HISTORY)
+    raw = _Fetcher(HISTORY * 2)
+    _get(adj, db, "20240401", "20240430", adjusted=True)
+    out = _get(raw, db, "20240401", "20240430", adjusted=False)
+    assert len(raw.calls) == 1
+    assert out["Close"].iloc[0] == HISTORY.loc["2024-04-01", "Close"] * 2
+
+
+def test_market_snapshot_backs_latest_closes(db):
+    snap = pd.DataFrame({"Close": [70000.0, 150000.0]}, index=["005930", "000660"])
+    conn = daily_bar_store.get_connection(db)
+    try:
+        daily_bar_store.upsert_market_snapshot(conn, "KR", "20240627", snap)
+    finally:
+        conn.close()
+    closes = daily_bar_store.latest_closes(["005930", "000660", "035720"], TODAY, db_path=db)
+    assert closes == {"005930": 70000.0, "000660": 150000.0}
+
+
+def test_rs_universe_matrix_downloads_each_closed_session_once(db, monkeypatch):
+    import trigger_batch
+
+    sessions = ["20240624", "20240625", "20240626"]
+    calls = []
+
+    def _snapshot(date):
+        calls.append(date)
+        return pd.DataFrame({"Close": [float(date[-2:]), 2 * float(date[-2:])]}, index=["005930", "000660"])
+
+    monkeypatch.setenv("DAILY_BAR_DB_PATH", str(db))
+    monkeypatch.setenv("MARKET_SNAPSHOT_CACHE_DIR", str(db.parent / "snapshots"))
+    monkeypatch.setattr(trigger_batch, "_get_session_dates", lambda trade_date, days: sessions)
+    monkeypatch.setattr(trigger_batch.stock_api, "get_market_ohlcv_by_ticker", staticmethod(_snapshot))
+    monkeypatch.setattr(trigger_batch, "_krx_throttle", lambda: None)
+
+    first = trigger_batch.load_market_close_matrix("20240626", days=3)
+    again = trigger_batch.load_market_close_matrix("20240626", days=3)
+
+    assert calls == sessions  # 마감된 세션은 1회만 다운로드
+    pd.testing.assert_frame_equal(first, again)
+    assert set(first.columns) == {"000660", "005930"}
+    assert first.loc["2024-06-26", "000660"] == 52.0
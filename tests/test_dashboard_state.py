@@ -0,0 +1,110 @@
+"""Tests for examples/dashboard_state (incremental dashboard JSON generation).
+
+SQLite DB and state files live in tmp_path; index fetches are stubs.
+Run with:  python -m pytest tests/test_dashboard_state.py -q
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "examples"))
+
+from dashboard_state import DashboardState, cumulative_realized_profit, table_fingerprint
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "db.sqlite"))
+    conn.execute("CREATE TABLE trading_history (id INTEGER PRIMARY KEY, ticker TEXT, "
+                 "sell_date TEXT, profit_rate REAL)")
+    conn.executemany("INSERT INTO trading_history (ticker, sell_date, profit_rate) VALUES (?, ?, ?)",
+                     [("005930", "2025-10-01 15:00:00", 5.0), ("000660", "2025-10-03", -2.0)])
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+class _Counter:
+    def __init__(self, conn):
+        self.conn = conn
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return [dict(zip(("id", "ticker"), r)) for r in self.conn.execute("SELECT id, ticker FROM trading_history")]
+
+
+def test_section_is_reused_until_its_table_changes(conn, tmp_path):
+    compute = _Counter(conn)
+    for _ in range(2):                           # two cron runs, nothing changed
+        state = DashboardState("kr", tmp_path, enabled=True)
+        first = state.section("trading_history", conn, ["trading_history"], compute)
+        state.save()
+    assert compute.calls == 1 and state.hits == ["trading_history"]
+
+    conn.execute("UPDATE trading_history SET profit_rate = 6.5 WHERE ticker = '005930'")
+    conn.commit()
+    state = DashboardState("kr", tmp_path, enabled=True)
+    assert state.section("trading_history", conn, ["trading_history"], compute) == first
+    assert compute.calls == 2                    # in-place update detected without a timestamp column
+
+
+def test_max_age_and_disabled_force_recompute(conn, tmp_path):
+    now = [1000.0]
+    compute = _Counter(conn)
+    state = DashboardState("kr", tmp_path, enabled=True, max_age_sec=60, clock=lambda: now[0])
+    state.section("history", conn, ["trading_history"], compute)
+    state.save()
+    now[0] += 61
+    DashboardState("kr", tmp_path, enabled=True, max_age_sec=60, clock=lambda: now[0]).section(
+        "history", conn, ["trading_history"], compute)
+    DashboardState("kr", tmp_path, enabled=False).section("history", conn, ["trading_history"], compute)
+    assert compute.calls == 3
+
+
+def test_missing_table_fingerprint_is_none(conn):
+    assert table_fingerprint(conn, "jeoningu_trades") is None
+    assert table_fingerprint(conn, "trading_history")[:2] == [2, 2]
+
+
+def test_index_series_fetches_only_the_tail(tmp_path):
+    days = [f"2025-10-{d:02d}" for d in range(1, 21)]
+    calls = []
+
+    def fetch(since):
+        calls.append(since)
+        return [{"date": d, "close": 1.0} for d in days if since is None or d >= since]
+
+    state = DashboardState("us", tmp_path, enabled=True)
+    assert len(state.series("market_condition", fetch)) == 20
+    state.save()
+
+    days.append("2025-10-21")
+    state = DashboardState("us", tmp_path, enabled=True)
+    series = state.series("market_condition", fetch)
+    assert calls == [None, "2025-10-16"]
+    assert [item["date"] for item in series] == days
+    assert state.series("market_condition", lambda since: []) == series   # failed fetch keeps cache
+
+
+def test_cumulative_profit_matches_per_day_rescan():
+    trades = [{"sell_date": f"2025-10-{d:02d} 10:00:00", "profit_rate": float(d % 5 - 2)}
+              for d in range(1, 29, 3)] + [{"sell_date": None, "profit_rate": 9.0}]
+    market = [{"date": f"2025-{m:02d}-{d:02d}"} for m in (9, 10) for d in range(1, 31)]
+
+    expected = []
+    for item in market:
+        if item["date"] < "2025-09-29":
+            continue
+        total = sum(t["profit_rate"] for t in trades
+                    if t["sell_date"] and t["sell_date"].split(" ")[0] <= item["date"])
+        expected.append({"date": item["date"], "cumulative_realized_profit": total,
+                         "prism_simulator_return": total / 10})
+
+    assert cumulative_realized_profit(trades, market, "2025-09-29") == expected
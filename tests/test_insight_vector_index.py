@@ -0,0 +1,173 @@
+"""Tests for the in-memory insight vector index (cores.archive.vector_index)
+and its use in persistent_insights.search_insights.
+
+Embeddings are synthetic unit vectors — no OpenAI calls.
+Run with:  python -m pytest tests/test_insight_vector_index.py -q
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+
+import numpy as np
+import pytest
+
+from cores.archive import persistent_insights as pi
+from cores.archive import vector_index
+from cores.archive.archive_db import init_db
+from cores.archive.embedding import EMBEDDING_DIM
+
+
+def _vec(seed: int) -> np.ndarray:
+    return np.random.default_rng(seed).standard_normal(EMBEDDING_DIM).astype(np.float32)
+
+
+def _blob(v: np.ndarray) -> bytes:
+    return np.asarray(v, dtype=np.float32).tobytes()
+
+
+def _near(v: np.ndarray, seed: int, noise: float = 0.3) -> np.ndarray:
+    return v + noise * _vec(seed) * (np.linalg.norm(v) / np.sqrt(EMBEDDING_DIM))
+
+
+async def _save(db_path, question, emb):
+    return await pi.save_insight(
+        user_id=1, chat_id=1, question=question, answer="a",
+        key_takeaways=[question], tools_used=[], tickers_mentioned=[],
+        evidence_report_ids=[], model_used="test",
+        embedding=_blob(emb) if emb is not None else None, db_path=db_path,
+    )
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    vector_index.reset_indexes()
+    path = str(tmp_path / "archive.db")
+    asyncio.run(init_db(path))
+    yield path
+    vector_index.reset_indexes()
+
+
+def test_semantic_hit_without_fts_overlap(db_path):
+    topic = _vec(1)
+
+    async def _go():
+        await _save(db_path, "semiconductor export outlook", _vec(2))
+        target = await _save(db_path, "memory chip cycle bottoming", _near(topic, 3))
+        await _save(db_path, "bank dividend policy", _vec(4))
+        return target, await pi.search_insights(
+            "semiconductor", _blob(_near(topic, 5)), limit=2, db_path=db_path,
+        )
+
+    target, results = asyncio.run(_go())
+    ids = [r.id for r in results]
+    assert ids[0] == target                      # no shared token, found by the index
+    assert len(ids) == 2                         # plus the FTS match
+    assert vector_index.loaded_index(db_path).size == 3
+
+
+def test_without_embedding_keeps_fts_order(db_path):
+    async def _go():
+        a = await _save(db_path, "rates rates outlook", _vec(1))
+        b = await _save(db_path, "rates cut", _vec(2))
+        await _save(db_path, "unrelated topic", _vec(3))
+        return {a, b}, await pi.search_insights("rates", None, limit=5, db_path=db_path)
+
+    expected, results = asyncio.run(_go())
+    assert {r.id for r in results} == expected
+    assert vector_index.loaded_index(db_path) is None   # index not touched
+
+
+def test_writes_update_loaded_index_incrementally(db_path):
+    topic = _vec(10)
+
+    async def _go():
+        await _save(db_path, "seed", _vec(11))
+        await pi.search_insights("seed", _blob(topic), db_path=db_path)   # loads index
+        index = vector_index.loaded_index(db_path)
+        new_id = await _save(db_path, "fresh insight", _near(topic, 12))
+        assert index.size == 2                   # added by the save hook, no reload
+        hits = await pi.search_insights("zzz", _blob(topic), db_path=db_path)
+        assert [h.id for h in hits] == [new_id]
+
+        await pi.mark_superseded([new_id], summary_id=99, db_path=db_path)
+        assert await pi.search_insights("zzz", _blob(topic), db_path=db_path) == []
+        kept = await pi.search_insights(
+            "zzz", _blob(topic), exclude_superseded=False, db_path=db_path,
+        )
+        assert [h.id for h in kept] == [new_id]
+
+    asyncio.run(_go())
+
+
+def test_sync_picks_up_other_process_writes(db_path):
+    topic = _vec(20)
+
+    async def _go():
+        first = await _save(db_path, "first", _near(topic, 21))
+        index = vector_index.get_index(db_path)
+        await index.sync()
+        assert [i for i, _ in index.search(topic, 5)] == [first]
+
+        # another process: new row + weekly compression marks `first` superseded
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "INSERT INTO persistent_insights (question, answer, key_takeaways, embedding) "
+            "VALUES ('other', 'a', '[]', ?)", (_blob(_near(topic, 22)),))
+        conn.execute("UPDATE persistent_insights SET superseded_by=7 WHERE id=?", (first,))
+        conn.commit()
+        conn.close()
+
+        await index.sync()                       # new rows every time
+        assert index.size == 2
+        assert first in [i for i, _ in index.search(topic, 5)]
+        await index.sync(force_reconcile=True)   # superseded state on the reconcile cadence
+        assert first not in [i for i, _ in index.search(topic, 5)]
+
+    asyncio.run(_go())
+
+
+def test_reconcile_picks_up_embeddings_backfilled_below_max_id(db_path):
+    topic = _vec(30)
+
+    async def _go():
+        pending = await _save(db_path, "pending", None)          # embedding failed at write time
+        latest = await _save(db_path, "latest", _near(topic, 31))
+        index = vector_index.get_index(db_path)
+        await index.sync()
+        assert index.size == 1 and index.max_id == latest
+
+        # another process (embedding backfill) fills the NULL embedding of an older id
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE persistent_insights SET embedding=? WHERE id=?",
+                     (_blob(_near(topic, 32)), pending))
+        conn.commit()
+        conn.close()
+
+        await index.sync()                       # id <= max_id: not seen by the incremental scan
+        assert index.size == 1
+        await index.sync(force_reconcile=True)
+        assert index.size == 2
+        assert sorted(i for i, _ in index.search(topic, 5)) == sorted([pending, latest])
+
+    asyncio.run(_go())
+
+
+def test_search_matches_bruteforce_cosine():
+    index = vector_index.InsightVectorIndex(":memory:")
+    rng = np.random.default_rng(0)
+    assert index.add(1, _blob(np.ones(8))) is False   # wrong dim — skipped
+    vecs = rng.standard_normal((300, EMBEDDING_DIM)).astype(np.float32)
+    for i, v in enumerate(vecs, start=1):
+        assert index.add(i, _blob(v))
+    index.deactivate([3, 4])
+    q = rng.standard_normal(EMBEDDING_DIM).astype(np.float32)
+
+    unit = vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+    sims = unit @ (q / np.linalg.norm(q))
+    sims[[2, 3]] = -np.inf
+    expected = (np.argsort(-sims)[:10] + 1).tolist()
+    got = index.search(q, 10)
+    assert [i for i, _ in got] == expected
+    assert [s for _, s in got] == pytest.approx(sorted(sims, reverse=True)[:10], abs=1e-5)
@@ -378,5 +378,56 @@ class TestReplay:
         assert out[-1][2] == 4
 
 
+# --------------------------------------------------------------------------- #
+# snapshot() / from_snapshot() — checkpointed replay == full replay           #
+# --------------------------------------------------------------------------- #
+def _random_walk(n: int, seed: int) -> List[DailyBar]:
+    """Volatile synthetic index: corrections, rally attempts, FTDs, missing volume."""
+    import random
+    from datetime import date, timedelta
+
+    rng = random.Random(seed)
+    close, vol = 100.0, 1000.0
+    out = []
+    for i in range(n):
+        close *= 1 + rng.gauss(0.0, 0.02)
+        vol = max(1.0, vol * (1 + rng.gauss(0.0, 0.25)))
+        out.append(DailyBar(date=(date(2024, 1, 1) + timedelta(days=i)).isoformat(),
+                            close=round(close, 4),
+                            volume=None if rng.random() < 0.05 else round(vol, 1)))
+    return out
+
+
+class TestSnapshot:
+    @pytest.mark.parametrize("seed", [1, 7, 42])
+    def test_resume_at_every_split_matches_full_replay(self, seed):
+        import json
+
+        from cores.regime_policy import _sessions_since_correction_exit
+
+        bars = _random_walk(220, seed)
+        full = MarketPulse()
+        expected = full.replay(bars)
+        states = [row[1] for row in expected]
+        assert CORRECTION in states and UPTREND in states   # the walk exercises exits
+
+        for split in range(1, len(bars)):
+            head = MarketPulse()
+            head.replay(bars[:split])
+            snap = json.loads(json.dumps(head.snapshot()))   # survives a JSON round trip
+            assert len(snap["closes"]) <= 26
+            resumed = MarketPulse.from_snapshot(snap)
+            assert resumed.replay(bars[split:]) == expected[split:], split
+            assert resumed.bars_seen == len(bars)
+            assert (resumed.sessions_since_correction_exit
+                    == _sessions_since_correction_exit(states))
+
+    def test_unknown_version_rejected(self):
+        snap = MarketPulse().snapshot()
+        snap["version"] = 999
+        with pytest.raises(ValueError):
+            MarketPulse.from_snapshot(snap)
+
+
 if __name__ == "__main__":  # pragma: no cover
     raise SystemExit(pytest.main([__file__, "-q"]))
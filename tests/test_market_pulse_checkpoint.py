@@ -0,0 +1,94 @@
+"""Tests for regime_policy MarketPulse checkpoints (resume instead of a 400-day replay).
+
+The index fetch is a stub over a synthetic bar series; checkpoints go to tmp_path.
+Run with:  python -m pytest tests/test_market_pulse_checkpoint.py -q
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import cores.regime_policy as regime_policy
+from cores.market_pulse import DailyBar, MarketPulse
+
+
+def _series(n: int, start: date = date(2025, 1, 1)):
+    bars, close = [], 100.0
+    for i in range(n):
+        close *= 0.985 if (i // 15) % 3 == 1 else 1.008     # falls every third 15-bar leg
+        bars.append(DailyBar((start + timedelta(days=i)).isoformat(), round(close, 4), 1000.0 + i % 7))
+    return bars
+
+
+class _Index:
+    """Fetch stub: bars up to and including ``today``, last ``days`` calendar days."""
+
+    def __init__(self, bars):
+        self.bars = bars
+        self.today = bars[-1].date
+        self.calls = []
+
+    def __call__(self, DailyBar, days=None):
+        self.calls.append(days)
+        end = date.fromisoformat(self.today)
+        start = end - timedelta(days=days if days is not None else 400)
+        return [b for b in self.bars if start.isoformat() <= b.date <= self.today]
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    stub = _Index(_series(300))
+    monkeypatch.setenv("MARKET_PULSE_CHECKPOINT_DIR", str(tmp_path))
+    monkeypatch.delenv("MARKET_PULSE_CHECKPOINT", raising=False)
+    monkeypatch.setattr(regime_policy, "_fetch_kr_bars", stub)
+    monkeypatch.setattr(regime_policy, "_market_today", lambda m: stub.today)
+    regime_policy._reset_state_cache()
+    yield stub
+    regime_policy._reset_state_cache()
+
+
+def _full_state(bars, today):
+    return MarketPulse().replay([b for b in bars if b.date <= today])[-1][1]
+
+
+def test_next_session_resumes_from_checkpoint(index, tmp_path):
+    index.today = index.bars[250].date
+    first = regime_policy.get_market_pulse_state("kr", use_cache=False)
+    assert index.calls == [None]                                 # no checkpoint: full window
+    # today's in-progress bar is never checkpointed
+    assert sorted(p.name for p in tmp_path.iterdir()) == [f"pulse_kr_{index.bars[249].date.replace('-', '')}.json"]
+
+    for i in range(251, 260):
+        index.today = index.bars[i].date
+        state = regime_policy.get_market_pulse_state("kr", use_cache=False)
+        assert state == _full_state(index.bars, index.today), index.today
+
+    assert index.calls[1:] == [3] * 9          # checkpoint session (overlap) .. today only
+    assert first == _full_state(index.bars, index.bars[250].date)
+
+
+def test_revised_overlap_bar_forces_full_replay(index):
+    index.today = index.bars[250].date
+    regime_policy.get_market_pulse_state("kr", use_cache=False)
+
+    revised = index.bars[249]
+    index.bars[249] = DailyBar(revised.date, revised.close * 1.01, revised.volume)
+    index.today = index.bars[251].date
+    state = regime_policy.get_market_pulse_state("kr", use_cache=False)
+    assert index.calls == [None, 3, None]
+    assert state == _full_state(index.bars, index.today)
+
+
+def test_pilot_and_state_share_one_fetch(index, monkeypatch):
+    monkeypatch.setenv("PULSE_PILOT_REEXPOSURE", "true")
+    monkeypatch.setenv("MARKET_PULSE_CHECKPOINT", "false")
+    regime_policy.get_market_pulse_state("kr")
+    regime_policy.pilot_reexposure_active("kr")
+    assert index.calls == [None]
+    assert not list(Path(regime_policy._checkpoint_dir()).iterdir())   # disabled: nothing written
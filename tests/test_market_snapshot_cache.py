@@ -0,0 +1,137 @@
+"""Tests for cores.market_snapshot_cache (date-keyed whole-market frame cache).
+
+Fetchers are stubs; the cache directory and the daily-bar store live in tmp_path — no network.
+Run with:  python -m pytest tests/test_market_snapshot_cache.py -q
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cores import market_snapshot_cache as msc
+
+KST = ZoneInfo("Asia/Seoul")
+
+
+@pytest.fixture(autouse=True)
+def _daily_bar_db(tmp_path, monkeypatch):
+    monkeypatch.setenv("DAILY_BAR_DB_PATH", str(tmp_path / "daily_bars.db"))
+
+
+def _epoch(day: str, hhmm: str) -> float:
+    return datetime.strptime(day + hhmm, "%Y%m%d%H%M").replace(tzinfo=KST).timestamp()
+
+
+class _Fetcher:
+    def __init__(self, close: float = 70000.0):
+        self.close = close
+        self.calls = 0
+
+    def __call__(self) -> pd.DataFrame:
+        self.calls += 1
+        return pd.DataFrame({"Close": [self.close, 150000.0], "Volume": [10.0, 20.0]},
+                            index=["005930", "000660"])
+
+
+def test_closed_session_is_downloaded_once(tmp_path):
+    cache = tmp_path / "snapshots"
+    fetch = _Fetcher()
+    first = msc.get_frame("cap_ALL", "20240626", fetch, cache_dir=cache)
+    again = msc.get_frame("cap_ALL", "2024-06-26", fetch, cache_dir=cache,
+                          now=_epoch("20240701", "0900"))
+    assert fetch.calls == 1
+    pd.testing.assert_frame_equal(first, again)
+    assert len(list(cache.iterdir())) == 1         # one file per (kind, date)
+
+
+def test_final_ohlcv_frame_lives_in_daily_bar_store(tmp_path):
+    from cores import daily_bar_store
+
+    cache = tmp_path / "snapshots"
+    fetch = _Fetcher()
+    intraday = _epoch("20240626", "1000")
+    msc.get_frame("ohlcv", "20240626", fetch, cache_dir=cache, now=intraday)
+    path = msc.snapshot_path("ohlcv", "20240626", cache)
+    assert path.exists()                                             # intraday frame: file + TTL
+    os.utime(path, (intraday, intraday))
+
+    final = msc.get_frame("ohlcv", "20240626", fetch, cache_dir=cache, now=_epoch("20240626", "1700"))
+    again = msc.get_frame("ohlcv", "20240626", fetch, cache_dir=cache)
+    assert fetch.calls == 2
+    assert not path.exists()                                         # superseded by the store copy
+    assert again.index.name == "Ticker" and again.loc["005930", "Close"] == final.loc["005930", "Close"]
+
+    conn = daily_bar_store.get_connection()
+    try:
+        assert daily_bar_store.snapshot_dates(conn, "KR", adjusted=False) == {"20240626"}
+    finally:
+        conn.close()
+
+
+def test_intraday_snapshot_expires_after_ttl(tmp_path, monkeypatch):
+    monkeypatch.setenv("MARKET_SNAPSHOT_TTL_SEC", "900")
+    fetch = _Fetcher(close=70000.0)
+    written = _epoch("20240626", "1000")             # morning run, market open
+    msc.get_frame("ohlcv", "20240626", fetch, cache_dir=tmp_path, now=written)
+    os.utime(msc.snapshot_path("ohlcv", "20240626", tmp_path), (written, written))
+
+    fetch.close = 71000.0
+    within = msc.get_frame("ohlcv", "20240626", fetch, cache_dir=tmp_path, now=written + 600)
+    assert fetch.calls == 1 and within.loc["005930", "Close"] == 70000.0
+
+    later = msc.get_frame("ohlcv", "20240626", fetch, cache_dir=tmp_path, now=written + 901)
+    assert fetch.calls == 2 and later.loc["005930", "Close"] == 71000.0
+
+
+def test_failed_or_empty_fetch_serves_stale_and_empty_is_not_cached(tmp_path):
+    written = _epoch("20240626", "1000")
+    msc.get_frame("ohlcv", "20240626", _Fetcher(), cache_dir=tmp_path, now=written)
+    path = msc.snapshot_path("ohlcv", "20240626", tmp_path)
+    os.utime(path, (written, written))
+
+    def down():
+        raise TimeoutError("KRX read timeout")
+
+    stale = msc.get_frame("ohlcv", "20240626", down, cache_dir=tmp_path, now=written + 3600)
+    assert stale.loc["005930", "Close"] == 70000.0
+
+    empty = msc.get_frame("ohlcv", "20240627", lambda: pd.DataFrame(), cache_dir=tmp_path)
+    assert empty.empty and not msc.snapshot_path("ohlcv", "20240627", tmp_path).exists()
+    with pytest.raises(TimeoutError):
+        msc.get_frame("ohlcv", "20240628", down, cache_dir=tmp_path)
+
+
+def test_trigger_batch_snapshots_go_through_cache(tmp_path, monkeypatch):
+    import trigger_batch
+
+    calls = []
+
+    def _snapshot(date):
+        calls.append(("ohlcv", date))
+        return pd.DataFrame({"Close": [1.0]}, index=["005930"])
+
+    def _cap(date, market="ALL"):
+        calls.append(("cap", date))
+        return pd.DataFrame({"MarketCap": [1e12]}, index=["005930"])
+
+    monkeypatch.setenv("MARKET_SNAPSHOT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(trigger_batch.stock_api, "get_market_ohlcv_by_ticker", staticmethod(_snapshot))
+    monkeypatch.setattr(trigger_batch.stock_api, "get_market_cap_by_ticker", staticmethod(_cap))
+    monkeypatch.setattr(trigger_batch.stock_api, "get_nearest_business_day_in_a_week",
+                        staticmethod(lambda d, prev=True: "20240625"))
+
+    for _ in range(2):                                # morning run, then afternoon run
+        trigger_batch.get_snapshot("20240626")
+        trigger_batch.get_previous_snapshot("20240626")
+        trigger_batch.get_market_cap_df("20240626")
+
+    assert calls == [("ohlcv", "20240626"), ("ohlcv", "20240625"), ("cap", "20240626")]
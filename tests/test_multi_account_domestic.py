@@ -1,3 +1,4 @@
+import asyncio
 import atexit
 import json
 import sqlite3
@@ -177,6 +178,42 @@ async def test_multi_account_trading_context_fans_out_orders_but_reads_primary(m
         assert trader.get_holding_quantity("005930") == 7
 
 
+@pytest.mark.asyncio
+async def test_multi_account_orders_run_concurrently_with_bound(monkeypatch):
+    state = {"in_flight": 0, "peak": 0}
+
+    class SlowTrader(FakeDomesticTrader):
+        async def async_sell_stock(self, stock_code, timeout=30.0, limit_price=None, quantity=None):
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.1)
+            state["in_flight"] -= 1
+            if self.account_name == "kr-broken":
+                raise RuntimeError("token expired")
+            return {"success": True, "stock_code": stock_code, "quantity": 1,
+                    "estimated_amount": 50000, "message": "sold"}
+
+    accounts = [
+        {"name": name, "account_key": f"vps:{name}:01", "product": "01"}
+        for name in ("kr-a", "kr-broken", "kr-c", "kr-d")
+    ]
+    monkeypatch.setattr(dst, "DomesticStockTrading", SlowTrader)
+    monkeypatch.setattr(dst.ka, "get_configured_accounts", lambda **kwargs: accounts)
+    monkeypatch.setattr(dst.ka, "resolve_account", lambda **kwargs: accounts[0])
+
+    trader = dst.MultiAccountDomesticStockTrading(mode="demo", order_concurrency=2)
+    started = time.monotonic()
+    result = await trader.async_sell_stock("005930")
+
+    assert time.monotonic() - started < 0.35          # 2 waves of 0.1s, not 4 in a row
+    assert state["peak"] == 2
+    assert [r["account_name"] for r in result["account_results"]] == ["kr-a", "kr-broken", "kr-c", "kr-d"]
+    assert result["partial_success"] is True
+    assert result["failed_accounts"] == ["kr-broken"]
+    assert result["quantity"] == 3 and result["total_amount"] == 150000
+    assert "token expired" in result["message"]
+
+
 def test_domestic_request_serializes_activation_and_fetch(monkeypatch):
     order = []
     barrier = threading.Barrier(2)
@@ -184,6 +221,9 @@ def test_domestic_request_serializes_activation_and_fetch(monkeypatch):
     results_lock = threading.Lock()
 
     trader = dst.DomesticStockTrading.__new__(dst.DomesticStockTrading)
+    trader.trenv = SimpleNamespace(my_acct="12345678", my_prod="01")
+    trader.env = "vps"
+    monkeypatch.setattr(dst.ka, "acquire_transport_token", lambda account, paper: 0.0)
 
     def fake_activate():
         order.append(f"activate-{threading.current_thread().name}")
@@ -231,6 +271,81 @@ def test_domestic_request_serializes_activation_and_fetch(monkeypatch):
     ]
 
 
+def test_throttled_account_does_not_hold_the_env_lock(monkeypatch):
+    kis_transport = dst.ka.kis_transport   # the module kis_auth pulls its transport from
+
+    transport = kis_transport.KISTransport(paper_tps=2)
+    monkeypatch.setattr(transport.session, "request",
+                        lambda method, url, **kwargs: SimpleNamespace(status_code=200, text="{}"))
+    kis_transport.reset_transport(transport)
+    active = {}
+
+    def make_trader(acct):
+        trader = dst.DomesticStockTrading.__new__(dst.DomesticStockTrading)
+        trader.trenv = SimpleNamespace(my_acct=acct, my_prod="01")
+        trader.env = "vps"
+        trader._activate_account = lambda: active.update(account=f"{acct}-01")
+        return trader
+
+    def fake_fetch(api_url, tr_id, hashkey, params, **kwargs):
+        return transport.get(f"https://kis{api_url}", account=active["account"], paper=True)
+
+    monkeypatch.setattr(dst.ka, "_url_fetch", fake_fetch)
+    transport.acquire("11111111-01", paper=True)   # account A has just spent its token (2/s → 0.5s refill)
+    elapsed = {}
+
+    def worker(trader, name):
+        started = time.monotonic()
+        trader._request("/uapi/test", "TEST0001", {})
+        elapsed[name] = time.monotonic() - started
+
+    try:
+        throttled = threading.Thread(target=worker, args=(make_trader("11111111"), "A"))
+        throttled.start()
+        time.sleep(0.05)
+        worker(make_trader("22222222"), "B")
+        throttled.join()
+    finally:
+        kis_transport.reset_transport()
+
+    assert elapsed["A"] >= 0.4
+    assert elapsed["B"] < 0.2     # not queued behind A's bucket wait
+    assert transport.metrics()["vps:11111111-01"]["throttled"] == 1
+
+
+def test_failed_activation_discards_its_prepaid_token(monkeypatch):
+    kis_transport = dst.ka.kis_transport
+
+    transport = kis_transport.KISTransport(paper_tps=2)
+    monkeypatch.setattr(transport.session, "request",
+                        lambda method, url, **kwargs: SimpleNamespace(status_code=200, text="{}"))
+    kis_transport.reset_transport(transport)
+    failures = [RuntimeError("token expired")]
+
+    def fake_activate():
+        if failures:
+            raise failures.pop()
+
+    trader = dst.DomesticStockTrading.__new__(dst.DomesticStockTrading)
+    trader.trenv = SimpleNamespace(my_acct="12345678", my_prod="01")
+    trader.env = "vps"
+    trader._activate_account = fake_activate
+    monkeypatch.setattr(dst.ka, "_url_fetch", lambda api_url, tr_id, hashkey, params, **kwargs:
+                        transport.get(f"https://kis{api_url}", account="12345678-01", paper=True))
+
+    try:
+        with pytest.raises(RuntimeError, match="token expired"):
+            trader._request("/uapi/test", "TEST0001", {})   # spends the bucket's token, sends nothing
+        started = time.monotonic()
+        trader._request("/uapi/test", "TEST0001", {})
+        elapsed = time.monotonic() - started
+    finally:
+        kis_transport.reset_transport()
+
+    assert elapsed >= 0.4     # waited for a fresh token (2/s) instead of reusing the stale one
+    assert transport.metrics()["vps:12345678-01"]["throttled"] == 1
+
+
 def test_domestic_trader_uses_account_buy_amount_override(monkeypatch):
     account = {
         "name": "kr-override",
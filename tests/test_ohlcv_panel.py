@@ -0,0 +1,119 @@
+"""
+tests/test_ohlcv_panel.py — trigger_batch OHLCV 패널 (1 fetch/ticker) 테스트
+
+Covers:
+  (1) 패널 슬라이스 == 단일 종목 fetch 의 tail(days) (스키마/값 동일).
+  (2) 종목당 fetch 1회: screening(260d) / agent-fit(10d) / MA20(20d) 가 같은 패널 공유.
+  (3) 패널 결과 == 기존 per-ticker fetch 결과 (screening / agent-fit / MA20).
+  (4) 데이터 없는 종목: 빈 df, 재시도 없음.
+
+네트워크 의존 없음 — get_multi_day_ohlcv 를 스텁.
+"""
+
+import sys
+import math
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from trigger_batch import (
+    OhlcvPanel,
+    RS_RATING_LOOKBACK_DAYS,
+    calculate_agent_fit_metrics,
+    calculate_screening_signals,
+    _compute_ma20,
+)
+
+
+def _make_ohlcv(n: int, start_close: float, end_close: float, offset: int = 0) -> pd.DataFrame:
+    idx = pd.date_range("2023-01-02", periods=n + offset, freq="B")[offset:]
+    closes = np.linspace(start_close, end_close, n)
+    return pd.DataFrame(
+        {"Open": closes * 0.995, "High": closes * 1.02, "Low": closes * 0.98,
+         "Close": closes, "Volume": [1_000_000.0] * n, "Amount": closes * 1e6},
+        index=idx,
+    )
+
+
+DATA = {
+    "AAA": _make_ohlcv(300, 100.0, 150.0),
+    "BBB": _make_ohlcv(280, 50.0, 40.0, offset=20),  # 다른 날짜 구간 (outer join 검증)
+    "CCC": _make_ohlcv(30, 10.0, 12.0, offset=290),  # 상장 직후 — 짧은 히스토리
+}
+
+
+class _Stub:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, ticker, end_date, days=10):
+        self.calls.append((ticker, days))
+        df = DATA.get(ticker)
+        return pd.DataFrame() if df is None else df.tail(days)
+
+
+def test_slice_matches_single_ticker_fetch():
+    stub = _Stub()
+    with patch("trigger_batch.get_multi_day_ohlcv", side_effect=stub):
+        panel = OhlcvPanel("20240101")
+        panel.load(["AAA", "BBB", "CCC"])
+        for ticker in DATA:
+            for days in (10, 20, 60, RS_RATING_LOOKBACK_DAYS):
+                got = panel.get(ticker, days)
+                expected = DATA[ticker].tail(RS_RATING_LOOKBACK_DAYS).tail(days)
+                pd.testing.assert_frame_equal(got, expected, check_freq=False)
+
+
+def test_one_fetch_per_ticker_across_consumers():
+    stub = _Stub()
+    with patch("trigger_batch.get_multi_day_ohlcv", side_effect=stub):
+        panel = OhlcvPanel("20240101")
+        panel.load(["AAA", "BBB"])
+        for ticker in ("AAA", "BBB"):
+            calculate_screening_signals(ticker, 120.0, "20240101", ohlcv_panel=panel)
+            calculate_agent_fit_metrics(ticker, 120.0, "20240101", 10, ohlcv_panel=panel)
+            _compute_ma20(ticker, "20240101", ohlcv_panel=panel)
+    assert stub.calls == [("AAA", RS_RATING_LOOKBACK_DAYS), ("BBB", RS_RATING_LOOKBACK_DAYS)]
+
+
+def test_panel_results_match_per_ticker_fetch():
+    for ticker, price in (("AAA", 151.0), ("BBB", 39.0), ("CCC", 12.5)):
+        with patch("trigger_batch.get_multi_day_ohlcv", side_effect=_Stub()):
+            old_sig = calculate_screening_signals(ticker, price, "20240101")
+            old_fit = calculate_agent_fit_metrics(ticker, price, "20240101", 10)
+            old_ma20 = _compute_ma20(ticker, "20240101")
+            panel = OhlcvPanel("20240101")
+            new_sig = calculate_screening_signals(ticker, price, "20240101", ohlcv_panel=panel)
+            new_fit = calculate_agent_fit_metrics(ticker, price, "20240101", 10, ohlcv_panel=panel)
+            new_ma20 = _compute_ma20(ticker, "20240101", ohlcv_panel=panel)
+
+        for key in ("return_nd", "extension_in_adr", "extension_score"):
+            assert math.isclose(old_sig[key], new_sig[key], abs_tol=1e-9), (ticker, key)
+        assert old_sig["oneil_raw"] == new_sig["oneil_raw"]
+        assert old_fit == new_fit
+        assert math.isclose(old_ma20, new_ma20, abs_tol=1e-9)
+
+
+def test_missing_ticker_is_empty_and_not_refetched():
+    stub = _Stub()
+    with patch("trigger_batch.get_multi_day_ohlcv", side_effect=stub):
+        panel = OhlcvPanel("20240101")
+        panel.load(["NONE"])
+        assert panel.get("NONE", 20).empty
+        assert _compute_ma20("NONE", "20240101", ohlcv_panel=panel) == 0.0
+    assert stub.calls == [("NONE", RS_RATING_LOOKBACK_DAYS)]
+
+
+def test_uncovered_window_falls_back_to_direct_fetch():
+    stub = _Stub()
+    with patch("trigger_batch.get_multi_day_ohlcv", side_effect=stub):
+        panel = OhlcvPanel("20240101", days=20)
+        _compute_ma20("AAA", "20240102", ohlcv_panel=panel)  # 다른 기준일
+        calculate_screening_signals("AAA", 120.0, "20240101", ohlcv_panel=panel)  # 260d > 20d
+    assert stub.calls == [("AAA", 20), ("AAA", RS_RATING_LOOKBACK_DAYS)]
+    assert panel.frame.empty
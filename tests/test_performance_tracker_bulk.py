@@ -0,0 +1,101 @@
+"""Tests for performance_tracker_batch bulk price lookup + single-transaction updates.
+
+KRX calls are replaced via monkeypatch — no network.
+Run with:  python -m pytest tests/test_performance_tracker_bulk.py -q
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import performance_tracker_batch as ptb
+from tracking.db_schema import TABLE_ANALYSIS_PERFORMANCE_TRACKER
+
+
+def _days_ago(n: int) -> str:
+    return (datetime.now() - timedelta(days=n)).strftime("%Y-%m-%d")
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "tracking.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute(TABLE_ANALYSIS_PERFORMANCE_TRACKER)
+    rows = [
+        ("005930", "Samsung", "volume", _days_ago(8), 70000.0, 1, "pending"),
+        ("005930", "Samsung", "gap", _days_ago(31), 60000.0, 0, "in_progress"),
+        ("000660", "SK hynix", "volume", _days_ago(15), 200000.0, 0, "pending"),
+        ("123456", "Halted", "volume", _days_ago(9), 1000.0, 0, "pending"),
+        ("035420", "NAVER", "volume", _days_ago(2), 200000.0, 0, "pending"),   # not due
+    ]
+    conn.executemany(
+        "INSERT INTO analysis_performance_tracker "
+        "(ticker, company_name, trigger_type, analyzed_date, analyzed_price, was_traded, tracking_status) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)", rows,
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def krx(monkeypatch, tmp_path):
+    calls = {"snapshot": 0, "single": []}
+    frame = pd.DataFrame({"Close": [77000.0, 230000.0]}, index=["005930", "000660"])
+
+    def snapshot(date):
+        calls["snapshot"] += 1
+        return frame
+
+    def single(start, end, ticker):
+        calls["single"].append(ticker)
+        return pd.DataFrame({"Close": [900.0]}) if ticker == "123456" else pd.DataFrame()
+
+    monkeypatch.setenv("MARKET_SNAPSHOT_CACHE_DIR", str(tmp_path / "snapshots"))
+    monkeypatch.setattr(ptb, "KRX_AVAILABLE", True)
+    monkeypatch.setattr(ptb, "get_market_ohlcv_by_ticker", snapshot, raising=False)
+    monkeypatch.setattr(ptb, "get_market_ohlcv_by_date", single, raising=False)
+    monkeypatch.setattr(ptb, "get_nearest_business_day_in_a_week", lambda d, prev=True: d, raising=False)
+    monkeypatch.setattr(ptb.daily_bar_store, "is_enabled", lambda: False)
+    return calls
+
+
+def test_one_snapshot_resolves_all_targets(db_path, krx):
+    stats = ptb.PerformanceTrackerBatch(db_path=db_path).run()
+
+    assert krx["snapshot"] == 1
+    assert krx["single"] == ["123456"]          # only the ticker absent from the snapshot
+    assert (stats["total"], stats["updated"], stats["skipped"], stats["errors"]) == (5, 4, 1, 0)
+    assert stats["completed"] == 1
+
+    conn = sqlite3.connect(db_path)
+    rows = {r[0]: r[1:] for r in conn.execute(
+        "SELECT id, tracked_7d_price, tracked_14d_price, tracked_30d_price, tracking_status "
+        "FROM analysis_performance_tracker"
+    )}
+    conn.close()
+    assert rows[1] == (77000.0, None, None, "in_progress")
+    assert rows[2] == (77000.0, 77000.0, 77000.0, "completed")
+    assert rows[3] == (230000.0, 230000.0, None, "in_progress")
+    assert rows[4] == (900.0, None, None, "in_progress")
+    assert rows[5] == (None, None, None, "pending")
+
+
+def test_bulk_update_is_all_or_nothing(db_path):
+    batch = ptb.PerformanceTrackerBatch(db_path=db_path)
+    ok = batch.apply_updates_bulk([
+        (1, {"tracked_7d_price": 1.0, "tracking_status": "in_progress"}),
+        (2, {"no_such_column": 1}),
+    ])
+    assert ok is False
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT tracked_7d_price FROM analysis_performance_tracker WHERE id=1").fetchone() == (None,)
+    conn.close()
@@ -12,6 +12,8 @@ import sys
 import asyncio
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Every case stubs the same trade date; fetch counts need the snapshot cache bypassed
+os.environ["MARKET_SNAPSHOT_CACHE_ENABLED"] = "false"
 
 passed = 0
 failed = 0
@@ -0,0 +1,89 @@
+"""Tests for price_snapshot.PriceSnapshot (per-cycle holdings price memo).
+
+Run with:  python -m pytest tests/test_price_snapshot.py -q
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from price_snapshot import PriceSnapshot, trader_quote_fetch
+
+
+class SlowSource:
+    def __init__(self, prices, delay=0.05):
+        self.prices = prices
+        self.delay = delay
+        self.calls = []
+
+    async def fetch(self, ticker):
+        self.calls.append(ticker)
+        await asyncio.sleep(self.delay)
+        if ticker == "ERR":
+            raise TimeoutError("quote timeout")
+        return self.prices.get(ticker, 0)
+
+
+def test_distinct_tickers_fetched_once_and_concurrently():
+    source = SlowSource({"005930": 72000, "000660": 180000, "035420": 210000})
+    holdings = ["005930", "005930", "000660", "005930", "035420", "ERR"]   # pyramided rows
+
+    async def _go():
+        snap = PriceSnapshot(source.fetch, concurrency=4)
+        started = time.monotonic()
+        await snap.prefetch(holdings)
+        elapsed = time.monotonic() - started
+        return snap, elapsed, [await snap.get(t) for t in holdings]
+
+    snap, elapsed, prices = asyncio.run(_go())
+    assert sorted(source.calls) == ["000660", "005930", "035420", "ERR"]
+    assert elapsed < 0.15                                   # one wave, not 4 x 0.05s
+    assert prices == [72000, 72000, 180000, 72000, 210000, 0.0]
+    assert snap.fetches == 4
+
+
+def test_bulk_source_first_then_per_ticker_for_uncovered():
+    source = SlowSource({"NEW1": 5000}, delay=0)
+    bulk_calls = []
+
+    async def bulk(tickers):
+        bulk_calls.append(list(tickers))
+        return {"005930": 72000, "DELISTED": 0}       # answered, even if 0
+
+    async def _go():
+        snap = PriceSnapshot(source.fetch, bulk=bulk)
+        return await snap.prefetch(["005930", "DELISTED", "NEW1", "005930"])
+
+    prices = asyncio.run(_go())
+    assert bulk_calls == [["005930", "DELISTED", "NEW1"]]
+    assert source.calls == ["NEW1"]
+    assert prices == {"005930": 72000, "DELISTED": 0.0, "NEW1": 5000}
+
+
+def test_concurrent_gets_share_one_fetch_and_bulk_failure_falls_back():
+    source = SlowSource({"AAPL": 190.5})
+
+    async def broken_bulk(tickers):
+        raise RuntimeError("KRX down")
+
+    async def _go():
+        snap = PriceSnapshot(source.fetch, bulk=broken_bulk)
+        together = await asyncio.gather(snap.get("AAPL"), snap.get("AAPL"), snap.get("AAPL"))
+        await snap.prefetch(["AAPL"])
+        return together
+
+    assert asyncio.run(_go()) == [190.5, 190.5, 190.5]
+    assert source.calls == ["AAPL"]
+
+
+def test_trader_quote_fetch_reads_current_price():
+    class Trader:
+        def get_current_price(self, ticker):
+            return {"stock_code": ticker, "current_price": "70100"}
+
+    assert asyncio.run(trader_quote_fetch(Trader())("005930")) == 70100.0
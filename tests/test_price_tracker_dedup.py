@@ -0,0 +1,147 @@
+"""Tests for cores.archive.price_tracker ticker-grouped refresh.
+
+Daily closes are faked via monkeypatch — no pykrx / yfinance calls.
+Run with:  python -m pytest tests/test_price_tracker_dedup.py -q
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+
+from cores.archive import price_tracker
+from cores.archive.archive_db import init_db, insert_report, upsert_enrichment
+
+
+def _day(offset: int) -> str:
+    return (date.today() - timedelta(days=offset)).strftime("%Y-%m-%d")
+
+
+_ENRICHMENT_NULLS = {
+    "index_at_analysis": None, "index_change_20d": None, "market_phase": None,
+    "return_7d": None, "return_14d": None, "return_30d": None,
+    "return_60d": None, "return_90d": None,
+    "stop_loss_price": None, "stop_loss_triggered": None, "stop_loss_date": None,
+    "post_stop_30d": None, "post_stop_60d": None, "stop_was_correct": None,
+    "target_1_price": None, "target_1_hit": None, "days_to_target_1": None,
+    "data_source": "test",
+}
+
+
+async def _add_report(db_path, ticker, report_date, price, mode="morning"):
+    report_id = await insert_report(
+        ticker=ticker, company_name=ticker, report_date=report_date, mode=mode,
+        model="test", market="kr", file_path=f"{ticker}_{report_date}_{mode}.md",
+        content=f"{ticker} {report_date} {mode}", db_path=db_path,
+    )
+    await upsert_enrichment(report_id, {
+        **_ENRICHMENT_NULLS, "ticker": ticker, "market": "kr",
+        "analysis_date": report_date, "price_at_analysis": price,
+    }, db_path=db_path)
+    return report_id
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "archive.db")
+    asyncio.run(init_db(path))
+    return path
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    calls = []
+    closes = {_day(10 - i): 100.0 + i for i in range(11)}   # 100 … 110, ending today
+
+    def _fake(ticker, start_date, end_date):
+        calls.append((ticker, start_date))
+        return {d: p for d, p in closes.items() if d >= start_date}
+
+    monkeypatch.setattr(price_tracker, "_fetch_kr_daily", _fake)
+    return calls
+
+
+def test_one_fetch_per_ticker_covers_every_report(db_path, fetches):
+    async def _go():
+        ids = {
+            "a_old": await _add_report(db_path, "005930", _day(10), 100.0),
+            "a_mid": await _add_report(db_path, "005930", _day(5), 105.0),
+            "a_new": await _add_report(db_path, "005930", _day(5), 105.0, mode="afternoon"),
+            "b": await _add_report(db_path, "000660", _day(3), 50.0),
+        }
+        summary = await price_tracker.PriceTracker(db_path=db_path).run(concurrency=2)
+        return ids, summary
+
+    ids, summary = asyncio.run(_go())
+    assert sorted(fetches) == [("000660", _day(3)), ("005930", _day(10))]
+    assert (summary["processed"], summary["errors"]) == (4, 0)
+
+    conn = sqlite3.connect(db_path)
+    history = dict(conn.execute(
+        "SELECT report_id, COUNT(*) FROM ticker_price_history GROUP BY report_id"
+    ).fetchall())
+    perf = {r[0]: r[1:] for r in conn.execute(
+        "SELECT report_id, return_current, last_price_update FROM report_enrichment"
+    ).fetchall()}
+    conn.close()
+
+    # only closes strictly after each report's own date
+    assert history == {ids["a_old"]: 10, ids["a_mid"]: 5, ids["a_new"]: 5, ids["b"]: 3}
+    assert perf[ids["a_old"]][0] == pytest.approx(10.0)
+    assert perf[ids["a_mid"]][0] == pytest.approx((110 - 105) / 105 * 100, abs=1e-3)
+    assert perf[ids["b"]][0] == pytest.approx(120.0)
+    assert all(p[1] for p in perf.values())
+
+
+def test_dry_run_fetches_once_and_writes_nothing(db_path, fetches):
+    async def _go():
+        r1 = await _add_report(db_path, "035420", _day(8), 100.0)
+        r2 = await _add_report(db_path, "035420", _day(2), 100.0)
+        results = await price_tracker.PriceTracker(db_path=db_path).update_ticker(
+            "kr", "035420",
+            [{"id": r1, "report_date": _day(8), "price_at_analysis": 100.0},
+             {"id": r2, "report_date": _day(2), "price_at_analysis": 100.0}],
+            dry_run=True,
+        )
+        return results
+
+    results = asyncio.run(_go())
+    assert fetches == [("035420", _day(8))]
+    assert [r["rows_written"] for r in results] == [8, 2]
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT COUNT(*) FROM ticker_price_history").fetchone()[0] == 0
+    conn.close()
+
+
+def test_bad_base_price_skips_only_that_report(db_path, fetches):
+    async def _go():
+        ids = {
+            "ok_old": await _add_report(db_path, "005930", _day(10), 100.0),
+            "zero": await _add_report(db_path, "005930", _day(6), 0.0),
+            "ok_new": await _add_report(db_path, "005930", _day(4), 104.0),
+        }
+        summary = await price_tracker.PriceTracker(db_path=db_path).run()
+        null_results = await price_tracker.PriceTracker(db_path=db_path).update_ticker(
+            "kr", "005930",
+            [{"id": ids["ok_old"], "report_date": _day(10), "price_at_analysis": None},
+             {"id": ids["ok_new"], "report_date": _day(4), "price_at_analysis": 104.0}],
+            dry_run=True,
+        )
+        return ids, summary, null_results
+
+    ids, summary, null_results = asyncio.run(_go())
+    assert (summary["processed"], summary["errors"]) == (2, 1)
+    assert sorted(r["report_id"] for r in summary["results"]) == sorted([ids["ok_old"], ids["ok_new"]])
+
+    conn = sqlite3.connect(db_path)
+    history = dict(conn.execute(
+        "SELECT report_id, COUNT(*) FROM ticker_price_history GROUP BY report_id"
+    ).fetchall())
+    conn.close()
+    assert history == {ids["ok_old"]: 10, ids["ok_new"]: 4}
+
+    assert "error" in null_results[0] and null_results[0]["rows_written"] == 0
+    assert "error" not in null_results[1] and null_results[1]["rows_written"] == 4
@@ -0,0 +1,105 @@
+"""Unit tests for report_manifest and the manifest-backed report cache lookups.
+
+Run with:  python -m pytest tests/test_report_manifest.py -q
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+import pytest
+
+import report_manifest
+
+
+@pytest.fixture
+def manifest(tmp_path, monkeypatch):
+    monkeypatch.setattr(report_manifest, "MANIFEST_DB_PATH", tmp_path / "report_manifest.sqlite")
+    monkeypatch.setattr(report_manifest, "_seeded", set())
+    return report_manifest
+
+
+@pytest.fixture
+def generator(tmp_path, manifest, monkeypatch):
+    monkeypatch.chdir(tmp_path)   # module creates reports/, pdf_reports/ ... at import
+    sys.modules.pop("report_generator", None)
+    import report_generator as mod
+    pdf_calls = []
+
+    def fake_pdf(code, name, md_path):
+        pdf = tmp_path / "pdf_reports" / f"{code}.pdf"
+        pdf.write_bytes(b"%PDF")
+        pdf_calls.append((code, name))
+        manifest.record_pdf(md_path, pdf)
+        return pdf
+
+    monkeypatch.setattr(mod, "save_pdf_report", fake_pdf)
+    yield mod, pdf_calls
+    sys.modules.pop("report_generator", None)
+
+
+def test_parse_report_name():
+    assert report_manifest.parse_report_name("reports/005930_삼성전자_20260105_morning_gpt5.4-mini.md") == {
+        "code": "005930", "name": "삼성전자", "date": "20260105", "mode": "morning_gpt5.4-mini"}
+    assert report_manifest.parse_report_name("AAPL_Apple_Inc_20260105_analysis.md")["name"] == "Apple_Inc"
+    assert report_manifest.parse_report_name("005930_삼성전자_20260105_morning_gpt5.4-mini_en.md") is None
+    assert report_manifest.parse_report_name("notes.md") is None
+
+
+def test_latest_report_respects_age_and_attaches_pdf(manifest, tmp_path):
+    old = tmp_path / "005930_삼성전자_20260101_analysis.md"
+    new = tmp_path / "005930_삼성전자_20260105_morning_gpt5.4-mini.md"
+    manifest.record_report("kr", "005930", old, company_name="삼성전자",
+                           created_at=time.time() - 3600)
+    manifest.record_report("kr", "005930", new, company_name="삼성전자", mode="morning")
+    manifest.record_pdf(new, tmp_path / "new.pdf")
+
+    entry = manifest.latest_report("kr", "005930")
+    assert entry["md_path"] == str(new.resolve()) and entry["mode"] == "morning"
+    assert entry["pdf_path"] == str((tmp_path / "new.pdf").resolve())
+    assert manifest.latest_report("us", "005930") is None
+    assert manifest.latest_report("kr", "005930", max_age_seconds=-1) is None
+
+    # re-saving the same key with a new file drops the stale PDF link
+    manifest.record_report("kr", "005930", tmp_path / "other.md", mode="morning",
+                           report_date="20260105")
+    assert manifest.latest_report("kr", "005930")["pdf_path"] is None
+
+    manifest.record_pdf(tmp_path / "other.md", tmp_path / "other.pdf")
+    manifest.forget_pdf(tmp_path / "other.md")
+    assert manifest.latest_report("kr", "005930")["pdf_path"] is None
+
+
+def test_cached_report_uses_manifest_and_seeds_existing_files(generator, tmp_path):
+    mod, pdf_calls = generator
+    # a report written before the manifest existed (plus its PDF and a translation)
+    legacy = tmp_path / "reports" / "000660_SK하이닉스_20260105_morning_gpt5.4-mini.md"
+    legacy.write_text("legacy report", encoding="utf-8")
+    (tmp_path / "reports" / f"{legacy.stem}_en.md").write_text("translated", encoding="utf-8")
+    (tmp_path / "pdf_reports" / f"{legacy.stem}.pdf").write_bytes(b"%PDF")
+    stale = tmp_path / "reports" / "035720_카카오_20260101_analysis.md"
+    stale.write_text("stale", encoding="utf-8")
+    os.utime(stale, (time.time() - 2 * 86400,) * 2)
+
+    cached, content, md, pdf = mod.get_cached_report("000660")
+    assert (cached, content) == (True, "legacy report")
+    assert pdf.name == f"{legacy.stem}.pdf" and pdf_calls == []
+    assert mod.get_cached_report("035720")[0] is False       # older than 24h
+
+    # new report saved by the bot → cached; missing PDF generated once and recorded
+    md_path = mod.save_report("005930", "삼성전자", "fresh report")
+    cached, content, md, pdf = mod.get_cached_report("005930")
+    assert (cached, content, md) == (True, "fresh report", md_path.resolve())
+    assert pdf_calls == [("005930", "삼성전자")]
+    assert mod.get_cached_report("005930")[3] == pdf and len(pdf_calls) == 1
+
+    # PDF removed behind the manifest's back → regenerated, not handed out
+    pdf.unlink()
+    assert mod.get_cached_report("005930")[3].exists() and len(pdf_calls) == 2
+
+    # file removed behind the manifest's back → miss, entry dropped
+    md_path.unlink()
+    assert mod.get_cached_report("005930")[0] is False
+    assert report_manifest.latest_report("kr", "005930") is None
@@ -0,0 +1,147 @@
+"""Unit tests for cores.report_pipeline and the orchestrator's concurrent report flow.
+
+No network / LLM: analyze_stock, PDF conversion and telegram summaries are faked.
+Run with:  python -m pytest tests/test_report_pipeline.py -q
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+from cores.report_pipeline import report_parallelism, run_bounded
+
+
+# --------------------------------------------------------------------------- #
+# report_parallelism                                                           #
+# --------------------------------------------------------------------------- #
+@pytest.mark.parametrize("raw, expected", [
+    (None, 0), ("false", 0), ("FALSE", 0), ("0", 0), ("true", 1), ("1", 1),
+    ("3", 3), (" 2 ", 2), ("fast", 0), ("-2", 0),
+])
+def test_report_parallelism_parses_single_setting(monkeypatch, raw, expected):
+    if raw is None:
+        monkeypatch.delenv("PRISM_PARALLEL_REPORT", raising=False)
+    else:
+        monkeypatch.setenv("PRISM_PARALLEL_REPORT", raw)
+    assert report_parallelism() == expected
+
+
+def test_orchestrator_concurrency_follows_parallel_report(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PRISM_PARALLEL_REPORT", "true")
+    sys.modules.pop("stock_analysis_orchestrator", None)
+    import stock_analysis_orchestrator as mod
+    assert mod.REPORT_CONCURRENCY == 1          # true = parallel sections, one ticker
+    monkeypatch.setenv("PRISM_PARALLEL_REPORT", "3")
+    sys.modules.pop("stock_analysis_orchestrator", None)
+    import stock_analysis_orchestrator as mod
+    assert mod.REPORT_CONCURRENCY == 3
+    sys.modules.pop("stock_analysis_orchestrator", None)
+
+
+# --------------------------------------------------------------------------- #
+# run_bounded                                                                  #
+# --------------------------------------------------------------------------- #
+def test_run_bounded_respects_concurrency_and_keeps_order():
+    in_flight = 0
+    peak = 0
+    finished = []
+
+    async def worker(i, item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 * (5 - i))   # later items finish first
+        in_flight -= 1
+        if item == "bad":
+            raise RuntimeError("boom")
+        return item.upper()
+
+    async def on_result(i, item, result):
+        finished.append((i, result))
+
+    items = ["a", "b", "bad", "d", "e"]
+    results = asyncio.run(run_bounded(items, worker, concurrency=2, on_result=on_result))
+
+    assert results == ["A", "B", None, "D", "E"]
+    assert peak == 2
+    assert sorted(finished) == [(0, "A"), (1, "B"), (2, None), (3, "D"), (4, "E")]
+    assert [i for i, _ in finished] != [0, 1, 2, 3, 4]   # callbacks fire as jobs finish
+
+
+# --------------------------------------------------------------------------- #
+# StockAnalysisOrchestrator                                                    #
+# --------------------------------------------------------------------------- #
+@pytest.fixture
+def orchestrator(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)   # module creates reports/, pdf_reports/ ... at import
+    import report_manifest
+    monkeypatch.setattr(report_manifest, "MANIFEST_DB_PATH", tmp_path / "report_manifest.sqlite")
+    sys.modules.pop("stock_analysis_orchestrator", None)
+    import stock_analysis_orchestrator as mod
+
+    monkeypatch.setattr(mod, "REPORTS_DIR", tmp_path / "reports")
+    (tmp_path / "reports").mkdir(exist_ok=True)
+    config = types.SimpleNamespace(use_telegram=False)
+    orch = mod.StockAnalysisOrchestrator(telegram_config=config)
+    yield mod, orch
+    sys.modules.pop("stock_analysis_orchestrator", None)
+
+
+def test_generate_reports_concurrent_with_overlapped_post_processing(orchestrator, monkeypatch):
+    mod, orch = orchestrator
+    events = []
+    in_flight = 0
+    peak = 0
+
+    async def fake_analyze_stock(company_code, company_name, reference_date, language, macro_context):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        events.append(("start", company_code))
+        await asyncio.sleep({"A": 0.01, "B": 0.05, "C": 0.01}[company_code])
+        in_flight -= 1
+        events.append(("done", company_code))
+        return "" if company_code == "C" else f"# report {company_code}"
+
+    fake_main = types.ModuleType("cores.main")
+    fake_main.analyze_stock = fake_analyze_stock
+    monkeypatch.setitem(sys.modules, "cores.main", fake_main)
+    monkeypatch.setattr(mod, "REPORT_CONCURRENCY", 2)
+
+    async def on_report(path):
+        events.append(("post", path.split("/")[-1].split("_")[0]))
+
+    tickers = [{"code": "A", "name": "Alpha"}, {"code": "B", "name": "Beta"},
+               {"code": "C", "name": "Gamma"}]
+    paths = asyncio.run(orch.generate_reports(tickers, "morning", on_report=on_report))
+
+    assert [p.split("/")[-1].split("_")[0] for p in paths] == ["A", "B"]   # ticker order, C empty
+    assert peak == 2
+    # A's post-processing starts before the slower B analysis finishes
+    assert events.index(("post", "A")) < events.index(("done", "B"))
+
+
+def test_post_process_report_skips_telegram_when_disabled(orchestrator, monkeypatch):
+    mod, orch = orchestrator
+    calls = []
+
+    async def fake_pdf(paths):
+        calls.append(("pdf", list(paths)))
+        return [f"{p}.pdf" for p in paths]
+
+    async def fake_messages(pdfs, language="ko"):
+        calls.append(("msg", list(pdfs)))
+        return ["msg.txt"]
+
+    monkeypatch.setattr(orch, "convert_to_pdf", fake_pdf)
+    monkeypatch.setattr(orch, "generate_telegram_messages", fake_messages)
+
+    assert asyncio.run(orch._post_process_report("r.md")) == (["r.md.pdf"], [])
+    orch.telegram_config.use_telegram = True
+    assert asyncio.run(orch._post_process_report("r.md")) == (["r.md.pdf"], ["msg.txt"])
+    assert calls == [("pdf", ["r.md"]), ("pdf", ["r.md"]), ("msg", ["r.md.pdf"])]
@@ -6,6 +6,8 @@ Covers:
   (b) percentile_ratings: 순서/1~99/동점/단일=50
   (c) SHADOW 기본(RS_RATING_ENABLED 미설정)에서 기존 rs_score 경로 유지
   (d) LIVE 플래그에서 rs_score가 oneil 백분위로, oneil_raw=None은 fallback
+  (e) 배치 API: oneil_weighted_returns == 종목별 oneil_weighted_return (NaN/결측 포함),
+      universe_percentile_ratings 로 시장 전체 대비 순위
 
 네트워크 의존 없음 — 순수 계산 함수만 테스트.
 """
@@ -21,7 +23,13 @@ import pytest
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from cores.rs_rating import oneil_weighted_return, percentile_ratings
+from cores.rs_rating import (
+    oneil_weighted_return,
+    oneil_weighted_returns,
+    percentile_ratings,
+    rs_ratings,
+    universe_percentile_ratings,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -148,6 +156,51 @@ class TestPercentileRatings:
         assert result["T99"] == 99.0
 
 
+# ---------------------------------------------------------------------------
+# (e) 배치 API (시장 전체 유니버스)
+# ---------------------------------------------------------------------------
+
+class TestBatchRatings:
+    def _matrix(self) -> pd.DataFrame:
+        rng = np.random.default_rng(7)
+        idx = pd.date_range("2023-01-02", periods=300, freq="B")
+        data = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.02, (300, 6)), axis=0))
+        df = pd.DataFrame(data, index=idx, columns=[f"T{i}" for i in range(6)])
+        df.iloc[:100, 1] = np.nan        # 신규 상장 → 253 미만
+        df.iloc[150:160, 2] = np.nan     # 거래정지 구간
+        df.iloc[:40, 3] = np.nan         # 상장 후 260개 (충분)
+        return df
+
+    def test_batch_matches_per_series(self):
+        df = self._matrix()
+        batch = oneil_weighted_returns(df)
+        for col in df.columns:
+            single = oneil_weighted_return(df[col].dropna())
+            if single is None:
+                assert np.isnan(batch[col]), col
+            else:
+                assert batch[col] == pytest.approx(single, abs=1e-12), col
+
+    def test_rs_ratings_frame(self):
+        out = rs_ratings(self._matrix())
+        assert list(out.columns) == ["oneil_raw", "rs_rating"]
+        assert "T1" not in out.index  # 히스토리 부족 → 제외
+        assert out["rs_rating"].between(1.0, 99.0).all()
+        assert out["rs_rating"].idxmax() == out["oneil_raw"].idxmax()
+
+    def test_universe_ranking_against_market(self):
+        """후보끼리가 아니라 시장 분포 기준: 시장 하위 후보는 후보 중 1등이어도 낮은 등급."""
+        universe = pd.Series(np.arange(100, dtype=float), index=[f"U{i}" for i in range(100)])
+        result = universe_percentile_ratings({"A": 5.0, "B": 10.0, "C": 99.0}, universe)
+        assert result["B"] < 20.0
+        assert result["C"] == 99.0
+        assert result["A"] < result["B"]
+
+    def test_universe_empty_falls_back_to_candidates(self):
+        raw = {"A": 1.0, "B": 2.0}
+        assert universe_percentile_ratings(raw, pd.Series(dtype=float)) == percentile_ratings(raw)
+
+
 # ---------------------------------------------------------------------------
 # (c) SHADOW 기본: rs_score 경로 불변
 # (d) LIVE 플래그: rs_score = oneil 백분위
@@ -36,6 +36,12 @@ from trigger_batch import (
 # Helpers
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(autouse=True)
+def _daily_bar_db(tmp_path, monkeypatch):
+    """일봉 저장소는 테스트별 tmp DB 사용 (저장소 루트에 daily_bars.db 생성 방지, 테스트 간 캐시 공유 방지)."""
+    monkeypatch.setenv("DAILY_BAR_DB_PATH", str(tmp_path / "daily_bars.db"))
+
+
 def _make_ohlcv(n: int, start_close: float = 100.0, end_close: float = 110.0) -> pd.DataFrame:
     """n 행짜리 합성 OHLCV DataFrame (영문 컬럼). 종가는 선형 보간."""
     idx = pd.date_range("2023-01-01", periods=n, freq="B")
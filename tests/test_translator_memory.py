@@ -0,0 +1,92 @@
+"""Tests for the translation memory at its call sites (dashboard + Telegram translators).
+
+The store lives in tmp_path and the LLM is a scripted stub — no network.
+Run with:  python -m pytest tests/test_translator_memory.py -q
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "examples"))
+
+from cores.llm import translation_memory as tm
+
+
+@pytest.fixture
+def memory_path(tmp_path, monkeypatch):
+    path = tmp_path / "tm.db"
+    monkeypatch.setenv("TRANSLATION_MEMORY_DB_PATH", str(path))
+    monkeypatch.delenv("TRANSLATION_MEMORY_ENABLED", raising=False)
+    tm.reset_translation_memory()
+    yield path
+    tm.reset_translation_memory()
+
+
+class _StubLLM:
+    """Answers numbered batches ("[n] text") and single prompts with an EN- prefix."""
+
+    def __init__(self):
+        self.messages = []
+
+    async def generate_str(self, message, request_params=None):
+        self.messages.append(message)
+        numbered = re.findall(r"^\[(\d+)\] (.+)$", message, re.MULTILINE)
+        if numbered:
+            return "\n\n".join(f"[{n}] EN-{text}" for n, text in numbered)
+        return "EN-" + message.rsplit("\n", 1)[-1]
+
+
+@pytest.mark.asyncio
+async def test_dashboard_translator_sends_only_unseen_strings(memory_path, monkeypatch):
+    from translation_utils import DashboardTranslator
+
+    llm = _StubLLM()
+    translator = DashboardTranslator()
+
+    async def attach_llm(_cls):
+        return llm
+
+    monkeypatch.setattr(translator.translation_agent, "attach_llm", attach_llm)
+    data = {"holdings": [{"company_name": "삼성전자", "scenario": {"rationale": "실적 개선"}},
+                         {"company_name": "삼성전자", "scenario": {"rationale": "수급 개선"}}]}
+
+    first = await translator.translate_dashboard_data(data)
+    assert first["holdings"][1]["company_name"] == "EN-삼성전자"
+    assert len(llm.messages) == 1 and "[3] 수급 개선" in llm.messages[0]    # duplicates sent once
+    assert "\n[4] " not in llm.messages[0]
+
+    data["holdings"].append({"company_name": "SK하이닉스"})
+    translator2 = DashboardTranslator()                           # next cron run
+    monkeypatch.setattr(translator2.translation_agent, "attach_llm", attach_llm)
+    second = await translator2.translate_dashboard_data(data)
+    assert second["holdings"][0]["scenario"]["rationale"] == "EN-실적 개선"
+    assert second["holdings"][2]["company_name"] == "EN-SK하이닉스"
+    assert "\n[1] SK하이닉스" in llm.messages[1] and "\n[2] " not in llm.messages[1]
+
+
+@pytest.mark.asyncio
+async def test_telegram_translation_is_remembered_per_language(memory_path, monkeypatch):
+    from cores.agents import telegram_translator_agent as tta
+
+    llm = _StubLLM()
+
+    class _Agent:
+        async def attach_llm(self, _cls):
+            return llm
+
+    async def governed(llm_, *, message, request_params=None, priority=None):
+        return await llm_.generate_str(message=message, request_params=request_params)
+
+    monkeypatch.setattr(tta, "create_telegram_translator_agent", lambda **kw: _Agent())
+    monkeypatch.setattr(tta, "governed_generate_str", governed)
+
+    for _ in range(2):
+        assert await tta.translate_telegram_message("매수 신호", to_lang="en") == "EN-매수 신호"
+    await tta.translate_telegram_message("매수 신호", to_lang="ja")
+    assert len(llm.messages) == 2
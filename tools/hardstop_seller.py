@@ -306,6 +306,11 @@ async def run_market(market: str, run_id: str) -> Dict[str, Any]:
             return summary
         try:
             async with _open_context(market) as trader:  # primary ctx, prices only (account-agnostic)
+                # Quote every single-row ticker up front (concurrently, once per run)
+                # instead of one blocking KIS call per loop iteration.
+                from price_snapshot import PriceSnapshot, trader_quote_fetch
+                prices = PriceSnapshot(trader_quote_fetch(trader))
+                await prices.prefetch(t for t, rows in by_ticker.items() if len(rows) == 1)
                 for ticker, rows in by_ticker.items():
                     if len(rows) > 1:
                         # Pyramided position -> leave to the batch's fractional logic.
@@ -321,12 +326,7 @@ async def run_market(market: str, run_id: str) -> Dict[str, Any]:
                         continue
                     if buy_price <= 0:
                         continue
-                    try:
-                        info = await asyncio.to_thread(trader.get_current_price, ticker)
-                        cur_price = float((info or {}).get("current_price", 0) or 0)
-                    except Exception as e:
-                        logger.warning("[%s] %s price fetch failed: %s", market, ticker, e)
-                        continue
+                    cur_price = await prices.get(ticker)  # 0 = fetch failed (logged)
                     if cur_price <= 0:
                         continue
                     summary["checked"] += 1
@@ -15,6 +15,7 @@ from tracking.db_schema import (
 from tracking.helpers import (
     extract_ticker_info,
     get_current_stock_price,
+    get_current_stock_prices,
     get_trading_value_rank_change,
     is_ticker_in_holdings,
     get_current_slots_count,
@@ -47,6 +48,7 @@ __all__ = [
     # Helpers
     "extract_ticker_info",
     "get_current_stock_price",
+    "get_current_stock_prices",
     "get_trading_value_rank_change",
     "is_ticker_in_holdings",
     "get_current_slots_count",
@@ -13,6 +13,7 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List
 
 from cores.openai_error_logging import log_openai_error
+from cores.llm.governor import governed_generate_str
 from cores.utils import parse_llm_json
 
 logger = logging.getLogger(__name__)
@@ -137,7 +138,8 @@ class CompressionManager:
                 entries_text = self._format_entries_for_compression(entries, hindsight_prices)
                 prompt = self._build_layer2_prompt(entries_text, len(entries))
 
-                response = await llm.generate_str(
+                response = await governed_generate_str(
+                    llm,
                     message=prompt,
                     request_params=RequestParams(model="gpt-5.4", reasoning_effort="none", maxTokens=8000)
                 )
@@ -196,7 +198,8 @@ class CompressionManager:
                 entries_text = self._format_entries_for_intuition(entries)
                 prompt = self._build_layer3_prompt(entries_text, len(entries))
 
-                response = await llm.generate_str(
+                response = await governed_generate_str(
+                    llm,
                     message=prompt,
                     request_params=RequestParams(model="gpt-5.4", reasoning_effort="none", maxTokens=8000)
                 )
@@ -266,7 +269,8 @@ class CompressionManager:
                 llm = await compressor_agent.attach_llm(OpenAIAugmentedLLM)
                 entries_text = self._format_entries_for_intuition(entries)
                 prompt = self._build_layer3_prompt(entries_text, len(entries))
-                response = await llm.generate_str(
+                response = await governed_generate_str(
+                    llm,
                     message=prompt,
                     request_params=RequestParams(model="gpt-5.4", reasoning_effort="none", maxTokens=8000)
                 )
@@ -290,27 +294,47 @@ class CompressionManager:
     def _fetch_hindsight_prices(self, entries: List[Dict[str, Any]]) -> Dict[str, float]:
         """Fetch current prices for tickers to add hindsight context during compression.
 
-        Uses pykrx batch API (single call for all KR tickers).
+        Uses pykrx batch API (single call for all KR tickers); the snapshot is also
+        written to the local daily-bar store, which serves last-known closes when
+        KRX is unavailable.
         Returns empty dict on failure — compression proceeds without hindsight.
         """
+        import datetime as dt
+        from cores import daily_bar_store, market_snapshot_cache
+
+        tickers = [entry.get('ticker', '') for entry in entries if entry.get('ticker', '')]
+        today = dt.datetime.now().strftime("%Y%m%d")
+        prices = {}
         try:
             from krx_data_client import get_nearest_business_day_in_a_week, get_market_ohlcv_by_ticker
-            import datetime as dt
 
-            today = dt.datetime.now().strftime("%Y%m%d")
             trade_date = get_nearest_business_day_in_a_week(today, prev=True)
-            df = get_market_ohlcv_by_ticker(trade_date)
+            df = market_snapshot_cache.get_frame(
+                "ohlcv", trade_date, lambda: get_market_ohlcv_by_ticker(trade_date))
 
-            prices = {}
-            for entry in entries:
-                ticker = entry.get('ticker', '')
-                if ticker and ticker in df.index:
+            for ticker in tickers:
+                if ticker in df.index:
                     prices[ticker] = float(df.loc[ticker, "Close"])
+            if daily_bar_store.is_enabled():
+                try:
+                    conn = daily_bar_store.get_connection()
+                    try:
+                        daily_bar_store.upsert_market_snapshot(conn, "KR", trade_date, df)
+                    finally:
+                        conn.close()
+                except Exception as e:
+                    logger.debug(f"Daily-bar store snapshot write skipped: {e}")
             logger.info(f"Fetched hindsight prices for {len(prices)} tickers")
             return prices
         except Exception as e:
-            logger.warning(f"Failed to fetch hindsight prices: {e}")
-            return {}
+            if daily_bar_store.is_enabled():
+                try:
+                    prices = daily_bar_store.latest_closes(tickers, today, "KR")
+                except Exception as store_err:
+                    logger.debug(f"Daily-bar store lookup failed: {store_err}")
+            logger.warning(f"Failed to fetch hindsight prices: {e}; "
+                           f"using {len(prices)} stored close(s) from daily-bar store")
+            return prices
 
     def _format_entries_for_compression(self, entries: List[Dict[str, Any]], hindsight_prices: Dict[str, float] | None = None) -> str:
         """Format entries for LLM compression."""
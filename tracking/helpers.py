@@ -11,7 +11,7 @@ import re
 import traceback
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -59,10 +59,31 @@ async def get_current_stock_price(cursor, ticker: str, account_key: str | None =
     Returns:
         float: Current stock price
     """
+    prices = await get_current_stock_prices(cursor, [ticker], account_key=account_key)
+    return prices[ticker]
+
+
+async def get_current_stock_prices(cursor, tickers: List[str], account_key: str | None = None) -> Dict[str, float]:
+    """
+    Get current prices for several stocks from ONE whole-market KRX frame.
+
+    Tickers missing from the frame fall back to the last DB price; if KRX stays
+    down after retries each ticker tries KIS, then the DB.
+
+    Args:
+        cursor: SQLite cursor
+        tickers: Stock codes
+
+    Returns:
+        Dict[str, float]: {ticker: current price} (0.0 when unavailable)
+    """
     import asyncio
     from krx_data_client import get_nearest_business_day_in_a_week, get_market_ohlcv_by_ticker
+    from cores import market_snapshot_cache
     import datetime
 
+    tickers = list(dict.fromkeys(tickers))
+
     # KRX API (data.krx.co.kr) can intermittently time out. Retry the transient
     # fetch a few times before falling back, so a momentary blip does not silently
     # drop a fresh buy candidate (its price is not yet in the DB, so the last-price
@@ -74,23 +95,27 @@ async def get_current_stock_price(cursor, ticker: str, account_key: str | None =
             trade_date = get_nearest_business_day_in_a_week(today, prev=True)
             logger.info(f"Target date: {trade_date}")
 
-            df = get_market_ohlcv_by_ticker(trade_date)
-
-            if ticker in df.index:
-                current_price = df.loc[ticker, "Close"]
-                logger.info(f"{ticker} current price: {current_price:,.0f} KRW")
-                return float(current_price)
-            else:
-                # Data fetched OK but ticker absent — retrying won't help.
-                logger.warning(f"Cannot find ticker {ticker}")
-                return _get_last_price_from_db(cursor, ticker, account_key=account_key)
+            df = market_snapshot_cache.get_frame(
+                "ohlcv", trade_date, lambda: get_market_ohlcv_by_ticker(trade_date))
+
+            prices: Dict[str, float] = {}
+            for ticker in tickers:
+                if ticker in df.index:
+                    current_price = df.loc[ticker, "Close"]
+                    logger.info(f"{ticker} current price: {current_price:,.0f} KRW")
+                    prices[ticker] = float(current_price)
+                else:
+                    # Data fetched OK but ticker absent — retrying won't help.
+                    logger.warning(f"Cannot find ticker {ticker}")
+                    prices[ticker] = _get_last_price_from_db(cursor, ticker, account_key=account_key)
+            return prices
 
         except Exception as e:
-            logger.error(f"Error querying current price for {ticker} "
+            logger.error(f"Error querying current price for {', '.join(tickers)} "
                          f"(attempt {attempt + 1}/{MAX_RETRIES}): {str(e)}")
             if attempt < MAX_RETRIES - 1:
                 wait = 2 * (attempt + 1)  # 2s, 4s exponential-ish backoff
-                logger.warning(f"{ticker} price query retry in {wait}s")
+                logger.warning(f"Price query retry in {wait}s")
                 await asyncio.sleep(wait)
             else:
                 logger.error(traceback.format_exc())
@@ -98,10 +123,12 @@ async def get_current_stock_price(cursor, ticker: str, account_key: str | None =
                 # candidate has no stock_holdings row, so the DB fallback
                 # returns 0 and the whole report analysis is silently skipped
                 # (2026-07-13 KRX outage dropped all 3 afternoon candidates).
-                kis_price = await _get_price_from_kis(ticker)
-                if kis_price > 0:
-                    return kis_price
-                return _get_last_price_from_db(cursor, ticker, account_key=account_key)
+                prices = {}
+                for ticker in tickers:
+                    kis_price = await _get_price_from_kis(ticker)
+                    prices[ticker] = kis_price if kis_price > 0 else \
+                        _get_last_price_from_db(cursor, ticker, account_key=account_key)
+                return prices
 
 
 async def _get_price_from_kis(ticker: str) -> float:
@@ -160,6 +187,7 @@ async def get_trading_value_rank_change(ticker: str) -> Tuple[float, str]:
     """
     try:
         from krx_data_client import get_nearest_business_day_in_a_week, get_market_ohlcv_by_ticker
+        from cores import market_snapshot_cache
         import datetime
 
         today = datetime.datetime.now().strftime("%Y%m%d")
@@ -174,8 +202,10 @@ async def get_trading_value_rank_change(ticker: str) -> Tuple[float, str]:
 
         logger.info(f"Recent trading day: {recent_date}, Previous trading day: {previous_date}")
 
-        recent_df = get_market_ohlcv_by_ticker(recent_date)
-        previous_df = get_market_ohlcv_by_ticker(previous_date)
+        recent_df = market_snapshot_cache.get_frame(
+            "ohlcv", recent_date, lambda: get_market_ohlcv_by_ticker(recent_date))
+        previous_df = market_snapshot_cache.get_frame(
+            "ohlcv", previous_date, lambda: get_market_ohlcv_by_ticker(previous_date))
 
         # Sort by trading value to generate rankings
         recent_rank = recent_df.sort_values(by="Amount", ascending=False).reset_index()
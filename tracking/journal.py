@@ -24,6 +24,9 @@ logger = logging.getLogger(__name__)
 JOURNAL_RECENT_LOSS_HOURS = float(os.getenv("JOURNAL_RECENT_LOSS_HOURS", "48"))
 JOURNAL_RECENT_LOSS_PENALTY = int(os.getenv("JOURNAL_RECENT_LOSS_PENALTY", "2"))
 
+# one_line_summary of the fallback entry saved when the agent response is unparseable
+PARSE_FAILED_SUMMARY = "Analysis parsing failed"
+
 
 class JournalManager:
     """Manages trading journal operations."""
@@ -98,6 +101,7 @@ class JournalManager:
                 scenario_data, sell_price, profit_rate, holding_days, sell_reason
             )
 
+            llm_backend = spec = None
             import os as _os
             if _os.getenv("LLM_BACKEND", "mcp_agent") == "openai_agents":
                 from cores.llm.agent_bridge import (
@@ -114,13 +118,18 @@ class JournalManager:
                     journal_agent,
                     model="gpt-5.4-mini",
                     params=LLMParams(max_tokens=16000, reasoning_effort="none"),
+                    cacheable=True,  # retry_journal_entry re-runs reuse the completion
                 )
-                result = await get_llm_backend(registry).run(spec, prompt)
+                llm_backend = get_llm_backend(registry)
+                result = await llm_backend.run(spec, prompt)
                 response = result.text
             else:
+                from cores.llm.governor import governed_generate_str
+
                 async with journal_agent:
                     llm = await journal_agent.attach_llm(OpenAIAugmentedLLM)
-                    response = await llm.generate_str(
+                    response = await governed_generate_str(
+                        llm,
                         message=prompt,
                         request_params=RequestParams(model="gpt-5.4-mini", reasoning_effort="none", maxTokens=16000)
                     )
@@ -128,6 +137,8 @@ class JournalManager:
 
             # Parse and save
             journal_data = self._parse_response(response)
+            if journal_data.get('one_line_summary') == PARSE_FAILED_SUMMARY and hasattr(llm_backend, "invalidate"):
+                llm_backend.invalidate(spec, prompt)  # a retry must ask the model again
             journal_id = self._save_to_database(
                 ticker, company_name, buy_price, buy_date, scenario_json,
                 scenario_data, sell_price, sell_reason, profit_rate,
@@ -226,7 +237,7 @@ Please review the following completed trade:
             "judgment_evaluation": {},
             "lessons": [],
             "pattern_tags": [],
-            "one_line_summary": "Analysis parsing failed",
+            "one_line_summary": PARSE_FAILED_SUMMARY,
             "confidence_score": 0.3
         }
 
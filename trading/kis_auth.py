@@ -41,6 +41,11 @@ from Crypto.Util.Padding import unpad
 
 from cryptography.fernet import Fernet
 
+try:
+    from . import kis_transport
+except ImportError:  # imported as top-level `kis_auth` (trading/ on sys.path)
+    import kis_transport
+
 class SecurityError(Exception):
     """Security-related errors"""
     pass
@@ -1208,6 +1213,26 @@ def getTREnv():
     return _TRENV
 
 
+def _transport_kwargs():
+    """Rate-limit bucket of the active account (see kis_transport)."""
+    return {"account": f"{_TRENV.my_acct}-{_TRENV.my_prod}", "paper": isPaperTrading()}
+
+
+def acquire_transport_token(account: str, paper: bool) -> float:
+    """Wait for the account's rate-limit token outside the env lock; the next _url_fetch on this thread uses it."""
+    return kis_transport.get_transport().acquire(account=account, paper=paper)
+
+
+def release_transport_token(account: str, paper: bool) -> int:
+    """Discard a token from acquire_transport_token that no request spent (the call failed before sending)."""
+    return kis_transport.get_transport().release(account=account, paper=paper)
+
+
+def get_transport_metrics():
+    """Per-account request / latency / throttle / rate-limit counters of the KIS REST transport."""
+    return kis_transport.get_transport().metrics()
+
+
 # Function to receive hash key value for order API and set it in header
 # Currently hash key is not mandatory, can be omitted, used when concerned about tampering during API calls
 # Input: HTTP Header, HTTP post param
@@ -1215,7 +1240,9 @@ def getTREnv():
 def set_order_hash_key(h, p):
     url = f"{getTREnv().my_url}/uapi/hashkey"  # hashkey issuance API URL
 
-    res = requests.post(url, data=json.dumps(p), headers=h, timeout=30)
+    res = kis_transport.get_transport().post(
+        url, data=json.dumps(p), headers=h, **_transport_kwargs()
+    )
     rescode = res.status_code
     if rescode == 200:
         h["hashkey"] = _getResultObject(res.json()).HASH
@@ -1380,11 +1407,13 @@ def _url_fetch(
         print(f"<header>\n{headers}")
         print(f"<body>\n{params}")
 
+    # Pooled keep-alive session, paced by the per-account token bucket
+    transport = kis_transport.get_transport()
     if postFlag:
         # if (hashFlag): set_order_hash_key(headers, params)
-        res = requests.post(url, headers=headers, data=json.dumps(params), timeout=30)
+        res = transport.post(url, headers=headers, data=json.dumps(params), **_transport_kwargs())
     else:
-        res = requests.get(url, headers=headers, params=params, timeout=30)
+        res = transport.get(url, headers=headers, params=params, **_transport_kwargs())
 
     if res.status_code == 200:
         ar = APIResp(res)
@@ -0,0 +1,237 @@
+"""
+KIS REST transport — pooled keep-alive session + per-account rate limiting
+
+kis_auth._url_fetch used to call bare requests.get/post (new TCP+TLS handshake
+per call); rate limiting was a blind smart_sleep() of a fixed delay.
+KISTransport keeps one requests.Session with a sized connection pool and puts a
+token bucket in front of every call:
+
+- Buckets are per (server mode, account) and calibrated to the KIS per-second
+  TR quota (real: 20/s, paper: 2/s) with a little headroom. Override with
+  KIS_REAL_TPS / KIS_PAPER_TPS.
+- Gateway rate-limit rejections (EGW00201 / EGW00215 "초당 거래건수 초과") drain
+  the bucket and are retried once after the refill interval.
+- acquire(account) takes the token ahead of time, so callers can wait for quota
+  before entering a critical section (kis_auth's shared-env lock); the next
+  request() on that thread for the same bucket uses it instead of waiting again.
+- metrics() reports request counts, a latency histogram, throttle waits and
+  rate-limit errors per bucket.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+REAL_TPS = float(os.getenv("KIS_REAL_TPS", "18"))
+PAPER_TPS = float(os.getenv("KIS_PAPER_TPS", "2"))
+RATE_LIMIT_CODES = ("EGW00201", "EGW00215")
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000)
+REQUEST_TIMEOUT = 30
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. acquire() blocks until a token is available.
+
+    capacity defaults to 1 (evenly paced calls, no burst): KIS counts calls per
+    wall-clock second, so a full-rate burst followed by refill would overshoot.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take one token; returns seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(self._clock())
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                delay = (1.0 - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+    def drain(self) -> None:
+        """Gateway said we are over quota — forget any burst allowance."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self._tokens, 0.0)
+
+
+class TransportMetrics:
+    """Counters for one bucket (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.http_errors = 0
+        self.rate_limited = 0
+        self.throttled = 0
+        self.throttle_wait = 0.0
+        self.latency_ms = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, latency: float, waited: float, status: int, rate_limited: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self.latency_ms[bisect_left(LATENCY_BUCKETS_MS, latency * 1000)] += 1
+            if waited > 0:
+                self.throttled += 1
+                self.throttle_wait += waited
+            if rate_limited:
+                self.rate_limited += 1
+            elif status != 200:
+                self.http_errors += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            labels = [f"<={b}ms" for b in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+            return {
+                "requests": self.requests,
+                "http_errors": self.http_errors,
+                "rate_limited": self.rate_limited,
+                "throttled": self.throttled,
+                "throttle_wait_sec": round(self.throttle_wait, 4),
+                "latency_ms": dict(zip(labels, self.latency_ms)),
+            }
+
+
+def _is_rate_limited(res: requests.Response) -> bool:
+    text = res.text or ""
+    if "EGW002" not in text:
+        return False
+    try:
+        return json.loads(text).get("msg_cd") in RATE_LIMIT_CODES
+    except (ValueError, AttributeError):
+        return any(code in text for code in RATE_LIMIT_CODES)
+
+
+class KISTransport:
+    """
+    Shared HTTP layer for KIS REST calls.
+
+    request(method, url, account=..., paper=...) → requests.Response
+    account is any stable label for the quota holder (e.g. "12345678-01").
+    """
+
+    def __init__(self, real_tps: float = REAL_TPS, paper_tps: float = PAPER_TPS,
+                 pool_size: int = 10, rate_limit_retries: int = 1,
+                 timeout: float = REQUEST_TIMEOUT):
+        self.real_tps = real_tps
+        self.paper_tps = paper_tps
+        self.rate_limit_retries = rate_limit_retries
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._buckets: Dict[Tuple[str, str], Tuple[TokenBucket, TransportMetrics]] = {}
+        self._lock = threading.Lock()
+        self._prepaid = threading.local()   # per thread: bucket key -> [waited, ...] of tokens taken by acquire()
+
+    def _bucket(self, key: Tuple[str, str]) -> Tuple[TokenBucket, TransportMetrics]:
+        paper = key[0] == "vps"
+        entry = self._buckets.get(key)
+        if entry is None:
+            with self._lock:
+                entry = self._buckets.get(key)
+                if entry is None:
+                    rate = self.paper_tps if paper else self.real_tps
+                    entry = self._buckets[key] = (TokenBucket(rate), TransportMetrics())
+        return entry
+
+    def _prepaid_tokens(self) -> Dict[Tuple[str, str], list]:
+        tokens = getattr(self._prepaid, "tokens", None)
+        if tokens is None:
+            tokens = self._prepaid.tokens = {}
+        return tokens
+
+    def acquire(self, account: str = "default", paper: bool = False) -> float:
+        """Take the next token of (mode, account) now; returns seconds spent waiting."""
+        key = ("vps" if paper else "prod", account)
+        waited = self._bucket(key)[0].acquire()
+        self._prepaid_tokens().setdefault(key, []).append(waited)
+        return waited
+
+    def release(self, account: str = "default", paper: bool = False) -> int:
+        """Drop this thread's unspent acquire() tokens of (mode, account); returns how many."""
+        key = ("vps" if paper else "prod", account)
+        return len(self._prepaid_tokens().pop(key, None) or [])
+
+    def request(self, method: str, url: str, *, account: str = "default",
+                paper: bool = False, **kwargs) -> requests.Response:
+        key = ("vps" if paper else "prod", account)
+        bucket, metrics = self._bucket(key)
+        prepaid = self._prepaid_tokens().get(key)
+        kwargs.setdefault("timeout", self.timeout)
+        attempt = 0
+        while True:
+            waited = prepaid.pop(0) if prepaid else bucket.acquire()
+            started = time.monotonic()
+            res = self.session.request(method, url, **kwargs)
+            limited = _is_rate_limited(res)
+            metrics.record(time.monotonic() - started, waited, res.status_code, limited)
+            if not limited or attempt >= self.rate_limit_retries:
+                return res
+            attempt += 1
+            bucket.drain()
+            logger.warning(f"KIS rate limit hit ({account}, {'paper' if paper else 'real'}), "
+                           f"retrying {attempt}/{self.rate_limit_retries}")
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """{"prod:12345678-01": {...}, ...}"""
+        with self._lock:
+            items = list(self._buckets.items())
+        return {f"{mode}:{account}": m.snapshot() for (mode, account), (_, m) in items}
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_transport: Optional[KISTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> KISTransport:
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = KISTransport()
+    return _transport
+
+
+def reset_transport(transport: Optional[KISTransport] = None) -> None:
+    """Replace (or drop) the shared transport — used by tests."""
+    global _transport
+    with _transport_lock:
+        if _transport is not None and _transport is not transport:
+            _transport.close()
+        _transport = transport
@@ -9,7 +9,13 @@ import numpy as np
 import logging
 import os
 from typing import Optional
-from cores.rs_rating import oneil_weighted_return, percentile_ratings
+from cores import daily_bar_store, market_snapshot_cache
+from cores.rs_rating import (
+    oneil_weighted_return,
+    oneil_weighted_returns,
+    percentile_ratings,
+    universe_percentile_ratings,
+)
 from krx_data_client import (
     _get_client,
     get_market_ohlcv_by_ticker,
@@ -70,7 +76,8 @@ def get_snapshot(trade_date: str) -> pd.DataFrame:
     Columns: "Open", "High", "Low", "Close", "Volume", "Amount"
     """
     logger.debug(f"get_snapshot called: {trade_date}")
-    df = stock_api.get_market_ohlcv_by_ticker(trade_date)
+    df = market_snapshot_cache.get_frame(
+        "ohlcv", trade_date, lambda: stock_api.get_market_ohlcv_by_ticker(trade_date))
     if df.empty:
         logger.error(f"No OHLCV data for {trade_date}.")
         raise ValueError(f"No OHLCV data for {trade_date}.")
@@ -99,7 +106,8 @@ def get_previous_snapshot(trade_date: str) -> (pd.DataFrame, str):
 
     logger.debug(f"Previous trading day check - Base date: {trade_date}, Day before: {prev_date_str}, Previous business day: {prev_date}")
 
-    df = stock_api.get_market_ohlcv_by_ticker(prev_date)
+    df = market_snapshot_cache.get_frame(
+        "ohlcv", prev_date, lambda: stock_api.get_market_ohlcv_by_ticker(prev_date))
     if df.empty:
         logger.error(f"No OHLCV data for {prev_date}.")
         raise ValueError(f"No OHLCV data for {prev_date}.")
@@ -158,10 +166,17 @@ def get_multi_day_ohlcv(ticker: str, end_date: str, days: int = 10) -> pd.DataFr
     start_dt = end_dt - datetime.timedelta(days=days * 2)  # 2x margin for business days
     start_date = start_dt.strftime('%Y%m%d')
 
+    def _fetch_krx(fromdate: str, todate: str) -> pd.DataFrame:
+        _krx_throttle()  # 버스트 스로틀: KRX 연타 방지로 read-timeout 빈도↓
+        return get_market_ohlcv_by_date(fromdate, todate, ticker)
+
     krx_failed = False
     try:
-        _krx_throttle()  # 버스트 스로틀: KRX 연타 방지로 read-timeout 빈도↓
-        df = get_market_ohlcv_by_date(start_date, end_date, ticker)
+        if daily_bar_store.is_enabled():
+            # 로컬 일봉 저장소: 빠진 거래일만 KRX 호출, KRX 장애 시 디스크 데이터(약간 stale) 반환
+            df = daily_bar_store.get_daily_bars(ticker, start_date, end_date, fetcher=_fetch_krx)
+        else:
+            df = _fetch_krx(start_date, end_date)
         if df.empty:
             logger.warning(f"No {days}-day data for {ticker} from KRX; attempting FinanceDataReader fallback.")
             krx_failed = True
@@ -207,7 +222,8 @@ def get_market_cap_df(trade_date: str, market: str = "ALL") -> pd.DataFrame:
     Index is stock code, includes market cap column.
     """
     logger.debug(f"get_market_cap_df called: {trade_date}, market={market}")
-    cap_df = stock_api.get_market_cap_by_ticker(trade_date, market=market)
+    cap_df = market_snapshot_cache.get_frame(
+        f"cap_{market}", trade_date, lambda: stock_api.get_market_cap_by_ticker(trade_date, market=market))
     if cap_df.empty:
         logger.error(f"No market cap data for {trade_date}.")
         raise ValueError(f"No market cap data for {trade_date}.")
@@ -296,7 +312,8 @@ TRIGGER_CRITERIA = {
 }
 
 
-def calculate_agent_fit_metrics(ticker: str, current_price: float, trade_date: str, lookback_days: int = 10, trigger_type: str = None) -> dict:
+def calculate_agent_fit_metrics(ticker: str, current_price: float, trade_date: str, lookback_days: int = 10, trigger_type: str = None,
+                                ohlcv_panel: Optional["OhlcvPanel"] = None) -> dict:
     """
     Calculate metrics that fit buy/sell agent criteria.
 
@@ -316,6 +333,7 @@ def calculate_agent_fit_metrics(ticker: str, current_price: float, trade_date: s
         trade_date: Reference trading date
         lookback_days: Number of past business days to query
         trigger_type: Trigger type (used for differentiated criteria)
+        ohlcv_panel: Shared OHLCV panel to slice from instead of fetching (optional)
 
     Returns:
         dict with keys: stop_loss_price, target_price, stop_loss_pct, risk_reward_ratio, agent_fit_score
@@ -343,7 +361,7 @@ def calculate_agent_fit_metrics(ticker: str, current_price: float, trade_date: s
     stop_loss_pct = sl_max  # Fixed value (5% or 7%)
 
     # Target price calculation: Maintain existing resistance level method
-    multi_day_df = get_multi_day_ohlcv(ticker, trade_date, lookback_days)
+    multi_day_df = _fetch_ohlcv(ticker, trade_date, lookback_days, ohlcv_panel)
     if multi_day_df.empty or len(multi_day_df) < 3:
         # Default to current price + 15% when data is insufficient
         target_price = current_price * 1.15
@@ -406,7 +424,8 @@ def calculate_agent_fit_metrics(ticker: str, current_price: float, trade_date: s
     return result
 
 
-def score_candidates_by_agent_criteria(candidates_df: pd.DataFrame, trade_date: str, lookback_days: int = 10, trigger_type: str = None) -> pd.DataFrame:
+def score_candidates_by_agent_criteria(candidates_df: pd.DataFrame, trade_date: str, lookback_days: int = 10, trigger_type: str = None,
+                                       ohlcv_panel: Optional["OhlcvPanel"] = None) -> pd.DataFrame:
     """
     Calculate agent criteria scores for candidate stocks and add to DataFrame.
 
@@ -417,6 +436,7 @@ def score_candidates_by_agent_criteria(candidates_df: pd.DataFrame, trade_date:
         trade_date: Reference trading date
         lookback_days: Number of past business days to query
         trigger_type: Trigger type (used for differentiated criteria)
+        ohlcv_panel: Shared OHLCV panel to slice from instead of fetching (optional)
 
     Returns:
         DataFrame with agent criteria scores added
@@ -435,7 +455,8 @@ def score_candidates_by_agent_criteria(candidates_df: pd.DataFrame, trade_date:
 
     for ticker in result_df.index:
         current_price = result_df.loc[ticker, "Close"]
-        metrics = calculate_agent_fit_metrics(ticker, current_price, trade_date, lookback_days, trigger_type)
+        metrics = calculate_agent_fit_metrics(ticker, current_price, trade_date, lookback_days, trigger_type,
+                                              ohlcv_panel=ohlcv_panel)
 
         result_df.loc[ticker, "stop_loss_price"] = metrics["stop_loss_price"]
         result_df.loc[ticker, "target_price"] = metrics["target_price"]
@@ -475,6 +496,137 @@ SCREENING_SIGNAL_LOOKBACK_DAYS = 60
 RS_RATING_LOOKBACK_DAYS = 260
 
 
+class OhlcvPanel:
+    """Shared date×ticker OHLCV frame for one batch run.
+
+    Screening signals (260d), agent-fit metrics (10d) and the sideways MA20 gate (20d)
+    used to fetch overlapping windows per ticker, each paying _krx_throttle. The panel
+    fetches every ticker ONCE at the widest window and consumers slice tail(days).
+
+    frame: wide DataFrame, index=Date, columns=MultiIndex(Ticker, Field).
+    """
+
+    def __init__(self, end_date: str, days: int = RS_RATING_LOOKBACK_DAYS):
+        self.end_date = end_date
+        self.days = days
+        self.frame = pd.DataFrame()
+        self._loaded: set[str] = set()
+
+    def covers(self, end_date: str, days: int) -> bool:
+        return end_date == self.end_date and days <= self.days
+
+    def load(self, tickers) -> None:
+        """Fetch tickers not yet in the panel (failed fetches are remembered as empty)."""
+        missing = [t for t in dict.fromkeys(tickers) if t not in self._loaded]
+        if not missing:
+            return
+        frames = {}
+        for ticker in missing:
+            self._loaded.add(ticker)
+            df = get_multi_day_ohlcv(ticker, self.end_date, self.days)
+            if not df.empty:
+                frames[ticker] = df
+        if frames:
+            added = pd.concat(frames, axis=1, names=["Ticker", "Field"])
+            parts = [self.frame, added] if not self.frame.empty else [added]
+            self.frame = pd.concat(parts, axis=1).sort_index()
+        logger.debug(f"OHLCV panel: loaded {len(missing)} ticker(s) "
+                     f"({len(frames)} with data), total {len(self._loaded)}")
+
+    def get(self, ticker: str, days: int) -> pd.DataFrame:
+        """Return ticker's last `days` rows in get_multi_day_ohlcv's single-ticker schema."""
+        self.load([ticker])
+        if self.frame.empty or ticker not in self.frame.columns.get_level_values(0):
+            return pd.DataFrame()
+        df = self.frame[ticker].dropna(how="all").dropna(axis=1, how="all")
+        df.columns.name = None
+        return df.tail(days)
+
+
+def _fetch_ohlcv(ticker: str, trade_date: str, days: int,
+                 ohlcv_panel: Optional[OhlcvPanel] = None) -> pd.DataFrame:
+    """Slice from the shared panel when it covers the window, else fetch directly."""
+    if ohlcv_panel is not None and ohlcv_panel.covers(trade_date, days):
+        return ohlcv_panel.get(ticker, days)
+    return get_multi_day_ohlcv(ticker, trade_date, days)
+
+
+def rs_universe_mode() -> str:
+    """RS_RATING_UNIVERSE: "candidates" (default, rank candidates among themselves)
+    or "market" (IBD-style: rank against every KOSPI+KOSDAQ ticker)."""
+    mode = os.getenv("RS_RATING_UNIVERSE", "candidates").strip().lower()
+    return mode if mode in ("candidates", "market") else "candidates"
+
+
+def _get_session_dates(trade_date: str, days: int) -> list:
+    """Last `days` KRX sessions up to trade_date (KOSPI index calendar)."""
+    from krx_data_client import get_index_ohlcv_by_date
+
+    start = (datetime.datetime.strptime(trade_date, '%Y%m%d') - datetime.timedelta(days=days * 2)).strftime('%Y%m%d')
+    _krx_throttle()
+    idx_df = get_index_ohlcv_by_date(start, trade_date, "1001")
+    return [d.strftime('%Y%m%d') for d in pd.to_datetime(idx_df.index)[-days:]]
+
+
+def load_market_close_matrix(trade_date: str, days: int = RS_RATING_LOOKBACK_DAYS,
+                             latest_snapshot: pd.DataFrame = None) -> pd.DataFrame:
+    """Whole-market date×ticker close matrix for RS universe ranking.
+
+    Built from one whole-market snapshot per session, fetched through
+    market_snapshot_cache (shared with get_snapshot). Closed sessions are kept in
+    the daily-bar store (raw prices), so after the first run only the newest
+    session is downloaded. Raw closes: a split inside the window skews that one
+    ticker's universe score, which barely moves a ~2,700-name distribution;
+    candidates themselves are still scored from adjusted series.
+
+    Args:
+        trade_date: Reference trading date (YYYYMMDD)
+        days: Number of sessions (>= 253 for an O'Neil raw score)
+        latest_snapshot: trade_date snapshot already in hand (avoids a re-download)
+    """
+    sessions = _get_session_dates(trade_date, days)
+    if not sessions:
+        return pd.DataFrame()
+
+    def _download(date):
+        _krx_throttle()
+        return stock_api.get_market_ohlcv_by_ticker(date)
+
+    use_store = daily_bar_store.is_enabled()
+    conn = daily_bar_store.get_connection() if use_store else None
+    frames = {}
+    try:
+        stored = daily_bar_store.snapshot_dates(conn, "KR", adjusted=False) if use_store else set()
+        missing = [d for d in sessions if d not in stored]
+        logger.info(f"RS universe: {len(sessions)} sessions, {len(missing)} to download")
+        for date in missing:
+            in_hand = date == trade_date and latest_snapshot is not None and not latest_snapshot.empty
+            if in_hand:
+                snap = latest_snapshot
+            else:
+                snap = market_snapshot_cache.get_frame("ohlcv", date, lambda date=date: _download(date))
+            if snap is None or snap.empty:
+                continue
+            if use_store:
+                # get_frame files closed sessions in the store itself; the snapshot in hand
+                # (fetch time unknown) and uncached intraday frames are added as non-final
+                final = not in_hand and market_snapshot_cache.is_final(date, _time.time())
+                if not (final and market_snapshot_cache.is_enabled()):
+                    daily_bar_store.upsert_market_snapshot(conn, "KR", date, snap, adjusted=False, final=final)
+            else:
+                frames[date] = snap["Close"]
+        if use_store:
+            return daily_bar_store.read_market_closes(conn, "KR", sessions, adjusted=False)
+    finally:
+        if conn is not None:
+            conn.close()
+    if not frames:
+        return pd.DataFrame()
+    matrix = pd.DataFrame(frames).T
+    matrix.index = pd.to_datetime(matrix.index, format='%Y%m%d')
+    return matrix.sort_index()
+
+
 def _compute_extension_score(extension_in_adr: float) -> float:
     """#289: Map ADR-extension above MA20 to a 0~1 score.
 
@@ -491,7 +643,8 @@ def _compute_extension_score(extension_in_adr: float) -> float:
 
 
 def calculate_screening_signals(ticker: str, current_price: float, trade_date: str,
-                                lookback_days: int = SCREENING_SIGNAL_LOOKBACK_DAYS) -> dict:
+                                lookback_days: int = SCREENING_SIGNAL_LOOKBACK_DAYS,
+                                ohlcv_panel: Optional[OhlcvPanel] = None) -> dict:
     """#289: Compute O'Neil-style screening signals from a single multi-week OHLCV fetch.
 
     Intentionally independent of calculate_agent_fit_metrics so the agent's 10-day
@@ -509,7 +662,7 @@ def calculate_screening_signals(ticker: str, current_price: float, trade_date: s
 
     # 최적화(B): 260일 1회 fetch 후 60일 슬라이싱 → fetch 2→1 절감.
     # df260.tail(lookback_days) == 독립 60일 fetch의 tail(60)과 동일한 마지막 행.
-    df260 = get_multi_day_ohlcv(ticker, trade_date, RS_RATING_LOOKBACK_DAYS)
+    df260 = _fetch_ohlcv(ticker, trade_date, RS_RATING_LOOKBACK_DAYS, ohlcv_panel)
     if df260.empty:
         return result
 
@@ -555,11 +708,12 @@ def calculate_screening_signals(ticker: str, current_price: float, trade_date: s
     return result
 
 
-def _compute_ma20(ticker: str, trade_date: str, lookback_days: int = 20) -> float:
+def _compute_ma20(ticker: str, trade_date: str, lookback_days: int = 20,
+                  ohlcv_panel: Optional[OhlcvPanel] = None) -> float:
     """#289 follow-up: 20-day moving average of close, for the sideways-trigger
     downtrend gate. Returns 0.0 when data is unavailable (the gate treats 0 as
     'unknown → pass' so a data blip never silently drops candidates)."""
-    df = get_multi_day_ohlcv(ticker, trade_date, lookback_days)
+    df = _fetch_ohlcv(ticker, trade_date, lookback_days, ohlcv_panel)
     if df.empty:
         return 0.0
     close_col = "Close" if "Close" in df.columns else "종가"
@@ -975,7 +1129,8 @@ def trigger_afternoon_closing_strength(trade_date: str, snapshot: pd.DataFrame,
     logger.debug(f"Closing strength top stocks detected: {len(result)}")
     return enhance_dataframe(result.sort_values("composite_score", ascending=False).head(10))
 
-def trigger_afternoon_volume_surge_flat(trade_date: str, snapshot: pd.DataFrame, prev_snapshot: pd.DataFrame, cap_df: pd.DataFrame = None, top_n: int = 20) -> pd.DataFrame:
+def trigger_afternoon_volume_surge_flat(trade_date: str, snapshot: pd.DataFrame, prev_snapshot: pd.DataFrame, cap_df: pd.DataFrame = None, top_n: int = 20,
+                                        ohlcv_panel: Optional[OhlcvPanel] = None) -> pd.DataFrame:
     """
     [Afternoon Trigger 3] Top volume increase sideways stocks
     - Absolute criteria: Minimum trade value 500M KRW + volume vs market average
@@ -1035,9 +1190,11 @@ def trigger_afternoon_volume_surge_flat(trade_date: str, snapshot: pd.DataFrame,
     # which mislabels a downtrending stock (below MA20, weak RS) as "sideways"
     # (e.g. 이노션 2026-05-29: -2.2%, below MA20). A real consolidation base sits
     # at/above the 20-day mean — exclude names clearly below MA20.
+    if ohlcv_panel is not None:
+        ohlcv_panel.load(result.index)
     kept_mask = []
     for ticker in result.index:
-        ma20 = _compute_ma20(ticker, trade_date)
+        ma20 = _compute_ma20(ticker, trade_date, ohlcv_panel=ohlcv_panel)
         close_price = float(result.loc[ticker, "Close"])
         # ma20 <= 0 means data unavailable → keep (don't drop on a data blip)
         kept_mask.append(ma20 <= 0 or close_price >= ma20 * SIDEWAYS_MA20_SUPPORT_TOLERANCE)
@@ -1382,7 +1539,8 @@ def _build_topdown_pool(trigger_candidates: dict, macro_context: dict, score_col
 
 
 # --- Comprehensive selection function ---
-def select_final_tickers(triggers: dict, trade_date: str = None, use_hybrid: bool = True, lookback_days: int = 10, macro_context: dict = None) -> dict:
+def select_final_tickers(triggers: dict, trade_date: str = None, use_hybrid: bool = True, lookback_days: int = 10, macro_context: dict = None,
+                         ohlcv_panel: Optional[OhlcvPanel] = None, rs_universe_raw: pd.Series = None) -> dict:
     """
     Consolidate stocks selected from each trigger and choose final stocks.
 
@@ -1397,6 +1555,9 @@ def select_final_tickers(triggers: dict, trade_date: str = None, use_hybrid: boo
         trade_date: Reference trading date (required in hybrid mode)
         use_hybrid: Whether to use hybrid selection (default: True)
         lookback_days: Number of past business days for agent score calculation (default: 10)
+        ohlcv_panel: Shared OHLCV panel (created here when omitted in hybrid mode)
+        rs_universe_raw: Market-wide O'Neil raw scores (ticker → raw); when given, the
+            RS percentile ranks candidates against the market instead of each other
 
     Returns:
         Dictionary of finally selected stocks
@@ -1428,6 +1589,12 @@ def select_final_tickers(triggers: dict, trade_date: str = None, use_hybrid: boo
         logger.info(f"[#289] Blend weights for regime '{_regime}': "
                     f"composite={w_comp}, agent={w_agent}, RS={w_rs}, extension={w_ext}")
 
+        # Panel stage: one fetch per unique candidate at the widest window; screening
+        # signals, agent-fit metrics and the MA20 gate all slice from this frame.
+        if ohlcv_panel is None or not ohlcv_panel.covers(trade_date, max(lookback_days, RS_RATING_LOOKBACK_DAYS)):
+            ohlcv_panel = OhlcvPanel(trade_date, max(lookback_days, RS_RATING_LOOKBACK_DAYS))
+        ohlcv_panel.load(sorted(all_tickers))
+
         # #289: pre-compute O'Neil-style signals across ALL unique candidates (cross-trigger),
         # then normalize the multi-week return into a relative-strength score (0~1).
         screening_signals = {}  # ticker -> {extension_in_adr, extension_score, return_nd}
@@ -1436,7 +1603,8 @@ def select_final_tickers(triggers: dict, trade_date: str = None, use_hybrid: boo
                 if _ticker in screening_signals:
                     continue
                 _cp = _cdf.loc[_ticker, "Close"] if "Close" in _cdf.columns else 0
-                screening_signals[_ticker] = calculate_screening_signals(_ticker, float(_cp), trade_date)
+                screening_signals[_ticker] = calculate_screening_signals(_ticker, float(_cp), trade_date,
+                                                                         ohlcv_panel=ohlcv_panel)
 
         rs_score_map = {}
         if screening_signals:
@@ -1452,7 +1620,14 @@ def select_final_tickers(triggers: dict, trade_date: str = None, use_hybrid: boo
         _rs_rating_enabled = os.getenv("RS_RATING_ENABLED", "false").strip().lower() == "true"
         _oneil_raw_map = {t: s["oneil_raw"] for t, s in screening_signals.items()
                           if s.get("oneil_raw") is not None}
-        _oneil_pct_map = percentile_ratings(_oneil_raw_map) if _oneil_raw_map else {}
+        if not _oneil_raw_map:
+            _oneil_pct_map = {}
+        elif rs_universe_raw is not None and len(rs_universe_raw) > 0:
+            _oneil_pct_map = universe_percentile_ratings(_oneil_raw_map, rs_universe_raw)
+            logger.info(f"[RS-RATING] Ranked {len(_oneil_raw_map)} candidates against "
+                        f"{len(rs_universe_raw)}-ticker market universe")
+        else:
+            _oneil_pct_map = percentile_ratings(_oneil_raw_map)
         if not _rs_rating_enabled:
             for _ticker, pct in _oneil_pct_map.items():
                 logger.info("[RS-RATING][SHADOW] %s oneil_pct=%.0f cur_rs=%.2f",
@@ -1464,7 +1639,8 @@ def select_final_tickers(triggers: dict, trade_date: str = None, use_hybrid: boo
 
         for name, candidates_df in trigger_candidates.items():
             # v1.16.6: Calculate agent scores by trigger type (agent_fit_score unchanged)
-            scored_df = score_candidates_by_agent_criteria(candidates_df, trade_date, lookback_days, trigger_type=name)
+            scored_df = score_candidates_by_agent_criteria(candidates_df, trade_date, lookback_days, trigger_type=name,
+                                                           ohlcv_panel=ohlcv_panel)
 
             # #289: final score = regime-weighted blend of composite + agent + RS + extension
             if "composite_score" in scored_df.columns and "agent_fit_score" in scored_df.columns:
@@ -1617,6 +1793,9 @@ def run_batch(trigger_time: str, log_level: str = "INFO", output_file: str = Non
     cap_df = get_market_cap_df(trade_date, market="ALL")
     logger.debug(f"Market cap data stock count: {len(cap_df)}")
 
+    # Shared OHLCV panel: the MA20 gate and final scoring slice from one fetch per ticker
+    ohlcv_panel = OhlcvPanel(trade_date)
+
     if trigger_time == "morning":
         logger.info("=== Morning batch execution ===")
         # Execute morning triggers - pass cap_df
@@ -1629,7 +1808,8 @@ def run_batch(trigger_time: str, log_level: str = "INFO", output_file: str = Non
         # Execute afternoon triggers - pass cap_df
         res1 = trigger_afternoon_daily_rise_top(trade_date, snapshot, prev_snapshot, cap_df)
         res2 = trigger_afternoon_closing_strength(trade_date, snapshot, prev_snapshot, cap_df)
-        res3 = trigger_afternoon_volume_surge_flat(trade_date, snapshot, prev_snapshot, cap_df)
+        res3 = trigger_afternoon_volume_surge_flat(trade_date, snapshot, prev_snapshot, cap_df,
+                                                   ohlcv_panel=ohlcv_panel)
         triggers = {"일중 상승률 상위주": res1, "마감 강도 상위주": res2, "거래량 증가 상위 횡보주": res3}
     else:
         logger.error("Invalid trigger_time value. Please enter 'morning' or 'afternoon'.")
@@ -1666,8 +1846,19 @@ def run_batch(trigger_time: str, log_level: str = "INFO", output_file: str = Non
             # Output detailed information only at debug level
             logger.debug(f"Detailed information:\n{df}\n{'-'*40}")
 
+    # RS universe (RS_RATING_UNIVERSE=market): rank candidates against the whole market
+    rs_universe_raw = None
+    if rs_universe_mode() == "market":
+        try:
+            matrix = load_market_close_matrix(trade_date, latest_snapshot=snapshot)
+            rs_universe_raw = oneil_weighted_returns(matrix).dropna()
+            logger.info(f"RS universe raw scores: {len(rs_universe_raw)} tickers")
+        except Exception as e:
+            logger.warning(f"RS universe load failed; ranking among candidates: {e}")
+
     # Final selection results
-    final_results = select_final_tickers(triggers, trade_date=trade_date, macro_context=macro_context)
+    final_results = select_final_tickers(triggers, trade_date=trade_date, macro_context=macro_context,
+                                         ohlcv_panel=ohlcv_panel, rs_universe_raw=rs_universe_raw)
 
     # Save results as JSON (if requested)
     if output_file:
@@ -150,9 +150,11 @@ def _get_sell_evaluation(cursor, week_start_str: str) -> str | None:
     if kr_sells:
         try:
             from krx_data_client import get_nearest_business_day_in_a_week, get_market_ohlcv_by_ticker
+            from cores import market_snapshot_cache
             today_str = datetime.now().strftime("%Y%m%d")
             trade_date = get_nearest_business_day_in_a_week(today_str, prev=True)
-            df = get_market_ohlcv_by_ticker(trade_date)
+            df = market_snapshot_cache.get_frame(
+                "ohlcv", trade_date, lambda: get_market_ohlcv_by_ticker(trade_date))
 
             for ticker, name, sell_price in kr_sells:
                 if ticker in df.index and sell_price: